@@ -2,6 +2,7 @@
 # ------------------
 
 # import packages/modules
+from collections import OrderedDict
 import numpy as np
 from PyREMOT.core.config import ROUND_FUN_ACCURACY
 
@@ -107,3 +108,189 @@ def selectRandomForList(myList, no):
     myList_2 = [a, *b, c]
     # res
     return myList_2
+
+
+class LruCacheClass:
+    """
+    bounded least-recently-used cache for node-level results
+        keys are built from numeric variables (T, P, composition) with the
+        mantissa rounded to a number of bits (52: exact match)
+    args:
+        maxSize: max number of stored results
+        bits: mantissa bits kept in keys
+    """
+
+    def __init__(self, maxSize=4096, bits=52):
+        self.maxSize = maxSize
+        self.bits = bits
+        self.data = OrderedDict()
+        # statistics
+        self.hits = 0
+        self.misses = 0
+
+    def setKey(self, tag, keyVars):
+        """
+        build a key from a tag and numeric variables
+        args:
+            tag: result name
+            keyVars: list of scalars/arrays
+        """
+        _vars = np.concatenate([np.ravel(np.asarray(item, dtype=float))
+                                for item in keyVars])
+        # quantize
+        if self.bits < 52:
+            _m, _e = np.frexp(_vars)
+            _vars = np.ldexp(np.round(_m*2**self.bits)/2**self.bits, _e)
+        return (tag, _vars.tobytes())
+
+    def get(self, key):
+        """
+        get a stored result (None if not found)
+        """
+        if key in self.data:
+            self.hits += 1
+            self.data.move_to_end(key)
+            return self.data[key]
+        self.misses += 1
+        return None
+
+    def set(self, key, value):
+        """
+        store a result (the least recently used one is removed)
+        """
+        self.data[key] = value
+        self.data.move_to_end(key)
+        if len(self.data) > self.maxSize:
+            self.data.popitem(last=False)
+
+    def stats(self):
+        """
+        cache statistics
+        """
+        _calls = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self.data),
+            "hitRate": self.hits/_calls if _calls > 0 else 0
+        }
+
+
+def cacheExe(cache, tag, keyVars, fun, *args, **kwargs):
+    """
+    execute a function through a cache
+    args:
+        cache: LruCacheClass (None: no cache)
+        tag: result name
+        keyVars: variables defining the result
+        fun: function
+        args/kwargs: function args
+    """
+    # check
+    if cache is None:
+        return fun(*args, **kwargs)
+
+    key = cache.setKey(tag, keyVars)
+    res = cache.get(key)
+    if res is None:
+        res = fun(*args, **kwargs)
+        cache.set(key, res)
+    return res
+
+
+class PropertyUpdateClass:
+    """
+    change-driven update of node properties
+        a node property is recomputed only when one of its state variables
+        (T, P, composition) drifts past a relative tolerance from the state
+        of its last evaluation, the other nodes keep the stored values
+    args:
+        tolerance: max relative drift of state variables
+        refMin: min reference magnitude (small mole fractions)
+    """
+
+    def __init__(self, tolerance=1e-3, refMin=1e-6):
+        self.tolerance = tolerance
+        self.refMin = refMin
+        # tag: (state variables, values)
+        self.data = {}
+        # statistics
+        self.calls = 0
+        self.updates = 0
+        self.nodes = 0
+
+    def exe(self, tag, stateVars, fun):
+        """
+        node properties (updated nodes only)
+        args:
+            tag: property name
+            stateVars: node state variables, last axis: nodes
+            fun: fun(index) -> values of the selected nodes, last axis: nodes
+                (array or tuple of arrays)
+        output:
+            values of all nodes (stored arrays, read only)
+        """
+        _state = [np.array(item, dtype=float) for item in stateVars]
+        nodeNo = _state[0].shape[-1]
+        self.calls += 1
+        self.nodes += nodeNo
+        _item = self.data.get(tag)
+
+        # check
+        if _item is None or [item.shape for item in _item[0]] != [item.shape for item in _state]:
+            _index = np.arange(nodeNo)
+            _res = fun(_index)
+            _values = tuple(np.array(item, dtype=float) for item in _res) if isinstance(
+                _res, tuple) else np.array(_res, dtype=float)
+            self.data[tag] = (_state, _values)
+            self.updates += nodeNo
+            return _values
+
+        # drifted nodes
+        _stateRef, _values = _item
+        _drift = np.zeros(nodeNo, dtype=bool)
+        for x, xRef in zip(_state, _stateRef):
+            _err = np.abs(x - xRef) > self.tolerance * \
+                np.maximum(np.abs(xRef), self.refMin)
+            _drift |= np.reshape(_err, (-1, nodeNo)).any(axis=0)
+        _index = np.flatnonzero(_drift)
+
+        # update
+        if _index.size > 0:
+            _res = fun(_index)
+            if isinstance(_values, tuple):
+                for item, itemNew in zip(_values, _res):
+                    item[..., _index] = itemNew
+            else:
+                _values[..., _index] = _res
+            for x, xRef in zip(_state, _stateRef):
+                xRef[..., _index] = x[..., _index]
+            self.updates += _index.size
+
+        return _values
+
+    def stats(self):
+        """
+        update statistics
+        """
+        return {
+            "calls": self.calls,
+            "updates": self.updates,
+            "nodes": self.nodes,
+            "updateRate": self.updates/self.nodes if self.nodes > 0 else 0
+        }
+
+
+def propertyUpdateExe(propUpdate, tag, stateVars, fun):
+    """
+    execute a node property function through the update scheduler
+    args:
+        propUpdate: PropertyUpdateClass (None: all nodes are computed)
+        tag: property name
+        stateVars: node state variables, last axis: nodes
+        fun: fun(index) -> values of the selected nodes
+    """
+    # check
+    if propUpdate is None:
+        return fun(np.arange(np.shape(stateVars[0])[-1]))
+    return propUpdate.exe(tag, stateVars, fun)
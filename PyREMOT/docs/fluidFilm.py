@@ -32,17 +32,20 @@ def calShNoEq1(Sc, Re, Method=1):
     gas-solid Sherwood number
         convective mass transfer coefficient / diffusive mass transfer coefficient
     args:
-        Sc: Schmidt number
-        Re: Reynolds number
+        Sc: Schmidt number, scalar or array
+        Re: Reynolds number, scalar or array
+        Method: correlation (CONST_EQ_Sh): Frossling, Rosner, Garner-and-Keey
     """
     # try/except
     try:
         if Method == CONST_EQ_Sh['Frossling']:
             return 2 + 1.1*(Sc**(1/3))*(Re**(0.6))
         elif Method == CONST_EQ_Sh['Rosner']:
-            return (Sc**0.4)*(0.4*(Re**0.5) + 0.2*(Re*(2/3)))
+            return (Sc**0.4)*(0.4*(Re**0.5) + 0.2*(Re**(2/3)))
         elif Method == CONST_EQ_Sh['Garner-and-Keey']:
             return 0.94*(Re**0.5)*(Sc**(1/3))
+        else:
+            raise Exception(f"Sherwood number method {Method} not found!")
     except Exception as e:
         raise
 
@@ -129,6 +132,64 @@ def calHeatTransferCoefficientEq1(Nu, GaThCo, CaPaDi):
         raise
 
 
+def calFilmCoefficientMat(GaDe, SuVe, CaPaDi, GaVi, GaDiCoi, GaHeCaCoPr, GaThCo, GaMoWe, ShMethod=CONST_EQ_Sh['Frossling']):
+    """ 
+    gas-solid film numbers and transfer coefficients for all nodes
+    args:
+        GaDe: gas density [kg/m^3], shape: (nodes)
+        SuVe: superficial velocity [m/s], scalar | (nodes)
+        CaPaDi: catalyst particle diameter [m]
+        GaVi: gas viscosity [Pa.s] | [kg/m.s], scalar | (nodes)
+        GaDiCoi: gas component diffusivity coefficient [m^2/s], shape: (compNo,) | (compNo, nodes)
+        GaHeCaCoPr: heat capacity at constant pressure [J/mol.K], shape: (nodes)
+        GaThCo: gas thermal conductivity [J/m.s.K], scalar | (nodes)
+        GaMoWe: gas molecular weight [kg/mol], shape: (nodes)
+        ShMethod: Sherwood number correlation (CONST_EQ_Sh)
+    output:
+        ReNu, PrNu, NuNu, HeTrCo: shape: (nodes)
+        ScNu, ShNu, MaTrCo: shape: (compNo, nodes)
+    """
+    # try/except
+    try:
+        # node properties
+        _GaDe = np.asarray(GaDe, dtype=float)
+        _GaVi = np.broadcast_to(GaVi, _GaDe.shape)
+        _GaThCo = np.broadcast_to(GaThCo, _GaDe.shape)
+        # component diffusivity, shape: (compNo, nodes)
+        _GaDiCoi = np.asarray(GaDiCoi, dtype=float)
+        if _GaDiCoi.ndim == 1:
+            _GaDiCoi = np.reshape(_GaDiCoi, (-1,) + (1,)*_GaDe.ndim)
+
+        # Reynolds number
+        ReNu = calReNoEq1(_GaDe, SuVe, CaPaDi, _GaVi)
+        # Schmidt number
+        ScNu = calScNoEq1(_GaDe, _GaVi, _GaDiCoi)
+        # Sherwood number
+        ShNu = calShNoEq1(ScNu, ReNu, ShMethod)
+        # mass transfer coefficient - gas/solid [m/s]
+        MaTrCo = calMassTransferCoefficientEq1(ShNu, _GaDiCoi, CaPaDi)
+
+        # Prandtl number
+        PrNu = calPrNoEq1(GaHeCaCoPr, _GaVi, _GaThCo, GaMoWe)
+        # Nusselt number
+        NuNu = calNuNoEq1(PrNu, ReNu)
+        # heat transfer coefficient - gas/solid [J/m^2.s.K]
+        HeTrCo = calHeatTransferCoefficientEq1(NuNu, _GaThCo, CaPaDi)
+
+        # res
+        return {
+            "ReNu": ReNu,
+            "ScNu": ScNu,
+            "ShNu": ShNu,
+            "MaTrCo": MaTrCo,
+            "PrNu": PrNu,
+            "NuNu": NuNu,
+            "HeTrCo": HeTrCo
+        }
+    except Exception as e:
+        raise
+
+
 def calThermalDiffusivity(GaThCo, GaDe, GaHeCaCoPr, GaMoWe):
     """
     calculate thermal diffusivity [m^2/s]
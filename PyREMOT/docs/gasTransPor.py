@@ -7,6 +7,8 @@ import numpy as np
 import re
 # internals
 from PyREMOT.docs.rmtUtility import rmtUtilityClass as rmtUtil
+from PyREMOT.docs.rmtReaction import compileExpressionVec
+from PyREMOT.docs.propTable import propertyTableExe
 # core
 from PyREMOT.core import Tref, R_CONST
 from PyREMOT.core import roundNum
@@ -39,93 +41,109 @@ def calGasDiffusivity(equation, compList, params):
         return -1
 
 
-def calGaDiEq1(compList, params):
+# Chapman-Enskog pair parameters (key: component list and data)
+GAS_DIFFUSIVITY_SET = {}
+
+
+def setGaDiEq1Params(compList, MWi, CrTei, CrPri):
+    """
+    temperature-independent pair parameters of Chapman-Enskog (cached)
+    args:
+        compList: component name list
+        MWi: molecular weight list [g/mol]
+        CrTei: critical temperature [K]
+        CrPri: critical pressure [bar]
+    output:
+        eij: e/K of pairs [K], shape: (compNo, compNo), diagonal: 1
+        DijConst: 1e-4*0.0018583*sqrt(1/MWi + 1/MWj)/sigmaij^2
+        offDiag: pair mask (i != j)
+    """
+    _key = (tuple(compList), tuple(np.ravel(MWi)),
+            tuple(np.ravel(CrTei)), tuple(np.ravel(CrPri)))
+    if _key not in GAS_DIFFUSIVITY_SET:
+        compNo = len(compList)
+        _MWi = np.asarray(MWi, dtype=float)
+        _CrTei = np.asarray(CrTei, dtype=float)
+        _CrPri = np.asarray(CrPri, dtype=float)
+        # pair mask
+        offDiag = ~np.eye(compNo, dtype=bool)
+        # e/K
+        eK_Ratio = 0.75*_CrTei
+        # sigma - characteristic length of the intermolecular force law
+        sigma = 2.44*(_CrTei/_CrPri)**(1/3)
+        # e[i,j]
+        eij = np.sqrt(np.outer(eK_Ratio, eK_Ratio))
+        eij[~offDiag] = 1
+        # sigma[i,j]
+        sigmaij = 0.5*(sigma[:, np.newaxis] + sigma[np.newaxis, :])
+        # T/P-independent part of D[i,j]
+        DijConst = (1e-4)*(0.0018583)*np.sqrt(1/_MWi[:, np.newaxis] +
+                                              1/_MWi[np.newaxis, :])/(sigmaij**2)
+        GAS_DIFFUSIVITY_SET[_key] = (eij, DijConst, offDiag)
+    return GAS_DIFFUSIVITY_SET[_key]
+
+
+def calGaDiEq1Mat(compList, params):
     """ 
-    calculate based on Chapman-Enskog 
+    calculate based on Chapman-Enskog for all nodes
     args:
         params: 
-            compList: component name list
-            MoFri: mole fraction list
-            T: temperature [K]
-            P: pressure [Pa]
+            MoFri: mole fraction, shape: (compNo, nodes)
+            T: temperature [K], shape: (nodes)
+            P: pressure [Pa], shape: (nodes)
             MWi: molecular weight list [g/mol]
             CrTei: critical temperature [K]
             CrPri: critical pressure [bar]
+    output:
+        Di: mixture diffusivity coefficient [m^2/s], shape: (compNo, nodes)
     """
     # input
-    MoFri = params['MoFri']
-    T = params['T']
-    P = params['P']
-    MWi = params['MWi']
-    CrTei = params['CrTei']
-    CrPri = params['CrPri']
-    # component no.
-    compNo = len(compList)
-    # e/K
-    eK_Ratio = np.array([0.75*item for item in CrTei])
-    # sigma - characteristic length of the intermolecular force law
-    sigma = np.zeros(compNo)
-    for i in range(compNo):
-        _loop = (CrTei[i]/CrPri[i])**(1/3)
-        sigma[i] = 2.44*_loop
-
-    # e[i,j]
-    eij = np.zeros((compNo, compNo))
-    for i in range(compNo):
-        for j in range(i, compNo):
-            if i == j:
-                eij[i][j] = 0
-            else:
-                eij[i][j] = sqrt(eK_Ratio[i]*eK_Ratio[j])
-
-    # sigma[i,j]
-    sigmaij = np.zeros((compNo, compNo))
-    for i in range(compNo):
-        for j in range(i, compNo):
-            if i == j:
-                sigmaij[i][j] = 0
-            else:
-                sigmaij[i][j] = 0.5*(sigma[i] + sigma[j])
-
-    # omega[i,j]
-    omegaij = np.zeros((compNo, compNo))
-    for i in range(compNo):
-        for j in range(i, compNo):
-            if i == j:
-                omegaij[i][j] = 0
-            else:
-                _Ts = T/eij[i][j]
-                _omegaLoop = 44.54*(_Ts**-4.909) + 1.911*(_Ts**-1.575)
-                omegaij[i][j] = _omegaLoop**0.10
+    MoFri = np.asarray(params['MoFri'], dtype=float)
+    T = np.asarray(params['T'], dtype=float)
+    P = np.asarray(params['P'], dtype=float)
+    # pair parameters
+    eij, DijConst, offDiag = setGaDiEq1Params(
+        compList, params['MWi'], params['CrTei'], params['CrPri'])
+
+    # omega[i,j], shape: (compNo, compNo, nodes)
+    _Ts = T/eij[:, :, np.newaxis]
+    omegaij = (44.54*(_Ts**-4.909) + 1.911*(_Ts**-1.575))**0.10
 
     # diffusivity coefficient D[i,j]
-    Dij = np.zeros((compNo, compNo))
-    for i in range(compNo):
-        for j in range(i, compNo):
-            if i == j:
-                Dij[i][j] = 0
-            else:
-                Dij[i][j] = (1e-4)*(0.0018583)*sqrt((T**3)*((1/MWi[i]) + (1/MWi[j]))) \
-                    * (1/((P*9.86923e-6)*(sigmaij[i][j]**2)*omegaij[i][j]))
+    Dij = DijConst[:, :, np.newaxis]*np.sqrt(T**3) / \
+        ((P*9.86923e-6)*omegaij)
 
     # based on Blanc's law
-    Dij_Cal = np.zeros((compNo, compNo))
-    # diagonal matrix
-    Dij_Transpose = np.transpose(Dij)
-    Dij_New = Dij + Dij_Transpose
-
-    for i in range(compNo):
-        for j in range(compNo):
-            if i == j:
-                Dij_Cal[i][j] = 0
-            else:
-                Dij_Cal[i][j] = MoFri[j]/Dij_New[i][j]
-
     # mixture diffusivity coefficient D[i]
-    Di = np.zeros(compNo)
+    Dij_Cal = np.where(offDiag[:, :, np.newaxis],
+                       MoFri[np.newaxis, :, :]/Dij, 0)
+    Di = 1/np.sum(Dij_Cal, axis=1)
+
+    # res
+    return Di
 
-    for k in range(compNo):
-        Di[k] = np.sum(Dij_Cal[k, :])**(-1)
+
+def calGaDiEq1(compList, params):
+    """ 
+    calculate based on Chapman-Enskog 
+    args:
+        params: 
+            compList: component name list
+            MoFri: mole fraction list
+            T: temperature [K]
+            P: pressure [Pa]
+            MWi: molecular weight list [g/mol]
+            CrTei: critical temperature [K]
+            CrPri: critical pressure [bar]
+    """
+    # one node
+    _params = {
+        **params,
+        "MoFri": np.reshape(np.asarray(params['MoFri'], dtype=float), (-1, 1)),
+        "T": np.reshape(params['T'], 1),
+        "P": np.reshape(params['P'], 1)
+    }
+    Di = calGaDiEq1Mat(compList, _params)[:, 0]
 
     # res
     return Di
@@ -163,59 +181,117 @@ def calGasVisEq2(eqExpr, T):
     """
     # try/except
     try:
-        return eval(eqExpr)
+        return compileExpressionVec(eqExpr)({"T": T})
     except Exception as e:
         raise
 
 
-def calGasViscosity(comList, T):
+# transport property parameters (key: (property name, component list))
+TRANSPORT_PROPERTY_SET = {}
+
+
+def setTransportPropertyParams(name, comList, loadEqData, loadData):
+    """
+        prepared transport property parameters of a component list (cached)
+            components are grouped by equation id
+
+        args:
+            name: property name (Vi, ThCo)
+            comList: component name list
+            loadEqData: equation id list [{"symbol": ..., "id": ...}, ...]
+            loadData: equation data list [{"symbol": ..., "eqParams": ..., "eqExpr": ...}, ...]
+        output:
+            compNo: number of components
+            eq1Index: component index of equation 1
+            eq1Params: parameters of equation 1, shape: (paramNo, eq1 compNo)
+            eq2List: expressions of equation 2 [(component index, eqExpr), ...]
+    """
+    _key = (name, tuple(comList))
+    if _key not in TRANSPORT_PROPERTY_SET:
+        # symbol index (first record)
+        eqIdData = {}
+        for item in loadEqData:
+            eqIdData.setdefault(item['symbol'], item['id'])
+        eqData = {}
+        for item in loadData:
+            eqData.setdefault(item['symbol'], item)
+
+        eq1Index = []
+        eq1Params = []
+        eq2List = []
+        for k, i in enumerate(comList):
+            # check
+            if i not in eqIdData or i not in eqData:
+                print("component not found, update the app database!")
+                raise Exception(f"{name} data of {i} not found")
+            _eqIdSet = eqIdData[i]
+            if _eqIdSet == 1:
+                eq1Index.append(k)
+                eq1Params.append(eqData[i].get('eqParams'))
+            elif _eqIdSet == 2:
+                eq2List.append((k, eqData[i].get('eqExpr')))
+            else:
+                print(f'{name} data not found, update app database!')
+                raise Exception(f"{name} equation of {i} not found")
+
+        TRANSPORT_PROPERTY_SET[_key] = {
+            "compNo": len(comList),
+            "eq1Index": np.array(eq1Index, dtype=int),
+            "eq1Params": np.array(eq1Params, dtype=float).T if len(eq1Params) > 0 else np.zeros((4, 0)),
+            "eq2List": eq2List
+        }
+    return TRANSPORT_PROPERTY_SET[_key]
+
+
+def calTransportPropertyEq(paramSet, T, eq1Fun):
+    """
+        evaluate a transport property for all components
+            equation 1 is evaluated in one pass over its components
+
+        args:
+            paramSet: prepared parameters (setTransportPropertyParams)
+            T: temperature [K], scalar or array
+            eq1Fun: equation 1 function (params, T)
+        output:
+            shape: (compNo,) | (compNo, T shape)
+    """
+    _T = T if np.ndim(T) == 0 else np.asarray(T, dtype=float)
+    res = np.zeros((paramSet['compNo'],) + np.shape(T))
+    # equation 1
+    eq1Index = paramSet['eq1Index']
+    if eq1Index.size > 0:
+        eq1Params = paramSet['eq1Params']
+        _params = np.reshape(
+            eq1Params, eq1Params.shape + (1,)*np.ndim(T))
+        res[eq1Index] = eq1Fun(_params, _T)
+    # equation 2
+    for k, eqExpr in paramSet['eq2List']:
+        res[k] = calGasVisEq2(eqExpr, _T)
+    return res
+
+
+def calGasViscosity(comList, T, propTableSet=None):
     """
         cal: gas viscosity at low pressure 
         unit: [Pa.s]
 
         args:
             comList: component name list
-            T: temperature [K]
+            T: temperature [K], scalar or array
+            propTableSet: property tables (None: exact correlations)
     """
     # try/except
     try:
-        # heat capacity
-        _Vii = []
-
-        # load data
-        loadEqData = viscosityEqList
-        loadData = viscosityList
-
-        for i in comList:
-            # get id
-            eqIdData = [item['id']
-                        for item in loadEqData if i == item['symbol']]
-            # get eq parameters
-            eqData = [{"eqParams": item['eqParams'], "eqExpr": item['eqExpr']}
-                      for item in loadData if i == item['symbol']]
-            # check
-            _eqLen = len(eqIdData) + len(eqData)
-            if _eqLen > 0:
-                _eqIdSet = eqIdData[0]
-                _eqData = eqData[0]
-                if _eqIdSet == 1:
-                    _eqParams = _eqData.get('eqParams')
-                    _res = calGasVisEq1(_eqParams, T)
-                    _Vii.append(_res)
-                elif _eqIdSet == 2:
-                    _eqExpr = _eqData.get('eqExpr')
-                    # build fun
-                    _res = calGasVisEq2(_eqExpr, T)
-                    _Vii.append(_res)
-                else:
-                    print('viscosity data not found, update app database!')
-                    raise
-            else:
-                print("component not found, update the app database!")
-                raise
+        # property table
+        _res = propertyTableExe(propTableSet, "Vi", comList, T)
+        if _res is not None:
+            return _res
 
-        # convert to numpy array
-        Vii = np.array(_Vii)
+        # prepared parameters
+        paramSet = setTransportPropertyParams(
+            "Vi", comList, viscosityEqList, viscosityList)
+        # viscosity list
+        Vii = calTransportPropertyEq(paramSet, T, calGasVisEq1)
 
         # res
         return Vii
@@ -226,6 +302,65 @@ def calGasViscosity(comList, T):
 # NOTE
 ### mixture property ###
 
+def calWilkeCoeffMat(Xi, MWi):
+    '''
+    interaction coefficients of the Wilke method
+    args:
+        Xi: component property, shape: (compNo,) | (nodes, compNo)
+        MWi: molecular weight [g/mol]
+    output:
+        wilkeCo: shape: (compNo, compNo) | (nodes, compNo, compNo)
+    '''
+    _Xi = np.asarray(Xi, dtype=float)
+    _MWi = np.asarray(MWi, dtype=float)
+    compNo = _MWi.size
+    # property ratio Xi/Xj
+    XiRatio = _Xi[..., :, np.newaxis]/_Xi[..., np.newaxis, :]
+    # molecular weight ratio MWj/MWi
+    MWiRatio = _MWi[np.newaxis, :]/_MWi[:, np.newaxis]
+    # i < j
+    A = 1 + np.sqrt(XiRatio)*(MWiRatio**(1/4))
+    BB = np.sqrt(8*(1 + 1/MWiRatio))
+    wilkeUp = (A**2)/BB
+    # i > j
+    wilkeLow = XiRatio*MWiRatio*np.swapaxes(wilkeUp, -1, -2)
+    # set
+    _index = np.arange(compNo)
+    wilkeCo = np.where(_index[:, np.newaxis] < _index[np.newaxis, :], wilkeUp,
+                       np.where(_index[:, np.newaxis] > _index[np.newaxis, :], wilkeLow, 1.0))
+    return wilkeCo
+
+
+def calMixturePropertyM1Mat(Xi, MoFri, MWi):
+    '''
+    calculate mixture property M1 for all nodes
+        Method of Wilke
+    args:
+        Xi: component property, shape: (compNo,) | (nodes, compNo)
+        MoFri: mole fraction [-], shape: (nodes, compNo)
+        MWi: molecular weight [g/mol]
+    output:
+        mixPropVal: shape: (nodes)
+    '''
+    try:
+        _Xi = np.asarray(Xi, dtype=float)
+        _MoFri = np.asarray(MoFri, dtype=float)
+        # interaction coefficients (once for a shared property set)
+        wilkeCo = calWilkeCoeffMat(_Xi, MWi)
+        # sum(MoFri[j]*wilkeCo[i, j])
+        if wilkeCo.ndim == 2:
+            B = np.einsum('ij,nj->ni', wilkeCo, _MoFri)
+        else:
+            B = np.einsum('nij,nj->ni', wilkeCo, _MoFri)
+        # mixture property
+        mixPropVal = np.sum(_Xi*_MoFri/B, axis=-1)
+        # res
+        return mixPropVal
+    except Exception as e:
+        print(e)
+        raise
+
+
 def calMixturePropertyM1(compNo, Xi, MoFri, MWi):
     '''
     calculate mixture property M1
@@ -237,37 +372,9 @@ def calMixturePropertyM1(compNo, Xi, MoFri, MWi):
         MWi: molecular weight [g/mol]
     '''
     try:
-
-        # wilke res
-        wilkeCo = np.zeros((compNo, compNo))
-        for i in range(compNo):
-            for j in range(compNo):
-                if i == j:
-                    wilkeCo[i, j] = 1
-                else:
-                    if i < j:
-                        # wilke coefficient mix
-                        A = 1 + sqrt(Xi[i]/Xi[j])*((MWi[j]/MWi[i])**(1/4))
-                        AA = A**2
-                        B = 8*(1+(MWi[i]/MWi[j]))
-                        BB = sqrt(B)
-                        wilkeCo[i, j] = AA/BB
-                    else:
-                        C = (Xi[i]/Xi[j])*(MWi[j]/MWi[i]) * wilkeCo[j, i]
-                        wilkeCo[i, j] = C
-        # vars
-        A = np.zeros(compNo)
-        B = np.zeros((compNo, compNo))
-        # mixture property
-        mixProp = np.zeros(compNo)
-        for i in range(compNo):
-            A[i] = Xi[i]*MoFri[i]
-            for j in range(compNo):
-                B[i, j] = MoFri[j]*wilkeCo[i, j]
-            # set
-            mixProp[i] = A[i]/np.sum(B[i, :])
-
-        mixPropVal = np.sum(mixProp)
+        # one node
+        mixPropVal = calMixturePropertyM1Mat(
+            np.ravel(Xi)[0:compNo], np.reshape(np.ravel(MoFri)[0:compNo], (1, compNo)), np.ravel(MWi)[0:compNo])[0]
         # res
         return mixPropVal
     except Exception as e:
@@ -277,54 +384,28 @@ def calMixturePropertyM1(compNo, Xi, MoFri, MWi):
 # NOTE
 ### thermal conductivity ###
 
-def calGasThermalConductivity(comList, T):
+def calGasThermalConductivity(comList, T, propTableSet=None):
     """
         cal: gas thermal conductivity at low pressure 
         unit: [W/m.K]
 
         args:
             comList: component name list
-            T: temperature [K]
+            T: temperature [K], scalar or array
+            propTableSet: property tables (None: exact correlations)
     """
     # try/except
     try:
+        # property table
+        _res = propertyTableExe(propTableSet, "ThCo", comList, T)
+        if _res is not None:
+            return _res
+
+        # prepared parameters
+        paramSet = setTransportPropertyParams(
+            "ThCo", comList, thermalConductivityEqList, TherConductivityList)
         # thermal conductivity list
-        _ThCoi = []
-
-        # load data
-        loadEqData = thermalConductivityEqList
-        loadData = TherConductivityList
-
-        for i in comList:
-            # get id
-            eqIdData = [item['id']
-                        for item in loadEqData if i == item['symbol']]
-            # get eq parameters
-            eqData = [{"eqParams": item['eqParams'], "eqExpr": item['eqExpr']}
-                      for item in loadData if i == item['symbol']]
-            # check
-            _eqLen = len(eqIdData) + len(eqData)
-            if _eqLen > 0:
-                _eqIdSet = eqIdData[0]
-                _eqData = eqData[0]
-                if _eqIdSet == 1:
-                    _eqParams = _eqData.get('eqParams')
-                    _res = calGasTherCondEq1(_eqParams, T)
-                    _ThCoi.append(_res)
-                elif _eqIdSet == 2:
-                    _eqExpr = _eqData.get('eqExpr')
-                    # build fun
-                    _res = calGasVisEq2(_eqExpr, T)
-                    _ThCoi.append(_res)
-                else:
-                    print('viscosity data not found, update app database!')
-                    raise
-            else:
-                print("component not found, update the app database!")
-                raise
-
-        # convert to numpy array
-        ThCoi = np.array(_ThCoi)
+        ThCoi = calTransportPropertyEq(paramSet, T, calGasTherCondEq1)
 
         # res
         return ThCoi
@@ -21,3 +21,25 @@ MODEL_SETTING = {
 PROCESS_SETTING = {
     "ISO-THER": "iso-thermal"
 }
+
+# reaction network setting
+# sparse: AUTO (by size/density) | TRUE | FALSE
+REACTION_NETWORK_SETTING = {
+    "sparse": "AUTO",
+    "sparseMinSize": 400,
+    "sparseMaxDensity": 0.2
+}
+
+# property table setting (solver-config: "property-table": "True")
+# size: initial number of temperature points
+# tolerance: max relative interpolation error
+# TLower/TUpper: default range [min(Tref, T0 - TLower), T0 + TUpper]
+# cacheSize: max number of tables kept across runs
+PROPERTY_TABLE_SETTING = {
+    "size": 65,
+    "maxSize": 4097,
+    "tolerance": 1e-6,
+    "cacheSize": 32,
+    "TLower": 100.0,
+    "TUpper": 300.0
+}
@@ -13,7 +13,7 @@ from PyREMOT.docs.modelSetting import MODEL_SETTING
 from PyREMOT.docs.rmtUtility import rmtUtilityClass as rmtUtil
 from PyREMOT.docs.rmtThermo import *
 from PyREMOT.docs.fluidFilm import *
-from PyREMOT.docs.rmtReaction import reactionRateExe, componentFormationRate
+from PyREMOT.docs.rmtReaction import componentFormationRateMat, ReactionRateClass
 from PyREMOT.docs.gasTransPor import calTest
 from PyREMOT.docs.rmtUtility import rmtUtilityClass as rmtUtil
 from PyREMOT.docs.rmtThermo import *
@@ -33,7 +33,8 @@ from PyREMOT.solvers.solOrCo import OrCoClass
 from PyREMOT.solvers.solCatParticle import OrCoCatParticleClass
 from PyREMOT.solvers.solFiDi import FiDiBuildCMatrix, FiDiBuildTMatrix, FiDiSetMatrix, FiDiBuildCMatrix_DiLe, FiDiBuildTMatrix_DiLe
 from PyREMOT.solvers.solFiDi import FiDiMeshGenerator, FiDiDerivative1, FiDiDerivative2, FiDiNonUniformDerivative1, FiDiNonUniformDerivative2
-from PyREMOT.solvers.odeSolver import AdBash3, PreCorr3
+from PyREMOT.solvers.solFiDi import FiDiStencilHalfWidth, FiDiJacobianPattern, FiDiDerivativeOperator, FiDiDerivativeApply
+from PyREMOT.solvers.odeSolver import AdBash3, PreCorr3, DoPri54, BDFSolverClass
 
 
 class PackedBedHeteroReactorClass:
@@ -52,11 +53,23 @@ class PackedBedHeteroReactorClass:
     # internal data
     _internalData = []
 
-    def __init__(self, modelInput, internalData, reactionListSorted, reactionStochCoeffList):
+    def __init__(self, modelInput, internalData, reactionListSorted, reactionStochCoeffList, reactionRateSet=None, propTableSet=None):
         self.modelInput = modelInput
         self.internalData = internalData
         self.reactionListSorted = reactionListSorted
         self.reactionStochCoeffList = reactionStochCoeffList
+        # reaction rate set (compiled kinetics)
+        self.reactionRateSet = reactionRateSet if reactionRateSet is not None else ReactionRateClass(
+            modelInput['reaction-rates'])
+        # property tables (opt-in, None: exact correlations)
+        self.propTableSet = propTableSet
+        # reaction enthalpy (solver-config: reaction-enthalpy)
+        # MEAN: mean heat capacity (default), INTEGRAL: closed-form integral of dCp
+        self.reactionEnthalpyMethod = modelInput.get(
+            'solver-config', {}).get('reaction-enthalpy', "MEAN")
+        # stoichiometric coefficient matrix [compNo, reactionNo]
+        self.reactionStochCoeffMat = rmtUtil.setReactionCoeffMatrix(
+            modelInput['feed']['components']['shell'], reactionStochCoeffList)
 
     # @property
     # def internalData(cls):
@@ -181,6 +194,8 @@ class PackedBedHeteroReactorClass:
         FunParam = {
             "compList": compList,
             "const": {
+                "propTableSet": self.propTableSet,
+                "reactionEnthalpyMethod": self.reactionEnthalpyMethod,
                 "CrSeAr": CrSeAr,
                 "MoWei": MoWei,
                 "StHeRe25": StHeRe25,
@@ -289,6 +304,10 @@ class PackedBedHeteroReactorClass:
         comList = FunParam['compList']
         # const ->
         const = FunParam['const']
+        # property tables
+        propTableSet = const['propTableSet']
+        # reaction enthalpy method
+        reactionEnthalpyMethod = const['reactionEnthalpyMethod']
         # cross-sectional area [m^2]
         CrSeAr = const['CrSeAr']
         # component molecular weight [g/mol]
@@ -454,7 +473,7 @@ class PackedBedHeteroReactorClass:
         # enthalpy
         # heat capacity at constant pressure of mixture Cp [kJ/kmol.K] | [J/mol.K]
         # Cp mean list
-        CpMeanList = calMeanHeatCapacityAtConstantPressure(comList, T)
+        CpMeanList = calMeanHeatCapacityAtConstantPressure(comList, T, propTableSet=propTableSet)
         # print(f"Cp mean list: {CpMeanList}")
         # Cp mixture
         CpMeanMixture = calMixtureHeatCapacityAtConstantPressure(
@@ -463,7 +482,7 @@ class PackedBedHeteroReactorClass:
 
         # enthalpy change from Tref to T [kJ/kmol] | [J/mol]
         # enthalpy change
-        EnChList = np.array(calEnthalpyChangeOfReaction(reactionListSorted, T))
+        EnChList = np.array(calEnthalpyChangeOfReaction(reactionListSorted, T, method=reactionEnthalpyMethod))
         # heat of reaction at T [kJ/kmol] | [J/mol]
         HeReT = np.array(EnChList + StHeRe25)
         # overall heat of reaction [J/m^3.s]
@@ -656,7 +675,7 @@ class PackedBedHeteroReactorClass:
 
         # heat capacity at constant pressure of mixture Cp [kJ/kmol.K] | [J/mol.K]
         # Cp mean list
-        GaCpMeanList0 = calMeanHeatCapacityAtConstantPressure(compList, T)
+        GaCpMeanList0 = calMeanHeatCapacityAtConstantPressure(compList, T, propTableSet=self.propTableSet)
         # Cp mixture
         GaCpMeanMix0 = calMixtureHeatCapacityAtConstantPressure(
             MoFri0, GaCpMeanList0)
@@ -883,6 +902,8 @@ class PackedBedHeteroReactorClass:
         FunParam = {
             "compList": compList,
             "const": {
+                "propTableSet": self.propTableSet,
+                "reactionEnthalpyMethod": self.reactionEnthalpyMethod,
                 "CrSeAr": CrSeAr,
                 "MoWei": MoWei,
                 "StHeRe25": StHeRe25,
@@ -920,7 +941,14 @@ class PackedBedHeteroReactorClass:
                 "dz": dz,
                 "dzs": dzs,
                 "zR": zR,
-                "zNoNo": zNoNo
+                "zNoNo": zNoNo,
+                # axial derivative operators (mass/energy balance)
+                "zDiffOperator": {
+                    "C": FiDiDerivativeOperator(zNo, dz, dzs, zNoNo[0], solverMeshSet,
+                                                solverSetting['T1']['dFdz'], solverSetting['T1']['d2Fdz2']),
+                    "T": FiDiDerivativeOperator(zNo, dz, dzs, zNoNo[0], solverMeshSet,
+                                                solverSetting['T1']['dTdz'], solverSetting['T1']['d2Tdz2'])
+                }
             },
             "solverSetting": {
                 "dFdz": solverSetting['T1']['dFdz'],
@@ -928,7 +956,9 @@ class PackedBedHeteroReactorClass:
                 "dTdz": solverSetting['T1']['dTdz'],
                 "d2Tdz2": solverSetting['T1']['d2Tdz2'],
             },
-            "reactionRateExpr": reactionRateExpr
+            "reactionRateExpr": reactionRateExpr,
+            "reactionRateSet": self.reactionRateSet,
+            "reactionStochCoeffMat": self.reactionStochCoeffMat
 
         }
 
@@ -976,7 +1006,17 @@ class PackedBedHeteroReactorClass:
         # solver selection
         # BDF, Radau, LSODA
         solverIVP = "LSODA" if solverIVPSet == 'default' else solverIVPSet
-
+        # in-house ode solver (ivp: AM)
+        odeSolverMethod = solverSetting['T1']['ode-solver']['method']
+        odeSolverOptions = solverSetting['T1']['ode-solver']['DoPri54']
+        # jacobian sparsity (BDF, Radau | ivp: AM, method: BDF)
+        # gas phase, shape: (noLayer, 1, varNoColumns)
+        jacPattern = FiDiJacobianPattern(noLayer, 1, varNoColumns,
+                                         FiDiStencilHalfWidth(solverSetting['T1'], solverMeshSet)) \
+            if solverIVP in ("BDF", "Radau") or (solverIVP == "AM" and odeSolverMethod == "BDF") else None
+        jacOptions = {
+            "jac_sparsity": jacPattern
+        } if solverIVP in ("BDF", "Radau") else {}
         # FIXME
         n = solverSetting['T1']['ode-solver']['PreCorr3']['n']
         # t0 = 0
@@ -990,8 +1030,15 @@ class PackedBedHeteroReactorClass:
         paramsSet_2 = (reactionListSorted, reactionStochCoeff,
                        FunParam, DimensionlessAnalysisParams, BulkParams)
         funSet_ode2 = PackedBedHeteroReactorClass.modelEquationM3
+        # in-house stiff solver (ivp: AM, method: BDF)
+        # kept over the time loop, the factorization is reused as long as the
+        # newton iteration converges after the interface update
+        stiffSolver = BDFSolverClass(funSet, paramsSet, jacType="sparse", jacSparsity=jacPattern,
+                                     **solverSetting['T1']['ode-solver']['BDF']) if solverIVP == "AM" and odeSolverMethod == "BDF" else None
 
-        # time loop
+        # NOTE
+        # time loop (chunked integration)
+        # the gas/solid interface values are updated at the end of each time span
         for i in range(tNo):
             # set time span
             t = np.array([opTSpan[i], opTSpan[i+1]])
@@ -1001,8 +1048,13 @@ class PackedBedHeteroReactorClass:
             # ode call
             if solverIVP == "AM":
                 # sol = AdBash3(t[0], t[1], n, IV, funSet, paramsSet)
-                # PreCorr3
-                sol = PreCorr3(t[0], t[1], n, IVGas, funSet, paramsSet)
+                # DoPri54 (adaptive), PreCorr3 (fixed-step)
+                # BDF (stiff, jacobian/LU reuse over the time loop)
+                if odeSolverMethod == "BDF":
+                    sol = stiffSolver.solve(t[0], t[1], IVGas)
+                else:
+                    sol = DoPri54(t[0], t[1], IVGas, funSet, paramsSet, **odeSolverOptions) if odeSolverMethod == "DoPri54" else PreCorr3(
+                        t[0], t[1], n, IVGas, funSet, paramsSet)
                 successStatus = True
                 # time interval
                 dataTime = t
@@ -1014,7 +1066,7 @@ class PackedBedHeteroReactorClass:
                 # method [1]: LSODA, [2]: BDF, [3]: Radau
                 # ode 1: gas phase
                 sol = solve_ivp(funSet, t, IVGas, method=solverIVP,
-                                t_eval=times,  args=(paramsSet,))
+                                t_eval=times,  args=(paramsSet,), **jacOptions)
                 # ode result
                 successStatus = sol.success
                 # time interval
@@ -1295,6 +1347,8 @@ class PackedBedHeteroReactorClass:
         comList = FunParam['compList']
         # const ->
         const = FunParam['const']
+        # property tables
+        propTableSet = const['propTableSet']
         # cross-sectional area [m^2]
         CrSeAr = const['CrSeAr']
         # component molecular weight [g/mol]
@@ -1392,25 +1446,15 @@ class PackedBedHeteroReactorClass:
         zNoNoDense = zNoNo[0]
         # normal
         zNoNoNormal = zNoNo[1]
-
-        # solver setting
-        solverSetting = FunParam['solverSetting']
-        # mass balance equation
-        DIFF1_C_SET = solverSetting['dFdz']
-        DIFF2_C_SET_BC1 = solverSetting['d2Fdz2']['BC1']
-        DIFF2_C_SET_BC2 = solverSetting['d2Fdz2']['BC2']
-        DIFF2_C_SET_G = solverSetting['d2Fdz2']['G']
-        # energy balance equation
-        DIFF1_T_SET = solverSetting['dTdz']
-        DIFF2_T_SET_BC1 = solverSetting['d2Tdz2']['BC1']
-        DIFF2_T_SET_BC2 = solverSetting['d2Tdz2']['BC2']
-        DIFF2_T_SET_G = solverSetting['d2Tdz2']['G']
+        # axial derivative operators
+        zDiffOperator = meshSetting['zDiffOperator']
 
         # reaction rate expressions
         reactionRateExpr = FunParam['reactionRateExpr']
-        # using equation
-        varisSet = reactionRateExpr['VARS']
-        ratesSet = reactionRateExpr['RATES']
+        # compiled reaction rate set
+        reactionRateSet = FunParam['reactionRateSet']
+        # stoichiometric coefficient matrix
+        reactionStochCoeffMat = FunParam['reactionStochCoeffMat']
 
         # dimensionless analysis params
 
@@ -1566,6 +1610,26 @@ class PackedBedHeteroReactorClass:
         # NOTE
         # FIXME
         # define ode equations for each finite difference [zNo]
+        # NOTE
+        # axial derivatives of all nodes (precomputed operators)
+        # first node step size
+        dz0 = dz if solverMeshSet is True else dzs[0]
+        # inlet ghost node (BC1)
+        BC1_C_2 = 1/(np.array(PeNuMa0)*dz0)
+        Ci_0 = np.ones(compNo) if MODEL_SETTING['GaMaCoTe0'] != "MAX" else np.array(
+            SpCoi0)/np.max(SpCoi0)
+        Ci_b0 = (Ci_0 + BC1_C_2*SpCoi_z[:, 1])/(BC1_C_2 + 1)
+        # concentration, shape: (compNo, zNo)
+        dCdz_z, d2Cdz2_z = FiDiDerivativeApply(
+            zDiffOperator['C'], SpCoi_z, Ci_b0)
+        # T*[0] = (T0 - Tf)/Tf
+        BC1_T_2 = 1/(PeNuHe0*dz0)
+        T_b0 = (0 + BC1_T_2*T_z[1])/(BC1_T_2 + 1)
+        # temperature, shape: (zNo,)
+        dTdz_z, d2Tdz2_z = FiDiDerivativeApply(zDiffOperator['T'], T_z, T_b0)
+        dTdz_z = dTdz_z[0]
+        d2Tdz2_z = d2Tdz2_z[0]
+
         for z in range(varNoColumns):
             ## block ##
 
@@ -1736,7 +1800,7 @@ class PackedBedHeteroReactorClass:
             # heat capacity at constant pressure of mixture Cp [kJ/kmol.K] | [J/mol.K]
             # Cp mean list
             GaCpMeanList = calMeanHeatCapacityAtConstantPressure(
-                comList, T_ReVa)
+                comList, T_ReVa, propTableSet=propTableSet)
             # Cp mixture
             GaCpMeanMix = calMixtureHeatCapacityAtConstantPressure(
                 MoFri, GaCpMeanList)
@@ -1859,125 +1923,10 @@ class PackedBedHeteroReactorClass:
                 # concentration [kmol/m^3]
                 # central
                 Ci_c = SpCoi_z[i][z]
-                # check BC
-                if z == 0 and solverMeshSet is True:
-                    # NOTE
-                    # BC1 (normal)
-                    BC1_C_1 = PeNuMa0[i]*dz
-                    BC1_C_2 = 1/BC1_C_1
-                    # forward
-                    Ci_f = SpCoi_z[i][z+1]
-                    Ci_ff = SpCoi_z[i][z+2]
-                    # backward
-                    # GaDii_DiLeVa = 1
-                    Ci_0 = 1 if MODEL_SETTING['GaMaCoTe0'] != "MAX" else SpCoi0[i]/np.max(
-                        SpCoi0)
-                    Ci_b = (Ci_0 + BC1_C_2*Ci_f)/(BC1_C_2 + 1)
-                    Ci_bb = 0
-                    # function value
-                    dFdz_C = [Ci_b, Ci_c, Ci_f]
-                    d2Fdz2_C = [Ci_bb, Ci_b, Ci_c, Ci_f, Ci_ff]
-                    # dFdz
-                    dCdz = FiDiDerivative1(dFdz_C, dz, DIFF1_C_SET)
-                    # d2Fdz2
-                    d2Cdz2 = FiDiDerivative2(d2Fdz2_C, dz, DIFF2_C_SET_BC1)
-                elif z == 0 and solverMeshSet is False:
-                    # NOTE
-                    # BC1 (dense)
-                    # i=0 is discretized based on inlet
-                    # i=1
-                    BC1_C_1 = PeNuMa0[i]*dzs[z]
-                    BC1_C_2 = 1/BC1_C_1
-                    # forward
-                    Ci_f = SpCoi_z[i][z+1]
-                    Ci_ff = SpCoi_z[i][z+2]
-                    # backward
-                    # GaDii_DiLeVa = 1
-                    Ci_0 = 1 if MODEL_SETTING['GaMaCoTe0'] != "MAX" else SpCoi0[i]/np.max(
-                        SpCoi0)
-                    Ci_b = (Ci_0 + BC1_C_2*Ci_f)/(BC1_C_2 + 1)
-                    Ci_bb = 0
-                    # function value
-                    dFdz_C = [Ci_b, Ci_c, Ci_f]
-                    d2Fdz2_C = [Ci_bb, Ci_b, Ci_c, Ci_f, Ci_ff]
-                    # REVIEW
-                    ### uniform nodes ###
-                    # dFdz
-                    dCdz = FiDiDerivative1(dFdz_C, dzs[z], DIFF1_C_SET)
-                    # d2Fdz2
-                    # d2Cdz2 = FiDiDerivative2(d2Fdz2_C, dzs[z], DIFF2_C_SET_BC1)
-                    ### non-uniform nodes ###
-                    # R value
-                    _zR_b = 0
-                    _zR_c = dzs[z]/dzs[z-1]
-                    # dCdz = FiDiNonUniformDerivative1(
-                    #     dFdz_C, dzs[z], DIFF1_C_SET, zR[z])
-                    # d2Fdz2
-                    d2Cdz2 = FiDiNonUniformDerivative2(
-                        d2Fdz2_C, dzs[z], DIFF2_C_SET_BC1, _zR_c)
-                    # FIXME
-                    checkME = 0
-                elif (z > 0 and z < zNoNoDense) and solverMeshSet is False:
-                    # NOTE
-                    # dense section
-                    # i=2,...,zNoNoDense-1
-                    # forward
-                    Ci_f = SpCoi_z[i][z+1]
-                    Ci_ff = SpCoi_z[i][z+2]
-                    # backward
-                    Ci_b = SpCoi_z[i][z-1]
-                    Ci_bb = SpCoi_z[i][z-2]
-                    # function value
-                    dFdz_C = [Ci_bb, Ci_b, Ci_c, Ci_f, Ci_ff]
-                    d2Fdz2_C = [Ci_bb, Ci_b, Ci_c, Ci_f, Ci_ff]
-                    # REVIEW
-                    ### non-uniform nodes ###
-                    # R value
-                    _zR_b = dzs[z-2]/dzs[z-1]
-                    _zR_c = dzs[z]/dzs[z-1]
-                    #
-                    dCdz = FiDiNonUniformDerivative1(
-                        dFdz_C, dzs[z], DIFF1_C_SET, _zR_b)
-                    # d2Fdz2
-                    d2Cdz2 = FiDiNonUniformDerivative2(
-                        d2Fdz2_C, dzs[z], DIFF2_C_SET_G, _zR_c)
-                    # FIXME
-                    checkME = 0
-                elif z == zNo - 1:
-                    # NOTE
-                    # BC2
-                    # backward
-                    Ci_b = SpCoi_z[i][z-1]
-                    Ci_bb = SpCoi_z[i][z-2]
-                    # forward difference
-                    Ci_f = Ci_b
-                    Ci_ff = 0
-                    # function value
-                    dFdz_C = [Ci_b, Ci_c, Ci_f]
-                    d2Fdz2_C = [Ci_bb, Ci_b, Ci_c, Ci_f, Ci_ff]
-                    # dFdz
-                    dCdz = FiDiDerivative1(dFdz_C, dz, DIFF1_C_SET)
-                    # d2Fdz2
-                    d2Cdz2 = FiDiDerivative2(d2Fdz2_C, dz, DIFF2_C_SET_BC2)
-                else:
-                    # NOTE
-                    # normal sections
-                    # interior nodes
-                    # forward
-                    Ci_f = SpCoi_z[i][z+1]
-                    Ci_ff = SpCoi_z[i][z+2] if z < zNo-2 else 0
-                    # backward
-                    Ci_b = SpCoi_z[i][z-1]
-                    Ci_bb = SpCoi_z[i][z-2]
-                    # function value
-                    dFdz_C = [Ci_b, Ci_c, Ci_f]
-                    d2Fdz2_C = [Ci_bb, Ci_b, Ci_c, Ci_f, Ci_ff]
-                    # REVIEW
-                    ### uniform nodes ###
-                    # dFdz
-                    dCdz = FiDiDerivative1(dFdz_C, dz, DIFF1_C_SET)
-                    # d2Fdz2
-                    d2Cdz2 = FiDiDerivative2(d2Fdz2_C, dz, DIFF2_C_SET_G)
+                # NOTE
+                # axial derivatives (BC1, BC2, dense/normal sections)
+                dCdz = dCdz_z[i][z]
+                d2Cdz2 = d2Cdz2_z[i][z]
 
                 # REVIEW
                 # cal differentiate
@@ -2011,119 +1960,10 @@ class PackedBedHeteroReactorClass:
             # T_c
             # T_c = T_z[z]
 
-            # check BC
-            if z == 0 and solverMeshSet is True:
-                # BC1
-                BC1_T_1 = PeNuHe0*dz
-                BC1_T_2 = 1/BC1_T_1
-                # forward
-                T_f = T_z[z+1]
-                T_ff = T_z[z+2]
-                # backward
-                # GaDe_DiLeVa, GaCpMeanMix_DiLeVa, v_z_DiLeVa = 1
-                # T*[0] = (T0 - Tf)/Tf
-                T_0 = 0
-                T_b = (T_0 + BC1_T_2*T_f)/(BC1_T_2 + 1)
-                T_bb = 0
-                # function value
-                dFdz_T = [T_b, T_c, T_f]
-                d2Fdz2_T = [T_bb, T_b, T_c, T_f, T_ff]
-                # dFdz
-                dTdz = FiDiDerivative1(dFdz_T, dz, DIFF1_T_SET)
-                # d2Fdz2
-                d2Tdz2 = FiDiDerivative2(d2Fdz2_T, dz, DIFF2_T_SET_BC1)
-            elif z == 0 and solverMeshSet is False:
-                # BC1
-                BC1_T_1 = PeNuHe0*dzs[z]
-                BC1_T_2 = 1/BC1_T_1
-                # forward
-                T_f = T_z[z+1]
-                T_ff = T_z[z+2]
-                # backward
-                # GaDe_DiLeVa, GaCpMeanMix_DiLeVa, v_z_DiLeVa = 1
-                # T*[0] = (T0 - Tf)/Tf
-                T_0 = 0
-                T_b = (T_0 + BC1_T_2*T_f)/(BC1_T_2 + 1)
-                T_bb = 0
-                # function value
-                dFdz_T = [T_b, T_c, T_f]
-                d2Fdz2_T = [T_bb, T_b, T_c, T_f, T_ff]
-                # REVIEW
-                ### uniform nodes ###
-                # dFdz
-                dTdz = FiDiDerivative1(dFdz_T, dzs[z], DIFF1_T_SET)
-                # d2Fdz2
-                # d2Tdz2 = FiDiDerivative2(d2Fdz2_T, dz, DIFF_T_SET_BC1)
-                # REVIEW
-                ### non-uniform nodes ###
-                # R value
-                _zR_b = 0
-                _zR_c = dzs[z]/dzs[z-1]
-                # d2Fdz2
-                d2Tdz2 = FiDiNonUniformDerivative2(
-                    d2Fdz2_T, dzs[z], DIFF2_T_SET_G, _zR_c)
-                # FIXME
-                checkME = 0
-            elif (z > 0 and z < zNoNoDense) and solverMeshSet is False:
-                # NOTE
-                # dense section
-                # i=2,...,zNoNoDense-1
-                # forward
-                T_f = T_z[z+1]
-                T_ff = T_z[z+2]
-                # backward
-                T_b = T_z[z-1]
-                T_bb = T_z[z-2]
-                # function value
-                dFdz_T = [T_bb, T_b, T_c, T_f, T_ff]
-                d2Fdz2_T = [T_bb, T_b, T_c, T_f, T_ff]
-                # REVIEW
-                ### non-uniform nodes ###
-                # R value
-                _zR_b = dzs[z-2]/dzs[z-1]
-                _zR_c = dzs[z]/dzs[z-1]
-                #
-                dTdz = FiDiNonUniformDerivative1(
-                    dFdz_T, dzs[z], DIFF1_T_SET, _zR_b)
-                # d2Fdz2
-                d2Tdz2 = FiDiNonUniformDerivative2(
-                    d2Fdz2_T, dzs[z], DIFF2_T_SET_G, _zR_c)
-                # FIXME
-                checkME = 0
-            elif z == zNo - 1:
-                # BC2
-                # backward
-                T_b = T_z[z-1]
-                T_bb = T_z[z-2]
-                # forward
-                T_f = T_b
-                T_ff = 0
-                # function value
-                dFdz_T = [T_b, T_c, T_f]
-                d2Fdz2_T = [T_bb, T_b, T_c, T_f, T_ff]
-                # REVIEW
-                ### uniform nodes ###
-                # dFdz
-                dTdz = FiDiDerivative1(dFdz_T, dz, DIFF1_T_SET)
-                # d2Fdz2
-                d2Tdz2 = FiDiDerivative2(d2Fdz2_T, dz, DIFF2_T_SET_BC2)
-            else:
-                # interior nodes
-                # forward
-                T_f = T_z[z+1]
-                T_ff = T_z[z+2] if z < zNo-2 else 0
-                # backward
-                T_b = T_z[z-1]
-                T_bb = T_z[z-2]
-                # function value
-                dFdz_T = [T_b, T_c, T_f]
-                d2Fdz2_T = [T_bb, T_b, T_c, T_f, T_ff]
-                # REVIEW
-                ### uniform nodes ###
-                # dFdz
-                dTdz = FiDiDerivative1(dFdz_T, dz, DIFF1_T_SET)
-                # d2Fdz2
-                d2Tdz2 = FiDiDerivative2(d2Fdz2_T, dz, DIFF2_T_SET_G)
+            # NOTE
+            # axial derivatives (BC1, BC2, dense/normal sections)
+            dTdz = dTdz_z[z]
+            d2Tdz2 = d2Tdz2_z[z]
 
             # REVIEW
             # cal differentiate
@@ -2240,6 +2080,10 @@ class PackedBedHeteroReactorClass:
         comList = FunParam['compList']
         # const ->
         const = FunParam['const']
+        # property tables
+        propTableSet = const['propTableSet']
+        # reaction enthalpy method
+        reactionEnthalpyMethod = const['reactionEnthalpyMethod']
         # cross-sectional area [m^2]
         CrSeAr = const['CrSeAr']
         # component molecular weight [g/mol]
@@ -2353,9 +2197,10 @@ class PackedBedHeteroReactorClass:
 
         # reaction rate expressions
         reactionRateExpr = FunParam['reactionRateExpr']
-        # using equation
-        varisSet = reactionRateExpr['VARS']
-        ratesSet = reactionRateExpr['RATES']
+        # compiled reaction rate set
+        reactionRateSet = FunParam['reactionRateSet']
+        # stoichiometric coefficient matrix
+        reactionStochCoeffMat = FunParam['reactionStochCoeffMat']
 
         # dimensionless analysis params
 
@@ -2658,16 +2503,16 @@ class PackedBedHeteroReactorClass:
 
                 # component formation rate [mol/m^3.s]
                 # check unit
-                r0 = np.array(reactionRateExe(
-                    loopVars0, varisSet, ratesSet))
+                r0 = np.array(reactionRateSet.reactionRateExe(
+                    loopVars0))
 
                 # loop
                 Ri_zr[z, r, :] = r0
                 Ri_r[r, :] = r0
 
                 # component formation rate [kmol/m^3.s]
-                ri_r[r] = componentFormationRate(
-                    compNo, comList, reactionStochCoeff, Ri_r[r])
+                ri_r[r] = componentFormationRateMat(
+                    reactionStochCoeffMat, Ri_r[r])
 
                 # overall formation rate [kmol/m^3.s]
                 OvR[r] = np.sum(ri_r[r])
@@ -2679,7 +2524,7 @@ class PackedBedHeteroReactorClass:
                 # heat capacity at constant pressure of mixture Cp [kJ/kmol.K] | [J/mol.K]
                 # Cp mean list
                 SoCpMeanList = calMeanHeatCapacityAtConstantPressure(
-                    comList, Ts_r_ReVa[r])
+                    comList, Ts_r_ReVa[r], propTableSet=propTableSet)
                 # Cp mixture
                 SoCpMeanMix[r] = calMixtureHeatCapacityAtConstantPressure(
                     MoFrsi_r[r], SoCpMeanList)
@@ -2691,7 +2536,7 @@ class PackedBedHeteroReactorClass:
                 # enthalpy change from Tref to T [kJ/kmol] | [J/mol]
                 # enthalpy change
                 EnChList = np.array(
-                    calEnthalpyChangeOfReaction(reactionListSorted, Ts_r_ReVa[r]))
+                    calEnthalpyChangeOfReaction(reactionListSorted, Ts_r_ReVa[r], method=reactionEnthalpyMethod))
                 # heat of reaction at T [kJ/kmol] | [J/mol]
                 HeReT = np.array(EnChList + StHeRe25)
                 # overall heat of reaction [kJ/m^3.s]
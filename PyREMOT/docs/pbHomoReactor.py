@@ -9,12 +9,13 @@ from scipy.integrate import solve_ivp
 from timeit import default_timer as timer
 from scipy.optimize import fsolve
 from scipy import optimize
+from scipy import sparse
 # internal
 from PyREMOT.docs.modelSetting import MODEL_SETTING, PROCESS_SETTING
 from PyREMOT.docs.rmtUtility import rmtUtilityClass as rmtUtil
 from PyREMOT.docs.rmtThermo import *
 from PyREMOT.docs.fluidFilm import *
-from PyREMOT.docs.rmtReaction import reactionRateExe, componentFormationRate
+from PyREMOT.docs.rmtReaction import componentFormationRateMat, componentFormationRateJacobian, ReactionRateClass
 from PyREMOT.docs.gasTransPor import calGasViscosity, calMixturePropertyM1
 # library
 from PyREMOT.library.plot import plotClass as pltc
@@ -29,7 +30,8 @@ from PyREMOT.core import REACTION_RATE_ACCURACY
 from PyREMOT.core import CONST_EQ_Sh
 # solver
 from PyREMOT.solvers import solverSetting
-from PyREMOT.solvers import AdBash3, PreCorr3
+from PyREMOT.solvers import AdBash3, PreCorr3, DoPri54, BDFSolverClass
+from PyREMOT.solvers.solFiDi import FiDiJacobianPattern
 from PyREMOT.solvers import sortResult4, sortResult5, plotResultsSteadyState, plotResultsDynamic
 from PyREMOT.solvers import printProgressBar
 
@@ -52,11 +54,23 @@ class PackedBedHomoReactorClass:
     # internal data
     _internalData = []
 
-    def __init__(self, modelInput, internalData, reactionListSorted, reactionStochCoeffList):
+    def __init__(self, modelInput, internalData, reactionListSorted, reactionStochCoeffList, reactionRateSet=None, propTableSet=None):
         self.modelInput = modelInput
         self.internalData = internalData
         self.reactionListSorted = reactionListSorted
         self.reactionStochCoeffList = reactionStochCoeffList
+        # reaction rate set (compiled kinetics)
+        self.reactionRateSet = reactionRateSet if reactionRateSet is not None else ReactionRateClass(
+            modelInput['reaction-rates'])
+        # property tables (opt-in, None: exact correlations)
+        self.propTableSet = propTableSet
+        # reaction enthalpy (solver-config: reaction-enthalpy)
+        # MEAN: mean heat capacity (default), INTEGRAL: closed-form integral of dCp
+        self.reactionEnthalpyMethod = modelInput.get(
+            'solver-config', {}).get('reaction-enthalpy', "MEAN")
+        # stoichiometric coefficient matrix [compNo, reactionNo]
+        self.reactionStochCoeffMat = rmtUtil.setReactionCoeffMatrix(
+            modelInput['feed']['components']['shell'], reactionStochCoeffList)
 
     # @property
     # def internalData(cls):
@@ -239,6 +253,8 @@ class PackedBedHomoReactorClass:
         FunParam = {
             "compList": compList,
             "const": {
+                "propTableSet": self.propTableSet,
+                "reactionEnthalpyMethod": self.reactionEnthalpyMethod,
                 "CrSeAr": CrSeAr,
                 "MoWei": MoWei,
                 "StHeRe25": StHeRe25,
@@ -250,7 +266,9 @@ class PackedBedHomoReactorClass:
                 "EfHeTrAr": a,
                 "MeTe": Tm
             },
-            "reactionRateExpr": reactionRateExpr
+            "reactionRateExpr": reactionRateExpr,
+            "reactionRateSet": self.reactionRateSet,
+            "reactionStochCoeffMat": self.reactionStochCoeffMat
         }
 
         # save data
@@ -377,6 +395,10 @@ class PackedBedHomoReactorClass:
         comList = FunParam['compList']
         # const ->
         const = FunParam['const']
+        # property tables
+        propTableSet = const['propTableSet']
+        # reaction enthalpy method
+        reactionEnthalpyMethod = const['reactionEnthalpyMethod']
         # cross-sectional area [m^2]
         CrSeAr = const['CrSeAr']
         # component molecular weight [g/mol]
@@ -397,9 +419,10 @@ class PackedBedHomoReactorClass:
         ExHe = FunParam['ExHe']
         # reaction rate expressions
         reactionRateExpr = FunParam['reactionRateExpr']
-        # using equation
-        varisSet = reactionRateExpr['VARS']
-        ratesSet = reactionRateExpr['RATES']
+        # compiled reaction rate set
+        reactionRateSet = FunParam['reactionRateSet']
+        # stoichiometric coefficient matrix
+        reactionStochCoeffMat = FunParam['reactionStochCoeffMat']
 
         # components no
         # y: component molar flowrate, total molar flux, temperature, pressure
@@ -464,8 +487,8 @@ class PackedBedHomoReactorClass:
 
         # component formation rate [mol/m^3.s]
         # check unit
-        RiLoop = np.array(reactionRateExe(
-            loopVars0, varisSet, ratesSet))
+        RiLoop = np.array(reactionRateSet.reactionRateExe(
+            loopVars0))
         Ri = np.copy(RiLoop)
 
         # component formation rate [mol/m^3.s]
@@ -481,8 +504,8 @@ class PackedBedHomoReactorClass:
         #         ri[k] = _riLoop
 
         # call [mol/m^3.s]
-        ri = componentFormationRate(
-            compNo, comList, reactionStochCoeff, Ri)
+        ri = componentFormationRateMat(
+            reactionStochCoeffMat, Ri)
 
         # overall formation rate [mol/m^3.s]
         OvR = np.sum(ri)
@@ -490,7 +513,7 @@ class PackedBedHomoReactorClass:
         # enthalpy
         # heat capacity at constant pressure of mixture Cp [kJ/kmol.K] | [J/mol.K]
         # Cp mean list
-        CpMeanList = calMeanHeatCapacityAtConstantPressure(comList, T)
+        CpMeanList = calMeanHeatCapacityAtConstantPressure(comList, T, propTableSet=propTableSet)
         # print(f"Cp mean list: {CpMeanList}")
         # Cp mixture
         CpMeanMixture = calMixtureHeatCapacityAtConstantPressure(
@@ -499,7 +522,7 @@ class PackedBedHomoReactorClass:
 
         # enthalpy change from Tref to T [kJ/kmol] | [J/mol]
         # enthalpy change
-        EnChList = np.array(calEnthalpyChangeOfReaction(reactionListSorted, T))
+        EnChList = np.array(calEnthalpyChangeOfReaction(reactionListSorted, T, method=reactionEnthalpyMethod))
         # heat of reaction at T [kJ/kmol] | [J/mol]
         HeReT = np.array(EnChList + StHeRe25)
         # overall heat of reaction [J/m^3.s]
@@ -666,6 +689,8 @@ class PackedBedHomoReactorClass:
         FunParam = {
             "compList": compList,
             "const": {
+                "propTableSet": self.propTableSet,
+                "reactionEnthalpyMethod": self.reactionEnthalpyMethod,
                 "CrSeAr": CrSeAr,
                 "MoWei": MoWei,
                 "StHeRe25": StHeRe25,
@@ -679,6 +704,8 @@ class PackedBedHomoReactorClass:
             "ReSpec": ReSpec,
             "ExHe": ExHe,
             "reactionRateExpr": reactionRateExpr,
+            "reactionRateSet": self.reactionRateSet,
+            "reactionStochCoeffMat": self.reactionStochCoeffMat,
             "constBC1": {
                 "VoFlRa0": VoFlRa0,
                 "SpCoi0": SpCoi0,
@@ -706,27 +733,24 @@ class PackedBedHomoReactorClass:
         # BDF, Radau, LSODA
         solverIVP = "LSODA" if solverIVPSet == 'default' else solverIVPSet
 
-        # time loop
-        for i in range(tNo):
-            # set time span
-            t = np.array([opTSpan[i], opTSpan[i+1]])
-            times = np.linspace(t[0], t[1], timesNo)
-            print(f"time: {t} seconds")
-
-            # ode call
-            sol = solve_ivp(PackedBedHomoReactorClass.modelEquationM2,
-                            t, IV, method=solverIVP, t_eval=times, args=(reactionListSorted, reactionStochCoeff, FunParam))
+        # ode call
+        # single integration over the operation time, the results are saved at opTSpan[1:]
+        print(f"time: {opTSpan[[0, -1]]} seconds")
+        sol = solve_ivp(PackedBedHomoReactorClass.modelEquationM2,
+                        opTSpan[[0, -1]], IV, method=solverIVP, t_eval=opTSpan[1:], args=(reactionListSorted, reactionStochCoeff, FunParam))
 
-            # ode result
-            successStatus = sol.success
-            # check
-            if successStatus is False:
-                raise
+        # ode result
+        successStatus = sol.success
+        # check
+        if successStatus is False:
+            raise
 
+        # time loop
+        for i in range(tNo):
             # time interval
-            dataTime = sol.t
+            dataTime = sol.t[0:i+1]
             # all results
-            dataYs = sol.y
+            dataYs = sol.y[:, 0:i+1]
 
             # component concentration [mol/m^3]
             dataYs1 = dataYs[0:varNoCon, -1]
@@ -755,9 +779,6 @@ class PackedBedHomoReactorClass:
                 # var list
                 dataPacktime[m][i, :] = dataPack[i]['dataYs'][m, :]
 
-            # update initial values [IV]
-            IV = dataYs[:, -1]
-
         # NOTE
         # end of computation
         end = timer()
@@ -878,6 +899,10 @@ class PackedBedHomoReactorClass:
         comList = FunParam['compList']
         # const ->
         const = FunParam['const']
+        # property tables
+        propTableSet = const['propTableSet']
+        # reaction enthalpy method
+        reactionEnthalpyMethod = const['reactionEnthalpyMethod']
         # cross-sectional area [m^2]
         CrSeAr = const['CrSeAr']
         # component molecular weight [g/mol]
@@ -908,9 +933,10 @@ class PackedBedHomoReactorClass:
 
         # reaction rate expressions
         reactionRateExpr = FunParam['reactionRateExpr']
-        # using equation
-        varisSet = reactionRateExpr['VARS']
-        ratesSet = reactionRateExpr['RATES']
+        # compiled reaction rate set
+        reactionRateSet = FunParam['reactionRateSet']
+        # stoichiometric coefficient matrix
+        reactionStochCoeffMat = FunParam['reactionStochCoeffMat']
 
         # zNo
         zNo = const['zNo']
@@ -1062,14 +1088,14 @@ class PackedBedHomoReactorClass:
             # loop
             loopVars0 = (T, P, MoFri, _SpCoi)
             # check unit
-            RiLoop = 1e-3*np.array(reactionRateExe(
-                loopVars0, varisSet, ratesSet))
+            RiLoop = 1e-3*np.array(reactionRateSet.reactionRateExe(
+                loopVars0))
             Ri_z[z, :] = RiLoop
 
             # REVIEW
             # component formation rate [kmol/m^3.s]
-            ri = componentFormationRate(
-                compNo, comList, reactionStochCoeff, Ri_z[z, :])
+            ri = componentFormationRateMat(
+                reactionStochCoeffMat, Ri_z[z, :])
 
             # overall formation rate [kmol/m^3.s]
             OvR = np.sum(ri)
@@ -1078,7 +1104,7 @@ class PackedBedHomoReactorClass:
             # enthalpy
             # heat capacity at constant pressure of mixture Cp [kJ/kmol.K] | [J/mol.K]
             # Cp mean list
-            CpMeanList = calMeanHeatCapacityAtConstantPressure(comList, T)
+            CpMeanList = calMeanHeatCapacityAtConstantPressure(comList, T, propTableSet=propTableSet)
             # print(f"Cp mean list: {CpMeanList}")
             # Cp mixture
             CpMeanMixture = calMixtureHeatCapacityAtConstantPressure(
@@ -1088,7 +1114,7 @@ class PackedBedHomoReactorClass:
             # enthalpy change from Tref to T [kJ/kmol] | [J/mol]
             # enthalpy change
             EnChList = np.array(
-                calEnthalpyChangeOfReaction(reactionListSorted, T))
+                calEnthalpyChangeOfReaction(reactionListSorted, T, method=reactionEnthalpyMethod))
             # heat of reaction at T [kJ/kmol] | [J/mol]
             HeReT = np.array(EnChList + StHeRe25)
             # overall heat of reaction [kJ/m^3.s]
@@ -1259,6 +1285,8 @@ class PackedBedHomoReactorClass:
         FunParam = {
             "compList": compList,
             "const": {
+                "propTableSet": self.propTableSet,
+                "reactionEnthalpyMethod": self.reactionEnthalpyMethod,
                 "CrSeAr": CrSeAr,
                 "MoWei": MoWei,
                 "StHeRe25": StHeRe25,
@@ -1274,6 +1302,8 @@ class PackedBedHomoReactorClass:
                 "T0": T
             },
             "reactionRateExpr": reactionRateExpr,
+            "reactionRateSet": self.reactionRateSet,
+            "reactionStochCoeffMat": self.reactionStochCoeffMat,
         }
 
         # save data
@@ -1392,6 +1422,10 @@ class PackedBedHomoReactorClass:
         comList = FunParam['compList']
         # const ->
         const = FunParam['const']
+        # property tables
+        propTableSet = const['propTableSet']
+        # reaction enthalpy method
+        reactionEnthalpyMethod = const['reactionEnthalpyMethod']
         # cross-sectional area [m^2]
         CrSeAr = const['CrSeAr']
         # component molecular weight [g/mol]
@@ -1427,9 +1461,10 @@ class PackedBedHomoReactorClass:
 
         # reaction rate expressions
         reactionRateExpr = FunParam['reactionRateExpr']
-        # using equation
-        varisSet = reactionRateExpr['VARS']
-        ratesSet = reactionRateExpr['RATES']
+        # compiled reaction rate set
+        reactionRateSet = FunParam['reactionRateSet']
+        # stoichiometric coefficient matrix
+        reactionStochCoeffMat = FunParam['reactionStochCoeffMat']
 
         # calculate
         # molar flowrate [kmol/s]
@@ -1504,8 +1539,8 @@ class PackedBedHomoReactorClass:
         # loop
         loopVars0 = (T, P, MoFri, CoSpi)
         # check unit
-        r0 = np.array(reactionRateExe(
-            loopVars0, varisSet, ratesSet))
+        r0 = np.array(reactionRateSet.reactionRateExe(
+            loopVars0))
 
         # loop
         Ri = r0
@@ -1513,8 +1548,8 @@ class PackedBedHomoReactorClass:
         # component formation rate [mol/m^3.s]
         # rf[mol/kgcat.s]*CaBeDe[kgcat/m^3]
         # call [mol/m^3.s]
-        ri = componentFormationRate(
-            compNo, comList, reactionStochCoeff, Ri)
+        ri = componentFormationRateMat(
+            reactionStochCoeffMat, Ri)
 
         # overall formation rate [mol/m^3.s]
         OvR = np.sum(ri)
@@ -1522,7 +1557,7 @@ class PackedBedHomoReactorClass:
         # enthalpy
         # heat capacity at constant pressure of mixture Cp [kJ/kmol.K] | [J/mol.K]
         # Cp mean list
-        CpMeanList = calMeanHeatCapacityAtConstantPressure(comList, T)
+        CpMeanList = calMeanHeatCapacityAtConstantPressure(comList, T, propTableSet=propTableSet)
         # print(f"Cp mean list: {CpMeanList}")
         # Cp mixture
         CpMeanMixture = calMixtureHeatCapacityAtConstantPressure(
@@ -1531,7 +1566,7 @@ class PackedBedHomoReactorClass:
 
         # enthalpy change from Tref to T [kJ/kmol] | [J/mol]
         # enthalpy change
-        EnChList = np.array(calEnthalpyChangeOfReaction(reactionListSorted, T))
+        EnChList = np.array(calEnthalpyChangeOfReaction(reactionListSorted, T, method=reactionEnthalpyMethod))
         # heat of reaction at T [kJ/kmol] | [J/mol]
         HeReT = np.array(EnChList + StHeRe25)
         # overall heat of reaction [J/m^3.s]
@@ -1674,6 +1709,8 @@ class PackedBedHomoReactorClass:
         FunParam = {
             "compList": compList,
             "const": {
+                "propTableSet": self.propTableSet,
+                "reactionEnthalpyMethod": self.reactionEnthalpyMethod,
                 "CrSeAr": CrSeAr,
                 "MoWei": MoWei,
                 "StHeRe25": StHeRe25,
@@ -1688,7 +1725,9 @@ class PackedBedHomoReactorClass:
                 "P0": P,
                 "T0": T
             },
-            "reactionRateExpr": reactionRateExpr
+            "reactionRateExpr": reactionRateExpr,
+            "reactionRateSet": self.reactionRateSet,
+            "reactionStochCoeffMat": self.reactionStochCoeffMat
         }
 
         # save data
@@ -1803,6 +1842,10 @@ class PackedBedHomoReactorClass:
         comList = FunParam['compList']
         # const ->
         const = FunParam['const']
+        # property tables
+        propTableSet = const['propTableSet']
+        # reaction enthalpy method
+        reactionEnthalpyMethod = const['reactionEnthalpyMethod']
         # cross-sectional area [m^2]
         CrSeAr = const['CrSeAr']
         # component molecular weight [g/mol]
@@ -1838,9 +1881,10 @@ class PackedBedHomoReactorClass:
 
         # reaction rate expressions
         reactionRateExpr = FunParam['reactionRateExpr']
-        # using equation
-        varisSet = reactionRateExpr['VARS']
-        ratesSet = reactionRateExpr['RATES']
+        # compiled reaction rate set
+        reactionRateSet = FunParam['reactionRateSet']
+        # stoichiometric coefficient matrix
+        reactionStochCoeffMat = FunParam['reactionStochCoeffMat']
 
         # calculate
         # molar flowrate [kmol/s]
@@ -1918,8 +1962,8 @@ class PackedBedHomoReactorClass:
         # loop
         loopVars0 = (T, P, MoFri, CoSpi)
         # check unit
-        r0 = np.array(reactionRateExe(
-            loopVars0, varisSet, ratesSet))
+        r0 = np.array(reactionRateSet.reactionRateExe(
+            loopVars0))
 
         # loop
         Ri = r0
@@ -1942,7 +1986,7 @@ class PackedBedHomoReactorClass:
         # enthalpy
         # heat capacity at constant pressure of mixture Cp [kJ/kmol.K] | [J/mol.K]
         # Cp mean list
-        CpMeanList = calMeanHeatCapacityAtConstantPressure(comList, T)
+        CpMeanList = calMeanHeatCapacityAtConstantPressure(comList, T, propTableSet=propTableSet)
         # print(f"Cp mean list: {CpMeanList}")
         # Cp mixture
         CpMeanMixture = calMixtureHeatCapacityAtConstantPressure(
@@ -1951,7 +1995,7 @@ class PackedBedHomoReactorClass:
 
         # enthalpy change from Tref to T [kJ/kmol] | [J/mol]
         # enthalpy change
-        EnChList = np.array(calEnthalpyChangeOfReaction(reactionListSorted, T))
+        EnChList = np.array(calEnthalpyChangeOfReaction(reactionListSorted, T, method=reactionEnthalpyMethod))
         # heat of reaction at T [kJ/kmol] | [J/mol]
         HeReT = np.array(EnChList + StHeRe25)
         # overall heat of reaction [J/m^3.s]
@@ -2139,6 +2183,8 @@ class PackedBedHomoReactorClass:
         FunParam = {
             "compList": compList,
             "const": {
+                "propTableSet": self.propTableSet,
+                "reactionEnthalpyMethod": self.reactionEnthalpyMethod,
                 "CrSeAr": CrSeAr,
                 "MoWei": MoWei,
                 "StHeRe25": StHeRe25,
@@ -2163,7 +2209,9 @@ class PackedBedHomoReactorClass:
                 "T0": T,
                 "SuGaVe0": SuGaVe0
             },
-            "reactionRateExpr": reactionRateExpr
+            "reactionRateExpr": reactionRateExpr,
+            "reactionRateSet": self.reactionRateSet,
+            "reactionStochCoeffMat": self.reactionStochCoeffMat
         }
 
         # time span
@@ -2185,27 +2233,24 @@ class PackedBedHomoReactorClass:
         # BDF, Radau, LSODA
         solverIVP = "LSODA" if solverIVPSet == 'default' else solverIVPSet
 
-        # time loop
-        for i in range(tNo):
-            # set time span
-            t = np.array([opTSpan[i], opTSpan[i+1]])
-            times = np.linspace(t[0], t[1], timesNo)
-            print(f"time: {t} seconds")
-
-            # ode call
-            sol = solve_ivp(PackedBedHomoReactorClass.modelEquationM5,
-                            t, IV, method=solverIVP, t_eval=times, args=(reactionListSorted, reactionStochCoeff, FunParam))
+        # ode call
+        # single integration over the operation time, the results are saved at opTSpan[1:]
+        print(f"time: {opTSpan[[0, -1]]} seconds")
+        sol = solve_ivp(PackedBedHomoReactorClass.modelEquationM5,
+                        opTSpan[[0, -1]], IV, method=solverIVP, t_eval=opTSpan[1:], args=(reactionListSorted, reactionStochCoeff, FunParam))
 
-            # ode result
-            successStatus = sol.success
-            # check
-            if successStatus is False:
-                raise
+        # ode result
+        successStatus = sol.success
+        # check
+        if successStatus is False:
+            raise
 
+        # time loop
+        for i in range(tNo):
             # time interval
-            dataTime = sol.t
+            dataTime = sol.t[0:i+1]
             # all results
-            dataYs = sol.y
+            dataYs = sol.y[:, 0:i+1]
 
             # component concentration [kmol/m^3]
             dataYs1 = dataYs[0:varNoCon, -1]
@@ -2234,9 +2279,6 @@ class PackedBedHomoReactorClass:
                 # var list
                 dataPacktime[m][i, :] = dataPack[i]['dataYs'][m, :]
 
-            # update initial values [IV]
-            IV = dataYs[:, -1]
-
         # NOTE
         # end of computation
         end = timer()
@@ -2358,6 +2400,10 @@ class PackedBedHomoReactorClass:
         comList = FunParam['compList']
         # const ->
         const = FunParam['const']
+        # property tables
+        propTableSet = const['propTableSet']
+        # reaction enthalpy method
+        reactionEnthalpyMethod = const['reactionEnthalpyMethod']
         # cross-sectional area [m^2]
         CrSeAr = const['CrSeAr']
         # component molecular weight [g/mol]
@@ -2408,9 +2454,10 @@ class PackedBedHomoReactorClass:
 
         # reaction rate expressions
         reactionRateExpr = FunParam['reactionRateExpr']
-        # using equation
-        varisSet = reactionRateExpr['VARS']
-        ratesSet = reactionRateExpr['RATES']
+        # compiled reaction rate set
+        reactionRateSet = FunParam['reactionRateSet']
+        # stoichiometric coefficient matrix
+        reactionStochCoeffMat = FunParam['reactionStochCoeffMat']
 
         # calculate
         # molar flowrate [kmol/s]
@@ -2554,8 +2601,8 @@ class PackedBedHomoReactorClass:
             # loop
             loopVars0 = (T_z[z], P_z[z], MoFri, CoSpi)
             # check unit
-            r0 = np.array(reactionRateExe(
-                loopVars0, varisSet, ratesSet))
+            r0 = np.array(reactionRateSet.reactionRateExe(
+                loopVars0))
             # r0 = np.copy(RiLoop)
 
             # loop
@@ -2564,8 +2611,8 @@ class PackedBedHomoReactorClass:
             # REVIEW
             # component formation rate [kmol/m^3.s]
             # call
-            ri = componentFormationRate(
-                compNo, comList, reactionStochCoeff, Ri_z[z, :])
+            ri = componentFormationRateMat(
+                reactionStochCoeffMat, Ri_z[z, :])
 
             # overall formation rate [kmol/m^3.s]
             OvR = np.sum(ri)
@@ -2574,7 +2621,7 @@ class PackedBedHomoReactorClass:
             # enthalpy
             # heat capacity at constant pressure of mixture Cp [kJ/kmol.K] | [J/mol.K]
             # Cp mean list
-            CpMeanList = calMeanHeatCapacityAtConstantPressure(comList, T)
+            CpMeanList = calMeanHeatCapacityAtConstantPressure(comList, T, propTableSet=propTableSet)
             # print(f"Cp mean list: {CpMeanList}")
             # Cp mixture
             CpMeanMixture = calMixtureHeatCapacityAtConstantPressure(
@@ -2584,7 +2631,7 @@ class PackedBedHomoReactorClass:
             # enthalpy change from Tref to T [kJ/kmol] | [J/mol]
             # enthalpy change
             EnChList = np.array(
-                calEnthalpyChangeOfReaction(reactionListSorted, T))
+                calEnthalpyChangeOfReaction(reactionListSorted, T, method=reactionEnthalpyMethod))
             # heat of reaction at T [kJ/kmol] | [J/mol]
             HeReT = np.array(EnChList + StHeRe25)
             # overall heat of reaction [kJ/m^3.s]
@@ -2779,12 +2826,12 @@ class PackedBedHomoReactorClass:
 
         # gas mixture viscosity [Pa.s]
         # GaMiVi = self.modelInput['feed']['mixture-viscosity']
-        GaVii0 = calGasViscosity(compList, T)
+        GaVii0 = calGasViscosity(compList, T, propTableSet=self.propTableSet)
         GaMiVi = calMixturePropertyM1(compNo, GaVii0, MoFri0, MoWei)
 
         # heat capacity at constant pressure of mixture Cp [kJ/kmol.K] | [J/mol.K]
         # Cp mean list
-        GaCpMeanList0 = calMeanHeatCapacityAtConstantPressure(compList, T)
+        GaCpMeanList0 = calMeanHeatCapacityAtConstantPressure(compList, T, propTableSet=self.propTableSet)
         # Cp mixture
         GaCpMeanMix0 = calMixtureHeatCapacityAtConstantPressure(
             MoFri0, GaCpMeanList0)
@@ -2869,6 +2916,8 @@ class PackedBedHomoReactorClass:
         FunParam = {
             "compList": compList,
             "const": {
+                "propTableSet": self.propTableSet,
+                "reactionEnthalpyMethod": self.reactionEnthalpyMethod,
                 "CrSeAr": CrSeAr,
                 "MoWei": MoWei,
                 "StHeRe25": StHeRe25,
@@ -2891,6 +2940,8 @@ class PackedBedHomoReactorClass:
                 "GaCpMeanMix0": GaCpMeanMix0
             },
             "reactionRateExpr": reactionRateExpr,
+            "reactionRateSet": self.reactionRateSet,
+            "reactionStochCoeffMat": self.reactionStochCoeffMat,
 
         }
 
@@ -3060,6 +3111,10 @@ class PackedBedHomoReactorClass:
         comList = FunParam['compList']
         # const ->
         const = FunParam['const']
+        # property tables
+        propTableSet = const['propTableSet']
+        # reaction enthalpy method
+        reactionEnthalpyMethod = const['reactionEnthalpyMethod']
         # cross-sectional area [m^2]
         CrSeAr = const['CrSeAr']
         # component molecular weight [g/mol]
@@ -3101,9 +3156,10 @@ class PackedBedHomoReactorClass:
 
         # reaction rate expressions
         reactionRateExpr = FunParam['reactionRateExpr']
-        # using equation
-        varisSet = reactionRateExpr['VARS']
-        ratesSet = reactionRateExpr['RATES']
+        # compiled reaction rate set
+        reactionRateSet = FunParam['reactionRateSet']
+        # stoichiometric coefficient matrix
+        reactionStochCoeffMat = FunParam['reactionStochCoeffMat']
 
         # dimensionless analysis params
         #  feed species concentration [mol/m^3]
@@ -3225,8 +3281,8 @@ class PackedBedHomoReactorClass:
         # loop
         loopVars0 = (T_ReVa, P_ReVa, MoFri, CoSpi_ReVa)
         # check unit
-        r0 = np.array(reactionRateExe(
-            loopVars0, varisSet, ratesSet))
+        r0 = np.array(reactionRateSet.reactionRateExe(
+            loopVars0))
 
         # loop
         Ri = r0
@@ -3234,8 +3290,8 @@ class PackedBedHomoReactorClass:
         # component formation rate [mol/m^3.s]
         # rf[mol/kgcat.s]*CaBeDe[kgcat/m^3]
         # call [mol/m^3.s]
-        ri = componentFormationRate(
-            compNo, comList, reactionStochCoeff, Ri)
+        ri = componentFormationRateMat(
+            reactionStochCoeffMat, Ri)
 
         # overall formation rate [mol/m^3.s]
         OvR = np.sum(ri)
@@ -3243,7 +3299,7 @@ class PackedBedHomoReactorClass:
         # enthalpy
         # heat capacity at constant pressure of mixture Cp [kJ/kmol.K] | [J/mol.K]
         # Cp mean list
-        CpMeanList = calMeanHeatCapacityAtConstantPressure(comList, T_ReVa)
+        CpMeanList = calMeanHeatCapacityAtConstantPressure(comList, T_ReVa, propTableSet=propTableSet)
         # print(f"Cp mean list: {CpMeanList}")
         # Cp mixture
         GaCpMeanMix = calMixtureHeatCapacityAtConstantPressure(
@@ -3259,7 +3315,7 @@ class PackedBedHomoReactorClass:
         # enthalpy change from Tref to T [kJ/kmol] | [J/mol]
         # enthalpy change
         EnChList = np.array(calEnthalpyChangeOfReaction(
-            reactionListSorted, T_ReVa))
+            reactionListSorted, T_ReVa, method=reactionEnthalpyMethod))
         # heat of reaction at T [kJ/kmol] | [J/mol]
         HeReT = np.array(EnChList + StHeRe25)
         # overall heat of reaction [J/m^3.s]
@@ -3336,6 +3392,8 @@ class PackedBedHomoReactorClass:
         solverIVPSet = solverConfig['ivp']
         displayResultGet = solverConfig['display-result']
         displayResult = True if displayResultGet == "True" else False
+        # jacobian: numerical (solver finite difference) | analytic
+        jacobianSet = solverConfig.get('jacobian', 'numerical')
 
         # operating conditions
         P = self.modelInput['operating-conditions']['pressure']
@@ -3412,12 +3470,12 @@ class PackedBedHomoReactorClass:
 
         # gas mixture viscosity [Pa.s]
         # GaMiVi = self.modelInput['feed']['mixture-viscosity']
-        GaVii0 = calGasViscosity(compList, T)
+        GaVii0 = calGasViscosity(compList, T, propTableSet=self.propTableSet)
         GaMiVi = calMixturePropertyM1(compNo, GaVii0, MoFri0, MoWei)
 
         # heat capacity at constant pressure of mixture Cp [kJ/kmol.K] | [J/mol.K]
         # Cp mean list
-        GaCpMeanList0 = calMeanHeatCapacityAtConstantPressure(compList, T)
+        GaCpMeanList0 = calMeanHeatCapacityAtConstantPressure(compList, T, propTableSet=self.propTableSet)
         # Cp mixture
         GaCpMeanMix0 = calMixtureHeatCapacityAtConstantPressure(
             MoFri0, GaCpMeanList0)
@@ -3506,10 +3564,27 @@ class PackedBedHomoReactorClass:
         StHeRe25 = np.array(
             list(map(calStandardEnthalpyOfReaction, reactionList)))
 
+        # NOTE
+        # reaction network
+        # components each reaction rate depends on (feed state)
+        reactionDepPattern = self.reactionRateSet.reactionDependencyPattern(
+            (T, P, MoFri0, SpCoi0))
+        # coupling of the variables of a node (Ci, T)
+        # dri/dCj from the stoichiometry and the rate dependency, convective term (diagonal)
+        nodePattern = np.identity(varNo, dtype=bool)
+        nodePattern[0:compNo, 0:compNo] |= rmtUtil.buildReactionJacobianPattern(
+            self.reactionStochCoeffMat, reactionDepPattern).toarray()
+        # temperature
+        if processType != PROCESS_SETTING['ISO-THER']:
+            nodePattern[indexTemp, :] = True
+            nodePattern[:, indexTemp] = True
+
         # fun parameters
         FunParam = {
             "compList": compList,
             "const": {
+                "propTableSet": self.propTableSet,
+                "reactionEnthalpyMethod": self.reactionEnthalpyMethod,
                 "CrSeAr": CrSeAr,
                 "MoWei": MoWei,
                 "StHeRe25": StHeRe25,
@@ -3536,7 +3611,10 @@ class PackedBedHomoReactorClass:
                 "GaDe0": GaDe0,
                 "GaCpMeanMix0": GaCpMeanMix0
             },
-            "reactionRateExpr": reactionRateExpr
+            "reactionRateExpr": reactionRateExpr,
+            "reactionRateSet": self.reactionRateSet,
+            "reactionStochCoeffMat": self.reactionStochCoeffMat,
+            "reactionDepPattern": reactionDepPattern
         }
 
         # dimensionless analysis parameters
@@ -3568,6 +3646,9 @@ class PackedBedHomoReactorClass:
         dataPacktime = np.zeros((varNo, tNo, zNo))
         #
 
+        # in-house ode solver (ivp: AM)
+        odeSolverMethod = solverSetting['T1']['ode-solver']['method']
+        odeSolverOptions = solverSetting['T1']['ode-solver']['DoPri54']
         # FIXME
         n = solverSetting['T1']['ode-solver']['PreCorr3']['n']
 
@@ -3578,6 +3659,29 @@ class PackedBedHomoReactorClass:
         paramsSet = (reactionListSorted, reactionStochCoeff,
                      FunParam, DimensionlessAnalysisParams, processType)
         funSet = PackedBedHomoReactorClass.modelEquationN2
+        # analytic jacobian (implicit solvers)
+        jacSet = PackedBedHomoReactorClass.jacobianN2 if jacobianSet == 'analytic' and solverIVP in (
+            "BDF", "Radau", "LSODA") else None
+        # jacobian sparsity (numerical jacobian, BDF, Radau | ivp: AM, method: BDF)
+        # upwind difference along the reactor length, the variables of a node are
+        # coupled by the reaction network (nodePattern),
+        # pressure (ergun equation) is integrated from the inlet, the gas density
+        # depends on the concentrations and temperature of all upstream nodes,
+        # jacobian columns are evaluated in one call (vectorized rhs)
+        jacPattern = FiDiJacobianPattern(
+            1, varNoRows, varNoColumns, 1, None, list(range(varNoRows)), rowPattern=nodePattern)
+        jacOptions = {
+            "jac_sparsity": jacPattern,
+            "vectorized": True
+        } if jacSet is None and solverIVP in ("BDF", "Radau") else {}
+        # in-house stiff solver (ivp: AM, method: BDF)
+        # kept over the time loop, the jacobian/LU factorization is reused between time spans
+        # the analytic jacobian is sparse (csr) for large reaction networks
+        stiffSolver = (BDFSolverClass(funSet, paramsSet, jac=PackedBedHomoReactorClass.jacobianN2,
+                                      jacType="sparse" if sparse.issparse(self.reactionStochCoeffMat) else "dense",
+                                      **solverSetting['T1']['ode-solver']['BDF']) if jacobianSet == 'analytic' else
+                       BDFSolverClass(funSet, paramsSet, jacType="sparse", jacSparsity=jacPattern,
+                                      **solverSetting['T1']['ode-solver']['BDF'])) if solverIVP == "AM" and odeSolverMethod == "BDF" else None
 
         # NOTE
         # progress-bar
@@ -3585,11 +3689,19 @@ class PackedBedHomoReactorClass:
         printProgressBar(0, tNo+1, prefix='Progress:',
                          suffix='Complete', length=50)
 
+        # ode call
+        # single integration over the operation time, the results are saved at opTSpan[1:]
+        if solverIVP != "AM":
+            solIVP = solve_ivp(funSet,
+                               opTSpan[[0, -1]], IV, method=solverIVP, t_eval=opTSpan[1:], jac=jacSet, args=(paramsSet,), **jacOptions)
+            # check
+            if solIVP.success is False:
+                raise
+
         # time loop
         for i in range(tNo):
             # set time span
             t = np.array([opTSpan[i], opTSpan[i+1]])
-            times = np.linspace(t[0], t[1], timesNo)
             # print(f"time ivp: {t} seconds")
             printProgressBar(i + 1, tNo+1, prefix='Progress:',
                              suffix='Complete', length=50)
@@ -3597,8 +3709,13 @@ class PackedBedHomoReactorClass:
             # ode call
             if solverIVP == "AM":
                 # sol = AdBash3(t[0], t[1], n, IV, funSet, paramsSet)
-                # PreCorr3
-                sol = PreCorr3(t[0], t[1], n, IV, funSet, paramsSet)
+                # DoPri54 (adaptive), PreCorr3 (fixed-step)
+                # BDF (stiff, jacobian/LU reuse over the time loop)
+                if odeSolverMethod == "BDF":
+                    sol = stiffSolver.solve(t[0], t[1], IV)
+                else:
+                    sol = DoPri54(t[0], t[1], IV, funSet, paramsSet, **odeSolverOptions) if odeSolverMethod == "DoPri54" else PreCorr3(
+                        t[0], t[1], n, IV, funSet, paramsSet)
                 successStatus = True
                 # time interval
                 dataTime = t
@@ -3606,19 +3723,14 @@ class PackedBedHomoReactorClass:
                 # components, temperature layers
                 dataYs = sol
             else:
-                sol = solve_ivp(funSet,
-                                t, IV, method=solverIVP, t_eval=times, args=(paramsSet,))
                 # ode result
-                successStatus = sol.success
-                # check
-                if successStatus is False:
-                    raise
+                successStatus = solIVP.success
                 # time interval
-                dataTime = sol.t
+                dataTime = solIVP.t[0:i+1]
                 dataShape = np.array(dataTime[-1]).shape
                 # all results
                 # components, temperature layers
-                dataYs = sol.y
+                dataYs = solIVP.y[:, 0:i+1]
 
             # check
             if successStatus is False:
@@ -3707,6 +3819,7 @@ class PackedBedHomoReactorClass:
         """
             [dynamic modeling]
             mass, energy, and momentum balance equations
+                y: state (Ci, T) flatten, shape: (varNoT,) | (varNoT, k) (vectorized)
             modelParameters:
                 reactionListSorted: reactant/product and coefficient lists
                 reactionStochCoeff: reaction stoichiometric coefficient
@@ -3744,6 +3857,10 @@ class PackedBedHomoReactorClass:
         comList = FunParam['compList']
         # const ->
         const = FunParam['const']
+        # property tables
+        propTableSet = const['propTableSet']
+        # reaction enthalpy method
+        reactionEnthalpyMethod = const['reactionEnthalpyMethod']
         # cross-sectional area [m^2]
         CrSeAr = const['CrSeAr']
         # component molecular weight [g/mol]
@@ -3798,9 +3915,10 @@ class PackedBedHomoReactorClass:
 
         # reaction rate expressions
         reactionRateExpr = FunParam['reactionRateExpr']
-        # using equation
-        varisSet = reactionRateExpr['VARS']
-        ratesSet = reactionRateExpr['RATES']
+        # compiled reaction rate set
+        reactionRateSet = FunParam['reactionRateSet']
+        # stoichiometric coefficient matrix
+        reactionStochCoeffMat = FunParam['reactionStochCoeffMat']
 
         # dimensionless analysis params
         #  feed species concentration [mol/m^3]
@@ -3825,211 +3943,137 @@ class PackedBedHomoReactorClass:
         GaHeCoTe0 = DimensionlessAnalysisParams['GaHeCoTe0']
 
         # calculate
-        # molar flowrate [mol/s]
-        MoFlRa0 = SpCo0*VoFlRa0
         # superficial gas velocity [m/s]
         InGaVe0 = VoFlRa0/(CrSeAr*BeVoFr)
         # interstitial gas velocity [m/s]
         SuGaVe0 = InGaVe0*BeVoFr
 
-        # superficial gas velocity [m/s]
-        InGaVeList_z = np.zeros(zNo)
-        InGaVeList_z[0] = InGaVe0
-
-        # total molar flux [mol/m^2.s]
-        MoFl_z = np.zeros(zNo)
-        MoFl_z[0] = MoFlRa0
-
-        # reaction rate
-        Ri_z = np.zeros((zNo, reactionListNo))
-
-        # pressure [Pa]
-        P_z = np.zeros(zNo + 1)
-        P_z[0] = P0
-
-        # superficial gas velocity [m/s]
-        v_z = np.zeros(zNo + 1)
-        v_z[0] = SuGaVe0
-
         # components no
-        # y: component molar concentration, temperature, pressure
+        # y: component molar concentration, temperature
         compNo = len(comList)
         indexT = compNo
-        indexP = indexT + 1
-        indexV = indexP + 1
-
-        # species concentration [mol/m^3]
-        CoSpi = np.zeros(compNo)
-        # dimensionless analysis: real value
-        CoSpi_ReVa = np.zeros(compNo)
-
-        # reaction rate
-        ri = np.zeros(compNo)
-        ri0 = np.zeros(compNo)
 
         # NOTE
         # distribute y[i] value through the reactor length
-        # reshape
-        yLoop = np.reshape(y, (varNo, zNo))
+        # vectorized mode: y shape (varNoT, k), k state vectors per call
+        vecSet = np.ndim(y) == 2
+        # reshape, shape: (varNo, zNo, k)
+        yLoop = np.reshape(y, (varNo, zNo, -1))
+        # number of state vectors
+        colNo = yLoop.shape[2]
 
         # -> concentration [mol/m^3]
-        SpCoi_z = np.zeros((compNo, zNo))
-        for i in range(compNo):
-            _SpCoi = yLoop[i, :]
-            SpCoi_z[i, :] = _SpCoi
+        SpCoi_z = yLoop[0:compNo]
 
         # temperature [K]
-        T_z = np.zeros(zNo)
-        T_z = yLoop[indexT,
-                    :] if processType != PROCESS_SETTING['ISO-THER']else np.repeat(0, zNo)
+        T_z = yLoop[indexT] if processType != PROCESS_SETTING['ISO-THER'] else np.zeros(
+            (zNo, colNo))
 
         # diff/dt
-        # dxdt = []
-        dxdtMat = np.zeros((varNo, zNo))
+        dxdtMat = np.zeros((varNo, zNo, colNo))
 
         # NOTE
-        # define ode equations for each finite difference [zNo]
-        for z in range(zNo):
-            ## block ##
-
-            # FIXME
-            # concentration species [mol/m^3]
-            for i in range(compNo):
-                _SpCoi_z = SpCoi_z[i][z]
-                CoSpi[i] = max(_SpCoi_z, CONST.EPS_CONST)
-                # dimensionless analysis: real value
-                SpCoi0_Set = SpCoi0 if MODEL_SETTING['GaMaCoTe0'] != "MAX" else np.max(
-                    SpCoi0)
-                CoSpi_ReVa[i] = rmtUtil.calRealDiLessValue(
-                    CoSpi[i], SpCoi0_Set)
-
-            # total concentration [mol/m^3]
-            CoSp = np.sum(CoSpi)
-            # dimensionless analysis: real value
-            CoSp_ReVa = np.sum(CoSpi_ReVa)
-
-            # temperature [K]
-            T = T_z[z]
-            # dimensionless analysis: real value
-            T_ReVa = rmtUtil.calRealDiLessValue(T, Tf, "TEMP")
-            # pressure [Pa]
-            P = P_z[z]
-            # dimensionless analysis
-            P_DiLeVa = P/Pf
-
-            # velocity
-            v = v_z[z]
-            # dimensionless analysis
-            v_DiLeVa = v/vf
-
-            ## calculate ##
-            # mole fraction
-            MoFri = np.array(
-                rmtUtil.moleFractionFromConcentrationSpecies(CoSpi_ReVa))
-
-            # TODO
-            # dv/dz
-            # gas velocity based on interstitial velocity [m/s]
-            # InGaVe = rmtUtil.calGaVeFromEOS(InGaVe0, SpCo0, CoSp, P0, P)
-            # superficial gas velocity [m/s]
-            # SuGaVe = InGaVe*BeVoFr
-            # from ode eq. dv/dz
-            SuGaVe = v
-            # dimensionless analysis
-            SuGaVe_DiLeVa = SuGaVe/SuGaVe0
-            # gas velocity based on interstitial velocity [m/s]
-            InGaVe = SuGaVe/BeVoFr
-            # dimensionless analysis
-            InGaVe_DiLeVa = rmtUtil.calDiLessValue(InGaVe, InGaVe0)
-
-            # total flowrate [mol/s]
-            # [kmol/m^3]*[m/s]*[m^2]
-            MoFlRa = CoSp_ReVa*SuGaVe*CrSeAr
-            # molar flowrate list [mol/s]
-            MoFlRai = MoFlRa*MoFri
-            # convert to [mol/s]
-            MoFlRai_Con1 = 1000*MoFlRai
-
-            # molar flux [kmol/m^2.s]
-            MoFl = MoFlRa/CrSeAr
-
-            # volumetric flowrate [m^3/s]
-            VoFlRai = calVolumetricFlowrateIG(P, T_ReVa, MoFlRai)
-
-            # mixture molecular weight [kg/mol]
-            MiMoWe = rmtUtil.mixtureMolecularWeight(MoFri, MoWei, "kg/mol")
+        ### all nodes ###
+        # concentration scale [mol/m^3]
+        SpCoi0_Set_z = SpCoi0 if MODEL_SETTING['GaMaCoTe0'] != "MAX" else np.repeat(
+            np.max(SpCoi0), compNo)
+        SpCoi0_Set_z = np.reshape(SpCoi0_Set_z, (compNo, 1, 1))
+        # concentration species [mol/m^3]
+        CoSpi_z_ReVa = np.maximum(SpCoi_z, CONST.EPS_CONST)*SpCoi0_Set_z
+        # mole fraction, shape: (compNo, zNo, k)
+        MoFri_z = CoSpi_z_ReVa/np.sum(CoSpi_z_ReVa, axis=0)
+        # mixture molecular weight [kg/mol]
+        MiMoWe_z = rmtUtil.mixtureMolecularWeightMat(MoFri_z, MoWei, "kg/mol")
 
-            # gas density [kg/m^3]
-            GaDe = calDensityIG(MiMoWe, CoSp_ReVa)
-            GaDeEOS = calDensityIGFromEOS(P, T_ReVa, MiMoWe)
-            # dimensionless value
-            GaDe_DiLeVa = rmtUtil.calDiLessValue(GaDeEOS, GaDe0)
+        # temperature [K]
+        T_z_ReVa = rmtUtil.calRealDiLessValue(T_z, Tf, "TEMP")
+        # heat capacity at constant pressure of mixture Cp [kJ/kmol.K] | [J/mol.K]
+        # Cp mean list, shape: (compNo, zNo, k)
+        CpMeanList_z = calMeanHeatCapacityAtConstantPressure(
+            comList, T_z_ReVa, propTableSet=propTableSet)
+        # Cp mixture
+        GaCpMeanMix_z = calMixtureHeatCapacityAtConstantPressureMat(
+            MoFri_z, CpMeanList_z)
+        # enthalpy change from Tref to T [kJ/kmol] | [J/mol]
+        # shape: (reactionListNo, zNo, k)
+        EnChList_z = calEnthalpyChangeOfReaction(reactionListSorted, T_z_ReVa, method=reactionEnthalpyMethod)
 
-            # NOTE
-            # ergun equation
-            ergA = 150*GaMiVi*SuGaVe/(PaDi**2)
-            ergB = ((1-BeVoFr)**2)/(BeVoFr**3)
-            ergC = 1.75*GaDeEOS*(SuGaVe**2)/PaDi
-            ergD = (1-BeVoFr)/(BeVoFr**3)
-            RHS_ergun = -1*(ergA*ergB + ergC*ergD)
+        # TODO
+        # dv/dz
+        # superficial gas velocity [m/s]
+        # velocity is constant along the reactor length (v_z[z+1] = v_z[z])
+        SuGaVe = SuGaVe0
+        # dimensionless analysis
+        v_DiLeVa = SuGaVe/vf
+        # gas velocity based on interstitial velocity [m/s]
+        InGaVe = SuGaVe/BeVoFr
+        # dimensionless analysis
+        InGaVe_DiLeVa = rmtUtil.calDiLessValue(InGaVe, InGaVe0)
 
-            # momentum balance (ergun equation)
-            dxdt_P = RHS_ergun
-            # dxdt.append(dxdt_P)
+        # NOTE
+        # ergun equation
+        ergA = 150*GaMiVi*SuGaVe/(PaDi**2)
+        ergB = ((1-BeVoFr)**2)/(BeVoFr**3)
+        ergD = (1-BeVoFr)/(BeVoFr**3)
+        # pressure [Pa]
+        P_z = np.zeros((zNo + 1, colNo))
+        P_z[0] = P0
+        # gas density [kg/m^3]
+        GaDeEOS_z = np.zeros((zNo, colNo))
+        # momentum balance (ergun equation)
+        # pressure depends on the upstream nodes
+        for z in range(zNo):
+            GaDeEOS_z[z] = calDensityIGFromEOS(
+                P_z[z], T_z_ReVa[z], MiMoWe_z[z])
+            ergC = 1.75*GaDeEOS_z[z]*(SuGaVe**2)/PaDi
+            dxdt_P = -1*(ergA*ergB + ergC*ergD)
             P_z[z+1] = dxdt_P*dz + P_z[z]
+        # dimensionless value
+        GaDe_DiLeVa = rmtUtil.calDiLessValue(GaDeEOS_z, GaDe0)
 
-            # NOTE
-            ## kinetics ##
-            # net reaction rate expression [kmol/m^3.s]
-            # rf[kmol/kgcat.s]*CaBeDe[kgcat/m^3]
-            # r0 = np.array(PackedBedReactorClass.modelReactions(
-            #     P_z[z], T_z[z], MoFri, CaBeDe))
-
-            # loop
-            loopVars0 = (T_ReVa, P_z[z], MoFri, CoSpi_ReVa)
-            # check unit
-            r0 = np.array(reactionRateExe(
-                loopVars0, varisSet, ratesSet))
-
-            # loop
-            Ri_z[z, :] = r0
+        # NOTE
+        ## kinetics ##
+        # net reaction rate expression [kmol/m^3.s]
+        # shape: (reactionListNo, zNo, k)
+        loopVars0 = (T_z_ReVa, P_z[0:zNo], MoFri_z, CoSpi_z_ReVa)
+        Ri_z = reactionRateSet.reactionRateExeGrid(loopVars0)
 
-            # REVIEW
-            # component formation rate [mol/m^3.s]
-            # call
-            ri = componentFormationRate(
-                compNo, comList, reactionStochCoeff, Ri_z[z, :])
+        # REVIEW
+        # component formation rate [mol/m^3.s]
+        # shape: (compNo, zNo, k)
+        ri_z = np.moveaxis(componentFormationRateMat(
+            reactionStochCoeffMat, np.moveaxis(Ri_z, 0, -1)), -1, 0)
 
-            # overall formation rate [kmol/m^3.s]
-            OvR = np.sum(ri)
+        # NOTE
+        # mass balance (backward difference)
+        # loop vars
+        const_F1 = 1/(BeVoFr*(zf/vf))
+        # BC1
+        Ci_b_z = np.zeros((compNo, zNo, colNo))
+        Ci_b_z[:, 0, :] = np.reshape(SpCoi0/np.max(SpCoi0), (compNo, 1))
+        # interior nodes
+        Ci_b_z[:, 1:, :] = np.maximum(SpCoi_z[:, :-1, :], CONST.EPS_CONST)
+        # backward difference
+        dCdz = (SpCoi_z - Ci_b_z)/dz
+        # mass balance
+        dxdtMat[0:compNo] = const_F1*(-v_DiLeVa*dCdz +
+                                      (ri_z/np.reshape(GaMaCoTe0, (compNo, 1, 1))))
 
+        # energy balance (temperature) [K]
+        if processType != PROCESS_SETTING['ISO-THER']:
             # NOTE
             # enthalpy
-            # heat capacity at constant pressure of mixture Cp [kJ/kmol.K] | [J/mol.K]
-            # Cp mean list
-            CpMeanList = calMeanHeatCapacityAtConstantPressure(comList, T_ReVa)
-            # print(f"Cp mean list: {CpMeanList}")
-            # Cp mixture
-            GaCpMeanMix = calMixtureHeatCapacityAtConstantPressure(
-                MoFri, CpMeanList)
             # dimensionless analysis
             GaCpMeanMix_DiLeVa = rmtUtil.calDiLessValue(
-                GaCpMeanMix, GaCpMeanMix0)
-            # effective heat capacity - gas phase [kJ/kmol.K] | [J/mol.K]
-            GaCpMeanMixEff = GaCpMeanMix*BeVoFr
-            # dimensionless analysis
+                GaCpMeanMix_z, GaCpMeanMix0)
+            # effective heat capacity - gas phase
             GaCpMeanMixEff_DiLeVa = GaCpMeanMix_DiLeVa*BeVoFr
-
-            # enthalpy change from Tref to T [kJ/kmol] | [J/mol]
-            # enthalpy change
-            EnChList = np.array(
-                calEnthalpyChangeOfReaction(reactionListSorted, T_ReVa))
             # heat of reaction at T [kJ/kmol] | [J/mol]
-            HeReT = np.array(EnChList + StHeRe25)
+            HeReT_z = EnChList_z + np.reshape(StHeRe25, (-1, 1, 1))
             # overall heat of reaction [J/m^3.s]
             # exothermic reaction (negative sign)
             # endothermic sign (positive sign)
-            OvHeReT = np.dot(Ri_z[z, :], HeReT)
+            OvHeReT_z = np.sum(Ri_z*HeReT_z, axis=0)
 
             # NOTE
             # cooling temperature [K]
@@ -4038,97 +4082,254 @@ class PackedBedHomoReactorClass:
             U = ExHe['OvHeTrCo']
             # heat transfer area over volume [m2/m3]
             a = ExHe['EfHeTrAr']
-            # heat transfer parameter [W/m^3.K] | [J/s.m^3.K]
-            Ua = U*a
             # external heat [kJ/m^3.s]
-            Qm = rmtUtil.calHeatExchangeBetweenReactorMedium(
-                Tm, T_ReVa, U, a, 'J/m^3.s')
-
-            # NOTE
-            # velocity from global concentration
-            # check BC
-            # if z == 0:
-            #     # BC1
-            #     T_b = T0
-            # else:
-            #     # interior nodes
-            #     T_b = T_z[z - 1]
-
-            # dxdt_v_T = (T_z[z] - T_b)/dz
-            # # CoSp x 1000
-            # # OvR x 1000
-            # dxdt_v = (1/(CoSp_ReVa*1000))*((-SuGaVe/CONST.R_CONST) *
-            #                                ((1/T_ReVa)*dxdt_P - (P/T_ReVa**2)*dxdt_v_T) + OvR*1000)
-            # velocity [forward value] is updated
-            # backward value of temp is taken
-            # dT/dt will update the old value
-            # v_z[z+1] = dxdt_v*dz + v_z[z]
-            v_z[z+1] = v_z[z]
-
-            # NOTE
-            # diff/dt
-            # dxdt = []
-            # matrix
-            # dxdtMat = np.zeros((varNo, zNo))
+            Qm_z = rmtUtil.calHeatExchangeBetweenReactorMedium(
+                Tm, T_z_ReVa, U, a, 'J/m^3.s')
 
             # loop vars
-            const_F1 = 1/(BeVoFr*(zf/vf))
-            const_T1 = GaDe_DiLeVa*GaCpMeanMixEff_DiLeVa*InGaVe_DiLeVa
             const_T2 = 1/(GaDe_DiLeVa*GaCpMeanMix_DiLeVa*BeVoFr*(zf/vf))
 
-            # NOTE
-
-            # concentration [mol/m^3]
-            for i in range(compNo):
-                # mass balance (forward difference)
-                # concentration [kmol/m^3]
-                # central
-                Ci_c = SpCoi_z[i][z]
-                # check BC
-                if z == 0:
-                    # BC1
-                    Ci_b = SpCoi0[i]/np.max(SpCoi0)
-                else:
-                    # interior nodes
-                    Ci_b = max(SpCoi_z[i][z - 1], CONST.EPS_CONST)
-                # backward difference
-                dCdz = (Ci_c - Ci_b)/dz
-                # mass balance
-                # dxdt_F = const_F1*(-v_z[z]*dCdz - Ci_c*dxdt_v + ri[i])
-                dxdt_F = const_F1*(-v_DiLeVa*dCdz + (ri[i]/GaMaCoTe0[i]))
-                dxdtMat[i][z] = dxdt_F
-
-            # energy balance (temperature) [K]
-            if processType != PROCESS_SETTING['ISO-THER']:
-                # temp [K]
-                T_c = T_z[z]
-                # check BC
-                if z == 0:
-                    # BC1
-                    T_b = (T0 - Tf)/Tf
-                else:
-                    # interior nodes
-                    T_b = T_z[z - 1]
+            # BC1
+            T_b_z = np.zeros((zNo, colNo))
+            T_b_z[0] = (T0 - Tf)/Tf
+            # interior nodes
+            T_b_z[1:] = T_z[:-1]
+            # backward difference
+            dTdz = (T_z - T_b_z)/dz
+            # convective term [no unit]
+            _convectiveTerm = -1*InGaVe_DiLeVa*GaDe_DiLeVa*GaCpMeanMixEff_DiLeVa*dTdz
+            # heat of reaction [no unit]
+            _heatFormationTerm = (1/GaHeCoTe0)*(-OvHeReT_z)
+            # heat exchange term [no unit]
+            _heatExchangeTerm = (1/GaHeCoTe0)*Qm_z
+
+            # convective flux, enthalpy of reaction, cooling heat
+            dxdtMat[indexT] = const_T2*(_convectiveTerm +
+                                        _heatFormationTerm + _heatExchangeTerm)
 
-                # backward difference
-                dTdz = (T_c - T_b)/dz
-                # convective term [no unit]
-                _convectiveTerm = -1*InGaVe_DiLeVa*GaDe_DiLeVa*GaCpMeanMixEff_DiLeVa*dTdz
-                # heat of reaction [no unit]
-                _heatFormationTerm = (1/GaHeCoTe0)*(-OvHeReT)
-                # heat exchange term [no unit]
-                _heatExchangeTerm = (1/GaHeCoTe0)*Qm
-
-                # convective flux, enthalpy of reaction, cooling heat
-                # dxdt_T = const_T2 * \
-                #     (-const_T1*dTdz + ((-OvHeReT + Qm)/GaHeCoTe0))
-                dxdt_T = const_T2*(_convectiveTerm +
-                                   _heatFormationTerm + _heatExchangeTerm)
-
-                dxdtMat[indexT][z] = dxdt_T
+        # check
+        if vecSet is True:
+            return np.reshape(dxdtMat, (varNoT, colNo))
 
         # flat
         dxdt = dxdtMat.flatten().tolist()
         # print("time: ", t)
 
         return dxdt
+
+    def jacobianN2(t, y, paramsSet):
+        """
+            [dynamic modeling]
+            jacobian of the N2 model equations (implicit solvers)
+                kinetics derivatives are exact (dual numbers), the convective terms
+                are the backward difference stencil, and the physical properties
+                (density, heat capacity, pressure, heat of reaction) are frozen
+                at the current state
+            args:
+                t: time
+                y: state (Ci, T) flatten
+                paramsSet: same as modelEquationN2
+            output:
+                jac: jacobian matrix [varNoT, varNoT], csr for sparse reaction networks
+        """
+        reactionListSorted, reactionStochCoeff, FunParam, DimensionlessAnalysisParams, processType = paramsSet
+        # component symbol list
+        comList = FunParam['compList']
+        # const ->
+        const = FunParam['const']
+        # property tables
+        propTableSet = const['propTableSet']
+        # reaction enthalpy method
+        reactionEnthalpyMethod = const['reactionEnthalpyMethod']
+        # component molecular weight [g/mol]
+        MoWei = const['MoWei']
+        # standard heat of reaction at 25C [kJ/kmol] | [J/mol]
+        StHeRe25 = const['StHeRe25']
+        # gas viscosity [Pa.s]
+        GaMiVi = const['GaMiVi']
+        # dz [m]
+        dz = const['dz']
+        # zNo
+        zNo = const['zNo']
+        # var no.
+        varNo = const['varNo']
+        # var no. in the domain
+        varNoT = const['varNoT']
+        # reactor spec ->
+        ReSpec = FunParam['ReSpec']
+        # particle diameter [m]
+        PaDi = ReSpec['PaDi']
+        # bed void fraction - porosity
+        BeVoFr = ReSpec['BeVoFr']
+        # exchange heat spec ->
+        ExHe = FunParam['ExHe']
+        # boundary conditions constants
+        constBC1 = FunParam['constBC1']
+        # inlet species concentration [mol/m^3]
+        SpCoi0 = constBC1['SpCoi0']
+        # inlet pressure [Pa]
+        P0 = constBC1['P0']
+        # gas density [kg/m^3]
+        GaDe0 = constBC1['GaDe0']
+        # heat capacity at constant pressure [kJ/kmol.K] | [J/mol.K]
+        GaCpMeanMix0 = constBC1['GaCpMeanMix0']
+        # inlet superficial gas velocity [m/s]
+        SuGaVe0 = constBC1['SuGaVe0']
+        # compiled reaction rate set
+        reactionRateSet = FunParam['reactionRateSet']
+        # stoichiometric coefficient matrix
+        reactionStochCoeffMat = FunParam['reactionStochCoeffMat']
+        # reaction rate dependency on components
+        reactionDepPattern = FunParam['reactionDepPattern']
+
+        # dimensionless analysis params
+        Tf = DimensionlessAnalysisParams['Tf']
+        vf = DimensionlessAnalysisParams['vf']
+        zf = DimensionlessAnalysisParams['zf']
+        GaMaCoTe0 = DimensionlessAnalysisParams['GaMaCoTe0']
+        GaHeCoTe0 = DimensionlessAnalysisParams['GaHeCoTe0']
+
+        # components no
+        compNo = len(comList)
+        indexT = compNo
+        # non iso-thermal
+        tempSet = processType != PROCESS_SETTING['ISO-THER']
+
+        # reshape
+        yLoop = np.reshape(y, (varNo, zNo))
+
+        # concentration [mol/m^3]
+        SpCoi_z = yLoop[0:compNo, :]
+        CoSpi_z = np.maximum(SpCoi_z, CONST.EPS_CONST)
+        # dimensionless analysis: real value
+        SpCoi0_Set = SpCoi0 if MODEL_SETTING['GaMaCoTe0'] != "MAX" else np.max(
+            SpCoi0)
+        SpCoi0_Set = np.broadcast_to(SpCoi0_Set, compNo)
+        CoSpi_z_ReVa = CoSpi_z*SpCoi0_Set[:, np.newaxis]
+        # d(CoSpi_ReVa)/d(y)
+        dCoSpidy_z = (SpCoi_z > CONST.EPS_CONST)*SpCoi0_Set[:, np.newaxis]
+        # mole fraction
+        MoFri_z = CoSpi_z_ReVa/np.sum(CoSpi_z_ReVa, axis=0)
+
+        # temperature [K]
+        T_z = yLoop[indexT, :] if tempSet else np.zeros(zNo)
+        T_z_ReVa = rmtUtil.calRealDiLessValue(T_z, Tf, "TEMP")
+
+        # velocity
+        SuGaVe = SuGaVe0
+        v_DiLeVa = SuGaVe/vf
+        InGaVe_DiLeVa = rmtUtil.calDiLessValue(SuGaVe/BeVoFr, SuGaVe0/BeVoFr)
+
+        # pressure [Pa], convective and heat terms (frozen properties)
+        P_z = np.zeros(zNo + 1)
+        P_z[0] = P0
+        convCoeff_z = np.zeros(zNo)
+        heatCoeff_z = np.zeros(zNo)
+        HeReT_z = []
+
+        # mixture molecular weight [kg/mol]
+        MiMoWe_z = rmtUtil.mixtureMolecularWeightMat(MoFri_z, MoWei, "kg/mol")
+        # Cp mixture
+        GaCpMeanMix_z = calMixtureHeatCapacityAtConstantPressureMat(
+            MoFri_z, calMeanHeatCapacityAtConstantPressure(comList, T_z_ReVa, propTableSet=propTableSet))
+        # enthalpy change from Tref to T [kJ/kmol] | [J/mol]
+        EnChList_z = calEnthalpyChangeOfReaction(reactionListSorted, T_z_ReVa, method=reactionEnthalpyMethod)
+
+        for z in range(zNo):
+            # mixture molecular weight [kg/mol]
+            MiMoWe = MiMoWe_z[z]
+            # gas density [kg/m^3]
+            GaDeEOS = calDensityIGFromEOS(P_z[z], T_z_ReVa[z], MiMoWe)
+            GaDe_DiLeVa = rmtUtil.calDiLessValue(GaDeEOS, GaDe0)
+            # ergun equation
+            ergA = 150*GaMiVi*SuGaVe/(PaDi**2)
+            ergB = ((1-BeVoFr)**2)/(BeVoFr**3)
+            ergC = 1.75*GaDeEOS*(SuGaVe**2)/PaDi
+            ergD = (1-BeVoFr)/(BeVoFr**3)
+            P_z[z+1] = -1*(ergA*ergB + ergC*ergD)*dz + P_z[z]
+
+            # check
+            if tempSet is False:
+                continue
+
+            # Cp mixture
+            GaCpMeanMix = GaCpMeanMix_z[z]
+            GaCpMeanMix_DiLeVa = rmtUtil.calDiLessValue(
+                GaCpMeanMix, GaCpMeanMix0)
+            const_T2 = 1/(GaDe_DiLeVa*GaCpMeanMix_DiLeVa*BeVoFr*(zf/vf))
+            # convective term coefficient
+            convCoeff_z[z] = const_T2*InGaVe_DiLeVa * \
+                GaDe_DiLeVa*GaCpMeanMix_DiLeVa*BeVoFr
+            # heat term coefficient
+            heatCoeff_z[z] = const_T2/GaHeCoTe0
+            # heat of reaction at T [kJ/kmol] | [J/mol]
+            HeReT_z.append(EnChList_z[:, z] + StHeRe25)
+
+        # NOTE
+        ## kinetics ##
+        loopVars0 = (T_z_ReVa, P_z[0:zNo], MoFri_z, CoSpi_z_ReVa)
+        Ri_rz, dRidC_rz, dRidT_rz = reactionRateSet.reactionRateJacobian(
+            loopVars0, reactionDepPattern)
+        # component formation rate derivatives
+        dridC_z = componentFormationRateJacobian(
+            reactionStochCoeffMat, dRidC_rz)
+        dridT_z = componentFormationRateJacobian(
+            reactionStochCoeffMat, dRidT_rz)
+        # nonzero dri/dCj (stoichiometry, rate dependency)
+        iIndex, jIndex = rmtUtil.buildReactionJacobianPattern(
+            reactionStochCoeffMat, reactionDepPattern).nonzero()
+
+        # jacobian triplets, variable (var, z): var*zNo + z
+        zIndex = np.arange(zNo)
+        compIndex = np.arange(compNo)[:, np.newaxis]
+        jacRows = []
+        jacCols = []
+        jacVals = []
+
+        # mass balance
+        const_F1 = 1/(BeVoFr*(zf/vf))
+        # reaction term
+        jacRows.append(iIndex[:, np.newaxis]*zNo + zIndex)
+        jacCols.append(jIndex[:, np.newaxis]*zNo + zIndex)
+        jacVals.append(const_F1*dridC_z[iIndex, jIndex] *
+                       dCoSpidy_z[jIndex]/GaMaCoTe0[iIndex][:, np.newaxis])
+        # backward difference
+        jacRows.append(compIndex*zNo + zIndex)
+        jacCols.append(compIndex*zNo + zIndex)
+        jacVals.append(np.full((compNo, zNo), -const_F1*v_DiLeVa/dz))
+        jacRows.append(compIndex*zNo + zIndex[1:])
+        jacCols.append(compIndex*zNo + zIndex[:-1])
+        jacVals.append(const_F1*v_DiLeVa *
+                       (SpCoi_z[:, :-1] > CONST.EPS_CONST)/dz)
+        # temperature
+        if tempSet is True:
+            jacRows.append(compIndex*zNo + zIndex)
+            jacCols.append(np.broadcast_to(indexT*zNo + zIndex, (compNo, zNo)))
+            jacVals.append(const_F1*dridT_z*Tf/GaMaCoTe0[:, np.newaxis])
+
+        # energy balance
+        if tempSet is True:
+            HeReT_z = np.array(HeReT_z).T
+            # heat exchange [J/m^3.s.K]
+            Ua = 0 if ExHe['MeTe'] == 0 else ExHe['OvHeTrCo']*ExHe['EfHeTrAr']
+            # d(OvHeReT)/dCi, d(OvHeReT)/dT
+            dOvHeReTdC_z = np.einsum('rjz,rz->jz', dRidC_rz, HeReT_z)
+            dOvHeReTdT_z = np.einsum('rz,rz->z', dRidT_rz, HeReT_z)
+            jacRows.append(np.broadcast_to(indexT*zNo + zIndex, (compNo, zNo)))
+            jacCols.append(compIndex*zNo + zIndex)
+            jacVals.append(-heatCoeff_z*dOvHeReTdC_z*dCoSpidy_z)
+            jacRows.append(indexT*zNo + zIndex)
+            jacCols.append(indexT*zNo + zIndex)
+            jacVals.append(heatCoeff_z*(-dOvHeReTdT_z - Ua)*Tf - convCoeff_z/dz)
+            jacRows.append(indexT*zNo + zIndex[1:])
+            jacCols.append(indexT*zNo + zIndex[:-1])
+            jacVals.append(convCoeff_z[1:]/dz)
+
+        # jacobian [varNoT, varNoT] (duplicates are summed)
+        jacMat = sparse.coo_matrix((np.concatenate([np.ravel(item) for item in jacVals]),
+                                    (np.concatenate([np.ravel(item) for item in jacRows]),
+                                     np.concatenate([np.ravel(item) for item in jacCols]))),
+                                   shape=(varNoT, varNoT)).tocsr()
+
+        # res (dense for small reaction networks)
+        return jacMat if sparse.issparse(reactionStochCoeffMat) else jacMat.toarray()
@@ -14,8 +14,8 @@ from PyREMOT.docs.modelSetting import MODEL_SETTING, PROCESS_SETTING
 from PyREMOT.docs.rmtUtility import rmtUtilityClass as rmtUtil
 from PyREMOT.docs.rmtThermo import *
 from PyREMOT.docs.fluidFilm import *
-from PyREMOT.docs.rmtReaction import reactionRateExe, componentFormationRate
-from PyREMOT.docs.gasTransPor import calTest
+from PyREMOT.docs.rmtReaction import componentFormationRateMat, ReactionRateClass
+from PyREMOT.docs.gasTransPor import calTest, calGaDiEq1Mat, calGasViscosity, calGasThermalConductivity, calMixturePropertyM1Mat
 # library
 from PyREMOT.library.plot import plotClass as pltc
 # data
@@ -23,7 +23,7 @@ from PyREMOT.data.inputDataReactor import *
 # core
 from PyREMOT.core.errors import errGeneralClass as errGeneral
 from PyREMOT.core import constants as CONST
-from PyREMOT.core.utilities import roundNum, selectFromListByIndex
+from PyREMOT.core.utilities import roundNum, selectFromListByIndex, LruCacheClass, cacheExe, PropertyUpdateClass, propertyUpdateExe
 from PyREMOT.core.config import REACTION_RATE_ACCURACY
 # solvers
 from PyREMOT.solvers.solSetting import solverSetting
@@ -32,7 +32,8 @@ from PyREMOT.solvers.solOrCo import OrCoClass
 from PyREMOT.solvers.solCatParticle import OrCoCatParticleClass
 from PyREMOT.solvers.solFiDi import FiDiBuildCMatrix, FiDiBuildTMatrix, FiDiSetMatrix, FiDiBuildCMatrix_DiLe, FiDiBuildTMatrix_DiLe
 from PyREMOT.solvers.solFiDi import FiDiMeshGenerator, FiDiDerivative1, FiDiDerivative2, FiDiNonUniformDerivative1, FiDiNonUniformDerivative2
-from PyREMOT.solvers.odeSolver import AdBash3, PreCorr3
+from PyREMOT.solvers.solFiDi import FiDiStencilHalfWidth, FiDiJacobianPattern, FiDiDerivativeOperator, FiDiDerivativeApply
+from PyREMOT.solvers.odeSolver import AdBash3, PreCorr3, DoPri54, BDFSolverClass
 from PyREMOT.solvers.solResultAnalysis import setOptimizeRootMethod, sortedResult3
 
 
@@ -54,11 +55,23 @@ class PackedBedReactorClass:
     # internal data
     _internalData = []
 
-    def __init__(self, modelInput, internalData, reactionListSorted, reactionStochCoeffList):
+    def __init__(self, modelInput, internalData, reactionListSorted, reactionStochCoeffList, reactionRateSet=None, propTableSet=None):
         self.modelInput = modelInput
         self.internalData = internalData
         self.reactionListSorted = reactionListSorted
         self.reactionStochCoeffList = reactionStochCoeffList
+        # reaction rate set (compiled kinetics)
+        self.reactionRateSet = reactionRateSet if reactionRateSet is not None else ReactionRateClass(
+            modelInput['reaction-rates'])
+        # property tables (opt-in, None: exact correlations)
+        self.propTableSet = propTableSet
+        # reaction enthalpy (solver-config: reaction-enthalpy)
+        # MEAN: mean heat capacity (default), INTEGRAL: closed-form integral of dCp
+        self.reactionEnthalpyMethod = modelInput.get(
+            'solver-config', {}).get('reaction-enthalpy', "MEAN")
+        # stoichiometric coefficient matrix [compNo, reactionNo]
+        self.reactionStochCoeffMat = rmtUtil.setReactionCoeffMatrix(
+            modelInput['feed']['components']['shell'], reactionStochCoeffList)
 
     # @property
     # def internalData(cls):
@@ -241,6 +254,8 @@ class PackedBedReactorClass:
         FunParam = {
             "compList": compList,
             "const": {
+                "propTableSet": self.propTableSet,
+                "reactionEnthalpyMethod": self.reactionEnthalpyMethod,
                 "CrSeAr": CrSeAr,
                 "MoWei": MoWei,
                 "StHeRe25": StHeRe25,
@@ -252,7 +267,9 @@ class PackedBedReactorClass:
                 "EfHeTrAr": a,
                 "MeTe": Tm
             },
-            "reactionRateExpr": reactionRateExpr
+            "reactionRateExpr": reactionRateExpr,
+            "reactionRateSet": self.reactionRateSet,
+            "reactionStochCoeffMat": self.reactionStochCoeffMat
         }
 
         # save data
@@ -379,6 +396,10 @@ class PackedBedReactorClass:
         comList = FunParam['compList']
         # const ->
         const = FunParam['const']
+        # property tables
+        propTableSet = const['propTableSet']
+        # reaction enthalpy method
+        reactionEnthalpyMethod = const['reactionEnthalpyMethod']
         # cross-sectional area [m^2]
         CrSeAr = const['CrSeAr']
         # component molecular weight [g/mol]
@@ -399,9 +420,10 @@ class PackedBedReactorClass:
         ExHe = FunParam['ExHe']
         # reaction rate expressions
         reactionRateExpr = FunParam['reactionRateExpr']
-        # using equation
-        varisSet = reactionRateExpr['VARS']
-        ratesSet = reactionRateExpr['RATES']
+        # compiled reaction rate set
+        reactionRateSet = FunParam['reactionRateSet']
+        # stoichiometric coefficient matrix
+        reactionStochCoeffMat = FunParam['reactionStochCoeffMat']
 
         # components no
         # y: component molar flowrate, total molar flux, temperature, pressure
@@ -466,8 +488,8 @@ class PackedBedReactorClass:
 
         # component formation rate [mol/m^3.s]
         # check unit
-        RiLoop = np.array(reactionRateExe(
-            loopVars0, varisSet, ratesSet))
+        RiLoop = np.array(reactionRateSet.reactionRateExe(
+            loopVars0))
         Ri = np.copy(RiLoop)
 
         # component formation rate [mol/m^3.s]
@@ -483,8 +505,8 @@ class PackedBedReactorClass:
         #         ri[k] = _riLoop
 
         # call [mol/m^3.s]
-        ri = componentFormationRate(
-            compNo, comList, reactionStochCoeff, Ri)
+        ri = componentFormationRateMat(
+            reactionStochCoeffMat, Ri)
 
         # overall formation rate [mol/m^3.s]
         OvR = np.sum(ri)
@@ -492,7 +514,7 @@ class PackedBedReactorClass:
         # enthalpy
         # heat capacity at constant pressure of mixture Cp [kJ/kmol.K] | [J/mol.K]
         # Cp mean list
-        CpMeanList = calMeanHeatCapacityAtConstantPressure(comList, T)
+        CpMeanList = calMeanHeatCapacityAtConstantPressure(comList, T, propTableSet=propTableSet)
         # print(f"Cp mean list: {CpMeanList}")
         # Cp mixture
         CpMeanMixture = calMixtureHeatCapacityAtConstantPressure(
@@ -501,7 +523,7 @@ class PackedBedReactorClass:
 
         # enthalpy change from Tref to T [kJ/kmol] | [J/mol]
         # enthalpy change
-        EnChList = np.array(calEnthalpyChangeOfReaction(reactionListSorted, T))
+        EnChList = np.array(calEnthalpyChangeOfReaction(reactionListSorted, T, method=reactionEnthalpyMethod))
         # heat of reaction at T [kJ/kmol] | [J/mol]
         HeReT = np.array(EnChList + StHeRe25)
         # overall heat of reaction [J/m^3.s]
@@ -668,6 +690,8 @@ class PackedBedReactorClass:
         FunParam = {
             "compList": compList,
             "const": {
+                "propTableSet": self.propTableSet,
+                "reactionEnthalpyMethod": self.reactionEnthalpyMethod,
                 "CrSeAr": CrSeAr,
                 "MoWei": MoWei,
                 "StHeRe25": StHeRe25,
@@ -681,6 +705,8 @@ class PackedBedReactorClass:
             "ReSpec": ReSpec,
             "ExHe": ExHe,
             "reactionRateExpr": reactionRateExpr,
+            "reactionRateSet": self.reactionRateSet,
+            "reactionStochCoeffMat": self.reactionStochCoeffMat,
             "constBC1": {
                 "VoFlRa0": VoFlRa0,
                 "SpCoi0": SpCoi0,
@@ -708,27 +734,24 @@ class PackedBedReactorClass:
         # BDF, Radau, LSODA
         solverIVP = "LSODA" if solverIVPSet == 'default' else solverIVPSet
 
-        # time loop
-        for i in range(tNo):
-            # set time span
-            t = np.array([opTSpan[i], opTSpan[i+1]])
-            times = np.linspace(t[0], t[1], timesNo)
-            print(f"time: {t} seconds")
-
-            # ode call
-            sol = solve_ivp(PackedBedReactorClass.modelEquationM2,
-                            t, IV, method=solverIVP, t_eval=times, args=(reactionListSorted, reactionStochCoeff, FunParam))
+        # ode call
+        # single integration over the operation time, the results are saved at opTSpan[1:]
+        print(f"time: {opTSpan[[0, -1]]} seconds")
+        sol = solve_ivp(PackedBedReactorClass.modelEquationM2,
+                        opTSpan[[0, -1]], IV, method=solverIVP, t_eval=opTSpan[1:], args=(reactionListSorted, reactionStochCoeff, FunParam))
 
-            # ode result
-            successStatus = sol.success
-            # check
-            if successStatus is False:
-                raise
+        # ode result
+        successStatus = sol.success
+        # check
+        if successStatus is False:
+            raise
 
+        # time loop
+        for i in range(tNo):
             # time interval
-            dataTime = sol.t
+            dataTime = sol.t[0:i+1]
             # all results
-            dataYs = sol.y
+            dataYs = sol.y[:, 0:i+1]
 
             # component concentration [mol/m^3]
             dataYs1 = dataYs[0:varNoCon, -1]
@@ -757,9 +780,6 @@ class PackedBedReactorClass:
                 # var list
                 dataPacktime[m][i, :] = dataPack[i]['dataYs'][m, :]
 
-            # update initial values [IV]
-            IV = dataYs[:, -1]
-
         # NOTE
         # end of computation
         end = timer()
@@ -880,6 +900,10 @@ class PackedBedReactorClass:
         comList = FunParam['compList']
         # const ->
         const = FunParam['const']
+        # property tables
+        propTableSet = const['propTableSet']
+        # reaction enthalpy method
+        reactionEnthalpyMethod = const['reactionEnthalpyMethod']
         # cross-sectional area [m^2]
         CrSeAr = const['CrSeAr']
         # component molecular weight [g/mol]
@@ -910,9 +934,10 @@ class PackedBedReactorClass:
 
         # reaction rate expressions
         reactionRateExpr = FunParam['reactionRateExpr']
-        # using equation
-        varisSet = reactionRateExpr['VARS']
-        ratesSet = reactionRateExpr['RATES']
+        # compiled reaction rate set
+        reactionRateSet = FunParam['reactionRateSet']
+        # stoichiometric coefficient matrix
+        reactionStochCoeffMat = FunParam['reactionStochCoeffMat']
 
         # zNo
         zNo = const['zNo']
@@ -1064,14 +1089,14 @@ class PackedBedReactorClass:
             # loop
             loopVars0 = (T, P, MoFri, _SpCoi)
             # check unit
-            RiLoop = 1e-3*np.array(reactionRateExe(
-                loopVars0, varisSet, ratesSet))
+            RiLoop = 1e-3*np.array(reactionRateSet.reactionRateExe(
+                loopVars0))
             Ri_z[z, :] = RiLoop
 
             # REVIEW
             # component formation rate [kmol/m^3.s]
-            ri = componentFormationRate(
-                compNo, comList, reactionStochCoeff, Ri_z[z, :])
+            ri = componentFormationRateMat(
+                reactionStochCoeffMat, Ri_z[z, :])
 
             # overall formation rate [kmol/m^3.s]
             OvR = np.sum(ri)
@@ -1080,7 +1105,7 @@ class PackedBedReactorClass:
             # enthalpy
             # heat capacity at constant pressure of mixture Cp [kJ/kmol.K] | [J/mol.K]
             # Cp mean list
-            CpMeanList = calMeanHeatCapacityAtConstantPressure(comList, T)
+            CpMeanList = calMeanHeatCapacityAtConstantPressure(comList, T, propTableSet=propTableSet)
             # print(f"Cp mean list: {CpMeanList}")
             # Cp mixture
             CpMeanMixture = calMixtureHeatCapacityAtConstantPressure(
@@ -1090,7 +1115,7 @@ class PackedBedReactorClass:
             # enthalpy change from Tref to T [kJ/kmol] | [J/mol]
             # enthalpy change
             EnChList = np.array(
-                calEnthalpyChangeOfReaction(reactionListSorted, T))
+                calEnthalpyChangeOfReaction(reactionListSorted, T, method=reactionEnthalpyMethod))
             # heat of reaction at T [kJ/kmol] | [J/mol]
             HeReT = np.array(EnChList + StHeRe25)
             # overall heat of reaction [kJ/m^3.s]
@@ -1261,6 +1286,8 @@ class PackedBedReactorClass:
         FunParam = {
             "compList": compList,
             "const": {
+                "propTableSet": self.propTableSet,
+                "reactionEnthalpyMethod": self.reactionEnthalpyMethod,
                 "CrSeAr": CrSeAr,
                 "MoWei": MoWei,
                 "StHeRe25": StHeRe25,
@@ -1276,6 +1303,8 @@ class PackedBedReactorClass:
                 "T0": T
             },
             "reactionRateExpr": reactionRateExpr,
+            "reactionRateSet": self.reactionRateSet,
+            "reactionStochCoeffMat": self.reactionStochCoeffMat,
         }
 
         # save data
@@ -1394,6 +1423,10 @@ class PackedBedReactorClass:
         comList = FunParam['compList']
         # const ->
         const = FunParam['const']
+        # property tables
+        propTableSet = const['propTableSet']
+        # reaction enthalpy method
+        reactionEnthalpyMethod = const['reactionEnthalpyMethod']
         # cross-sectional area [m^2]
         CrSeAr = const['CrSeAr']
         # component molecular weight [g/mol]
@@ -1429,9 +1462,10 @@ class PackedBedReactorClass:
 
         # reaction rate expressions
         reactionRateExpr = FunParam['reactionRateExpr']
-        # using equation
-        varisSet = reactionRateExpr['VARS']
-        ratesSet = reactionRateExpr['RATES']
+        # compiled reaction rate set
+        reactionRateSet = FunParam['reactionRateSet']
+        # stoichiometric coefficient matrix
+        reactionStochCoeffMat = FunParam['reactionStochCoeffMat']
 
         # calculate
         # molar flowrate [kmol/s]
@@ -1506,8 +1540,8 @@ class PackedBedReactorClass:
         # loop
         loopVars0 = (T, P, MoFri, CoSpi)
         # check unit
-        r0 = np.array(reactionRateExe(
-            loopVars0, varisSet, ratesSet))
+        r0 = np.array(reactionRateSet.reactionRateExe(
+            loopVars0))
 
         # loop
         Ri = r0
@@ -1515,8 +1549,8 @@ class PackedBedReactorClass:
         # component formation rate [mol/m^3.s]
         # rf[mol/kgcat.s]*CaBeDe[kgcat/m^3]
         # call [mol/m^3.s]
-        ri = componentFormationRate(
-            compNo, comList, reactionStochCoeff, Ri)
+        ri = componentFormationRateMat(
+            reactionStochCoeffMat, Ri)
 
         # overall formation rate [mol/m^3.s]
         OvR = np.sum(ri)
@@ -1524,7 +1558,7 @@ class PackedBedReactorClass:
         # enthalpy
         # heat capacity at constant pressure of mixture Cp [kJ/kmol.K] | [J/mol.K]
         # Cp mean list
-        CpMeanList = calMeanHeatCapacityAtConstantPressure(comList, T)
+        CpMeanList = calMeanHeatCapacityAtConstantPressure(comList, T, propTableSet=propTableSet)
         # print(f"Cp mean list: {CpMeanList}")
         # Cp mixture
         CpMeanMixture = calMixtureHeatCapacityAtConstantPressure(
@@ -1533,7 +1567,7 @@ class PackedBedReactorClass:
 
         # enthalpy change from Tref to T [kJ/kmol] | [J/mol]
         # enthalpy change
-        EnChList = np.array(calEnthalpyChangeOfReaction(reactionListSorted, T))
+        EnChList = np.array(calEnthalpyChangeOfReaction(reactionListSorted, T, method=reactionEnthalpyMethod))
         # heat of reaction at T [kJ/kmol] | [J/mol]
         HeReT = np.array(EnChList + StHeRe25)
         # overall heat of reaction [J/m^3.s]
@@ -1673,6 +1707,8 @@ class PackedBedReactorClass:
         FunParam = {
             "compList": compList,
             "const": {
+                "propTableSet": self.propTableSet,
+                "reactionEnthalpyMethod": self.reactionEnthalpyMethod,
                 "CrSeAr": CrSeAr,
                 "MoWei": MoWei,
                 "StHeRe25": StHeRe25,
@@ -1801,6 +1837,10 @@ class PackedBedReactorClass:
         comList = FunParam['compList']
         # const ->
         const = FunParam['const']
+        # property tables
+        propTableSet = const['propTableSet']
+        # reaction enthalpy method
+        reactionEnthalpyMethod = const['reactionEnthalpyMethod']
         # cross-sectional area [m^2]
         CrSeAr = const['CrSeAr']
         # component molecular weight [g/mol]
@@ -1925,7 +1965,7 @@ class PackedBedReactorClass:
         # enthalpy
         # heat capacity at constant pressure of mixture Cp [kJ/kmol.K] | [J/mol.K]
         # Cp mean list
-        CpMeanList = calMeanHeatCapacityAtConstantPressure(comList, T)
+        CpMeanList = calMeanHeatCapacityAtConstantPressure(comList, T, propTableSet=propTableSet)
         # print(f"Cp mean list: {CpMeanList}")
         # Cp mixture
         CpMeanMixture = calMixtureHeatCapacityAtConstantPressure(
@@ -1934,7 +1974,7 @@ class PackedBedReactorClass:
 
         # enthalpy change from Tref to T [kJ/kmol] | [J/mol]
         # enthalpy change
-        EnChList = np.array(calEnthalpyChangeOfReaction(reactionListSorted, T))
+        EnChList = np.array(calEnthalpyChangeOfReaction(reactionListSorted, T, method=reactionEnthalpyMethod))
         # heat of reaction at T [kJ/kmol] | [J/mol]
         HeReT = np.array(EnChList + StHeRe25)
         # overall heat of reaction [J/m^3.s]
@@ -2116,6 +2156,8 @@ class PackedBedReactorClass:
         FunParam = {
             "compList": compList,
             "const": {
+                "propTableSet": self.propTableSet,
+                "reactionEnthalpyMethod": self.reactionEnthalpyMethod,
                 "CrSeAr": CrSeAr,
                 "MoWei": MoWei,
                 "StHeRe25": StHeRe25,
@@ -2136,7 +2178,9 @@ class PackedBedReactorClass:
                 "T0": T,
                 "SuGaVe0": SuGaVe0
             },
-            "reactionRateExpr": reactionRateExpr
+            "reactionRateExpr": reactionRateExpr,
+            "reactionRateSet": self.reactionRateSet,
+            "reactionStochCoeffMat": self.reactionStochCoeffMat
 
         }
 
@@ -2159,27 +2203,24 @@ class PackedBedReactorClass:
         # BDF, Radau, LSODA
         solverIVP = "LSODA" if solverIVPSet == 'default' else solverIVPSet
 
-        # time loop
-        for i in range(tNo):
-            # set time span
-            t = np.array([opTSpan[i], opTSpan[i+1]])
-            times = np.linspace(t[0], t[1], timesNo)
-            print(f"time: {t} seconds")
-
-            # ode call
-            sol = solve_ivp(PackedBedReactorClass.modelEquationM5,
-                            t, IV, method=solverIVP, t_eval=times, args=(reactionListSorted, reactionStochCoeff, FunParam))
+        # ode call
+        # single integration over the operation time, the results are saved at opTSpan[1:]
+        print(f"time: {opTSpan[[0, -1]]} seconds")
+        sol = solve_ivp(PackedBedReactorClass.modelEquationM5,
+                        opTSpan[[0, -1]], IV, method=solverIVP, t_eval=opTSpan[1:], args=(reactionListSorted, reactionStochCoeff, FunParam))
 
-            # ode result
-            successStatus = sol.success
-            # check
-            if successStatus is False:
-                raise
+        # ode result
+        successStatus = sol.success
+        # check
+        if successStatus is False:
+            raise
 
+        # time loop
+        for i in range(tNo):
             # time interval
-            dataTime = sol.t
+            dataTime = sol.t[0:i+1]
             # all results
-            dataYs = sol.y
+            dataYs = sol.y[:, 0:i+1]
 
             # component concentration [kmol/m^3]
             dataYs1 = dataYs[0:varNoCon, -1]
@@ -2208,9 +2249,6 @@ class PackedBedReactorClass:
                 # var list
                 dataPacktime[m][i, :] = dataPack[i]['dataYs'][m, :]
 
-            # update initial values [IV]
-            IV = dataYs[:, -1]
-
         # NOTE
         # end of computation
         end = timer()
@@ -2332,6 +2370,10 @@ class PackedBedReactorClass:
         comList = FunParam['compList']
         # const ->
         const = FunParam['const']
+        # property tables
+        propTableSet = const['propTableSet']
+        # reaction enthalpy method
+        reactionEnthalpyMethod = const['reactionEnthalpyMethod']
         # cross-sectional area [m^2]
         CrSeAr = const['CrSeAr']
         # component molecular weight [g/mol]
@@ -2382,9 +2424,10 @@ class PackedBedReactorClass:
 
         # reaction rate expressions
         reactionRateExpr = FunParam['reactionRateExpr']
-        # using equation
-        varisSet = reactionRateExpr['VARS']
-        ratesSet = reactionRateExpr['RATES']
+        # compiled reaction rate set
+        reactionRateSet = FunParam['reactionRateSet']
+        # stoichiometric coefficient matrix
+        reactionStochCoeffMat = FunParam['reactionStochCoeffMat']
 
         # calculate
         # molar flowrate [kmol/s]
@@ -2528,8 +2571,8 @@ class PackedBedReactorClass:
             # loop
             loopVars0 = (T_z[z], P_z[z], MoFri, CoSpi)
             # check unit
-            r0 = np.array(reactionRateExe(
-                loopVars0, varisSet, ratesSet))
+            r0 = np.array(reactionRateSet.reactionRateExe(
+                loopVars0))
             # r0 = np.copy(RiLoop)
 
             # loop
@@ -2538,8 +2581,8 @@ class PackedBedReactorClass:
             # REVIEW
             # component formation rate [kmol/m^3.s]
             # call
-            ri = componentFormationRate(
-                compNo, comList, reactionStochCoeff, Ri_z[z, :])
+            ri = componentFormationRateMat(
+                reactionStochCoeffMat, Ri_z[z, :])
 
             # overall formation rate [kmol/m^3.s]
             OvR = np.sum(ri)
@@ -2548,7 +2591,7 @@ class PackedBedReactorClass:
             # enthalpy
             # heat capacity at constant pressure of mixture Cp [kJ/kmol.K] | [J/mol.K]
             # Cp mean list
-            CpMeanList = calMeanHeatCapacityAtConstantPressure(comList, T)
+            CpMeanList = calMeanHeatCapacityAtConstantPressure(comList, T, propTableSet=propTableSet)
             # print(f"Cp mean list: {CpMeanList}")
             # Cp mixture
             CpMeanMixture = calMixtureHeatCapacityAtConstantPressure(
@@ -2558,7 +2601,7 @@ class PackedBedReactorClass:
             # enthalpy change from Tref to T [kJ/kmol] | [J/mol]
             # enthalpy change
             EnChList = np.array(
-                calEnthalpyChangeOfReaction(reactionListSorted, T))
+                calEnthalpyChangeOfReaction(reactionListSorted, T, method=reactionEnthalpyMethod))
             # heat of reaction at T [kJ/kmol] | [J/mol]
             HeReT = np.array(EnChList + StHeRe25)
             # overall heat of reaction [kJ/m^3.s]
@@ -2834,6 +2877,8 @@ class PackedBedReactorClass:
         FunParam = {
             "compList": compList,
             "const": {
+                "propTableSet": self.propTableSet,
+                "reactionEnthalpyMethod": self.reactionEnthalpyMethod,
                 "CrSeAr": CrSeAr,
                 "MoWei": MoWei,
                 "StHeRe25": StHeRe25,
@@ -2863,9 +2908,14 @@ class PackedBedReactorClass:
                 "dz": dz
             },
             "solverSetting": {
-                "OrCoClassSetRes": OrCoClassSetRes
+                "OrCoClassSetRes": OrCoClassSetRes,
+                # catalyst particle collocation operators (built once per run)
+                "OrCoCatParticleClassSet": OrCoCatParticleClass(
+                    OrCoClassSetRes['Xc'], OrCoClassSetRes['N'], OrCoClassSetRes['Q'], OrCoClassSetRes['A'], OrCoClassSetRes['B'], varNo)
             },
-            "reactionRateExpr": reactionRateExpr
+            "reactionRateExpr": reactionRateExpr,
+            "reactionRateSet": self.reactionRateSet,
+            "reactionStochCoeffMat": self.reactionStochCoeffMat
 
         }
 
@@ -2888,28 +2938,25 @@ class PackedBedReactorClass:
         # BDF, Radau, LSODA
         solverIVP = "LSODA" if solverIVPSet == 'default' else solverIVPSet
 
-        # time loop
-        for i in range(tNo):
-            # set time span
-            t = np.array([opTSpan[i], opTSpan[i+1]])
-            times = np.linspace(t[0], t[1], timesNo)
-
-            # ode call
-            # method [1]: LSODA, [2]: BDF, [3]: Radau
-            sol = solve_ivp(PackedBedReactorClass.modelEquationM6,
-                            t, IV, method=solverIVP, t_eval=times, args=(reactionListSorted, reactionStochCoeff, FunParam))
+        # ode call
+        # single integration over the operation time, the results are saved at opTSpan[1:]
+        # method [1]: LSODA, [2]: BDF, [3]: Radau
+        sol = solve_ivp(PackedBedReactorClass.modelEquationM6,
+                        opTSpan[[0, -1]], IV, method=solverIVP, t_eval=opTSpan[1:], args=(reactionListSorted, reactionStochCoeff, FunParam))
 
-            # ode result
-            successStatus = sol.success
-            # check
-            if successStatus is False:
-                raise
+        # ode result
+        successStatus = sol.success
+        # check
+        if successStatus is False:
+            raise
 
+        # time loop
+        for i in range(tNo):
             # time interval
-            dataTime = sol.t
+            dataTime = sol.t[0:i+1]
             # all results
             # components, temperature layers
-            dataYs = sol.y
+            dataYs = sol.y[:, 0:i+1]
 
             # std format
             dataYs_Reshaped = np.reshape(
@@ -2965,9 +3012,6 @@ class PackedBedReactorClass:
                 # var list
                 dataPacktime[m][i, :] = dataPack[i]['dataYs'][m, :]
 
-            # update initial values [IV]
-            IV = dataYs[:, -1]
-
         # NOTE
         # end of computation
         end = timer()
@@ -3097,6 +3141,10 @@ class PackedBedReactorClass:
         comList = FunParam['compList']
         # const ->
         const = FunParam['const']
+        # property tables
+        propTableSet = const['propTableSet']
+        # reaction enthalpy method
+        reactionEnthalpyMethod = const['reactionEnthalpyMethod']
         # cross-sectional area [m^2]
         CrSeAr = const['CrSeAr']
         # component molecular weight [g/mol]
@@ -3169,22 +3217,16 @@ class PackedBedReactorClass:
 
         # solver setting
         solverSetting = FunParam['solverSetting']
-        # number of collocation points
-        ocN = solverSetting['OrCoClassSetRes']['N']
-        ocXc = solverSetting['OrCoClassSetRes']['Xc']
-        ocA = solverSetting['OrCoClassSetRes']['A']
-        ocB = solverSetting['OrCoClassSetRes']['B']
-        ocQ = solverSetting['OrCoClassSetRes']['Q']
 
-        # init OrCoCatParticle
-        OrCoCatParticleClassSet = OrCoCatParticleClass(
-            ocXc, ocN, ocQ, ocA, ocB, varNo)
+        # init OrCoCatParticle (collocation operators built once per run)
+        OrCoCatParticleClassSet = solverSetting['OrCoCatParticleClassSet']
 
         # reaction rate expressions
         reactionRateExpr = FunParam['reactionRateExpr']
-        # using equation
-        varisSet = reactionRateExpr['VARS']
-        ratesSet = reactionRateExpr['RATES']
+        # compiled reaction rate set
+        reactionRateSet = FunParam['reactionRateSet']
+        # stoichiometric coefficient matrix
+        reactionStochCoeffMat = FunParam['reactionStochCoeffMat']
 
         # components no
         # y: component molar flowrate, total molar flux, temperature, pressure
@@ -3300,6 +3342,21 @@ class PackedBedReactorClass:
         # NOTE
         # FIXME
         # define ode equations for each finite difference [zNo]
+        # NOTE
+        # solid phase (orthogonal collocation) inputs of all z nodes
+        # concentration, shape: (zNo, compNo, rNo)
+        OrCoYs_C = np.zeros((zNo, compNo, rNo))
+        OrCoConst1_C = np.zeros((zNo, compNo))
+        OrCoConst2_C = np.zeros((zNo, compNo, rNo))
+        OrCoConst3_C = (np.zeros((zNo, compNo)), np.zeros((zNo, compNo)))
+        OrCoCoeff_C = np.zeros((zNo, compNo))
+        # temperature, shape: (zNo, rNo)
+        OrCoYs_T = np.zeros((zNo, rNo))
+        OrCoConst1_T = np.zeros(zNo)
+        OrCoConst2_T = np.zeros((zNo, rNo))
+        OrCoConst3_T = (np.zeros(zNo), np.zeros(zNo))
+        OrCoCoeff_T = np.zeros((zNo, rNo))
+
         for z in range(varNoColumns):
             ## block ##
 
@@ -3461,8 +3518,8 @@ class PackedBedReactorClass:
 
                 # component formation rate [mol/m^3.s]
                 # check unit
-                r0 = np.array(reactionRateExe(
-                    loopVars0, varisSet, ratesSet))
+                r0 = np.array(reactionRateSet.reactionRateExe(
+                    loopVars0))
 
                 # loop
                 Ri_zr[z, r, :] = r0
@@ -3487,8 +3544,8 @@ class PackedBedReactorClass:
                 #                     Ri_r[r][m]
                 #         ri_r0[r][k] = _riLoop
 
-                ri_r[r] = componentFormationRate(
-                    compNo, comList, reactionStochCoeff, Ri_r[r])
+                ri_r[r] = componentFormationRateMat(
+                    reactionStochCoeffMat, Ri_r[r])
 
                 # overall formation rate [kmol/m^3.s]
                 OvR[r] = np.sum(ri_r[r])
@@ -3498,7 +3555,7 @@ class PackedBedReactorClass:
             # gas phase
             # heat capacity at constant pressure of mixture Cp [kJ/kmol.K] | [J/mol.K]
             # Cp mean list
-            GaCpMeanList = calMeanHeatCapacityAtConstantPressure(comList, T)
+            GaCpMeanList = calMeanHeatCapacityAtConstantPressure(comList, T, propTableSet=propTableSet)
             # Cp mixture
             GaCpMeanMix = calMixtureHeatCapacityAtConstantPressure(
                 MoFri, GaCpMeanList)
@@ -3514,7 +3571,7 @@ class PackedBedReactorClass:
                 # heat capacity at constant pressure of mixture Cp [kJ/kmol.K] | [J/mol.K]
                 # Cp mean list
                 SoCpMeanList = calMeanHeatCapacityAtConstantPressure(
-                    comList, Ts_r[r])
+                    comList, Ts_r[r], propTableSet=propTableSet)
                 # Cp mixture
                 SoCpMeanMix[r] = calMixtureHeatCapacityAtConstantPressure(
                     MoFrsi_r[r], SoCpMeanList)
@@ -3522,7 +3579,7 @@ class PackedBedReactorClass:
                 # enthalpy change from Tref to T [kJ/kmol] | [J/mol]
                 # enthalpy change
                 EnChList = np.array(
-                    calEnthalpyChangeOfReaction(reactionListSorted, Ts_r[r]))
+                    calEnthalpyChangeOfReaction(reactionListSorted, Ts_r[r], method=reactionEnthalpyMethod))
                 # heat of reaction at T [kJ/kmol] | [J/mol]
                 HeReT = np.array(EnChList + StHeRe25)
                 # overall heat of reaction [kJ/m^3.s]
@@ -3717,13 +3774,13 @@ class PackedBedReactorClass:
                 _Cs_r_Updated = OrCoCatParticleClassSet.CalUpdateYnSolidGasInterface(
                     _Cs_r, Ci_c, betaC[i])
 
-                # dC/dt list
-                dCsdti = OrCoCatParticleClassSet.buildOrCoMatrix(
-                    _Cs_r_Updated, SoDiiEff[i], (PaRa**2)*ri_r[:, i])
-
-                for r in range(rNo):
-                    # update
-                    dxdtMat[i][r+1][z] = const_Cs1*dCsdti[r]
+                # dC/dt list (evaluated for all z nodes after the node loop)
+                OrCoYs_C[z, i] = _Cs_r_Updated.flatten()
+                OrCoConst1_C[z, i] = SoDiiEff[i]
+                OrCoConst2_C[z, i] = (PaRa**2)*ri_r[:, i]
+                OrCoConst3_C[0][z, i] = Ci_c
+                OrCoConst3_C[1][z, i] = betaC[i]
+                OrCoCoeff_C[z, i] = const_Cs1
 
             # NOTE
             # energy balance (temperature) [K]
@@ -3786,12 +3843,25 @@ class PackedBedReactorClass:
             SoThCoEff_Conv = SoThCoEff/1000
             # OvHeReT [kJ/m^3.s]
             OvHeReT_Conv = -1*OvHeReT
-            dTsdti = OrCoCatParticleClassSet.buildOrCoMatrix(
-                _Ts_r_Updated, SoThCoEff_Conv, (PaRa**2)*OvHeReT_Conv)
+            # (evaluated for all z nodes after the node loop)
+            OrCoYs_T[z] = _Ts_r_Updated.flatten()
+            OrCoConst1_T[z] = SoThCoEff_Conv
+            OrCoConst2_T[z] = (PaRa**2)*OvHeReT_Conv
+            OrCoConst3_T[0][z] = T_c
+            OrCoConst3_T[1][z] = betaT
+            OrCoCoeff_T[z] = const_Ts1
 
-            for r in range(rNo):
-                # update
-                dxdtMat[indexT][r+1][z] = const_Ts1*dTsdti[r]
+        # NOTE
+        # solid phase (orthogonal collocation), all components and z nodes
+        # concentration, shape: (zNo, compNo, rNo)
+        dCsdt_z = OrCoCatParticleClassSet.buildOrCoMatrixBatch(
+            OrCoYs_C, OrCoConst1_C, OrCoConst2_C, OrCoConst3_C)
+        dxdtMat[0:compNo, 1:, :] = np.transpose(
+            OrCoCoeff_C[:, :, np.newaxis]*dCsdt_z, (1, 2, 0))
+        # temperature, shape: (zNo, rNo)
+        dTsdt_z = OrCoCatParticleClassSet.buildOrCoMatrixBatch(
+            OrCoYs_T, OrCoConst1_T, OrCoConst2_T, OrCoConst3_T)
+        dxdtMat[indexT, 1:, :] = np.transpose(OrCoCoeff_T*dTsdt_z)
 
         # NOTE
         # set time
@@ -3819,6 +3889,9 @@ class PackedBedReactorClass:
         solverIVPSet = solverConfig['ivp']
         solverMesh = solverConfig['mesh']
         solverMeshSet = True if solverMesh == "normal" else False
+        # change-driven property update (transport/film properties)
+        propUpdateSet = True if solverConfig.get(
+            'property-update', "False") == "True" else False
 
         # operating conditions
         P = self.modelInput['operating-conditions']['pressure']
@@ -3875,6 +3948,9 @@ class PackedBedReactorClass:
 
         # component molecular weight [g/mol]
         MoWei = rmtUtil.extractCompData(self.internalData, "MW")
+        # critical temperature [K] and pressure [bar]
+        CrTei = rmtUtil.extractCompData(self.internalData, "Tc")
+        CrPri = rmtUtil.extractCompData(self.internalData, "Pc")
 
         # external heat
         ExHe = self.modelInput['external-heat']
@@ -3949,7 +4025,7 @@ class PackedBedReactorClass:
 
         # heat capacity at constant pressure of mixture Cp [kJ/kmol.K] | [J/mol.K]
         # Cp mean list
-        GaCpMeanList0 = calMeanHeatCapacityAtConstantPressure(compList, T)
+        GaCpMeanList0 = calMeanHeatCapacityAtConstantPressure(compList, T, propTableSet=self.propTableSet)
         # Cp mixture
         GaCpMeanMix0 = calMixtureHeatCapacityAtConstantPressure(
             MoFri0, GaCpMeanList0)
@@ -4107,8 +4183,12 @@ class PackedBedReactorClass:
         FunParam = {
             "compList": compList,
             "const": {
+                "propTableSet": self.propTableSet,
+                "reactionEnthalpyMethod": self.reactionEnthalpyMethod,
                 "CrSeAr": CrSeAr,
                 "MoWei": MoWei,
+                "CrTei": CrTei,
+                "CrPri": CrPri,
                 "StHeRe25": StHeRe25,
                 "GaMiVi": GaViMix0,
                 "varNo": varNo,
@@ -4144,7 +4224,14 @@ class PackedBedReactorClass:
                 "dz": dz,
                 "dzs": dzs,
                 "zR": zR,
-                "zNoNo": zNoNo
+                "zNoNo": zNoNo,
+                # axial derivative operators (mass/energy balance)
+                "zDiffOperator": {
+                    "C": FiDiDerivativeOperator(zNo, dz, dzs, zNoNo[0], solverMeshSet,
+                                                solverSetting['T1']['dFdz'], solverSetting['T1']['d2Fdz2']),
+                    "T": FiDiDerivativeOperator(zNo, dz, dzs, zNoNo[0], solverMeshSet,
+                                                solverSetting['T1']['dTdz'], solverSetting['T1']['d2Tdz2'])
+                }
             },
             "solverSetting": {
                 "dFdz": solverSetting['T1']['dFdz'],
@@ -4152,8 +4239,13 @@ class PackedBedReactorClass:
                 "dTdz": solverSetting['T1']['dTdz'],
                 "d2Tdz2": solverSetting['T1']['d2Tdz2'],
             },
-            "reactionRateExpr": reactionRateExpr
-
+            "reactionRateExpr": reactionRateExpr,
+            "reactionRateSet": self.reactionRateSet,
+            "reactionStochCoeffMat": self.reactionStochCoeffMat,
+            # property update scheduler (None: not active)
+            "propertyUpdate": PropertyUpdateClass(
+                solverSetting['T1']['propertyUpdate']['tolerance'],
+                solverSetting['T1']['propertyUpdate']['refMin']) if propUpdateSet is True else None
         }
 
         # dimensionless analysis parameters
@@ -4200,7 +4292,18 @@ class PackedBedReactorClass:
         # solver selection
         # BDF, Radau, LSODA
         solverIVP = "LSODA" if solverIVPSet == 'default' else solverIVPSet
-
+        # in-house ode solver (ivp: AM)
+        odeSolverMethod = solverSetting['T1']['ode-solver']['method']
+        odeSolverOptions = solverSetting['T1']['ode-solver']['DoPri54']
+        # jacobian sparsity (BDF, Radau | ivp: AM, method: BDF)
+        # gas phase is discretized along the reactor length, particle nodes are local,
+        # pressure (ergun equation) depends on the gas phase concentrations of all upstream nodes
+        jacPattern = FiDiJacobianPattern(noLayer, varNoRows, varNoColumns,
+                                         FiDiStencilHalfWidth(solverSetting['T1'], solverMeshSet), [0], [0], list(range(compNo))) \
+            if solverIVP in ("BDF", "Radau") or (solverIVP == "AM" and odeSolverMethod == "BDF") else None
+        jacOptions = {
+            "jac_sparsity": jacPattern
+        } if solverIVP in ("BDF", "Radau") else {}
         # FIXME
         n = solverSetting['T1']['ode-solver']['PreCorr3']['n']
         # t0 = 0
@@ -4209,19 +4312,38 @@ class PackedBedReactorClass:
         paramsSet = (reactionListSorted, reactionStochCoeff,
                      FunParam, DimensionlessAnalysisParams)
         funSet = PackedBedReactorClass.modelEquationM7
+        # in-house stiff solver (ivp: AM, method: BDF)
+        # kept over the time loop, the jacobian/LU factorization is reused between time spans
+        stiffSolver = BDFSolverClass(funSet, paramsSet, jacType="sparse", jacSparsity=jacPattern,
+                                     **solverSetting['T1']['ode-solver']['BDF']) if solverIVP == "AM" and odeSolverMethod == "BDF" else None
+
+        # ode call
+        # single integration over the operation time, the results are saved at opTSpan[1:]
+        # method [1]: LSODA, [2]: BDF, [3]: Radau
+        if solverIVP != "AM":
+            print(f"time: {opTSpan[[0, -1]]} seconds")
+            solIVP = solve_ivp(funSet, opTSpan[[0, -1]], IV, method=solverIVP,
+                               t_eval=opTSpan[1:],  args=(paramsSet,), **jacOptions)
+            # check
+            if solIVP.success is False:
+                raise
 
         # time loop
         for i in range(tNo):
             # set time span
             t = np.array([opTSpan[i], opTSpan[i+1]])
-            times = np.linspace(t[0], t[1], timesNo)
-            print(f"time: {t} seconds")
 
             # ode call
             if solverIVP == "AM":
+                print(f"time: {t} seconds")
                 # sol = AdBash3(t[0], t[1], n, IV, funSet, paramsSet)
-                # PreCorr3
-                sol = PreCorr3(t[0], t[1], n, IV, funSet, paramsSet)
+                # DoPri54 (adaptive), PreCorr3 (fixed-step)
+                # BDF (stiff, jacobian/LU reuse over the time loop)
+                if odeSolverMethod == "BDF":
+                    sol = stiffSolver.solve(t[0], t[1], IV)
+                else:
+                    sol = DoPri54(t[0], t[1], IV, funSet, paramsSet, **odeSolverOptions) if odeSolverMethod == "DoPri54" else PreCorr3(
+                        t[0], t[1], n, IV, funSet, paramsSet)
                 successStatus = True
                 # time interval
                 dataTime = t
@@ -4229,23 +4351,13 @@ class PackedBedReactorClass:
                 # components, temperature layers
                 dataYs = sol
             else:
-                # method [1]: LSODA, [2]: BDF, [3]: Radau
-                # options
-                solverOptions = {
-                    "atol": 1e-7
-                }
-                sol = solve_ivp(funSet, t, IV, method=solverIVP,
-                                t_eval=times,  args=(paramsSet,))
                 # ode result
-                successStatus = sol.success
-                # check
-                if successStatus is False:
-                    raise
+                successStatus = solIVP.success
                 # time interval
-                dataTime = sol.t
+                dataTime = solIVP.t[0:i+1]
                 # all results
                 # components, temperature layers
-                dataYs = sol.y
+                dataYs = solIVP.y[:, 0:i+1]
 
             # REVIEW
             # post-processing result
@@ -4306,6 +4418,10 @@ class PackedBedReactorClass:
         end = timer()
         elapsed = roundNum(end - start)
 
+        # property update statistics
+        if propUpdateSet is True:
+            print(f"property update: {FunParam['propertyUpdate'].stats()}")
+
         # NOTE
         # steady-state result
         # txt
@@ -4462,10 +4578,17 @@ class PackedBedReactorClass:
         comList = FunParam['compList']
         # const ->
         const = FunParam['const']
+        # property tables
+        propTableSet = const['propTableSet']
+        # reaction enthalpy method
+        reactionEnthalpyMethod = const['reactionEnthalpyMethod']
         # cross-sectional area [m^2]
         CrSeAr = const['CrSeAr']
         # component molecular weight [g/mol]
         MoWei = const['MoWei']
+        # critical temperature [K] and pressure [bar]
+        CrTei = const['CrTei']
+        CrPri = const['CrPri']
         # standard heat of reaction at 25C [kJ/kmol] | [J/mol]
         StHeRe25 = const['StHeRe25']
         # gas viscosity [Pa.s]
@@ -4559,25 +4682,15 @@ class PackedBedReactorClass:
         zNoNoDense = zNoNo[0]
         # normal
         zNoNoNormal = zNoNo[1]
-
-        # solver setting
-        solverSetting = FunParam['solverSetting']
-        # mass balance equation
-        DIFF1_C_SET = solverSetting['dFdz']
-        DIFF2_C_SET_BC1 = solverSetting['d2Fdz2']['BC1']
-        DIFF2_C_SET_BC2 = solverSetting['d2Fdz2']['BC2']
-        DIFF2_C_SET_G = solverSetting['d2Fdz2']['G']
-        # energy balance equation
-        DIFF1_T_SET = solverSetting['dTdz']
-        DIFF2_T_SET_BC1 = solverSetting['d2Tdz2']['BC1']
-        DIFF2_T_SET_BC2 = solverSetting['d2Tdz2']['BC2']
-        DIFF2_T_SET_G = solverSetting['d2Tdz2']['G']
+        # axial derivative operators
+        zDiffOperator = meshSetting['zDiffOperator']
 
         # reaction rate expressions
         reactionRateExpr = FunParam['reactionRateExpr']
-        # using equation
-        varisSet = reactionRateExpr['VARS']
-        ratesSet = reactionRateExpr['RATES']
+        # compiled reaction rate set
+        reactionRateSet = FunParam['reactionRateSet']
+        # stoichiometric coefficient matrix
+        reactionStochCoeffMat = FunParam['reactionStochCoeffMat']
 
         # dimensionless analysis params
 
@@ -4743,9 +4856,180 @@ class PackedBedReactorClass:
         # dxdtMat = np.zeros((varNo, zNo))
         dxdtMat = np.zeros((noLayer, varNoRows, varNoColumns))
 
+        # NOTE
+        ### all nodes ###
+        # concentration scale [kmol/m^3]
+        SpCoi0_Set_z = SpCoi0 if MODEL_SETTING['GaMaCoTe0'] != "MAX" else np.repeat(
+            np.max(SpCoi0), compNo)
+        SpCoi0_Set_z = np.reshape(SpCoi0_Set_z, (compNo, 1))
+
+        # concentration species in the gas phase [kmol/m^3]
+        CoSpi_z_ReVa = np.maximum(SpCoi_z, CONST.EPS_CONST)*SpCoi0_Set_z
+        # total concentration [kmol/m^3]
+        CoSp_z_ReVa = np.sum(CoSpi_z_ReVa, axis=0)
+        # mole fraction in the gas phase
+        MoFri_z = CoSpi_z_ReVa/CoSp_z_ReVa
+        # mixture molecular weight [kg/mol]
+        MiMoWe_z = rmtUtil.mixtureMolecularWeightMat(MoFri_z, MoWei, "kg/mol")
+        # gas density [kg/m^3]
+        GaDe_z = calDensityIG(MiMoWe_z, CoSp_z_ReVa*1000)
+
+        # superficial gas velocity [m/s]
+        # FIXME
+        # dimensionless velocity v = 1
+        SuGaVe_z_ReVa = rmtUtil.calRealDiLessValue(1, SuGaVe0)
+
+        # total flowrate [kmol/s]
+        # [kmol/m^3]*[m/s]*[m^2]
+        MoFlRa_z = calMolarFlowRate(CoSp_z_ReVa, SuGaVe_z_ReVa, CrSeAr)
+        # molar flowrate list [kmol/s]
+        # shape: (compNo, zNo)
+        MoFlRai_z = MoFlRa_z*MoFri_z
+
+        # heat capacity at constant pressure of mixture Cp [kJ/kmol.K] | [J/mol.K]
+        # gas phase
+        T_z_ReVa = rmtUtil.calRealDiLessValue(T_z, T0, "TEMP")
+        # Cp mean list, shape: (compNo, zNo)
+        GaCpMeanList_z = calMeanHeatCapacityAtConstantPressure(
+            comList, T_z_ReVa, propTableSet=propTableSet)
+        # Cp mixture
+        GaCpMeanMix_z = calMixtureHeatCapacityAtConstantPressureMat(
+            MoFri_z, GaCpMeanList_z)
+
+        # ergun equation
+        ergA = 150*GaMiVi*SuGaVe_z_ReVa/(PaDi**2)
+        ergB = ((1-BeVoFr)**2)/(BeVoFr**3)
+        ergC = 1.75*GaDe_z*(SuGaVe_z_ReVa**2)/PaDi
+        ergD = (1-BeVoFr)/(BeVoFr**3)
+        RHS_ergun_z = -1*(ergA*ergB + ergC*ergD)
+
+        # momentum balance (ergun equation)
+        # pressure [Pa]
+        P_z[1:] = P_z[0] + np.cumsum(RHS_ergun_z*dz)
+
+        # concentration species in the solid phase [kmol/m^3]
+        # shape: (compNo, rNo, zNo)
+        CosSpi_zr_ReVa = np.maximum(SpCosi_mzr, CONST.EPS_CONST) * \
+            np.reshape(SpCoi0_Set_z, (compNo, 1, 1))
+        # mole fraction in the solid phase
+        MoFrsi_zr = CosSpi_zr_ReVa/np.sum(CosSpi_zr_ReVa, axis=0)
+        # temperature in the solid phase [K]
+        Ts_zr_ReVa = rmtUtil.calRealDiLessValue(Ts_z, Tf, "TEMP")
+
+        ## kinetics ##
+        # net reaction rate expression [kmol/m^3.s] for all nodes
+        # shape: (reactionListNo, rNo, zNo)
+        loopVarsGrid = (Ts_zr_ReVa, P_z[0:zNo], MoFrsi_zr, CosSpi_zr_ReVa)
+        Ri_rz = reactionRateSet.reactionRateExeGrid(loopVarsGrid)
+        # shape: (zNo, rNo, reactionListNo)
+        Ri_zr = np.transpose(Ri_rz, (2, 1, 0))
+        # component formation rate [kmol/m^3.s]
+        # shape: (zNo, rNo, compNo)
+        ri_zr = componentFormationRateMat(reactionStochCoeffMat, Ri_zr)
+
+        # volumetric flowrate [m^3/s]
+        VoFlRai_z = calVolumetricFlowrateIGMat(
+            P_z[0:zNo], T_z, 1000*MoFlRai_z)
+
+        # NOTE
+        # transport/film properties are updated only for the nodes whose
+        # T/P/composition changed (property update scheduler)
+        propUpdate = FunParam.get('propertyUpdate')
+        # node state variables
+        stateVars_z = (T_z_ReVa, P_z[0:zNo], MoFri_z)
+
+        # diffusivity coefficient - gas phase [m^2/s]
+        # shape: (compNo, zNo)
+        if MODEL_SETTING['GaDii'] != "FIX":
+            def GaDiiFun(index):
+                GaDiiParams = {
+                    "MoFri": MoFri_z[:, index],
+                    "T": T_z_ReVa[index],
+                    "P": P_z[index],
+                    "MWi": MoWei,
+                    "CrTei": CrTei,
+                    "CrPri": CrPri
+                }
+                return calGaDiEq1Mat(comList, GaDiiParams)
+            GaDii_z = propertyUpdateExe(
+                propUpdate, "GaDii", stateVars_z, GaDiiFun)
+
+        # viscosity in the gas phase [Pa.s] | [kg/m.s]
+        if MODEL_SETTING['GaVii'] != "FIX":
+            def GaViiFun(index):
+                # shape: (compNo, nodes)
+                _GaVii = calGasViscosity(comList, T_z_ReVa[index], propTableSet=propTableSet)
+                # mixture viscosity (wilke method), shape: (nodes)
+                return _GaVii, calMixturePropertyM1Mat(_GaVii.T, MoFri_z[:, index].T, MoWei)
+            GaVii_z, GaViMix_z = propertyUpdateExe(
+                propUpdate, "GaVii", stateVars_z, GaViiFun)
+
+        # thermal conductivity - gas phase [J/s.m.K]
+        if MODEL_SETTING['GaThCoi'] != "FIX":
+            def GaThCoiFun(index):
+                # shape: (compNo, nodes)
+                _GaThCoi = calGasThermalConductivity(comList, T_z_ReVa[index], propTableSet=propTableSet)
+                # mixture thermal conductivity (wilke method), shape: (nodes)
+                return _GaThCoi, calMixturePropertyM1Mat(_GaThCoi.T, MoFri_z[:, index].T, MoWei)
+            GaThCoi_z, GaThCoMix_z = propertyUpdateExe(
+                propUpdate, "GaThCoi", stateVars_z, GaThCoiFun)
+
+        # film coefficients - gas/solid
+        if MODEL_SETTING['MaTrCo'] != "FIX" or MODEL_SETTING['HeTrCo'] != "FIX":
+            # properties of all nodes
+            GaViMix_zF = np.broadcast_to(
+                2.5e-5 if MODEL_SETTING['GaVii'] == "FIX" else GaViMix_z, zNo)
+            GaDii_zF = np.broadcast_to(np.reshape(GaDii0, (compNo, 1)), (compNo, zNo)) \
+                if MODEL_SETTING['GaDii'] == "FIX" else GaDii_z
+            GaThCoMix_zF = np.broadcast_to(
+                GaThCoMix0 if MODEL_SETTING['GaThCoi'] == "FIX" else GaThCoMix_z, zNo)
+
+            def filmFun(index):
+                # dimensionless velocity v = 1 (as in the node loop)
+                # Re, Sc, Sh, Pr, Nu numbers and transfer coefficients
+                _film = calFilmCoefficientMat(
+                    GaDe_z[index], 1, PaDi, GaViMix_zF[index], GaDii_zF[:, index],
+                    GaCpMeanMix_z[index], GaThCoMix_zF[index], MiMoWe_z[index], CONST_EQ_Sh['Frossling'])
+                return _film['MaTrCo'], _film['HeTrCo']
+            MaTrCo_z, HeTrCo_z = propertyUpdateExe(
+                propUpdate, "film", stateVars_z + (CoSp_z_ReVa,), filmFun)
+
+        ## enthalpy ##
+        # solid phase
+        # Cp mean list, shape: (compNo, rNo, zNo)
+        SoCpMeanList_zr = calMeanHeatCapacityAtConstantPressure(
+            comList, Ts_zr_ReVa, propTableSet=propTableSet)
+        # Cp mixture, shape: (rNo, zNo)
+        SoCpMeanMix_zr = calMixtureHeatCapacityAtConstantPressureMat(
+            MoFrsi_zr, SoCpMeanList_zr)
+        # enthalpy change from Tref to T [kJ/kmol] | [J/mol] for all nodes
+        # shape: (reactionListNo, rNo, zNo)
+        EnChList_rz = calEnthalpyChangeOfReaction(
+            reactionListSorted, Ts_zr_ReVa, method=reactionEnthalpyMethod)
+
         # NOTE
         # FIXME
         # define ode equations for each finite difference [zNo]
+        # NOTE
+        # axial derivatives of all nodes (precomputed operators)
+        # first node step size
+        dz0 = dz if solverMeshSet is True else dzs[0]
+        # inlet ghost node (BC1)
+        BC1_C_2 = 1/(np.array(PeNuMa0)*dz0)
+        Ci_0 = np.ones(compNo) if MODEL_SETTING['GaMaCoTe0'] != "MAX" else np.array(
+            SpCoi0)/np.max(SpCoi0)
+        Ci_b0 = (Ci_0 + BC1_C_2*SpCoi_z[:, 1])/(BC1_C_2 + 1)
+        # concentration, shape: (compNo, zNo)
+        dCdz_z, d2Cdz2_z = FiDiDerivativeApply(
+            zDiffOperator['C'], SpCoi_z, Ci_b0)
+        # T*[0] = (T0 - Tf)/Tf
+        BC1_T_2 = 1/(PeNuHe0*dz0)
+        T_b0 = (0 + BC1_T_2*T_z[1])/(BC1_T_2 + 1)
+        # temperature, shape: (zNo,)
+        dTdz_z, d2Tdz2_z = FiDiDerivativeApply(zDiffOperator['T'], T_z, T_b0)
+        dTdz_z = dTdz_z[0]
+        d2Tdz2_z = d2Tdz2_z[0]
+
         for z in range(varNoColumns):
             ## block ##
 
@@ -4809,8 +5093,7 @@ class PackedBedReactorClass:
 
             ## calculate ##
             # mole fraction in the gas phase
-            MoFri = np.array(
-                rmtUtil.moleFractionFromConcentrationSpecies(CoSpi_ReVa))
+            MoFri = MoFri_z[:, z]
 
             # mole fraction in the solid phase
             # MoFrsi_r0 = CosSpi_r/CosSp_r
@@ -4829,48 +5112,36 @@ class PackedBedReactorClass:
             SuGaVe_ReVa = rmtUtil.calRealDiLessValue(SuGaVe, SuGaVe0)
 
             # total flowrate [kmol/s]
-            # [kmol/m^3]*[m/s]*[m^2]
-            MoFlRa = calMolarFlowRate(CoSp_ReVa, SuGaVe_ReVa, CrSeAr)
+            MoFlRa = MoFlRa_z[z]
             # molar flowrate list [kmol/s]
-            MoFlRai = MoFlRa*MoFri
-            # convert to [mol/s]
-            MoFlRai_Con1 = 1000*MoFlRai
+            MoFlRai = MoFlRai_z[:, z]
 
             # molar flux [kmol/m^2.s]
             MoFl = MoFlRa/CrSeAr
 
             # volumetric flowrate [m^3/s]
-            VoFlRai = calVolumetricFlowrateIG(P, T, MoFlRai_Con1)
+            VoFlRai = VoFlRai_z[z]
 
             # mixture molecular weight [kg/mol]
-            MiMoWe = rmtUtil.mixtureMolecularWeight(MoFri, MoWei, "kg/mol")
+            MiMoWe = MiMoWe_z[z]
 
             # gas density [kg/m^3]
-            GaDe = calDensityIG(MiMoWe, CoSp_ReVa*1000)
+            GaDe = GaDe_z[z]
             # GaDeEOS = calDensityIGFromEOS(P, T, MiMoWe)
             # dimensionless value
             GaDe_DiLeVa = rmtUtil.calDiLessValue(GaDe, GaDe0)
 
             # NOTE
             # ergun equation
-            ergA = 150*GaMiVi*SuGaVe_ReVa/(PaDi**2)
-            ergB = ((1-BeVoFr)**2)/(BeVoFr**3)
-            ergC = 1.75*GaDe*(SuGaVe_ReVa**2)/PaDi
-            ergD = (1-BeVoFr)/(BeVoFr**3)
-            RHS_ergun = -1*(ergA*ergB + ergC*ergD)
-
-            # momentum balance (ergun equation)
-            dxdt_P = RHS_ergun
-            # dxdt.append(dxdt_P)
-            P_z[z+1] = dxdt_P*dz + P_z[z]
+            # pressure profile (P_z) is calculated for all nodes
 
             # REVIEW
             # FIXME
             # viscosity in the gas phase [Pa.s] | [kg/m.s]
-            GaVii = GaVii0 if MODEL_SETTING['GaVii'] == "FIX" else calTest()
+            GaVii = GaVii0 if MODEL_SETTING['GaVii'] == "FIX" else GaVii_z[:, z]
             # mixture viscosity in the gas phase [Pa.s] | [kg/m.s]
             # FIXME
-            GaViMix = 2.5e-5  # f(yi,GaVi,MWs);
+            GaViMix = 2.5e-5 if MODEL_SETTING['GaVii'] == "FIX" else GaViMix_z[z]
             # kinematic viscosity in the gas phase [m^2/s]
             GaKiViMix = GaViMix/GaDe
 
@@ -4885,13 +5156,12 @@ class PackedBedReactorClass:
             MeThCo = 1
             # thermal conductivity - gas phase [J/s.m.K]
             # GaThCoi = np.zeros(compNo)  # f(T);
-            GaThCoi = GaThCoi0 if MODEL_SETTING['GaThCoi'] == "FIX" else calTest(
-            )
+            GaThCoi = GaThCoi0 if MODEL_SETTING['GaThCoi'] == "FIX" else GaThCoi_z[:, z]
             # dimensionless
             GaThCoi_DiLe = GaThCoi/GaThCoi0
             # FIXME
             # mixture thermal conductivity - gas phase [J/s.m.K]
-            GaThCoMix = GaThCoMix0
+            GaThCoMix = GaThCoMix0 if MODEL_SETTING['GaThCoi'] == "FIX" else GaThCoMix_z[z]
             # dimensionless analysis
             GaThCoMix_DiLeVa = GaThCoMix/GaThCoMix0
             # thermal conductivity - solid phase [J/s.m.K]
@@ -4919,7 +5189,7 @@ class PackedBedReactorClass:
 
             # REVIEW
             # diffusivity coefficient - gas phase [m^2/s]
-            GaDii = GaDii0 if MODEL_SETTING['GaDii'] == "FIX" else calTest()
+            GaDii = GaDii0 if MODEL_SETTING['GaDii'] == "FIX" else GaDii_z[:, z]
             # dimensionless analysis
             GaDii_DiLeVa = GaDii/GaDii0
             # effective diffusivity coefficient - gas phase
@@ -4933,38 +5203,19 @@ class PackedBedReactorClass:
 
             # REVIEW
             if MODEL_SETTING['MaTrCo'] != "FIX":
-                ### dimensionless numbers ###
-                # Re Number
-                ReNu = calReNoEq1(GaDe, SuGaVe, PaDi, GaViMix)
-                # Sc Number
-                ScNu = calScNoEq1(GaDe, GaViMix, GaDii)
-                # Sh Number (choose method)
-                ShNu = calShNoEq1(ScNu, ReNu, CONST_EQ_Sh['Frossling'])
-
-                # mass transfer coefficient - gas/solid [m/s]
-                MaTrCo = calMassTransferCoefficientEq1(ShNu, GaDii, PaDi)
+                # mass transfer coefficient - gas/solid [m/s] (all nodes)
+                MaTrCo = MaTrCo_z[:, z]
 
             # NOTE
             ## kinetics ##
             # net reaction rate expression [kmol/m^3.s]
             # rf[kmol/kgcat.s]*CaDe[kgcat/m^3]
             for r in range(rNo):
-                # loop
-                loopVars0 = (Ts_r_ReVa[r], P_z[z],
-                             MoFrsi_r[r], CosSpi_r_ReVa[r])
-
-                # component formation rate [mol/m^3.s]
-                # check unit
-                r0 = np.array(reactionRateExe(
-                    loopVars0, varisSet, ratesSet))
-
-                # loop
-                Ri_zr[z, r, :] = r0
-                Ri_r[r, :] = r0
+                # reaction rate (all nodes evaluated above)
+                Ri_r[r, :] = Ri_zr[z, r, :]
 
                 # component formation rate [kmol/m^3.s]
-                ri_r[r] = componentFormationRate(
-                    compNo, comList, reactionStochCoeff, Ri_r[r])
+                ri_r[r] = ri_zr[z, r]
 
                 # overall formation rate [kmol/m^3.s]
                 OvR[r] = np.sum(ri_r[r])
@@ -4973,12 +5224,8 @@ class PackedBedReactorClass:
             ### enthalpy calculation ###
             # gas phase
             # heat capacity at constant pressure of mixture Cp [kJ/kmol.K] | [J/mol.K]
-            # Cp mean list
-            GaCpMeanList = calMeanHeatCapacityAtConstantPressure(
-                comList, T_ReVa)
-            # Cp mixture
-            GaCpMeanMix = calMixtureHeatCapacityAtConstantPressure(
-                MoFri, GaCpMeanList)
+            # Cp mixture (all nodes)
+            GaCpMeanMix = GaCpMeanMix_z[z]
             # dimensionless analysis
             GaCpMeanMix_DiLeVa = rmtUtil.calDiLessValue(
                 GaCpMeanMix, GaCpMeanMix0)
@@ -4990,12 +5237,8 @@ class PackedBedReactorClass:
             # solid phase
             for r in range(rNo):
                 # heat capacity at constant pressure of mixture Cp [kJ/kmol.K] | [J/mol.K]
-                # Cp mean list
-                SoCpMeanList = calMeanHeatCapacityAtConstantPressure(
-                    comList, Ts_r_ReVa[r])
-                # Cp mixture
-                SoCpMeanMix[r] = calMixtureHeatCapacityAtConstantPressure(
-                    MoFrsi_r[r], SoCpMeanList)
+                # Cp mixture (all nodes)
+                SoCpMeanMix[r] = SoCpMeanMix_zr[r, z]
 
                 # effective heat capacity - solid phase [kJ/m^3.K]
                 SoCpMeanMixEff_ReVa[r] = CosSp_r_ReVa[r] * \
@@ -5003,8 +5246,7 @@ class PackedBedReactorClass:
 
                 # enthalpy change from Tref to T [kJ/kmol] | [J/mol]
                 # enthalpy change
-                EnChList = np.array(
-                    calEnthalpyChangeOfReaction(reactionListSorted, Ts_r_ReVa[r]))
+                EnChList = EnChList_rz[:, r, z]
                 # heat of reaction at T [kJ/kmol] | [J/mol]
                 HeReT = np.array(EnChList + StHeRe25)
                 # overall heat of reaction [kJ/m^3.s]
@@ -5014,16 +5256,8 @@ class PackedBedReactorClass:
 
             # REVIEW
             if MODEL_SETTING['HeTrCo'] != "FIX":
-                ### dimensionless numbers ###
-                # Prandtl Number
-                # MW kg/mol -> g/mol
-                # MiMoWe_Conv = 1000*MiMoWe
-                PrNu = calPrNoEq1(
-                    GaCpMeanMix, GaViMix, GaThCoMix, MiMoWe)
-                # Nu number
-                NuNu = calNuNoEq1(PrNu, ReNu)
-                # heat transfer coefficient - gas/solid [J/m^2.s.K]
-                HeTrCo = calHeatTransferCoefficientEq1(NuNu, GaThCoMix, PaDi)
+                # heat transfer coefficient - gas/solid [J/m^2.s.K] (all nodes)
+                HeTrCo = HeTrCo_z[z]
 
             # REVIEW
             # heat transfer coefficient - medium side [J/m2.s.K]
@@ -5123,125 +5357,10 @@ class PackedBedReactorClass:
                 # concentration [kmol/m^3]
                 # central
                 Ci_c = SpCoi_z[i][z]
-                # check BC
-                if z == 0 and solverMeshSet is True:
-                    # NOTE
-                    # BC1 (normal)
-                    BC1_C_1 = PeNuMa0[i]*dz
-                    BC1_C_2 = 1/BC1_C_1
-                    # forward
-                    Ci_f = SpCoi_z[i][z+1]
-                    Ci_ff = SpCoi_z[i][z+2]
-                    # backward
-                    # GaDii_DiLeVa = 1
-                    Ci_0 = 1 if MODEL_SETTING['GaMaCoTe0'] != "MAX" else SpCoi0[i]/np.max(
-                        SpCoi0)
-                    Ci_b = (Ci_0 + BC1_C_2*Ci_f)/(BC1_C_2 + 1)
-                    Ci_bb = 0
-                    # function value
-                    dFdz_C = [Ci_b, Ci_c, Ci_f]
-                    d2Fdz2_C = [Ci_bb, Ci_b, Ci_c, Ci_f, Ci_ff]
-                    # dFdz
-                    dCdz = FiDiDerivative1(dFdz_C, dz, DIFF1_C_SET)
-                    # d2Fdz2
-                    d2Cdz2 = FiDiDerivative2(d2Fdz2_C, dz, DIFF2_C_SET_BC1)
-                elif z == 0 and solverMeshSet is False:
-                    # NOTE
-                    # BC1 (dense)
-                    # i=0 is discretized based on inlet
-                    # i=1
-                    BC1_C_1 = PeNuMa0[i]*dzs[z]
-                    BC1_C_2 = 1/BC1_C_1
-                    # forward
-                    Ci_f = SpCoi_z[i][z+1]
-                    Ci_ff = SpCoi_z[i][z+2]
-                    # backward
-                    # GaDii_DiLeVa = 1
-                    Ci_0 = 1 if MODEL_SETTING['GaMaCoTe0'] != "MAX" else SpCoi0[i]/np.max(
-                        SpCoi0)
-                    Ci_b = (Ci_0 + BC1_C_2*Ci_f)/(BC1_C_2 + 1)
-                    Ci_bb = 0
-                    # function value
-                    dFdz_C = [Ci_b, Ci_c, Ci_f]
-                    d2Fdz2_C = [Ci_bb, Ci_b, Ci_c, Ci_f, Ci_ff]
-                    # REVIEW
-                    ### uniform nodes ###
-                    # dFdz
-                    dCdz = FiDiDerivative1(dFdz_C, dzs[z], DIFF1_C_SET)
-                    # d2Fdz2
-                    # d2Cdz2 = FiDiDerivative2(d2Fdz2_C, dzs[z], DIFF2_C_SET_BC1)
-                    ### non-uniform nodes ###
-                    # R value
-                    _zR_b = 0
-                    _zR_c = dzs[z]/dzs[z-1]
-                    # dCdz = FiDiNonUniformDerivative1(
-                    #     dFdz_C, dzs[z], DIFF1_C_SET, zR[z])
-                    # d2Fdz2
-                    d2Cdz2 = FiDiNonUniformDerivative2(
-                        d2Fdz2_C, dzs[z], DIFF2_C_SET_BC1, _zR_c)
-                    # FIXME
-                    checkME = 0
-                elif (z > 0 and z < zNoNoDense) and solverMeshSet is False:
-                    # NOTE
-                    # dense section
-                    # i=2,...,zNoNoDense-1
-                    # forward
-                    Ci_f = SpCoi_z[i][z+1]
-                    Ci_ff = SpCoi_z[i][z+2]
-                    # backward
-                    Ci_b = SpCoi_z[i][z-1]
-                    Ci_bb = SpCoi_z[i][z-2]
-                    # function value
-                    dFdz_C = [Ci_bb, Ci_b, Ci_c, Ci_f, Ci_ff]
-                    d2Fdz2_C = [Ci_bb, Ci_b, Ci_c, Ci_f, Ci_ff]
-                    # REVIEW
-                    ### non-uniform nodes ###
-                    # R value
-                    _zR_b = dzs[z-2]/dzs[z-1]
-                    _zR_c = dzs[z]/dzs[z-1]
-                    #
-                    dCdz = FiDiNonUniformDerivative1(
-                        dFdz_C, dzs[z], DIFF1_C_SET, _zR_b)
-                    # d2Fdz2
-                    d2Cdz2 = FiDiNonUniformDerivative2(
-                        d2Fdz2_C, dzs[z], DIFF2_C_SET_G, _zR_c)
-                    # FIXME
-                    checkME = 0
-                elif z == zNo - 1:
-                    # NOTE
-                    # BC2
-                    # backward
-                    Ci_b = SpCoi_z[i][z-1]
-                    Ci_bb = SpCoi_z[i][z-2]
-                    # forward difference
-                    Ci_f = Ci_b
-                    Ci_ff = 0
-                    # function value
-                    dFdz_C = [Ci_b, Ci_c, Ci_f]
-                    d2Fdz2_C = [Ci_bb, Ci_b, Ci_c, Ci_f, Ci_ff]
-                    # dFdz
-                    dCdz = FiDiDerivative1(dFdz_C, dz, DIFF1_C_SET)
-                    # d2Fdz2
-                    d2Cdz2 = FiDiDerivative2(d2Fdz2_C, dz, DIFF2_C_SET_BC2)
-                else:
-                    # NOTE
-                    # normal sections
-                    # interior nodes
-                    # forward
-                    Ci_f = SpCoi_z[i][z+1]
-                    Ci_ff = SpCoi_z[i][z+2] if z < zNo-2 else 0
-                    # backward
-                    Ci_b = SpCoi_z[i][z-1]
-                    Ci_bb = SpCoi_z[i][z-2]
-                    # function value
-                    dFdz_C = [Ci_b, Ci_c, Ci_f]
-                    d2Fdz2_C = [Ci_bb, Ci_b, Ci_c, Ci_f, Ci_ff]
-                    # REVIEW
-                    ### uniform nodes ###
-                    # dFdz
-                    dCdz = FiDiDerivative1(dFdz_C, dz, DIFF1_C_SET)
-                    # d2Fdz2
-                    d2Cdz2 = FiDiDerivative2(d2Fdz2_C, dz, DIFF2_C_SET_G)
+                # NOTE
+                # axial derivatives (BC1, BC2, dense/normal sections)
+                dCdz = dCdz_z[i][z]
+                d2Cdz2 = d2Cdz2_z[i][z]
 
                 # REVIEW
                 # cal differentiate
@@ -5308,119 +5427,10 @@ class PackedBedReactorClass:
             # temperature at different points of particle radius [rNo]
             # Ts[3], Ts[2], Ts[1], Ts[0]
             _Ts_r = Ts_r.flatten()
-            # check BC
-            if z == 0 and solverMeshSet is True:
-                # BC1
-                BC1_T_1 = PeNuHe0*dz
-                BC1_T_2 = 1/BC1_T_1
-                # forward
-                T_f = T_z[z+1]
-                T_ff = T_z[z+2]
-                # backward
-                # GaDe_DiLeVa, GaCpMeanMix_DiLeVa, v_z_DiLeVa = 1
-                # T*[0] = (T0 - Tf)/Tf
-                T_0 = 0
-                T_b = (T_0 + BC1_T_2*T_f)/(BC1_T_2 + 1)
-                T_bb = 0
-                # function value
-                dFdz_T = [T_b, T_c, T_f]
-                d2Fdz2_T = [T_bb, T_b, T_c, T_f, T_ff]
-                # dFdz
-                dTdz = FiDiDerivative1(dFdz_T, dz, DIFF1_T_SET)
-                # d2Fdz2
-                d2Tdz2 = FiDiDerivative2(d2Fdz2_T, dz, DIFF2_T_SET_BC1)
-            elif z == 0 and solverMeshSet is False:
-                # BC1
-                BC1_T_1 = PeNuHe0*dzs[z]
-                BC1_T_2 = 1/BC1_T_1
-                # forward
-                T_f = T_z[z+1]
-                T_ff = T_z[z+2]
-                # backward
-                # GaDe_DiLeVa, GaCpMeanMix_DiLeVa, v_z_DiLeVa = 1
-                # T*[0] = (T0 - Tf)/Tf
-                T_0 = 0
-                T_b = (T_0 + BC1_T_2*T_f)/(BC1_T_2 + 1)
-                T_bb = 0
-                # function value
-                dFdz_T = [T_b, T_c, T_f]
-                d2Fdz2_T = [T_bb, T_b, T_c, T_f, T_ff]
-                # REVIEW
-                ### uniform nodes ###
-                # dFdz
-                dTdz = FiDiDerivative1(dFdz_T, dzs[z], DIFF1_T_SET)
-                # d2Fdz2
-                # d2Tdz2 = FiDiDerivative2(d2Fdz2_T, dz, DIFF_T_SET_BC1)
-                # REVIEW
-                ### non-uniform nodes ###
-                # R value
-                _zR_b = 0
-                _zR_c = dzs[z]/dzs[z-1]
-                # d2Fdz2
-                d2Tdz2 = FiDiNonUniformDerivative2(
-                    d2Fdz2_T, dzs[z], DIFF2_T_SET_G, _zR_c)
-                # FIXME
-                checkME = 0
-            elif (z > 0 and z < zNoNoDense) and solverMeshSet is False:
-                # NOTE
-                # dense section
-                # i=2,...,zNoNoDense-1
-                # forward
-                T_f = T_z[z+1]
-                T_ff = T_z[z+2]
-                # backward
-                T_b = T_z[z-1]
-                T_bb = T_z[z-2]
-                # function value
-                dFdz_T = [T_bb, T_b, T_c, T_f, T_ff]
-                d2Fdz2_T = [T_bb, T_b, T_c, T_f, T_ff]
-                # REVIEW
-                ### non-uniform nodes ###
-                # R value
-                _zR_b = dzs[z-2]/dzs[z-1]
-                _zR_c = dzs[z]/dzs[z-1]
-                #
-                dTdz = FiDiNonUniformDerivative1(
-                    dFdz_T, dzs[z], DIFF1_T_SET, _zR_b)
-                # d2Fdz2
-                d2Tdz2 = FiDiNonUniformDerivative2(
-                    d2Fdz2_T, dzs[z], DIFF2_T_SET_G, _zR_c)
-                # FIXME
-                checkME = 0
-            elif z == zNo - 1:
-                # BC2
-                # backward
-                T_b = T_z[z-1]
-                T_bb = T_z[z-2]
-                # forward
-                T_f = T_b
-                T_ff = 0
-                # function value
-                dFdz_T = [T_b, T_c, T_f]
-                d2Fdz2_T = [T_bb, T_b, T_c, T_f, T_ff]
-                # REVIEW
-                ### uniform nodes ###
-                # dFdz
-                dTdz = FiDiDerivative1(dFdz_T, dz, DIFF1_T_SET)
-                # d2Fdz2
-                d2Tdz2 = FiDiDerivative2(d2Fdz2_T, dz, DIFF2_T_SET_BC2)
-            else:
-                # interior nodes
-                # forward
-                T_f = T_z[z+1]
-                T_ff = T_z[z+2] if z < zNo-2 else 0
-                # backward
-                T_b = T_z[z-1]
-                T_bb = T_z[z-2]
-                # function value
-                dFdz_T = [T_b, T_c, T_f]
-                d2Fdz2_T = [T_bb, T_b, T_c, T_f, T_ff]
-                # REVIEW
-                ### uniform nodes ###
-                # dFdz
-                dTdz = FiDiDerivative1(dFdz_T, dz, DIFF1_T_SET)
-                # d2Fdz2
-                d2Tdz2 = FiDiDerivative2(d2Fdz2_T, dz, DIFF2_T_SET_G)
+            # NOTE
+            # axial derivatives (BC1, BC2, dense/normal sections)
+            dTdz = dTdz_z[z]
+            d2Tdz2 = d2Tdz2_z[z]
 
             # REVIEW
             # cal differentiate
@@ -5629,7 +5639,7 @@ class PackedBedReactorClass:
 
         # heat capacity at constant pressure of mixture Cp [kJ/kmol.K] | [J/mol.K]
         # Cp mean list
-        GaCpMeanList0 = calMeanHeatCapacityAtConstantPressure(compList, T)
+        GaCpMeanList0 = calMeanHeatCapacityAtConstantPressure(compList, T, propTableSet=self.propTableSet)
         # Cp mixture
         GaCpMeanMix0 = calMixtureHeatCapacityAtConstantPressure(
             MoFri0, GaCpMeanList0)
@@ -5785,6 +5795,8 @@ class PackedBedReactorClass:
         FunParam = {
             "compList": compList,
             "const": {
+                "propTableSet": self.propTableSet,
+                "reactionEnthalpyMethod": self.reactionEnthalpyMethod,
                 "CrSeAr": CrSeAr,
                 "MoWei": MoWei,
                 "StHeRe25": StHeRe25,
@@ -5822,16 +5834,28 @@ class PackedBedReactorClass:
                 "dz": dz,
                 "dzs": dzs,
                 "zR": zR,
-                "zNoNo": zNoNo
+                "zNoNo": zNoNo,
+                # axial derivative operators (mass/energy balance)
+                "zDiffOperator": {
+                    "C": FiDiDerivativeOperator(zNo, dz, dzs, zNoNo[0], solverMeshSet,
+                                                solverSetting['T1']['dFdz'], solverSetting['T1']['d2Fdz2']),
+                    "T": FiDiDerivativeOperator(zNo, dz, dzs, zNoNo[0], solverMeshSet,
+                                                solverSetting['T1']['dTdz'], solverSetting['T1']['d2Tdz2'])
+                }
             },
             "solverSetting": {
                 "dFdz": solverSetting['T1']['dFdz'],
                 "d2Fdz2": solverSetting['T1']['d2Fdz2'],
                 "dTdz": solverSetting['T1']['dTdz'],
                 "d2Tdz2": solverSetting['T1']['d2Tdz2'],
-                "OrCoClassSetRes": OrCoClassSetRes
+                "OrCoClassSetRes": OrCoClassSetRes,
+                # catalyst particle collocation operators (built once per run)
+                "OrCoCatParticleClassSet": OrCoCatParticleClass(
+                    OrCoClassSetRes['Xc'], OrCoClassSetRes['N'], OrCoClassSetRes['Q'], OrCoClassSetRes['A'], OrCoClassSetRes['B'], varNo)
             },
-            "reactionRateExpr": reactionRateExpr
+            "reactionRateExpr": reactionRateExpr,
+            "reactionRateSet": self.reactionRateSet,
+            "reactionStochCoeffMat": self.reactionStochCoeffMat
 
         }
 
@@ -5879,34 +5903,33 @@ class PackedBedReactorClass:
         # solver selection
         # BDF, Radau, LSODA
         solverIVP = "LSODA" if solverIVPSet == 'default' else solverIVPSet
+        # jacobian sparsity (BDF, Radau)
+        # gas phase is discretized along the reactor length, particle nodes are local,
+        # pressure (ergun equation) depends on the gas phase concentrations of all upstream nodes
+        jacOptions = {
+            "jac_sparsity": FiDiJacobianPattern(noLayer, varNoRows, varNoColumns,
+                                                FiDiStencilHalfWidth(solverSetting['T1'], solverMeshSet), [0], [0], list(range(compNo)))
+        } if solverIVP in ("BDF", "Radau") else {}
 
-        # time loop
-        for i in range(tNo):
-            # set time span
-            t = np.array([opTSpan[i], opTSpan[i+1]])
-            times = np.linspace(t[0], t[1], timesNo)
-
-            # ode call
-            # method [1]: LSODA, [2]: BDF, [3]: Radau
-            # options
-            solverOptions = {
-                "atol": 1e-7
-            }
-
-            sol = solve_ivp(PackedBedReactorClass.modelEquationM8,
-                            t, IV, method=solverIVP, t_eval=times,  args=(reactionListSorted, reactionStochCoeff, FunParam, DimensionlessAnalysisParams))
+        # ode call
+        # single integration over the operation time, the results are saved at opTSpan[1:]
+        # method [1]: LSODA, [2]: BDF, [3]: Radau
+        sol = solve_ivp(PackedBedReactorClass.modelEquationM8,
+                        opTSpan[[0, -1]], IV, method=solverIVP, t_eval=opTSpan[1:], args=(reactionListSorted, reactionStochCoeff, FunParam, DimensionlessAnalysisParams), **jacOptions)
 
-            # ode result
-            successStatus = sol.success
-            # check
-            if successStatus is False:
-                raise
+        # ode result
+        successStatus = sol.success
+        # check
+        if successStatus is False:
+            raise
 
+        # time loop
+        for i in range(tNo):
             # time interval
-            dataTime = sol.t
+            dataTime = sol.t[0:i+1]
             # all results
             # components, temperature layers
-            dataYs = sol.y
+            dataYs = sol.y[:, 0:i+1]
 
             # std format
             dataYs_Reshaped = np.reshape(
@@ -5962,9 +5985,6 @@ class PackedBedReactorClass:
                 # var list
                 dataPacktime[m][i, :] = dataPack[i]['dataYs'][m, :]
 
-            # update initial values [IV]
-            IV = dataYs[:, -1]
-
         # NOTE
         # end of computation
         end = timer()
@@ -6122,6 +6142,10 @@ class PackedBedReactorClass:
         comList = FunParam['compList']
         # const ->
         const = FunParam['const']
+        # property tables
+        propTableSet = const['propTableSet']
+        # reaction enthalpy method
+        reactionEnthalpyMethod = const['reactionEnthalpyMethod']
         # cross-sectional area [m^2]
         CrSeAr = const['CrSeAr']
         # component molecular weight [g/mol]
@@ -6219,35 +6243,21 @@ class PackedBedReactorClass:
         zNoNoDense = zNoNo[0]
         # normal
         zNoNoNormal = zNoNo[1]
+        # axial derivative operators
+        zDiffOperator = meshSetting['zDiffOperator']
 
         # solver setting
         solverSetting = FunParam['solverSetting']
-        # mass balance equation
-        DIFF1_C_SET = solverSetting['dFdz']
-        DIFF2_C_SET_BC1 = solverSetting['d2Fdz2']['BC1']
-        DIFF2_C_SET_BC2 = solverSetting['d2Fdz2']['BC2']
-        DIFF2_C_SET_G = solverSetting['d2Fdz2']['G']
-        # energy balance equation
-        DIFF1_T_SET = solverSetting['dTdz']
-        DIFF2_T_SET_BC1 = solverSetting['d2Tdz2']['BC1']
-        DIFF2_T_SET_BC2 = solverSetting['d2Tdz2']['BC2']
-        DIFF2_T_SET_G = solverSetting['d2Tdz2']['G']
-        # number of collocation points
-        ocN = solverSetting['OrCoClassSetRes']['N']
-        ocXc = solverSetting['OrCoClassSetRes']['Xc']
-        ocA = solverSetting['OrCoClassSetRes']['A']
-        ocB = solverSetting['OrCoClassSetRes']['B']
-        ocQ = solverSetting['OrCoClassSetRes']['Q']
-
-        # init OrCoCatParticle
-        OrCoCatParticleClassSet = OrCoCatParticleClass(
-            ocXc, ocN, ocQ, ocA, ocB, varNo)
+
+        # init OrCoCatParticle (collocation operators built once per run)
+        OrCoCatParticleClassSet = solverSetting['OrCoCatParticleClassSet']
 
         # reaction rate expressions
         reactionRateExpr = FunParam['reactionRateExpr']
-        # using equation
-        varisSet = reactionRateExpr['VARS']
-        ratesSet = reactionRateExpr['RATES']
+        # compiled reaction rate set
+        reactionRateSet = FunParam['reactionRateSet']
+        # stoichiometric coefficient matrix
+        reactionStochCoeffMat = FunParam['reactionStochCoeffMat']
 
         # dimensionless analysis params
 
@@ -6416,6 +6426,41 @@ class PackedBedReactorClass:
         # NOTE
         # FIXME
         # define ode equations for each finite difference [zNo]
+        # NOTE
+        # axial derivatives of all nodes (precomputed operators)
+        # first node step size
+        dz0 = dz if solverMeshSet is True else dzs[0]
+        # inlet ghost node (BC1)
+        BC1_C_2 = 1/(np.array(PeNuMa0)*dz0)
+        Ci_0 = np.ones(compNo) if MODEL_SETTING['GaMaCoTe0'] != "MAX" else np.array(
+            SpCoi0)/np.max(SpCoi0)
+        Ci_b0 = (Ci_0 + BC1_C_2*SpCoi_z[:, 1])/(BC1_C_2 + 1)
+        # concentration, shape: (compNo, zNo)
+        dCdz_z, d2Cdz2_z = FiDiDerivativeApply(
+            zDiffOperator['C'], SpCoi_z, Ci_b0)
+        # T*[0] = (T0 - Tf)/Tf
+        BC1_T_2 = 1/(PeNuHe0*dz0)
+        T_b0 = (0 + BC1_T_2*T_z[1])/(BC1_T_2 + 1)
+        # temperature, shape: (zNo,)
+        dTdz_z, d2Tdz2_z = FiDiDerivativeApply(zDiffOperator['T'], T_z, T_b0)
+        dTdz_z = dTdz_z[0]
+        d2Tdz2_z = d2Tdz2_z[0]
+
+        # NOTE
+        # solid phase (orthogonal collocation) inputs of all z nodes
+        # concentration, shape: (zNo, compNo, rNo)
+        OrCoYs_C = np.zeros((zNo, compNo, rNo))
+        OrCoConst1_C = np.zeros((zNo, compNo))
+        OrCoConst2_C = np.zeros((zNo, compNo, rNo))
+        OrCoConst3_C = (np.zeros((zNo, compNo)), np.zeros((zNo, compNo)))
+        OrCoCoeff_C = np.zeros((zNo, compNo))
+        # temperature, shape: (zNo, rNo)
+        OrCoYs_T = np.zeros((zNo, rNo))
+        OrCoConst1_T = np.zeros(zNo)
+        OrCoConst2_T = np.zeros((zNo, rNo))
+        OrCoConst3_T = (np.zeros(zNo), np.zeros(zNo))
+        OrCoCoeff_T = np.zeros((zNo, rNo))
+
         for z in range(varNoColumns):
             ## block ##
 
@@ -6624,16 +6669,16 @@ class PackedBedReactorClass:
 
                 # component formation rate [mol/m^3.s]
                 # check unit
-                r0 = np.array(reactionRateExe(
-                    loopVars0, varisSet, ratesSet))
+                r0 = np.array(reactionRateSet.reactionRateExe(
+                    loopVars0))
 
                 # loop
                 Ri_zr[z, r, :] = r0
                 Ri_r[r, :] = r0
 
                 # component formation rate [kmol/m^3.s]
-                ri_r[r] = componentFormationRate(
-                    compNo, comList, reactionStochCoeff, Ri_r[r])
+                ri_r[r] = componentFormationRateMat(
+                    reactionStochCoeffMat, Ri_r[r])
 
                 # overall formation rate [kmol/m^3.s]
                 OvR[r] = np.sum(ri_r[r])
@@ -6644,7 +6689,7 @@ class PackedBedReactorClass:
             # heat capacity at constant pressure of mixture Cp [kJ/kmol.K] | [J/mol.K]
             # Cp mean list
             GaCpMeanList = calMeanHeatCapacityAtConstantPressure(
-                comList, T_ReVa)
+                comList, T_ReVa, propTableSet=propTableSet)
             # Cp mixture
             GaCpMeanMix = calMixtureHeatCapacityAtConstantPressure(
                 MoFri, GaCpMeanList)
@@ -6661,7 +6706,7 @@ class PackedBedReactorClass:
                 # heat capacity at constant pressure of mixture Cp [kJ/kmol.K] | [J/mol.K]
                 # Cp mean list
                 SoCpMeanList = calMeanHeatCapacityAtConstantPressure(
-                    comList, Ts_r[r])
+                    comList, Ts_r[r], propTableSet=propTableSet)
                 # Cp mixture
                 SoCpMeanMix[r] = calMixtureHeatCapacityAtConstantPressure(
                     MoFrsi_r[r], SoCpMeanList)
@@ -6673,7 +6718,7 @@ class PackedBedReactorClass:
                 # enthalpy change from Tref to T [kJ/kmol] | [J/mol]
                 # enthalpy change
                 EnChList = np.array(
-                    calEnthalpyChangeOfReaction(reactionListSorted, Ts_r[r]))
+                    calEnthalpyChangeOfReaction(reactionListSorted, Ts_r[r], method=reactionEnthalpyMethod))
                 # heat of reaction at T [kJ/kmol] | [J/mol]
                 HeReT = np.array(EnChList + StHeRe25)
                 # overall heat of reaction [kJ/m^3.s]
@@ -6819,17 +6864,17 @@ class PackedBedReactorClass:
                 _Cs_r_Updated = OrCoCatParticleClassSet.CalUpdateYnSolidGasInterface(
                     _Cs_r, Ci_c, _Cs_r_interface)
 
-                # # dC/dt list
-                dCsdti = OrCoCatParticleClassSet.buildOrCoMatrix(
-                    _Cs_r_Updated, SoDiiEff_DiLe[i], _Ri)
+                # dC/dt list (evaluated for all z nodes after the node loop)
+                OrCoYs_C[z, i] = _Cs_r_Updated.flatten()
+                OrCoConst1_C[z, i] = SoDiiEff_DiLe[i]
+                OrCoConst2_C[z, i] = _Ri
+                OrCoConst3_C[0][z, i] = Ci_c
+                OrCoConst3_C[1][z, i] = _Cs_r_interface
 
                 # const
                 _const1 = CaPo*(rf**2/GaDii0[i])
                 _const2 = 1/_const1
-                #
-                for r in range(rNo):
-                    # update
-                    dxdtMat[i][r+1][z] = _const2*dCsdti[r]
+                OrCoCoeff_C[z, i] = _const2
 
                 # concentration [kmol/m^3]
                 # central
@@ -6844,121 +6889,10 @@ class PackedBedReactorClass:
 
                 # REVIEW
                 ### gas phase ###
-                # check BC
-                if z == 0 and solverMeshSet is True:
-                    # NOTE
-                    # BC1 (normal)
-                    BC1_C_1 = PeNuMa0[i]*dz
-                    BC1_C_2 = 1/BC1_C_1
-                    # forward
-                    Ci_f = SpCoi_z[i][z+1]
-                    Ci_ff = SpCoi_z[i][z+2]
-                    # backward
-                    # GaDii_DiLeVa = 1
-                    Ci_0 = 1 if MODEL_SETTING['GaMaCoTe0'] != "MAX" else SpCoi0[i]/np.max(
-                        SpCoi0)
-                    Ci_b = (Ci_0 + BC1_C_2*Ci_f)/(BC1_C_2 + 1)
-                    Ci_bb = 0
-                    # function value
-                    dFdz_C = [Ci_b, Ci_c, Ci_f]
-                    d2Fdz2_C = [Ci_bb, Ci_b, Ci_c, Ci_f, Ci_ff]
-                    # dFdz
-                    dCdz = FiDiDerivative1(dFdz_C, dz, DIFF1_C_SET)
-                    # d2Fdz2
-                    d2Cdz2 = FiDiDerivative2(d2Fdz2_C, dz, DIFF2_C_SET_BC1)
-                elif z == 0 and solverMeshSet is False:
-                    # NOTE
-                    # BC1 (dense)
-                    # i=0 is discretized based on inlet
-                    # i=1
-                    BC1_C_1 = PeNuMa0[i]*dzs[z]
-                    BC1_C_2 = 1/BC1_C_1
-                    # forward
-                    Ci_f = SpCoi_z[i][z+1]
-                    Ci_ff = SpCoi_z[i][z+2]
-                    # backward
-                    # GaDii_DiLeVa = 1
-                    Ci_0 = 1 if MODEL_SETTING['GaMaCoTe0'] != "MAX" else SpCoi0[i]/np.max(
-                        SpCoi0)
-                    Ci_b = (Ci_0 + BC1_C_2*Ci_f)/(BC1_C_2 + 1)
-                    Ci_bb = 0
-                    # function value
-                    dFdz_C = [Ci_b, Ci_c, Ci_f]
-                    d2Fdz2_C = [Ci_bb, Ci_b, Ci_c, Ci_f, Ci_ff]
-                    # REVIEW
-                    ### uniform nodes ###
-                    # dFdz
-                    dCdz = FiDiDerivative1(dFdz_C, dzs[z], DIFF1_C_SET)
-                    # d2Fdz2
-                    # d2Cdz2 = FiDiDerivative2(d2Fdz2_C, dzs[z], DIFF2_C_SET_BC1)
-                    ### non-uniform nodes ###
-                    # R value
-                    _zR_b = 0
-                    _zR_c = dzs[z]/dzs[z-1]
-                    # dCdz = FiDiNonUniformDerivative1(
-                    #     dFdz_C, dzs[z], DIFF1_C_SET, zR[z])
-                    # d2Fdz2
-                    d2Cdz2 = FiDiNonUniformDerivative2(
-                        d2Fdz2_C, dzs[z], DIFF2_C_SET_BC1, _zR_c)
-                elif (z > 0 and z < zNoNoDense) and solverMeshSet is False:
-                    # NOTE
-                    # dense section
-                    # i=2,...,zNoNoDense-1
-                    # forward
-                    Ci_f = SpCoi_z[i][z+1]
-                    Ci_ff = SpCoi_z[i][z+2]
-                    # backward
-                    Ci_b = SpCoi_z[i][z-1]
-                    Ci_bb = SpCoi_z[i][z-2]
-                    # function value
-                    dFdz_C = [Ci_bb, Ci_b, Ci_c, Ci_f, Ci_ff]
-                    d2Fdz2_C = [Ci_bb, Ci_b, Ci_c, Ci_f, Ci_ff]
-                    # REVIEW
-                    ### non-uniform nodes ###
-                    # R value
-                    _zR_b = dzs[z-2]/dzs[z-1]
-                    _zR_c = dzs[z]/dzs[z-1]
-                    #
-                    dCdz = FiDiNonUniformDerivative1(
-                        dFdz_C, dzs[z], DIFF1_C_SET, _zR_b)
-                    # d2Fdz2
-                    d2Cdz2 = FiDiNonUniformDerivative2(
-                        d2Fdz2_C, dzs[z], DIFF2_C_SET_G, _zR_c)
-                elif z == zNo - 1:
-                    # NOTE
-                    # BC2
-                    # backward
-                    Ci_b = SpCoi_z[i][z-1]
-                    Ci_bb = SpCoi_z[i][z-2]
-                    # forward difference
-                    Ci_f = Ci_b
-                    Ci_ff = 0
-                    # function value
-                    dFdz_C = [Ci_b, Ci_c, Ci_f]
-                    d2Fdz2_C = [Ci_bb, Ci_b, Ci_c, Ci_f, Ci_ff]
-                    # dFdz
-                    dCdz = FiDiDerivative1(dFdz_C, dz, DIFF1_C_SET)
-                    # d2Fdz2
-                    d2Cdz2 = FiDiDerivative2(d2Fdz2_C, dz, DIFF2_C_SET_BC2)
-                else:
-                    # NOTE
-                    # normal sections
-                    # interior nodes
-                    # forward
-                    Ci_f = SpCoi_z[i][z+1]
-                    Ci_ff = SpCoi_z[i][z+2] if z < zNo-2 else 0
-                    # backward
-                    Ci_b = SpCoi_z[i][z-1]
-                    Ci_bb = SpCoi_z[i][z-2]
-                    # function value
-                    dFdz_C = [Ci_b, Ci_c, Ci_f]
-                    d2Fdz2_C = [Ci_bb, Ci_b, Ci_c, Ci_f, Ci_ff]
-                    # REVIEW
-                    ### uniform nodes ###
-                    # dFdz
-                    dCdz = FiDiDerivative1(dFdz_C, dz, DIFF1_C_SET)
-                    # d2Fdz2
-                    d2Cdz2 = FiDiDerivative2(d2Fdz2_C, dz, DIFF2_C_SET_G)
+                # NOTE
+                # axial derivatives (BC1, BC2, dense/normal sections)
+                dCdz = dCdz_z[i][z]
+                d2Cdz2 = d2Cdz2_z[i][z]
 
                 # REVIEW
                 # cal differentiate
@@ -7018,132 +6952,27 @@ class PackedBedReactorClass:
             _Ts_r_Updated = OrCoCatParticleClassSet.CalUpdateYnSolidGasInterface(
                 _Ts_r, T_c, _Ts_r_interfaceVar)
 
-            # dTs/dt list
-            dTsdti = OrCoCatParticleClassSet.buildOrCoMatrix(
-                _Ts_r_Updated, SoThCoEff_DiLeVa, _H)
+            # dTs/dt list (evaluated for all z nodes after the node loop)
+            OrCoYs_T[z] = _Ts_r_Updated.flatten()
+            OrCoConst1_T[z] = SoThCoEff_DiLeVa
+            OrCoConst2_T[z] = _H
+            OrCoConst3_T[0][z] = T_c
+            OrCoConst3_T[1][z] = _Ts_r_interfaceVar
 
             # const
             _const1 = SoCpMeanMixEff_ReVa*Tf/SoHeDiTe0
             _const2 = 1/_const1
-            #
-            for r in range(rNo):
-                # update
-                dxdtMat[indexT][r+1][z] = _const2[r]*dTsdti[r]
+            OrCoCoeff_T[z] = _const2
 
             # updated temperature in the gas-solid interface
             Ts_r_cat_gas = _Ts_r_Updated[-1]
 
             # REVIEW
             ### gas phase ###
-            # check BC
-            if z == 0 and solverMeshSet is True:
-                # BC1
-                BC1_T_1 = PeNuHe0*dz
-                BC1_T_2 = 1/BC1_T_1
-                # forward
-                T_f = T_z[z+1]
-                T_ff = T_z[z+2]
-                # backward
-                # GaDe_DiLeVa, GaCpMeanMix_DiLeVa, v_z_DiLeVa = 1
-                # T*[0] = (T0 - Tf)/Tf
-                T_0 = 0
-                T_b = (T_0 + BC1_T_2*T_f)/(BC1_T_2 + 1)
-                T_bb = 0
-                # function value
-                dFdz_T = [T_b, T_c, T_f]
-                d2Fdz2_T = [T_bb, T_b, T_c, T_f, T_ff]
-                # dFdz
-                dTdz = FiDiDerivative1(dFdz_T, dz, DIFF1_T_SET)
-                # d2Fdz2
-                d2Tdz2 = FiDiDerivative2(d2Fdz2_T, dz, DIFF2_T_SET_BC1)
-            elif z == 0 and solverMeshSet is False:
-                # BC1
-                BC1_T_1 = PeNuHe0*dzs[z]
-                BC1_T_2 = 1/BC1_T_1
-                # forward
-                T_f = T_z[z+1]
-                T_ff = T_z[z+2]
-                # backward
-                # GaDe_DiLeVa, GaCpMeanMix_DiLeVa, v_z_DiLeVa = 1
-                # T*[0] = (T0 - Tf)/Tf
-                T_0 = 0
-                T_b = (T_0 + BC1_T_2*T_f)/(BC1_T_2 + 1)
-                T_bb = 0
-                # function value
-                dFdz_T = [T_b, T_c, T_f]
-                d2Fdz2_T = [T_bb, T_b, T_c, T_f, T_ff]
-                # REVIEW
-                ### uniform nodes ###
-                # dFdz
-                dTdz = FiDiDerivative1(dFdz_T, dzs[z], DIFF1_T_SET)
-                # d2Fdz2
-                # d2Tdz2 = FiDiDerivative2(d2Fdz2_T, dz, DIFF_T_SET_BC1)
-                # REVIEW
-                ### non-uniform nodes ###
-                # R value
-                _zR_b = 0
-                _zR_c = dzs[z]/dzs[z-1]
-                # d2Fdz2
-                d2Tdz2 = FiDiNonUniformDerivative2(
-                    d2Fdz2_T, dzs[z], DIFF2_T_SET_G, _zR_c)
-            elif (z > 0 and z < zNoNoDense) and solverMeshSet is False:
-                # NOTE
-                # dense section
-                # i=2,...,zNoNoDense-1
-                # forward
-                T_f = T_z[z+1]
-                T_ff = T_z[z+2]
-                # backward
-                T_b = T_z[z-1]
-                T_bb = T_z[z-2]
-                # function value
-                dFdz_T = [T_bb, T_b, T_c, T_f, T_ff]
-                d2Fdz2_T = [T_bb, T_b, T_c, T_f, T_ff]
-                # REVIEW
-                ### non-uniform nodes ###
-                # R value
-                _zR_b = dzs[z-2]/dzs[z-1]
-                _zR_c = dzs[z]/dzs[z-1]
-                #
-                dTdz = FiDiNonUniformDerivative1(
-                    dFdz_T, dzs[z], DIFF1_T_SET, _zR_b)
-                # d2Fdz2
-                d2Tdz2 = FiDiNonUniformDerivative2(
-                    d2Fdz2_T, dzs[z], DIFF2_T_SET_G, _zR_c)
-            elif z == zNo - 1:
-                # BC2
-                # backward
-                T_b = T_z[z-1]
-                T_bb = T_z[z-2]
-                # forward
-                T_f = T_b
-                T_ff = 0
-                # function value
-                dFdz_T = [T_b, T_c, T_f]
-                d2Fdz2_T = [T_bb, T_b, T_c, T_f, T_ff]
-                # REVIEW
-                ### uniform nodes ###
-                # dFdz
-                dTdz = FiDiDerivative1(dFdz_T, dz, DIFF1_T_SET)
-                # d2Fdz2
-                d2Tdz2 = FiDiDerivative2(d2Fdz2_T, dz, DIFF2_T_SET_BC2)
-            else:
-                # interior nodes
-                # forward
-                T_f = T_z[z+1]
-                T_ff = T_z[z+2] if z < zNo-2 else 0
-                # backward
-                T_b = T_z[z-1]
-                T_bb = T_z[z-2]
-                # function value
-                dFdz_T = [T_b, T_c, T_f]
-                d2Fdz2_T = [T_bb, T_b, T_c, T_f, T_ff]
-                # REVIEW
-                ### uniform nodes ###
-                # dFdz
-                dTdz = FiDiDerivative1(dFdz_T, dz, DIFF1_T_SET)
-                # d2Fdz2
-                d2Tdz2 = FiDiDerivative2(d2Fdz2_T, dz, DIFF2_T_SET_G)
+            # NOTE
+            # axial derivatives (BC1, BC2, dense/normal sections)
+            dTdz = dTdz_z[z]
+            d2Tdz2 = d2Tdz2_z[z]
 
             # REVIEW
             # cal differentiate
@@ -7173,6 +7002,18 @@ class PackedBedReactorClass:
                               _heTrBeGaSoTerm + _heatExchangeTerm)
             dxdtMat[indexT][0][z] = dxdt_T
 
+        # NOTE
+        # solid phase (orthogonal collocation), all components and z nodes
+        # concentration, shape: (zNo, compNo, rNo)
+        dCsdt_z = OrCoCatParticleClassSet.buildOrCoMatrixBatch(
+            OrCoYs_C, OrCoConst1_C, OrCoConst2_C, OrCoConst3_C)
+        dxdtMat[0:compNo, 1:, :] = np.transpose(
+            OrCoCoeff_C[:, :, np.newaxis]*dCsdt_z, (1, 2, 0))
+        # temperature, shape: (zNo, rNo)
+        dTsdt_z = OrCoCatParticleClassSet.buildOrCoMatrixBatch(
+            OrCoYs_T, OrCoConst1_T, OrCoConst2_T, OrCoConst3_T)
+        dxdtMat[indexT, 1:, :] = np.transpose(OrCoCoeff_T*dTsdt_z)
+
         # NOTE
         # flat
         dxdt = dxdtMat.flatten().tolist()
@@ -7204,6 +7045,8 @@ class PackedBedReactorClass:
         solverIVPSet = solverConfig['ivp']
         solverMesh = solverConfig['mesh']
         solverMeshSet = True if solverMesh == "normal" else False
+        # node results cache (kinetics, thermo)
+        cacheSet = True if solverConfig.get('cache', "False") == "True" else False
 
         # operating conditions
         P = self.modelInput['operating-conditions']['pressure']
@@ -7288,6 +7131,14 @@ class PackedBedReactorClass:
         DoLe = 1
         # ramp list
         rampList = solverSetting['M9']['rampList']
+        # cache setting
+        cacheSetting = solverSetting['M9']['cache']
+        # kinetics cache
+        rateCache = LruCacheClass(
+            cacheSetting['size'], cacheSetting['bits']) if cacheSet is True else None
+        # thermo cache
+        thermoCache = LruCacheClass(
+            cacheSetting['size'], cacheSetting['bits']) if cacheSet is True else None
         # orthogonal collocation points in the r direction
         rNo = solverSetting['M9']['rNo']
         # mesh setting
@@ -7334,7 +7185,7 @@ class PackedBedReactorClass:
 
         # heat capacity at constant pressure of mixture Cp [kJ/kmol.K] | [J/mol.K]
         # Cp mean list
-        GaCpMeanList0 = calMeanHeatCapacityAtConstantPressure(compList, T)
+        GaCpMeanList0 = calMeanHeatCapacityAtConstantPressure(compList, T, propTableSet=self.propTableSet)
         # Cp mixture
         GaCpMeanMix0 = calMixtureHeatCapacityAtConstantPressure(
             MoFri0, GaCpMeanList0)
@@ -7455,7 +7306,10 @@ class PackedBedReactorClass:
         # fun parameters
         FunParam = {
             "compList": compList,
+            "thermoCache": thermoCache,
             "const": {
+                "propTableSet": self.propTableSet,
+                "reactionEnthalpyMethod": self.reactionEnthalpyMethod,
                 "CrSeAr": CrSeAr,
                 "MoWei": MoWei,
                 "StHeRe25": StHeRe25,
@@ -7493,7 +7347,14 @@ class PackedBedReactorClass:
                 "dz": dz,
                 "dzs": dzs,
                 "zR": zR,
-                "zNoNo": zNoNo
+                "zNoNo": zNoNo,
+                # axial derivative operators (mass/energy balance)
+                "zDiffOperator": {
+                    "C": FiDiDerivativeOperator(zNo, dz, dzs, zNoNo[0], solverMeshSet,
+                                                solverSetting['T1']['dFdz'], solverSetting['T1']['d2Fdz2']),
+                    "T": FiDiDerivativeOperator(zNo, dz, dzs, zNoNo[0], solverMeshSet,
+                                                solverSetting['T1']['dTdz'], solverSetting['T1']['d2Tdz2'])
+                }
             },
             "solverSetting": {
                 "dFdz": solverSetting['T1']['dFdz'],
@@ -7501,8 +7362,13 @@ class PackedBedReactorClass:
                 "dTdz": solverSetting['T1']['dTdz'],
                 "d2Tdz2": solverSetting['T1']['d2Tdz2'],
                 "OrCoClassSetRes": OrCoClassSetRes,
+                # catalyst particle collocation operators (built once per run)
+                "OrCoCatParticleClassSet": OrCoCatParticleClass(
+                    OrCoClassSetRes['Xc'], OrCoClassSetRes['N'], OrCoClassSetRes['Q'], OrCoClassSetRes['A'], OrCoClassSetRes['B'], varNo)
             },
-            "reactionRateExpr": reactionRateExpr
+            "reactionRateExpr": reactionRateExpr,
+            "reactionRateSet": self.reactionRateSet,
+            "reactionStochCoeffMat": self.reactionStochCoeffMat
 
         }
 
@@ -7607,40 +7473,51 @@ class PackedBedReactorClass:
 
         # NOTE
         rampListLen = len(rampList)
-        # ramp nonlinear term
-        for k in range(rampListLen):
-            rampSet = rampList[k]
-            print("rampSet: ", rampSet)
-            ### solve a system of nonlinear algebraic equation ###
-            if solverRootSet == "fsolve":
-                sol = optimize.fsolve(funSet, IV, args=(paramsSet, rampSet))
-                # result
-                successStatus = True if len(sol) > 0 else False
-                # all results
-                # components, temperature layers
-                dataYs = sol
-            elif solverRootSet == "root":
-                # root
-                # lm, krylov, anderson, hybr, broyden1, linearmixing, diagbroyden, excitingmixing
-                sol = optimize.root(funSet, IV, args=(
-                    paramsSet, rampSet), method='lm')
-                # result
-                successStatus = sol.success
-                # all results
-                # components, temperature layers
-                dataYs = sol.x
-            elif solverRootSet == "least_squares":
-                sol = optimize.least_squares(
-                    funSet, IV, bounds=setBounds, args=(paramsSet, rampSet))
-                # result
-                successStatus = sol.success
-                # all results
-                # components, temperature layers
-                dataYs = sol.x
+        # kinetics cache (this run only)
+        self.reactionRateSet.setCache(rateCache)
+        try:
+            # ramp nonlinear term
+            for k in range(rampListLen):
+                rampSet = rampList[k]
+                print("rampSet: ", rampSet)
+                ### solve a system of nonlinear algebraic equation ###
+                if solverRootSet == "fsolve":
+                    sol = optimize.fsolve(funSet, IV, args=(paramsSet, rampSet))
+                    # result
+                    successStatus = True if len(sol) > 0 else False
+                    # all results
+                    # components, temperature layers
+                    dataYs = sol
+                elif solverRootSet == "root":
+                    # root
+                    # lm, krylov, anderson, hybr, broyden1, linearmixing, diagbroyden, excitingmixing
+                    sol = optimize.root(funSet, IV, args=(
+                        paramsSet, rampSet), method='lm')
+                    # result
+                    successStatus = sol.success
+                    # all results
+                    # components, temperature layers
+                    dataYs = sol.x
+                elif solverRootSet == "least_squares":
+                    sol = optimize.least_squares(
+                        funSet, IV, bounds=setBounds, args=(paramsSet, rampSet))
+                    # result
+                    successStatus = sol.success
+                    # all results
+                    # components, temperature layers
+                    dataYs = sol.x
 
-            # NOTE
-            # update initial guess
-            IV = dataYs
+                # NOTE
+                # update initial guess
+                IV = dataYs
+        finally:
+            # the kinetics cache is detached from the shared reaction rate set
+            self.reactionRateSet.setCache(None)
+
+        # cache statistics
+        if cacheSet is True:
+            print(f"kinetics cache: {rateCache.stats()}")
+            print(f"thermo cache: {thermoCache.stats()}")
 
         # check
         if successStatus is False:
@@ -7823,6 +7700,10 @@ class PackedBedReactorClass:
         comList = FunParam['compList']
         # const ->
         const = FunParam['const']
+        # property tables
+        propTableSet = const['propTableSet']
+        # reaction enthalpy method
+        reactionEnthalpyMethod = const['reactionEnthalpyMethod']
         # cross-sectional area [m^2]
         CrSeAr = const['CrSeAr']
         # component molecular weight [g/mol]
@@ -7920,35 +7801,23 @@ class PackedBedReactorClass:
         zNoNoDense = zNoNo[0]
         # normal
         zNoNoNormal = zNoNo[1]
+        # axial derivative operators
+        zDiffOperator = meshSetting['zDiffOperator']
 
         # solver setting
         solverSetting = FunParam['solverSetting']
-        # mass balance equation
-        DIFF1_C_SET = solverSetting['dFdz']
-        DIFF2_C_SET_BC1 = solverSetting['d2Fdz2']['BC1']
-        DIFF2_C_SET_BC2 = solverSetting['d2Fdz2']['BC2']
-        DIFF2_C_SET_G = solverSetting['d2Fdz2']['G']
-        # energy balance equation
-        DIFF1_T_SET = solverSetting['dTdz']
-        DIFF2_T_SET_BC1 = solverSetting['d2Tdz2']['BC1']
-        DIFF2_T_SET_BC2 = solverSetting['d2Tdz2']['BC2']
-        DIFF2_T_SET_G = solverSetting['d2Tdz2']['G']
-        # number of collocation points
-        ocN = solverSetting['OrCoClassSetRes']['N']
-        ocXc = solverSetting['OrCoClassSetRes']['Xc']
-        ocA = solverSetting['OrCoClassSetRes']['A']
-        ocB = solverSetting['OrCoClassSetRes']['B']
-        ocQ = solverSetting['OrCoClassSetRes']['Q']
-
-        # init OrCoCatParticle
-        OrCoCatParticleClassSet = OrCoCatParticleClass(
-            ocXc, ocN, ocQ, ocA, ocB, varNo)
+
+        # init OrCoCatParticle (collocation operators built once per run)
+        OrCoCatParticleClassSet = solverSetting['OrCoCatParticleClassSet']
 
         # reaction rate expressions
         reactionRateExpr = FunParam['reactionRateExpr']
-        # using equation
-        varisSet = reactionRateExpr['VARS']
-        ratesSet = reactionRateExpr['RATES']
+        # compiled reaction rate set
+        reactionRateSet = FunParam['reactionRateSet']
+        # stoichiometric coefficient matrix
+        reactionStochCoeffMat = FunParam['reactionStochCoeffMat']
+        # thermo cache (None: not active)
+        thermoCache = FunParam['thermoCache']
 
         # dimensionless analysis params
 
@@ -8118,6 +7987,26 @@ class PackedBedReactorClass:
         # NOTE
         # FIXME
         # define ode equations for each finite difference [zNo]
+        # NOTE
+        # axial derivatives of all nodes (precomputed operators)
+        # first node step size
+        dz0 = dz if solverMeshSet is True else dzs[0]
+        # inlet ghost node (BC1)
+        BC1_C_2 = 1/(np.array(PeNuMa0)*dz0)
+        Ci_0 = np.ones(compNo) if MODEL_SETTING['GaMaCoTe0'] != "MAX" else np.array(
+            SpCoi0)/np.max(SpCoi0)
+        Ci_b0 = (Ci_0 + BC1_C_2*SpCoi_z[:, 1])/(BC1_C_2 + 1)
+        # concentration, shape: (compNo, zNo)
+        dCdz_z, d2Cdz2_z = FiDiDerivativeApply(
+            zDiffOperator['C'], SpCoi_z, Ci_b0)
+        # T*[0] = (T0 - Tf)/Tf
+        BC1_T_2 = 1/(PeNuHe0*dz0)
+        T_b0 = (0 + BC1_T_2*T_z[1])/(BC1_T_2 + 1)
+        # temperature, shape: (zNo,)
+        dTdz_z, d2Tdz2_z = FiDiDerivativeApply(zDiffOperator['T'], T_z, T_b0)
+        dTdz_z = dTdz_z[0]
+        d2Tdz2_z = d2Tdz2_z[0]
+
         for z in range(varNoColumns):
             ## block ##
             # concentration species in the gas phase [kmol/m^3]
@@ -8328,8 +8217,8 @@ class PackedBedReactorClass:
 
                 # component formation rate [mol/m^3.s]
                 # check unit
-                r0 = np.array(reactionRateExe(
-                    loopVars0, varisSet, ratesSet))
+                r0 = np.array(reactionRateSet.reactionRateExe(
+                    loopVars0))
 
                 # loop
                 Ri_zr[z, r, :] = r0
@@ -8338,8 +8227,8 @@ class PackedBedReactorClass:
                 # REVIEW
                 # add a ramp term to improve convergence
                 # component formation rate [kmol/m^3.s]
-                ri_r[r] = componentFormationRate(
-                    compNo, comList, reactionStochCoeff, Ri_r[r])
+                ri_r[r] = componentFormationRateMat(
+                    reactionStochCoeffMat, Ri_r[r])
 
                 # overall formation rate [kmol/m^3.s]
                 OvR[r] = np.sum(ri_r[r])
@@ -8349,8 +8238,8 @@ class PackedBedReactorClass:
             # gas phase
             # heat capacity at constant pressure of mixture Cp [kJ/kmol.K] | [J/mol.K]
             # Cp mean list
-            GaCpMeanList = calMeanHeatCapacityAtConstantPressure(
-                comList, T_ReVa)
+            GaCpMeanList = cacheExe(thermoCache, "Cp", (T_ReVa,),
+                                    calMeanHeatCapacityAtConstantPressure, comList, T_ReVa, propTableSet=propTableSet)
             # Cp mixture
             GaCpMeanMix = calMixtureHeatCapacityAtConstantPressure(
                 MoFri, GaCpMeanList)
@@ -8366,8 +8255,8 @@ class PackedBedReactorClass:
             for r in range(rNo):
                 # heat capacity at constant pressure of mixture Cp [kJ/kmol.K] | [J/mol.K]
                 # Cp mean list
-                SoCpMeanList = calMeanHeatCapacityAtConstantPressure(
-                    comList, Ts_r[r])
+                SoCpMeanList = cacheExe(thermoCache, "Cp", (Ts_r[r],),
+                                        calMeanHeatCapacityAtConstantPressure, comList, Ts_r[r], propTableSet=propTableSet)
                 # Cp mixture
                 SoCpMeanMix[r] = calMixtureHeatCapacityAtConstantPressure(
                     MoFrsi_r[r], SoCpMeanList)
@@ -8378,8 +8267,8 @@ class PackedBedReactorClass:
 
                 # enthalpy change from Tref to T [kJ/kmol] | [J/mol]
                 # enthalpy change
-                EnChList = np.array(
-                    calEnthalpyChangeOfReaction(reactionListSorted, Ts_r[r]))
+                EnChList = np.array(cacheExe(thermoCache, "EnCh", (Ts_r[r],),
+                                             calEnthalpyChangeOfReaction, reactionListSorted, Ts_r[r], method=reactionEnthalpyMethod))
                 # heat of reaction at T [kJ/kmol] | [J/mol]
                 HeReT = np.array(EnChList + StHeRe25)
                 # overall heat of reaction [kJ/m^3.s]
@@ -8507,133 +8396,10 @@ class PackedBedReactorClass:
 
                 # REVIEW
                 ### gas phase ###
-                # check BC
-                if z == 0 and solverMeshSet is True:
-                    # NOTE
-                    # BC1 (normal)
-                    BC1_C_1 = PeNuMa0[i]*dz
-                    BC1_C_2 = 1/BC1_C_1
-                    # forward
-                    Ci_f = SpCoi_z[i][z+1]
-                    Ci_ff = SpCoi_z[i][z+2]
-                    # backward
-                    # GaDii_DiLeVa = 1
-                    Ci_0 = 1 if MODEL_SETTING['GaMaCoTe0'] != "MAX" else SpCoi0[i]/np.max(
-                        SpCoi0)
-                    Ci_b = (Ci_0 + BC1_C_2*Ci_f)/(BC1_C_2 + 1)
-                    Ci_bb = 0
-                    # function value
-                    dFdz_C = [Ci_b, Ci_c, Ci_f]
-                    d2Fdz2_C = [Ci_bb, Ci_b, Ci_c, Ci_f, Ci_ff]
-                    # dFdz
-                    dCdz = FiDiDerivative1(dFdz_C, dz, DIFF1_C_SET)
-                    # d2Fdz2
-                    d2Cdz2 = FiDiDerivative2(d2Fdz2_C, dz, DIFF2_C_SET_BC1)
-                elif z == 0 and solverMeshSet is False:
-                    # NOTE
-                    # BC1 (dense)
-                    # i=0 is discretized based on inlet
-                    # i=1
-                    BC1_C_1 = PeNuMa0[i]*dzs[z]
-                    BC1_C_2 = 1/BC1_C_1
-                    # forward
-                    Ci_f = SpCoi_z[i][z+1]
-                    Ci_ff = SpCoi_z[i][z+2]
-                    # backward
-                    # GaDii_DiLeVa = 1
-                    Ci_0 = 1 if MODEL_SETTING['GaMaCoTe0'] != "MAX" else SpCoi0[i]/np.max(
-                        SpCoi0)
-                    Ci_b = (Ci_0 + BC1_C_2*Ci_f)/(BC1_C_2 + 1)
-                    Ci_bb = 0
-                    # function value
-                    dFdz_C = [Ci_b, Ci_c, Ci_f]
-                    d2Fdz2_C = [Ci_bb, Ci_b, Ci_c, Ci_f, Ci_ff]
-                    # REVIEW
-                    ### uniform nodes ###
-                    # dFdz
-                    dCdz = FiDiDerivative1(dFdz_C, dzs[z], DIFF1_C_SET)
-                    # d2Fdz2
-                    # d2Cdz2 = FiDiDerivative2(d2Fdz2_C, dzs[z], DIFF2_C_SET_BC1)
-                    ### non-uniform nodes ###
-                    # R value
-                    _zR_b = 0
-                    _zR_c = dzs[z]/dzs[z-1]
-                    # dCdz = FiDiNonUniformDerivative1(
-                    #     dFdz_C, dzs[z], DIFF1_C_SET, zR[z])
-                    # d2Fdz2
-                    d2Cdz2 = FiDiNonUniformDerivative2(
-                        d2Fdz2_C, dzs[z], DIFF2_C_SET_BC1, _zR_c)
-                elif (z > 0 and z < zNoNoDense) and solverMeshSet is False:
-                    # NOTE
-                    # dense section
-                    # i=2,...,zNoNoDense-1
-                    # forward
-                    Ci_f = SpCoi_z[i][z+1]
-                    Ci_ff = SpCoi_z[i][z+2]
-                    # backward
-                    Ci_b = SpCoi_z[i][z-1]
-                    Ci_bb = SpCoi_z[i][z-2]
-                    # function value
-                    dFdz_C = [Ci_bb, Ci_b, Ci_c, Ci_f, Ci_ff]
-                    d2Fdz2_C = [Ci_bb, Ci_b, Ci_c, Ci_f, Ci_ff]
-                    # REVIEW
-                    ### non-uniform nodes ###
-                    # R value
-                    _zR_b = dzs[z-2]/dzs[z-1]
-                    _zR_c = dzs[z]/dzs[z-1]
-                    #
-                    dCdz = FiDiNonUniformDerivative1(
-                        dFdz_C, dzs[z], DIFF1_C_SET, _zR_b)
-                    # d2Fdz2
-                    d2Cdz2 = FiDiNonUniformDerivative2(
-                        d2Fdz2_C, dzs[z], DIFF2_C_SET_G, _zR_c)
-                elif z == zNo - 1:
-                    # NOTE
-                    # BC2
-                    # backward
-                    Ci_b = SpCoi_z[i][z-1]
-                    Ci_bb = SpCoi_z[i][z-2]
-                    # forward difference
-                    Ci_f = Ci_b
-                    Ci_ff = 0
-                    # function value
-                    dFdz_C = [Ci_b, Ci_c, Ci_f]
-                    d2Fdz2_C = [Ci_bb, Ci_b, Ci_c, Ci_f, Ci_ff]
-                    # dFdz
-                    dCdz = FiDiDerivative1(dFdz_C, dz, DIFF1_C_SET)
-                    # d2Fdz2
-                    d2Cdz2 = FiDiDerivative2(d2Fdz2_C, dz, DIFF2_C_SET_BC2)
-                else:
-                    # NOTE
-                    # normal sections
-                    # interior nodes
-                    # forward
-                    Ci_f = SpCoi_z[i][z+1]
-                    Ci_ff = SpCoi_z[i][z+2] if z < zNo-2 else 0
-                    # backward
-                    Ci_b = SpCoi_z[i][z-1]
-                    Ci_bb = SpCoi_z[i][z-2]
-                    # function value
-                    dFdz_C = [Ci_b, Ci_c, Ci_f]
-                    d2Fdz2_C = [Ci_bb, Ci_b, Ci_c, Ci_f, Ci_ff]
-                    # REVIEW
-                    ### uniform nodes ###
-                    # dFdz
-                    dCdz = FiDiDerivative1(dFdz_C, dz, DIFF1_C_SET)
-                    # d2Fdz2
-                    d2Cdz2 = FiDiDerivative2(d2Fdz2_C, dz, DIFF2_C_SET_G)
-
-                # REVIEW
-                # *** convective flux between fluid-solid ***
-                # concentration
-                # Ci_c = SpCoi_z[i][z]
-                # concentration in the catalyst surface [kmol/m^3]
-                CosSpi_cat_gas = _Cs_r[0]
-                # dimensionless analysis: real value
-                Ci_f = SpCoi0[i] if MODEL_SETTING['GaMaCoTe0'] != "MAX" else np.max(
-                    SpCoi0)
-                # inward flux [kmol/m^2.s]
-                MoFli_z[i] = MaTrCo[i]*Ci_f*(Ci_c - CosSpi_cat_gas)
+                # NOTE
+                # axial derivatives (BC1, BC2, dense/normal sections)
+                dCdz = dCdz_z[i][z]
+                d2Cdz2 = d2Cdz2_z[i][z]
 
                 # REVIEW
                 # cal differentiate
@@ -8686,115 +8452,10 @@ class PackedBedReactorClass:
 
             # REVIEW
             ### gas phase ###
-            # check BC
-            if z == 0 and solverMeshSet is True:
-                # BC1
-                BC1_T_1 = PeNuHe0*dz
-                BC1_T_2 = 1/BC1_T_1
-                # forward
-                T_f = T_z[z+1]
-                T_ff = T_z[z+2]
-                # backward
-                # GaDe_DiLeVa, GaCpMeanMix_DiLeVa, v_z_DiLeVa = 1
-                # T*[0] = (T0 - Tf)/Tf
-                T_0 = 0
-                T_b = (T_0 + BC1_T_2*T_f)/(BC1_T_2 + 1)
-                T_bb = 0
-                # function value
-                dFdz_T = [T_b, T_c, T_f]
-                d2Fdz2_T = [T_bb, T_b, T_c, T_f, T_ff]
-                # dFdz
-                dTdz = FiDiDerivative1(dFdz_T, dz, DIFF1_T_SET)
-                # d2Fdz2
-                d2Tdz2 = FiDiDerivative2(d2Fdz2_T, dz, DIFF2_T_SET_BC1)
-            elif z == 0 and solverMeshSet is False:
-                # BC1
-                BC1_T_1 = PeNuHe0*dzs[z]
-                BC1_T_2 = 1/BC1_T_1
-                # forward
-                T_f = T_z[z+1]
-                T_ff = T_z[z+2]
-                # backward
-                # GaDe_DiLeVa, GaCpMeanMix_DiLeVa, v_z_DiLeVa = 1
-                # T*[0] = (T0 - Tf)/Tf
-                T_0 = 0
-                T_b = (T_0 + BC1_T_2*T_f)/(BC1_T_2 + 1)
-                T_bb = 0
-                # function value
-                dFdz_T = [T_b, T_c, T_f]
-                d2Fdz2_T = [T_bb, T_b, T_c, T_f, T_ff]
-                # REVIEW
-                ### uniform nodes ###
-                # dFdz
-                dTdz = FiDiDerivative1(dFdz_T, dzs[z], DIFF1_T_SET)
-                # d2Fdz2
-                # d2Tdz2 = FiDiDerivative2(d2Fdz2_T, dz, DIFF_T_SET_BC1)
-                # REVIEW
-                ### non-uniform nodes ###
-                # R value
-                _zR_b = 0
-                _zR_c = dzs[z]/dzs[z-1]
-                # d2Fdz2
-                d2Tdz2 = FiDiNonUniformDerivative2(
-                    d2Fdz2_T, dzs[z], DIFF2_T_SET_G, _zR_c)
-            elif (z > 0 and z < zNoNoDense) and solverMeshSet is False:
-                # NOTE
-                # dense section
-                # i=2,...,zNoNoDense-1
-                # forward
-                T_f = T_z[z+1]
-                T_ff = T_z[z+2]
-                # backward
-                T_b = T_z[z-1]
-                T_bb = T_z[z-2]
-                # function value
-                dFdz_T = [T_bb, T_b, T_c, T_f, T_ff]
-                d2Fdz2_T = [T_bb, T_b, T_c, T_f, T_ff]
-                # REVIEW
-                ### non-uniform nodes ###
-                # R value
-                _zR_b = dzs[z-2]/dzs[z-1]
-                _zR_c = dzs[z]/dzs[z-1]
-                #
-                dTdz = FiDiNonUniformDerivative1(
-                    dFdz_T, dzs[z], DIFF1_T_SET, _zR_b)
-                # d2Fdz2
-                d2Tdz2 = FiDiNonUniformDerivative2(
-                    d2Fdz2_T, dzs[z], DIFF2_T_SET_G, _zR_c)
-            elif z == zNo - 1:
-                # BC2
-                # backward
-                T_b = T_z[z-1]
-                T_bb = T_z[z-2]
-                # forward
-                T_f = T_b
-                T_ff = 0
-                # function value
-                dFdz_T = [T_b, T_c, T_f]
-                d2Fdz2_T = [T_bb, T_b, T_c, T_f, T_ff]
-                # REVIEW
-                ### uniform nodes ###
-                # dFdz
-                dTdz = FiDiDerivative1(dFdz_T, dz, DIFF1_T_SET)
-                # d2Fdz2
-                d2Tdz2 = FiDiDerivative2(d2Fdz2_T, dz, DIFF2_T_SET_BC2)
-            else:
-                # interior nodes
-                # forward
-                T_f = T_z[z+1]
-                T_ff = T_z[z+2] if z < zNo-2 else 0
-                # backward
-                T_b = T_z[z-1]
-                T_bb = T_z[z-2]
-                # function value
-                dFdz_T = [T_b, T_c, T_f]
-                d2Fdz2_T = [T_bb, T_b, T_c, T_f, T_ff]
-                # REVIEW
-                ### uniform nodes ###
-                # dFdz
-                dTdz = FiDiDerivative1(dFdz_T, dz, DIFF1_T_SET)
-                # d2Fdz2
-                d2Tdz2 = FiDiDerivative2(d2Fdz2_T, dz, DIFF2_T_SET_G)
+            # NOTE
+            # axial derivatives (BC1, BC2, dense/normal sections)
+            dTdz = dTdz_z[z]
+            d2Tdz2 = d2Tdz2_z[z]
 
             # REVIEW
             # cal differentiate
@@ -8,7 +8,7 @@ from scipy.integrate import solve_ivp
 # internal
 from PyREMOT.docs.rmtUtility import rmtUtilityClass as rmtUtil
 from PyREMOT.docs.rmtThermo import *
-from PyREMOT.docs.rmtReaction import reactionRateExe, componentFormationRate
+from PyREMOT.docs.rmtReaction import componentFormationRateMat, ReactionRateClass
 # library
 from PyREMOT.library.plot import plotClass as pltc
 # data
@@ -36,11 +36,23 @@ class PlugFlowReactorClass:
     # internal data
     _internalData = []
 
-    def __init__(self, modelInput, internalData, reactionListSorted, reactionStochCoeffList):
+    def __init__(self, modelInput, internalData, reactionListSorted, reactionStochCoeffList, reactionRateSet=None, propTableSet=None):
         self.modelInput = modelInput
         self.internalData = internalData
         self.reactionListSorted = reactionListSorted
         self.reactionStochCoeffList = reactionStochCoeffList
+        # reaction rate set (compiled kinetics)
+        self.reactionRateSet = reactionRateSet if reactionRateSet is not None else ReactionRateClass(
+            modelInput['reaction-rates'])
+        # property tables (opt-in, None: exact correlations)
+        self.propTableSet = propTableSet
+        # reaction enthalpy (solver-config: reaction-enthalpy)
+        # MEAN: mean heat capacity (default), INTEGRAL: closed-form integral of dCp
+        self.reactionEnthalpyMethod = modelInput.get(
+            'solver-config', {}).get('reaction-enthalpy', "MEAN")
+        # stoichiometric coefficient matrix [compNo, reactionNo]
+        self.reactionStochCoeffMat = rmtUtil.setReactionCoeffMatrix(
+            modelInput['feed']['components']['shell'], reactionStochCoeffList)
 
     @property
     def internalData(cls):
@@ -132,6 +144,8 @@ class PlugFlowReactorClass:
         FunParam = {
             "compList": compList,
             "const": {
+                "propTableSet": self.propTableSet,
+                "reactionEnthalpyMethod": self.reactionEnthalpyMethod,
                 "CrSeAr": CrSeAr,
                 "MoWei": MoWei,
                 "StHeRe25": StHeRe25,
@@ -144,6 +158,8 @@ class PlugFlowReactorClass:
                 "MeTe": Tm
             },
             "reactionRateExpr": reactionRateExpr,
+            "reactionRateSet": self.reactionRateSet,
+            "reactionStochCoeffMat": self.reactionStochCoeffMat,
             "constBC1": {
                 "MoFri0": MoFri,
                 "MoFlRa0": MoFlRa,
@@ -250,6 +266,10 @@ class PlugFlowReactorClass:
         comList = FunParam['compList']
         # const ->
         const = FunParam['const']
+        # property tables
+        propTableSet = const['propTableSet']
+        # reaction enthalpy method
+        reactionEnthalpyMethod = const['reactionEnthalpyMethod']
         # cross-sectional area [m^2]
         CrSeAr = const['CrSeAr']
         # component molecular weight [g/mol]
@@ -271,9 +291,10 @@ class PlugFlowReactorClass:
         # reaction rate expressions
         reactionRateExpr = FunParam['reactionRateExpr']
 
-        # using equation
-        varisSet = reactionRateExpr['VARS']
-        ratesSet = reactionRateExpr['RATES']
+        # compiled reaction rate set
+        reactionRateSet = FunParam['reactionRateSet']
+        # stoichiometric coefficient matrix
+        reactionStochCoeffMat = FunParam['reactionStochCoeffMat']
 
         # boundary conditions constants
         constBC1 = FunParam['constBC1']
@@ -324,8 +345,8 @@ class PlugFlowReactorClass:
 
         # component formation rate [mol/m^3.s]
         # check unit
-        RiLoop = np.array(reactionRateExe(
-            loopVars0, varisSet, ratesSet))
+        RiLoop = np.array(reactionRateSet.reactionRateExe(
+            loopVars0))
         Ri = np.copy(RiLoop)
 
         # component formation rate [mol/m^3.s]
@@ -340,13 +361,13 @@ class PlugFlowReactorClass:
         #         ri[k] = _riLoop
 
         # call [mol/m^3.s]
-        ri = componentFormationRate(
-            compNo, comList, reactionStochCoeff, Ri)
+        ri = componentFormationRateMat(
+            reactionStochCoeffMat, Ri)
 
         # enthalpy
         # heat capacity at constant pressure of mixture Cp [kJ/kmol.K] | [J/mol.K]
         # Cp mean list
-        CpMeanList = calMeanHeatCapacityAtConstantPressure(comList, T)
+        CpMeanList = calMeanHeatCapacityAtConstantPressure(comList, T, propTableSet=propTableSet)
         # print(f"Cp mean list: {CpMeanList}")
         # Cp mixture
         CpMeanMixture = calMixtureHeatCapacityAtConstantPressure(
@@ -355,7 +376,7 @@ class PlugFlowReactorClass:
 
         # enthalpy change from Tref to T [kJ/kmol] | [J/mol]
         # enthalpy change
-        EnChList = np.array(calEnthalpyChangeOfReaction(reactionListSorted, T))
+        EnChList = np.array(calEnthalpyChangeOfReaction(reactionListSorted, T, method=reactionEnthalpyMethod))
         # heat of reaction at T [kJ/kmol] | [J/mol]
         HeReT = np.array(EnChList + StHeRe25)
         # overall heat of reaction [J/m^3.s]
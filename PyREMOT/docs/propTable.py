@@ -0,0 +1,167 @@
+# PROPERTY TABLES
+# ----------------
+
+# import packages/modules
+import numpy as np
+# internals
+from PyREMOT.docs.modelSetting import PROPERTY_TABLE_SETTING
+from PyREMOT.core.utilities import LruCacheClass
+
+# built property tables, kept across runs
+# key: (property name, component list, TMin, TMax, tolerance)
+PROPERTY_TABLE_CACHE = LruCacheClass(PROPERTY_TABLE_SETTING['cacheSize'])
+
+
+class PropertyTableClass:
+    """
+    component property tabulated on a uniform temperature grid
+        values are served by linear interpolation, the grid is refined
+        until the interpolation error (checked at the grid midpoints)
+        is below the tolerance
+    args:
+        fun: property function fun(comList, T), T: array
+        comList: component name list
+        TMin: table min temperature [K]
+        TMax: table max temperature [K]
+        size: initial number of grid points
+        tolerance: max relative interpolation error
+        maxSize: max number of grid points
+    """
+
+    def __init__(self, fun, comList, TMin, TMax, size=PROPERTY_TABLE_SETTING['size'],
+                 tolerance=PROPERTY_TABLE_SETTING['tolerance'], maxSize=PROPERTY_TABLE_SETTING['maxSize']):
+        self.comList = tuple(comList)
+        self.TMin = float(TMin)
+        self.TMax = float(TMax)
+        self.tolerance = tolerance
+        # statistics
+        self.hits = 0
+        self.misses = 0
+
+        # check
+        if self.TMax <= self.TMin:
+            raise Exception("property table: TMax must be greater than TMin!")
+
+        # grid refinement
+        _size = max(int(size), 2)
+        while True:
+            _TGrid = np.linspace(self.TMin, self.TMax, _size)
+            _table = self.tabulate(fun, _TGrid)
+            # midpoints
+            _TMid = 0.5*(_TGrid[1:] + _TGrid[:-1])
+            _exact = self.tabulate(fun, _TMid)
+            _interp = 0.5*(_table[:, 1:] + _table[:, :-1])
+            _err = np.abs(_interp - _exact) / \
+                np.maximum(np.abs(_exact), np.finfo(float).tiny)
+            self.maxErr = np.max(_err)
+            # check
+            if self.maxErr <= tolerance or _size >= maxSize:
+                break
+            _size = min(2*_size - 1, maxSize)
+
+        self.size = _size
+        self.dT = (self.TMax - self.TMin)/(_size - 1)
+        self.TGrid = _TGrid
+        # shape: (compNo, size)
+        self.table = _table
+        # interval slope [1/K]
+        self.slope = np.diff(_table, axis=1)/self.dT
+
+    def tabulate(self, fun, TGrid):
+        """
+        exact property values on a grid
+        output:
+            shape: (compNo, gridNo)
+        """
+        _res = fun(self.comList, TGrid)
+        return np.array([np.broadcast_to(np.asarray(item, dtype=float), TGrid.shape)
+                         for item in _res])
+
+    def exe(self, T):
+        """
+        interpolated property values
+        args:
+            T: temperature [K], scalar or array
+        output:
+            shape: (compNo,) | (compNo, T shape), None if T is out of range
+        """
+        # check
+        if np.ndim(T) == 0:
+            if T < self.TMin or T > self.TMax:
+                self.misses += 1
+                return None
+            i = min(int((T - self.TMin)/self.dT), self.size - 2)
+            self.hits += 1
+            return self.table[:, i] + self.slope[:, i]*(T - self.TGrid[i])
+
+        _T = np.asarray(T, dtype=float)
+        if np.min(_T) < self.TMin or np.max(_T) > self.TMax:
+            self.misses += 1
+            return None
+        i = np.minimum(((_T - self.TMin)/self.dT).astype(int), self.size - 2)
+        self.hits += 1
+        return self.table[:, i] + self.slope[:, i]*(_T - self.TGrid[i])
+
+    def stats(self):
+        """
+        table statistics
+        """
+        _calls = self.hits + self.misses
+        return {
+            "size": self.size,
+            "TMin": self.TMin,
+            "TMax": self.TMax,
+            "maxErr": self.maxErr,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hitRate": self.hits/_calls if _calls > 0 else 0
+        }
+
+
+def setPropertyTable(name, fun, comList, TMin, TMax, size=PROPERTY_TABLE_SETTING['size'],
+                     tolerance=PROPERTY_TABLE_SETTING['tolerance'], maxSize=PROPERTY_TABLE_SETTING['maxSize']):
+    """
+    build (or reuse a cached) property table
+    args:
+        name: property name (Cp, Vi, ThCo)
+        fun: property function fun(comList, T)
+        comList: component name list
+        TMin, TMax: temperature range [K]
+    output:
+        PropertyTableClass
+    """
+    _key = (name, tuple(comList), float(TMin), float(TMax), tolerance)
+    _table = PROPERTY_TABLE_CACHE.get(_key)
+    # check
+    if _table is None:
+        _table = PropertyTableClass(
+            fun, comList, TMin, TMax, size, tolerance, maxSize)
+        PROPERTY_TABLE_CACHE.set(_key, _table)
+    return _table
+
+
+def propertyTableExe(propTableSet, name, comList, T):
+    """
+    interpolated property values of a table set
+    args:
+        propTableSet: property tables {name: PropertyTableClass} (None: no table)
+        name: property name (Cp, Vi, ThCo)
+        comList: component name list
+        T: temperature [K], scalar or array
+    output:
+        property values, None if no table is set for the component list or T is out of range
+    """
+    # check
+    if propTableSet is None:
+        return None
+    _table = propTableSet.get(name)
+    if _table is None or _table.comList != tuple(comList):
+        return None
+    return _table.exe(T)
+
+
+def clearPropertyTable():
+    """
+    remove all cached property tables
+    """
+    PROPERTY_TABLE_CACHE.data.clear()
@@ -4,12 +4,19 @@
 # import packages/modules
 # internal
 from PyREMOT.docs.rmtUtility import rmtUtilityClass as rmtUtil
+from PyREMOT.docs.rmtReaction import ReactionRateClass
 from PyREMOT.docs.cReactor import conventionalReactorClass as cRec
 from PyREMOT.docs.pbReactor import PackedBedReactorClass as pbRec
 from PyREMOT.docs.batchReactor import batchReactorClass as bRec
 from PyREMOT.docs.pfReactor import PlugFlowReactorClass as pfRec
 from PyREMOT.docs.pbHeterReactor import PackedBedHeteroReactorClass as pbHeterRec
 from PyREMOT.docs.pbHomoReactor import PackedBedHomoReactorClass as pbHomoRec
+from PyREMOT.docs.rmtThermo import calHeatCapacityAtConstantPressure
+from PyREMOT.docs.gasTransPor import calGasViscosity, calGasThermalConductivity
+from PyREMOT.docs.propTable import setPropertyTable
+from PyREMOT.docs.modelSetting import PROPERTY_TABLE_SETTING
+# core
+from PyREMOT.core import Tref
 # data
 from PyREMOT.data import *
 # core
@@ -33,6 +40,10 @@ class rmtCoreClass():
     def __init__(self, modelMode, modelInput):
         self.modelMode = modelMode
         self.modelInput = modelInput
+        # reaction rate set (compiled kinetics)
+        self.reactionRateSet = None
+        # property tables (opt-in)
+        self.propTableSet = None
 
         # bRec.__init__(self, modelInput, internalDataSet,
         #               reactionListSortedSet)
@@ -46,7 +57,7 @@ class rmtCoreClass():
     # def internalDataSet(self, value):
     #     self._internalDataSet = value
 
-    def gVarCal(self, compList, reactionList):
+    def gVarCal(self, compList, reactionList, reactionRateList):
         """
         init global var
         """
@@ -57,8 +68,11 @@ class rmtCoreClass():
         initReactionRes = self.initReaction(reactionList)
         # reactionListSortedRes = initReactionRes['res1']
         # reactionStochCoeffListRes = initReactionRes['res2']
+
+        # reaction rate expressions (compiled once)
+        initReactionRateRes = self.initReactionRate(reactionRateList)
         # res
-        return [internalDataRes, initReactionRes]
+        return [internalDataRes, initReactionRes, initReactionRateRes]
 
     def modExe(self):
         """
@@ -73,7 +87,7 @@ class rmtCoreClass():
 
         # set data
         # init globals vars
-        gVarRes = self.gVarCal(compList, reactionList)
+        gVarRes = self.gVarCal(compList, reactionList, reactionRateList)
         # set res
         # init database
         _internalDataSet = gVarRes[0]
@@ -84,6 +98,12 @@ class rmtCoreClass():
         _reactionStochCoeffListSet = gVarRes[1]['res2']
         # print(reactionCoeffSet)
 
+        # reaction rate set
+        self.reactionRateSet = gVarRes[2]
+
+        # property tables (opt-in)
+        self.propTableSet = self.initPropertyTable(compList)
+
         # select model type
         modelMode = self.modelMode
         # select
@@ -185,29 +205,64 @@ class rmtCoreClass():
     def initReactionRate(self, reactionRateDict):
         """
         initialize reaction rate expr list
+            VARS/RATES are analyzed once and used for all model equations
+        """
+        # try/except
+        try:
+            # reaction rate set
+            reactionRateSet = ReactionRateClass(reactionRateDict)
+
+            # res
+            return reactionRateSet
+        except Exception as e:
+            raise
+
+    def initPropertyTable(self, compList):
+        """
+        initialize component property tables (Cp, viscosity, thermal conductivity)
+            solver-config:
+                property-table: "True" | "False" (default)
+                property-table-range: [TMin, TMax] [K]
+                property-table-size: initial number of temperature points
+                property-table-tolerance: max relative interpolation error
+            tables are cached per (property, component list, range, tolerance)
+        output:
+            propTableSet: {Cp, Vi, ThCo}: PropertyTableClass | None
         """
         # try/except
         try:
-            # reaction rate expr no
-            reactionRateExprNo = list(reactionRateDict.keys())
-            # reaction rate expr list
-            reactionRateExprList = []
-
-            # reaction rate expression list
-            for i in reactionRateDict:
-                if i != "VAR":
-                    # _loop = rmtRec(reactionRateDict[i])
-                    # print("reaction rate expr: ",
-                    #       _loop.reactionRateFunSet(T=1, P=2, y=3))
-                    # add to list
-                    pass
-                else:
-                    _loop = reactionRateDict[i]
-
-                reactionRateExprList.append(_loop)
+            # solver setting
+            solverConfig = self.modelInput.get('solver-config', {})
+            # check
+            if solverConfig.get('property-table', "False") != "True":
+                return None
+
+            # temperature range [K]
+            T0 = self.modelInput['operating-conditions']['temperature']
+            TMin, TMax = solverConfig.get('property-table-range', [
+                min(Tref, T0 - PROPERTY_TABLE_SETTING['TLower']), T0 + PROPERTY_TABLE_SETTING['TUpper']])
+            # table size/tolerance
+            tableSize = solverConfig.get(
+                'property-table-size', PROPERTY_TABLE_SETTING['size'])
+            tableTol = solverConfig.get(
+                'property-table-tolerance', PROPERTY_TABLE_SETTING['tolerance'])
+
+            # display
+            displayResult = solverConfig.get('display-result', "False") == "True"
+
+            # tables
+            propTableSet = {}
+            for _name, _fun in (("Cp", calHeatCapacityAtConstantPressure),
+                                ("Vi", calGasViscosity),
+                                ("ThCo", calGasThermalConductivity)):
+                propTableSet[_name] = setPropertyTable(
+                    _name, _fun, compList, TMin, TMax, tableSize, tableTol)
+                if displayResult is True:
+                    print(
+                        f"property table {_name}: size {propTableSet[_name].size}, max error {propTableSet[_name].maxErr:.2e}")
 
             # res
-            return reactionRateExprList
+            return propTableSet
         except Exception as e:
             raise
 
@@ -220,7 +275,7 @@ class rmtCoreClass():
         """
         # init plug-flow reactor
         pfRecInit = pfRec(self.modelInput, internalData,
-                          reactionListSorted, reactionStochCoeffList)
+                          reactionListSorted, reactionStochCoeffList, self.reactionRateSet, self.propTableSet)
         # run algorithm
         res = pfRecInit.runM1()
         # result
@@ -232,7 +287,7 @@ class rmtCoreClass():
         """
         # init PBPR
         pbRecInit = pbRec(self.modelInput, internalData,
-                          reactionListSorted, reactionStochCoeffList)
+                          reactionListSorted, reactionStochCoeffList, self.reactionRateSet, self.propTableSet)
         # run algorithm
         res = pbRecInit.runM1()
         return res
@@ -243,7 +298,7 @@ class rmtCoreClass():
         """
         # init reactor
         reInit = pbRec(self.modelInput, internalData,
-                       reactionListSorted, reactionStochCoeffList)
+                       reactionListSorted, reactionStochCoeffList, self.reactionRateSet, self.propTableSet)
         # run algorithm
         res = reInit.runM2()
         return res
@@ -259,7 +314,7 @@ class rmtCoreClass():
         """
         # init plug-flow reactor
         pfRecInit = pfRec(self.modelInput, internalData,
-                          reactionListSorted, reactionStochCoeffList)
+                          reactionListSorted, reactionStochCoeffList, self.reactionRateSet, self.propTableSet)
         # run algorithm
         res = pfRecInit.runM1()
         # result
@@ -271,7 +326,7 @@ class rmtCoreClass():
         """
         # init PBPR
         pbHeterRecInit = pbHeterRec(self.modelInput, internalData,
-                                    reactionListSorted, reactionStochCoeffList)
+                                    reactionListSorted, reactionStochCoeffList, self.reactionRateSet, self.propTableSet)
         # run algorithm
         res = pbHeterRecInit.runM1()
         return res
@@ -303,7 +358,7 @@ class rmtCoreClass():
         """
         # init reactor
         reInit = pbRec(self.modelInput, internalData,
-                       reactionListSorted, reactionStochCoeffList)
+                       reactionListSorted, reactionStochCoeffList, self.reactionRateSet, self.propTableSet)
         # run algorithm
         res = reInit.runM3()
         return res
@@ -314,7 +369,7 @@ class rmtCoreClass():
         """
         # init reactor
         reInit = pbRec(self.modelInput, internalData,
-                       reactionListSorted, reactionStochCoeffList)
+                       reactionListSorted, reactionStochCoeffList, self.reactionRateSet, self.propTableSet)
         # run algorithm
         res = reInit.runM4()
         return res
@@ -325,7 +380,7 @@ class rmtCoreClass():
         """
         # init reactor
         reInit = pbRec(self.modelInput, internalData,
-                       reactionListSorted, reactionStochCoeffList)
+                       reactionListSorted, reactionStochCoeffList, self.reactionRateSet, self.propTableSet)
         # run algorithm
         res = reInit.runM5()
         return res
@@ -336,7 +391,7 @@ class rmtCoreClass():
         """
         # init reactor
         reInit = pbRec(self.modelInput, internalData,
-                       reactionListSorted, reactionStochCoeffList)
+                       reactionListSorted, reactionStochCoeffList, self.reactionRateSet, self.propTableSet)
         # run algorithm
         res = reInit.runM6()
         return res
@@ -347,7 +402,7 @@ class rmtCoreClass():
         """
         # init reactor
         reInit = pbRec(self.modelInput, internalData,
-                       reactionListSorted, reactionStochCoeffList)
+                       reactionListSorted, reactionStochCoeffList, self.reactionRateSet, self.propTableSet)
         # run algorithm
         res = reInit.runM7()
         return res
@@ -358,7 +413,7 @@ class rmtCoreClass():
         """
         # init reactor
         reInit = pbRec(self.modelInput, internalData,
-                       reactionListSorted, reactionStochCoeffList)
+                       reactionListSorted, reactionStochCoeffList, self.reactionRateSet, self.propTableSet)
         # run algorithm
         res = reInit.runM8()
         return res
@@ -369,7 +424,7 @@ class rmtCoreClass():
         """
         # init
         reInit = pbHeterRec(self.modelInput, internalData,
-                            reactionListSorted, reactionStochCoeffList)
+                            reactionListSorted, reactionStochCoeffList, self.reactionRateSet, self.propTableSet)
         # run algorithm
         res = reInit.runM2()
         return res
@@ -380,7 +435,7 @@ class rmtCoreClass():
         """
         # init reactor
         reInit = pbRec(self.modelInput, internalData,
-                       reactionListSorted, reactionStochCoeffList)
+                       reactionListSorted, reactionStochCoeffList, self.reactionRateSet, self.propTableSet)
         # build initial guess
         resIniGuess = reInit.runM3()
         # run algorithm
@@ -396,7 +451,7 @@ class rmtCoreClass():
         """
         # init PBPR
         pbRecInit = pbHomoRec(self.modelInput, internalData,
-                              reactionListSorted, reactionStochCoeffList)
+                              reactionListSorted, reactionStochCoeffList, self.reactionRateSet, self.propTableSet)
         # run algorithm
         res = pbRecInit.runN1()
         return res
@@ -407,7 +462,7 @@ class rmtCoreClass():
         """
         # init PBPR
         pbRecInit = pbHomoRec(self.modelInput, internalData,
-                              reactionListSorted, reactionStochCoeffList)
+                              reactionListSorted, reactionStochCoeffList, self.reactionRateSet, self.propTableSet)
         # run algorithm
         res = pbRecInit.runN2()
         return res
@@ -421,7 +476,7 @@ class rmtCoreClass():
         """
         # init reactor
         reInit = pMod(self.modelInput, internalData,
-                      reactionListSorted, reactionStochCoeffList)
+                      reactionListSorted, reactionStochCoeffList, self.reactionRateSet, self.propTableSet)
         # run algorithm
         res = reInit.runT1()
         return res
@@ -432,7 +487,7 @@ class rmtCoreClass():
         """
         # init reactor
         reInit = pMod(self.modelInput, internalData,
-                      reactionListSorted, reactionStochCoeffList)
+                      reactionListSorted, reactionStochCoeffList, self.reactionRateSet, self.propTableSet)
         # run algorithm
         res = reInit.runT2()
         return res
@@ -443,7 +498,7 @@ class rmtCoreClass():
         """
         # init reactor
         reInit = hMod(self.modelInput, internalData,
-                      reactionListSorted, reactionStochCoeffList)
+                      reactionListSorted, reactionStochCoeffList, self.reactionRateSet, self.propTableSet)
         # run algorithm
         res = reInit.runT1()
         return res
@@ -2,10 +2,473 @@
 # -------------------------
 
 # import packages/modules
+import ast
+import math
 import types
 import numpy as np
+import numpy.polynomial.polynomial as NP_POLY
+from scipy import sparse
 # internals
 from PyREMOT.core import constants as CONST
+from PyREMOT.docs.rmtUtility import rmtUtilityClass as rmtUtil
+
+
+def _npLog(x, base=None):
+    """
+    math.log with optional base for numpy arrays
+    """
+    if base is None:
+        return np.log(x)
+    return np.log(x)/np.log(base)
+
+
+# math functions replaced by numpy (vectorized kinetics)
+NP_MATH_FUN = {
+    "exp": np.exp,
+    "expm1": np.expm1,
+    "log": _npLog,
+    "log10": np.log10,
+    "log2": np.log2,
+    "log1p": np.log1p,
+    "sqrt": np.sqrt,
+    "pow": np.power,
+    "fabs": np.fabs,
+    "floor": np.floor,
+    "ceil": np.ceil,
+    "sin": np.sin,
+    "cos": np.cos,
+    "tan": np.tan,
+    "asin": np.arcsin,
+    "acos": np.arccos,
+    "atan": np.arctan,
+    "sinh": np.sinh,
+    "cosh": np.cosh,
+    "tanh": np.tanh,
+}
+
+# numpy-aware math namespace
+NP_MATH = types.SimpleNamespace(
+    **NP_MATH_FUN, pi=math.pi, e=math.e, inf=math.inf, nan=math.nan)
+
+
+def vectorizeRateFunction(fun, mathSet=NP_MATH, mathFunSet=NP_MATH_FUN):
+    """
+    rebuild a user function (lambda) with a numpy-aware namespace
+        math module and math functions found in the function globals
+        are replaced by their numpy counterparts
+    args:
+        fun: user function
+        mathSet: namespace replacing the math module
+        mathFunSet: dict of functions replacing math functions
+    output:
+        funVec: function accepting numpy arrays
+    """
+    # globals
+    _globals = dict(fun.__globals__)
+    # math function ids
+    _mathFunIds = {id(getattr(math, i)): i for i in mathFunSet}
+
+    for key, item in fun.__globals__.items():
+        if item is math:
+            _globals[key] = mathSet
+        elif id(item) in _mathFunIds:
+            _globals[key] = mathFunSet[_mathFunIds[id(item)]]
+
+    # new function
+    funVec = types.FunctionType(
+        fun.__code__, _globals, fun.__name__, fun.__defaults__, fun.__closure__)
+    return funVec
+
+
+class DualNumberClass:
+    """
+    forward-mode dual number (value and derivatives)
+        val: value, shape: (grid shape)
+        der: derivatives with respect to n seed variables, shape: (n, grid shape)
+    """
+    # numpy arrays defer binary operators to this class
+    __array_priority__ = 1000
+
+    def __init__(self, val, der):
+        self.val = val
+        self.der = der
+
+    @staticmethod
+    def expandDer(der, ndim):
+        """
+        reshape derivatives for broadcasting against a value of ndim dimensions
+        """
+        _ndim = np.ndim(der) - 1
+        if _ndim >= ndim:
+            return der
+        return np.reshape(der, (np.shape(der)[0],) + (1,)*(ndim - _ndim) + np.shape(der)[1:])
+
+    @staticmethod
+    def setDual(val, terms):
+        """
+        build a dual number from a value and chain-rule terms
+        args:
+            val: value
+            terms: list of (partial derivative, der)
+        """
+        _ndim = np.ndim(val)
+        der = 0
+        for coeff, _der in terms:
+            if _der is not None:
+                der = der + coeff*DualNumberClass.expandDer(_der, _ndim)
+        return DualNumberClass(val, der)
+
+    @property
+    def shape(self):
+        return np.shape(self.val)
+
+    def __len__(self):
+        return len(self.val)
+
+    def __getitem__(self, index):
+        _index = index if isinstance(index, tuple) else (index,)
+        return DualNumberClass(self.val[_index], self.der[(slice(None),) + _index])
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __float__(self):
+        return float(self.val)
+
+    def __neg__(self):
+        return DualNumberClass(-self.val, -self.der)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return dualAbs(self)
+
+    def __add__(self, other):
+        b, db = dualParts(other)
+        return DualNumberClass.setDual(self.val + b, [(1, self.der), (1, db)])
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        b, db = dualParts(other)
+        return DualNumberClass.setDual(self.val - b, [(1, self.der), (-1, db)])
+
+    def __rsub__(self, other):
+        b, db = dualParts(other)
+        return DualNumberClass.setDual(b - self.val, [(-1, self.der), (1, db)])
+
+    def __mul__(self, other):
+        b, db = dualParts(other)
+        return DualNumberClass.setDual(self.val*b, [(b, self.der), (self.val, db)])
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        b, db = dualParts(other)
+        return DualNumberClass.setDual(self.val/b, [(1/b, self.der), (-self.val/b**2, db)])
+
+    def __rtruediv__(self, other):
+        b, db = dualParts(other)
+        return DualNumberClass.setDual(b/self.val, [(-b/self.val**2, self.der), (1/self.val, db)])
+
+    def __pow__(self, other):
+        return dualPow(self, other)
+
+    def __rpow__(self, other):
+        return dualPow(other, self)
+
+    def __lt__(self, other):
+        return self.val < dualParts(other)[0]
+
+    def __le__(self, other):
+        return self.val <= dualParts(other)[0]
+
+    def __gt__(self, other):
+        return self.val > dualParts(other)[0]
+
+    def __ge__(self, other):
+        return self.val >= dualParts(other)[0]
+
+
+def dualParts(x):
+    """
+    split value and derivatives (None for constants)
+    """
+    if isinstance(x, DualNumberClass):
+        return x.val, x.der
+    return x, None
+
+
+def dualPow(x, y):
+    """
+    power function for dual numbers
+    """
+    a, da = dualParts(x)
+    b, db = dualParts(y)
+    val = np.power(a, b)
+    # d(a^b) = b*a^(b-1)*da + a^b*ln(a)*db
+    terms = [(b*np.power(a, b - 1), da)]
+    if db is not None:
+        terms.append((val*np.log(a), db))
+    return DualNumberClass.setDual(val, terms)
+
+
+def dualFunction(fun, dFun):
+    """
+    build a dual-aware function from a numpy function and its derivative
+    args:
+        fun: numpy function f(x)
+        dFun: derivative function f'(x, f(x))
+    """
+    def _fun(x):
+        if isinstance(x, DualNumberClass):
+            val = fun(x.val)
+            return DualNumberClass.setDual(val, [(dFun(x.val, val), x.der)])
+        return fun(x)
+    return _fun
+
+
+def dualLog(x, base=None):
+    """
+    math.log with optional base for dual numbers
+    """
+    res = dualLn(x)
+    if base is None:
+        return res
+    return res/np.log(base)
+
+
+dualAbs = dualFunction(np.fabs, lambda x, f: np.sign(x))
+dualLn = dualFunction(np.log, lambda x, f: 1/x)
+
+# math functions replaced by dual-aware functions (kinetics jacobian)
+DUAL_MATH_FUN = {
+    "exp": dualFunction(np.exp, lambda x, f: f),
+    "expm1": dualFunction(np.expm1, lambda x, f: f + 1),
+    "log": dualLog,
+    "log10": dualFunction(np.log10, lambda x, f: 1/(x*np.log(10))),
+    "log2": dualFunction(np.log2, lambda x, f: 1/(x*np.log(2))),
+    "log1p": dualFunction(np.log1p, lambda x, f: 1/(1 + x)),
+    "sqrt": dualFunction(np.sqrt, lambda x, f: 0.5/f),
+    "pow": dualPow,
+    "fabs": dualAbs,
+    "floor": dualFunction(np.floor, lambda x, f: 0*x),
+    "ceil": dualFunction(np.ceil, lambda x, f: 0*x),
+    "sin": dualFunction(np.sin, lambda x, f: np.cos(x)),
+    "cos": dualFunction(np.cos, lambda x, f: -np.sin(x)),
+    "tan": dualFunction(np.tan, lambda x, f: 1 + f**2),
+    "asin": dualFunction(np.arcsin, lambda x, f: 1/np.sqrt(1 - x**2)),
+    "acos": dualFunction(np.arccos, lambda x, f: -1/np.sqrt(1 - x**2)),
+    "atan": dualFunction(np.arctan, lambda x, f: 1/(1 + x**2)),
+    "sinh": dualFunction(np.sinh, lambda x, f: np.cosh(x)),
+    "cosh": dualFunction(np.cosh, lambda x, f: np.sinh(x)),
+    "tanh": dualFunction(np.tanh, lambda x, f: 1 - f**2),
+}
+
+# dual-aware math namespace
+DUAL_MATH = types.SimpleNamespace(
+    **DUAL_MATH_FUN, pi=math.pi, e=math.e, inf=math.inf, nan=math.nan)
+
+
+# expression compiler
+# allowed syntax nodes
+EXPR_NODES = (ast.Expression, ast.BinOp, ast.UnaryOp, ast.Call, ast.Name, ast.Load,
+              ast.Constant, ast.Subscript, ast.Add, ast.Sub, ast.Mult, ast.Div,
+              ast.Pow, ast.Mod, ast.FloorDiv, ast.USub, ast.UAdd)
+# allowed constants
+EXPR_CONST = ("pi", "e")
+
+# compiled expressions (key: expression text)
+EXPR_CACHE = {}
+# compiled numpy expressions (key: expression text)
+EXPR_VEC_CACHE = {}
+
+
+class _ExprTransformer(ast.NodeTransformer):
+    """
+    rewrite names of a validated expression
+        function -> math.fun
+        constant -> math.pi, math.e
+        variable -> x['name']
+        number -> float (no unbounded integer arithmetic such as 9**9**9)
+    """
+
+    def visit_Call(self, node):
+        node.args = [self.visit(item) for item in node.args]
+        node.func = ast.Attribute(value=ast.Name(
+            id='math', ctx=ast.Load()), attr=node.func.id, ctx=ast.Load())
+        return node
+
+    def visit_Name(self, node):
+        if node.id in EXPR_CONST:
+            return ast.Attribute(value=ast.Name(id='math', ctx=ast.Load()), attr=node.id, ctx=ast.Load())
+        return ast.Subscript(value=ast.Name(id='x', ctx=ast.Load()), slice=ast.Constant(value=node.id), ctx=ast.Load())
+
+    def visit_Subscript(self, node):
+        # index is kept as int
+        node.value = self.visit(node.value)
+        return node
+
+    def visit_Constant(self, node):
+        try:
+            return ast.Constant(value=float(node.value))
+        except OverflowError as e:
+            raise Exception(f"not allowed constant ({node.value})") from e
+
+
+def compileExpression(exprText):
+    """
+    compile an expression string to a function of a variable dict
+        the expression is parsed and validated once (arithmetic, math functions,
+        variables and constant index), then cached by expression text,
+        numbers are compiled as floats so a power overflows instead of
+        building an unbounded integer
+        example: "k0*exp(-Ea/(R_CONST*T))*MoFri[0]" -> fun({"k0": ..., "T": ...})
+    args:
+        exprText: expression string
+    output:
+        fun: function as fun(x), x: variable dict, fun.exprVars: variable names
+    """
+    # check cache
+    if exprText in EXPR_CACHE:
+        return EXPR_CACHE[exprText]
+
+    # try/except
+    try:
+        exprTree = ast.parse(exprText.strip(), mode='eval')
+    except SyntaxError as e:
+        raise Exception(f"invalid expression: {exprText}") from e
+
+    # validate
+    for node in ast.walk(exprTree):
+        if not isinstance(node, EXPR_NODES):
+            raise Exception(
+                f"not allowed in expression ({type(node).__name__}): {exprText}")
+        if isinstance(node, ast.Constant) and (not isinstance(node.value, (int, float)) or isinstance(node.value, bool)):
+            raise Exception(f"not allowed constant ({node.value}): {exprText}")
+        if isinstance(node, ast.Call):
+            if not isinstance(node.func, ast.Name) or node.func.id not in NP_MATH_FUN or len(node.keywords) > 0:
+                raise Exception(f"not allowed function: {exprText}")
+        if isinstance(node, ast.Subscript):
+            if not isinstance(node.value, ast.Name) or not isinstance(node.slice, ast.Constant) or not isinstance(node.slice.value, int):
+                raise Exception(f"not allowed index: {exprText}")
+        if isinstance(node, ast.Name) and node.id.startswith('_'):
+            raise Exception(f"not allowed name ({node.id}): {exprText}")
+
+    # variable names (function names excluded)
+    exprVars = set()
+    _funNodes = [node.func for node in ast.walk(
+        exprTree) if isinstance(node, ast.Call)]
+    for node in ast.walk(exprTree):
+        if isinstance(node, ast.Name) and node.id not in EXPR_CONST and all(node is not item for item in _funNodes):
+            exprVars.add(node.id)
+
+    # lambda x: expr
+    exprBody = _ExprTransformer().visit(exprTree.body)
+    funTree = ast.Expression(body=ast.Lambda(args=ast.arguments(
+        posonlyargs=[], args=[ast.arg(arg='x')], kwonlyargs=[], kw_defaults=[], defaults=[]), body=exprBody))
+    ast.fix_missing_locations(funTree)
+    fun = types.FunctionType(compile(funTree, '<expr>', 'eval').co_consts[0],
+                             {"math": math, "__builtins__": {}}, 'expr')
+    fun.exprText = exprText
+    fun.exprVars = exprVars
+
+    # cache
+    EXPR_CACHE[exprText] = fun
+    return fun
+
+
+def compileExpressionVec(exprText):
+    """
+    compile an expression string to a numpy function of a variable dict (cached)
+    args:
+        exprText: expression string
+    output:
+        fun: function as fun(x) accepting numpy arrays
+    """
+    # check cache
+    if exprText not in EXPR_VEC_CACHE:
+        _fun = compileExpression(exprText)
+        fun = vectorizeRateFunction(_fun)
+        fun.exprText = _fun.exprText
+        fun.exprVars = _fun.exprVars
+        EXPR_VEC_CACHE[exprText] = fun
+
+    return EXPR_VEC_CACHE[exprText]
+
+
+def expressionPolynomial(exprText, varName="T"):
+    """
+    polynomial coefficients of an expression string in one variable
+        such as Cp expressions "a + b*T + c*(T**2) + d*(T**3)"
+    args:
+        exprText: expression string
+        varName: variable name
+    output:
+        coeff: coefficient array (lowest order first), None if not a polynomial
+    """
+    # polynomial of a node
+    def _poly(node):
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)) and not isinstance(node.value, bool):
+            return np.array([float(node.value)])
+        if isinstance(node, ast.Name) and node.id == varName:
+            return np.array([0.0, 1.0])
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+            _res = _poly(node.operand)
+            return -_res if isinstance(node.op, ast.USub) else _res
+        if isinstance(node, ast.BinOp):
+            a = _poly(node.left)
+            if isinstance(node.op, ast.Pow):
+                # non-negative integer power
+                b = _poly(node.right)
+                if len(b) != 1 or b[0] < 0 or b[0] != int(b[0]):
+                    raise ValueError(exprText)
+                return NP_POLY.polypow(a, int(b[0]))
+            b = _poly(node.right)
+            if isinstance(node.op, ast.Add):
+                return NP_POLY.polyadd(a, b)
+            if isinstance(node.op, ast.Sub):
+                return NP_POLY.polysub(a, b)
+            if isinstance(node.op, ast.Mult):
+                return NP_POLY.polymul(a, b)
+            if isinstance(node.op, ast.Div) and len(b) == 1:
+                return a/b[0]
+        raise ValueError(exprText)
+
+    # try/except
+    try:
+        return _poly(ast.parse(exprText.strip(), mode='eval').body)
+    except (SyntaxError, ValueError):
+        return None
+
+
+def rateFunctionDeps(fun):
+    """
+    variable names used by a user function
+        compiled expressions keep their variable names, for lambdas
+        the string constants of the code (x['key']) are taken
+    args:
+        fun: user function
+    output:
+        deps: set of variable names
+    """
+    # compiled expression
+    if hasattr(fun, 'exprVars'):
+        return set(fun.exprVars)
+
+    # string constants
+    deps = set()
+    _codes = [fun.__code__]
+    while len(_codes) > 0:
+        _code = _codes.pop()
+        for item in _code.co_consts:
+            if isinstance(item, str):
+                deps.add(item)
+            elif isinstance(item, types.CodeType):
+                _codes.append(item)
+    return deps
 
 
 def reactionRateExe(loopVars, varDict, rateDict):
@@ -61,6 +524,491 @@ def reactionRateExe(loopVars, varDict, rateDict):
     return RiList
 
 
+class ReactionRateClass:
+    """
+    compiled reaction rate expressions (kinetics plan)
+        the VARS/RATES dicts are analyzed once, constants and functions
+        are separated and the evaluation order of the functions is fixed
+        at the first call, then each call only runs the functions
+    args:
+        reactionRateExpr: reaction rate expression dict
+            VARS: defined variables by users
+                _dict = {"key1": fun1, "key2": "expr2", ...}
+            RATES: defined reaction rates by users
+                _dict = {"r1": fun1, "r2": "expr2", ...}
+            expression strings are compiled by compileExpression
+    """
+    # loop variable names
+    loopVarNames = ("T", "P", "MoFri", "SpCoi")
+    # max number of cached (T, P) states
+    tempCacheSize = 1024
+
+    def __init__(self, reactionRateExpr):
+        # variables/rates
+        varDict = reactionRateExpr.get('VARS', {})
+        rateDict = reactionRateExpr.get('RATES', {})
+
+        # constant dict (shared by all calls)
+        self.constDict = {"R_CONST": CONST.R_CONST}
+        # loop variables overwritten by users (kept as constants)
+        self.loopVarSet = [i for i in self.loopVarNames if i not in varDict]
+        # function list [(key, fun)]
+        self.varFunList = []
+
+        for i in varDict:
+            # check function/expression/scaler
+            if isinstance(varDict[i], types.FunctionType):
+                self.varFunList.append((i, varDict[i]))
+            elif isinstance(varDict[i], str):
+                self.varFunList.append((i, compileExpression(varDict[i])))
+            else:
+                self.constDict[i] = varDict[i]
+
+        # rate function list
+        self.rateNameList = list(rateDict.keys())
+        self.rateFunList = [compileExpression(rateDict[j]) if isinstance(rateDict[j], str) else rateDict[j]
+                            for j in self.rateNameList]
+        # number of reactions
+        self.reactionNo = len(self.rateFunList)
+
+        # evaluation order (set at the first call)
+        self.planSet = False
+
+        # vectorized functions (grid mode)
+        self.varFunGridList = []
+        self.rateFunGridList = [vectorizeRateFunction(fun)
+                                for fun in self.rateFunList]
+        # grid mode availability (false: scalar loop over nodes)
+        self.gridSet = True
+
+        # T/P-only variables (set at the first call)
+        self.tempVarFunList = []
+        self.nodeVarFunList = []
+        self.nodeVarFunGridList = []
+        self.tempCache = {}
+
+        # node results cache (LruCacheClass, opt-in)
+        self.rateCache = None
+
+        # dual-aware functions (jacobian mode, set after the plan)
+        self.varFunDualList = []
+        self.rateFunDualList = None
+
+    def buildPlan(self, exeDict):
+        """
+        resolve the evaluation order of the variable functions
+            a function raising KeyError for a variable defined later in
+            the VARS dict is postponed until that variable is available
+        args:
+            exeDict: dict of constants and loop variables
+        """
+        # remaining functions
+        _pending = list(self.varFunList)
+        # function names
+        _pendingNames = set([i[0] for i in _pending])
+        # sorted list
+        _sorted = []
+
+        while len(_pending) > 0:
+            # postponed
+            _postponed = []
+            for item in _pending:
+                try:
+                    exeDict[item[0]] = item[1](exeDict)
+                    _sorted.append(item)
+                    _pendingNames.discard(item[0])
+                except KeyError as e:
+                    if e.args and e.args[0] in _pendingNames:
+                        _postponed.append(item)
+                    else:
+                        raise
+            # check progress
+            if len(_postponed) == len(_pending):
+                raise Exception(
+                    f"circular dependency in reaction rate variables: {[i[0] for i in _postponed]}")
+            _pending = _postponed
+
+        # set
+        self.varFunList = _sorted
+        self.setTempVars(exeDict)
+        self.planSet = True
+
+        return exeDict
+
+    def setTempVars(self, exeDict):
+        """
+        find variables depending only on T and P (such as rate and
+        equilibrium constants), they are evaluated once for each (T, P)
+        and reused for all nodes and calls
+        args:
+            exeDict: dict of evaluated variables (first call)
+        """
+        # loop variables depending on the node (not T, P)
+        _nodeVars = set(["MoFri", "SpCoi"]) & set(self.loopVarSet)
+        # T/P dependent variables
+        _tempVars = set(["T", "P"]) & set(self.loopVarSet)
+        # variables evaluated for each node
+        _nodeSet = set(_nodeVars)
+        # T/P-only function list
+        self.tempVarFunList = []
+        # node function list
+        self.nodeVarFunList = []
+
+        # constants and T, P
+        _tempDict = {key: exeDict[key]
+                     for key in list(self.constDict.keys()) + list(_tempVars)}
+
+        for key, fun in self.varFunList:
+            deps = rateFunctionDeps(fun)
+            _check = len(deps & _nodeSet) == 0
+            # check with T/P-only variables
+            if _check is True:
+                try:
+                    _tempDict[key] = fun(_tempDict)
+                except KeyError:
+                    _check = False
+            # set
+            if _check is True:
+                self.tempVarFunList.append((key, fun))
+            else:
+                self.nodeVarFunList.append((key, fun))
+                _nodeSet.add(key)
+
+        # cache {(T, P): {key: value}}
+        self.tempCache = {}
+
+    def tempVarExe(self, T, P):
+        """
+        execute T/P-only variables (cached)
+        args:
+            T: temperature [K]
+            P: pressure [Pa]
+        output:
+            tempDict: dict of T/P-only variables
+        """
+        # key
+        _key = (float(T), float(P))
+        # check
+        if _key in self.tempCache:
+            return self.tempCache[_key]
+
+        # exe dict
+        exeDict = self.constDict.copy()
+        if "T" in self.loopVarSet:
+            exeDict["T"] = T
+        if "P" in self.loopVarSet:
+            exeDict["P"] = P
+        tempDict = {}
+        for key, fun in self.tempVarFunList:
+            exeDict[key] = fun(exeDict)
+            tempDict[key] = exeDict[key]
+
+        # cache size limit
+        if len(self.tempCache) >= self.tempCacheSize:
+            self.tempCache.clear()
+        self.tempCache[_key] = tempDict
+
+        return tempDict
+
+    def setCache(self, rateCache):
+        """
+        set the node results cache
+        args:
+            rateCache: LruCacheClass (None: no cache)
+        """
+        self.rateCache = rateCache
+
+    def reactionRateExe(self, loopVars):
+        """
+        execute reaction rate expressions
+        args:
+            loopVars: main variables as:
+                T: temperature [K]
+                P: pressure [Pa]
+                MoFri: mole fraction
+                SpCoi: species concentration [mol/m^3]
+        output:
+            RiList: reaction rate list
+        """
+        # check cache
+        if self.rateCache is not None and self.planSet is True:
+            _key = self.rateCache.setKey("Ri", loopVars)
+            RiList = self.rateCache.get(_key)
+            if RiList is None:
+                RiList = self.reactionRateNodeExe(loopVars)
+                self.rateCache.set(_key, tuple(RiList))
+            return list(RiList)
+
+        return self.reactionRateNodeExe(loopVars)
+
+    def reactionRateNodeExe(self, loopVars):
+        """
+        execute reaction rate expressions (no cache)
+        args:
+            loopVars: (T, P, MoFri, SpCoi)
+        output:
+            RiList: reaction rate list
+        """
+        # exe dict
+        exeDict = self.constDict.copy()
+        # loop variables
+        for i, item in enumerate(self.loopVarNames):
+            if item in self.loopVarSet:
+                exeDict[item] = loopVars[i]
+
+        # variables
+        if self.planSet is False:
+            exeDict = self.buildPlan(exeDict)
+        else:
+            # T/P-only variables
+            exeDict.update(self.tempVarExe(loopVars[0], loopVars[1]))
+            for key, fun in self.nodeVarFunList:
+                exeDict[key] = fun(exeDict)
+
+        # reaction rate list
+        RiList = [fun(exeDict) for fun in self.rateFunList]
+
+        # return
+        return RiList
+
+    def reactionRateExeGrid(self, loopVars):
+        """
+        execute reaction rate expressions for all nodes of a grid
+            the user functions are evaluated once with numpy arrays,
+            if they do not accept arrays, the nodes are evaluated one by one
+        args:
+            loopVars: main variables as:
+                T: temperature [K], shape: (grid shape)
+                P: pressure [Pa], shape: broadcastable to grid shape
+                MoFri: mole fraction, shape: (compNo, grid shape)
+                SpCoi: species concentration [mol/m^3], shape: (compNo, grid shape)
+        output:
+            Ri: reaction rate array, shape: (reactionNo, grid shape)
+        """
+        # loop parameters
+        T, P, MoFri, SpCoi = loopVars
+        T = np.asarray(T, dtype=float)
+        MoFri = np.asarray(MoFri, dtype=float)
+        SpCoi = np.asarray(SpCoi, dtype=float)
+        # grid shape
+        gridShape = np.shape(MoFri)[1:]
+        P = np.broadcast_to(np.asarray(P, dtype=float), gridShape)
+        T = np.broadcast_to(T, gridShape)
+
+        # evaluation order is built in the scalar mode
+        if self.planSet is False:
+            _index0 = (slice(None),) + (0,)*len(gridShape)
+            self.reactionRateExe(
+                (T.flat[0], P.flat[0], MoFri[_index0], SpCoi[_index0]))
+
+        # check
+        if self.gridSet is True:
+            try:
+                # numpy returns nan/inf where math raises (such as sqrt of a negative pressure)
+                with np.errstate(invalid="raise", divide="raise"):
+                    return self.exeGrid((T, P, MoFri, SpCoi), gridShape)
+            except (TypeError, ValueError):
+                # scalar functions (such as if/else on variables)
+                self.gridSet = False
+            except FloatingPointError:
+                # invalid state: the scalar mode raises the original error
+                pass
+
+        # node by node
+        Ri = np.zeros((self.reactionNo,) + gridShape)
+        for index in np.ndindex(*gridShape):
+            _index = (slice(None),) + index
+            Ri[_index] = self.reactionRateExe(
+                (T[index], P[index], MoFri[_index], SpCoi[_index]))
+
+        # return
+        return Ri
+
+    def exeGrid(self, loopVars, gridShape):
+        """
+        execute vectorized functions for a grid
+        args:
+            loopVars: (T, P, MoFri, SpCoi) arrays
+            gridShape: grid shape
+        """
+        # vectorized functions
+        if len(self.varFunGridList) != len(self.varFunList):
+            self.varFunGridList = [(key, vectorizeRateFunction(fun))
+                                   for key, fun in self.varFunList]
+            self.nodeVarFunGridList = [(key, vectorizeRateFunction(fun))
+                                       for key, fun in self.nodeVarFunList]
+
+        # exe dict
+        exeDict = self.constDict.copy()
+        # loop variables
+        for i, item in enumerate(self.loopVarNames):
+            if item in self.loopVarSet:
+                exeDict[item] = loopVars[i]
+
+        # check uniform T, P (such as iso-thermal)
+        T, P = loopVars[0], loopVars[1]
+        if T.size > 0 and np.all(T == T.flat[0]) and np.all(P == P.flat[0]):
+            # T/P-only variables
+            exeDict.update(self.tempVarExe(T.flat[0], P.flat[0]))
+            for key, fun in self.nodeVarFunGridList:
+                exeDict[key] = fun(exeDict)
+        else:
+            for key, fun in self.varFunGridList:
+                exeDict[key] = fun(exeDict)
+
+        # reaction rate array
+        Ri = np.zeros((self.reactionNo,) + gridShape)
+        for j, fun in enumerate(self.rateFunGridList):
+            Ri[j] = fun(exeDict)
+
+        # return
+        return Ri
+
+    def reactionRateJacobian(self, loopVars, depPattern=None):
+        """
+        execute reaction rate expressions and their derivatives (forward-mode dual numbers)
+            the species concentrations and temperature are the independent variables,
+            mole fractions are taken as MoFri = SpCoi/sum(SpCoi) and pressure is constant
+        args:
+            loopVars: main variables as:
+                T: temperature [K], shape: (grid shape)
+                P: pressure [Pa], shape: broadcastable to grid shape
+                MoFri: mole fraction, shape: (compNo, grid shape)
+                SpCoi: species concentration [mol/m^3], shape: (compNo, grid shape)
+            a single node is set by T as a scalar and MoFri/SpCoi as (compNo,)
+            depPattern: reaction rate dependency on components [reactionNo, compNo]
+                (reactionDependencyPattern), components that do not share a rate
+                are seeded together (default: one seed per component)
+        output:
+            Ri: reaction rate array, shape: (reactionNo, grid shape)
+            dRidCi: dRi/dCi, shape: (reactionNo, compNo, grid shape)
+            dRidT: dRi/dT, shape: (reactionNo, grid shape)
+        """
+        # loop parameters
+        T, P, MoFri, SpCoi = loopVars
+        SpCoi = np.asarray(SpCoi, dtype=float)
+        # grid shape
+        compNo = np.shape(SpCoi)[0]
+        gridShape = np.shape(SpCoi)[1:]
+        T = np.broadcast_to(np.asarray(T, dtype=float), gridShape)
+        P = np.broadcast_to(np.asarray(P, dtype=float), gridShape)
+
+        # evaluation order is built in the scalar mode
+        if self.planSet is False:
+            _index0 = (slice(None),) + (0,)*len(gridShape)
+            self.reactionRateExe(
+                (T[(0,)*len(gridShape)], P[(0,)*len(gridShape)], np.asarray(MoFri)[_index0], SpCoi[_index0]))
+
+        # check
+        if self.gridSet is True or len(gridShape) == 0:
+            try:
+                return self.exeJacobian((T, P, SpCoi), compNo, gridShape, depPattern)
+            except (TypeError, ValueError):
+                # scalar functions (such as if/else on variables)
+                if len(gridShape) == 0:
+                    raise
+                self.gridSet = False
+
+        # node by node
+        Ri = np.zeros((self.reactionNo,) + gridShape)
+        dRidCi = np.zeros((self.reactionNo, compNo) + gridShape)
+        dRidT = np.zeros((self.reactionNo,) + gridShape)
+        for index in np.ndindex(*gridShape):
+            _index = (slice(None),) + index
+            _indexC = (slice(None), slice(None)) + index
+            Ri[_index], dRidCi[_indexC], dRidT[_index] = self.exeJacobian(
+                (T[index], P[index], SpCoi[_index]), compNo, (), depPattern)
+
+        # return
+        return Ri, dRidCi, dRidT
+
+    def reactionDependencyPattern(self, loopVars):
+        """
+        find the components each reaction rate depends on
+            nonzero derivatives of the rates at a probe state (such as the feed),
+            zero concentrations (products in the feed) are raised to a small
+            fraction of the total so that the terms of these species are kept
+        args:
+            loopVars: main variables of a single node (T, P, MoFri, SpCoi)
+        output:
+            depPattern: boolean array [reactionNo, compNo]
+        """
+        T, P, _, SpCoi = loopVars
+        # probe state
+        SpCoi = np.asarray(SpCoi, dtype=float)
+        SpCoi = np.maximum(SpCoi, 1e-3*np.sum(SpCoi))
+        # derivatives
+        _, dRidCi, _ = self.reactionRateJacobian(
+            (T, P, SpCoi/np.sum(SpCoi), SpCoi))
+        # pattern
+        depPattern = dRidCi != 0
+
+        return depPattern
+
+    def exeJacobian(self, loopVars, compNo, gridShape, depPattern=None):
+        """
+        execute dual-aware functions
+        args:
+            loopVars: (T, P, SpCoi) arrays
+            compNo: number of components
+            gridShape: grid shape
+            depPattern: reaction rate dependency on components (None: all)
+        """
+        # dual-aware functions
+        if self.rateFunDualList is None:
+            self.varFunDualList = [(key, vectorizeRateFunction(fun, DUAL_MATH, DUAL_MATH_FUN))
+                                   for key, fun in self.varFunList]
+            self.rateFunDualList = [vectorizeRateFunction(fun, DUAL_MATH, DUAL_MATH_FUN)
+                                    for fun in self.rateFunList]
+
+        T, P, SpCoi = loopVars
+        # seeds: Ci (grouped by seedColor), T (last)
+        seedColor = np.arange(compNo) if depPattern is None else rmtUtil.buildJacobianSeedColor(
+            depPattern)
+        colorNo = np.max(seedColor) + 1 if compNo > 0 else 0
+        seedNo = colorNo + 1
+        _derC = np.zeros((seedNo, compNo) + gridShape)
+        _derT = np.zeros((seedNo,) + gridShape)
+        for i in range(compNo):
+            _derC[(seedColor[i], i) + (Ellipsis,)] = 1
+        _derT[colorNo] = 1
+        SpCoiDual = DualNumberClass(SpCoi, _derC)
+        TDual = DualNumberClass(T, _derT)
+        # mole fraction
+        _CoSp = SpCoiDual[0]
+        for i in range(1, compNo):
+            _CoSp = _CoSp + SpCoiDual[i]
+        MoFriDual = SpCoiDual/_CoSp
+
+        # exe dict
+        exeDict = self.constDict.copy()
+        # loop variables
+        for i, item in enumerate(self.loopVarNames):
+            if item in self.loopVarSet:
+                exeDict[item] = (TDual, P, MoFriDual, SpCoiDual)[i]
+
+        for key, fun in self.varFunDualList:
+            exeDict[key] = fun(exeDict)
+
+        # reaction rate array
+        Ri = np.zeros((self.reactionNo,) + gridShape)
+        dRi = np.zeros((self.reactionNo, seedNo) + gridShape)
+        for j, fun in enumerate(self.rateFunDualList):
+            _val, _der = dualParts(fun(exeDict))
+            Ri[j] = _val
+            if _der is not None:
+                dRi[j] = DualNumberClass.expandDer(_der, len(gridShape))
+
+        # seeds -> components
+        dRidCi = dRi[:, seedColor]
+        if depPattern is not None:
+            dRidCi = dRidCi*np.reshape(np.asarray(depPattern) != 0,
+                                       np.shape(depPattern) + (1,)*len(gridShape))
+
+        # return
+        return Ri, dRidCi, dRi[:, colorNo]
+
+
 def componentFormationRate(compNo, comList, reactionStochCoeff, Ri):
     '''
     calculate component formation rate
@@ -95,3 +1043,63 @@ def componentFormationRate(compNo, comList, reactionStochCoeff, Ri):
         return ri
     except Exception as e:
         raise
+
+
+def componentFormationRateMat(reactionStochCoeffMat, Ri):
+    '''
+    calculate component formation rate (stoichiometric matrix)
+        positive value for products
+        negative value for reactants
+    args:
+        reactionStochCoeffMat: stoichiometric coefficient matrix [compNo, reactionNo] (dense/sparse)
+        Ri: formation rate [mol/m^3.s] | [kmol/m^3.s]
+            shape: (reactionNo,) or (..., reactionNo) for a batch of nodes
+    output:
+        ri: component formation rate [mol/m^3.s], [kmol/m^3.s] (depend on Ri)
+            shape: (compNo,) or (..., compNo)
+    '''
+    # try/except
+    try:
+        # component formation rate
+        if sparse.issparse(reactionStochCoeffMat):
+            _Ri = np.asarray(Ri)
+            _shape = np.shape(_Ri)
+            # (reactionNo, nodes) -> (compNo, nodes)
+            ri = (reactionStochCoeffMat @ np.reshape(_Ri, (-1, _shape[-1])).T).T
+            ri = np.reshape(ri, _shape[:-1] + (reactionStochCoeffMat.shape[0],))
+        else:
+            ri = np.asarray(Ri) @ reactionStochCoeffMat.T
+
+        # res
+        return ri
+    except Exception as e:
+        raise
+
+
+def componentFormationRateJacobian(reactionStochCoeffMat, dRi):
+    '''
+    calculate derivatives of component formation rate
+    args:
+        reactionStochCoeffMat: stoichiometric coefficient matrix [compNo, reactionNo] (dense/sparse)
+        dRi: derivatives of formation rate (dRi/dCi or dRi/dT)
+            shape: (reactionNo, ...)
+    output:
+        dri: derivatives of component formation rate, shape: (compNo, ...)
+    '''
+    # try/except
+    try:
+        # dri/dx = sum_j(nu_ij*dRj/dx)
+        if sparse.issparse(reactionStochCoeffMat):
+            _dRi = np.asarray(dRi)
+            _shape = np.shape(_dRi)
+            dri = reactionStochCoeffMat @ np.reshape(_dRi, (_shape[0], -1))
+            dri = np.reshape(
+                dri, (reactionStochCoeffMat.shape[0],) + _shape[1:])
+        else:
+            dri = np.tensordot(reactionStochCoeffMat,
+                               np.asarray(dRi), axes=(1, 0))
+
+        # res
+        return dri
+    except Exception as e:
+        raise
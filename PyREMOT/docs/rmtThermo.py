@@ -6,6 +6,8 @@ import numpy as np
 import re
 # internals
 from PyREMOT.core import Tref, R_CONST
+from PyREMOT.docs.rmtReaction import compileExpressionVec, expressionPolynomial
+from PyREMOT.docs.propTable import propertyTableExe
 from PyREMOT.data import heatCapacityAtConstatPresureList, standardHeatOfFormationList
 
 
@@ -13,35 +15,104 @@ def main():
     pass
 
 
-def calHeatCapacityAtConstantPressure(comList, T):
+def buildHeatCapacityCoeff(loadData):
+    """
+        build heat capacity coefficient arrays from Cp expressions
+            Cp = A + B*T + C*T^2 + ... (expressions are parsed once)
+
+        args:
+            loadData: heat capacity data list [{"symbol": ..., "Cp": expr}, ...]
+        output:
+            compIndex: component index {symbol: i}
+            coeff: coefficient matrix [compNo, order + 1]
+            funList: compiled expressions of non-polynomial Cp (None: polynomial)
+    """
+    # component index (first record of a symbol)
+    compIndex = {}
+    _coeffList = []
+    funList = []
+    for item in loadData:
+        if item['symbol'] in compIndex:
+            continue
+        compIndex[item['symbol']] = len(_coeffList)
+        _coeff = expressionPolynomial(item['Cp'], "T")
+        # check
+        if _coeff is None:
+            _coeffList.append(np.zeros(1))
+            funList.append(compileExpressionVec(item['Cp']))
+        else:
+            _coeffList.append(_coeff)
+            funList.append(None)
+
+    # coefficient matrix
+    _order = max([len(item) for item in _coeffList]) if len(_coeffList) > 0 else 1
+    coeff = np.zeros((len(_coeffList), _order))
+    for i, item in enumerate(_coeffList):
+        coeff[i, 0:len(item)] = item
+
+    return compIndex, coeff, funList
+
+
+# heat capacity coefficients [kJ/kmol.K]
+HEAT_CAPACITY_INDEX, HEAT_CAPACITY_COEFF, HEAT_CAPACITY_FUN = buildHeatCapacityCoeff(
+    heatCapacityAtConstatPresureList)
+# component index list (key: component list)
+HEAT_CAPACITY_SET = {}
+
+
+def setHeatCapacityCoeff(comList):
+    """
+        coefficient matrix [order, compNo] and non-polynomial expressions
+        of a component list (cached)
+
+        args:
+            comList: component name list
+    """
+    _key = tuple(comList)
+    if _key not in HEAT_CAPACITY_SET:
+        _index = [HEAT_CAPACITY_INDEX[i] for i in comList]
+        _funList = [(k, HEAT_CAPACITY_FUN[i])
+                    for k, i in enumerate(_index) if HEAT_CAPACITY_FUN[i] is not None]
+        # coefficients [order, compNo]
+        HEAT_CAPACITY_SET[_key] = (
+            np.ascontiguousarray(HEAT_CAPACITY_COEFF[_index].T), _funList)
+    return HEAT_CAPACITY_SET[_key]
+
+
+def calHeatCapacityAtConstantPressure(comList, T, propTableSet=None):
     """
         cal: heat capacity at constant pressure
         unit: [kJ/kmol.K] 
 
         args:
             comList: component name list
-            T: temperature [K]
+            T: temperature [K], scalar or array
+            propTableSet: property tables (None: exact correlations)
+        output:
+            Cpi: heat capacity, shape: (compNo,) | (compNo, T shape)
     """
     # try/except
     try:
-        # heat capacity
-        _Cpi = []
+        # property table
+        Cpi = propertyTableExe(propTableSet, "Cp", comList, T)
+        if Cpi is not None:
+            return Cpi
+
+        # coefficients
+        coeff, funList = setHeatCapacityCoeff(comList)
+
+        # Cp (horner scheme) [compNo, T shape]
+        _T = T if np.ndim(T) == 0 else np.asarray(T, dtype=float)
+        _coeff = coeff if np.ndim(T) == 0 else np.reshape(
+            coeff, coeff.shape + (1,)*np.ndim(T))
+        Cpi = _coeff[-1]
+        for j in range(coeff.shape[0] - 2, -1, -1):
+            Cpi = Cpi*_T + _coeff[j]
+
+        # non-polynomial expressions
+        for k, cpFun in funList:
+            Cpi[k] = cpFun({"T": _T})
 
-        # heat capacity data
-        loadData = heatCapacityAtConstatPresureList
-
-        for i in comList:
-            # fun expr
-            CpiData = [item['Cp'] for item in loadData if i == item['symbol']]
-            # fun
-            def cpFun(T): return eval(CpiData[0])
-            # fun exe
-            CpiVal = cpFun(T)
-            # store
-            _Cpi.append(CpiVal)
-
-        # convert to numpy array
-        Cpi = np.array(_Cpi)
         # print("Cpi: ", Cpi)
         # res
         return Cpi
@@ -49,22 +120,28 @@ def calHeatCapacityAtConstantPressure(comList, T):
         print(e)
 
 
-def calMeanHeatCapacityAtConstantPressure(comList, T2, T1=Tref):
+def calMeanHeatCapacityAtConstantPressure(comList, T2, T1=Tref, propTableSet=None):
     """
         cal: mean heat capacity at constant pressure 
         unit: [kJ/kmol.K] 
 
         args:
             comList: name of components
-            T2: final temperature [K]
+            T2: final temperature [K], scalar or array
             T1: reference temperature [K]
+            propTableSet: property tables (None: exact correlations)
+        output:
+            CpAvg: shape: (compNo,) | (compNo, T2 shape)
     """
     # try/except
     try:
         # cp at T1 [kJ/kmol.K]
-        CpT1 = calHeatCapacityAtConstantPressure(comList, T1)
+        CpT1 = calHeatCapacityAtConstantPressure(comList, T1, propTableSet)
         # cp at T2 [kJ/kmol.K]
-        CpT2 = calHeatCapacityAtConstantPressure(comList, T2)
+        CpT2 = calHeatCapacityAtConstantPressure(comList, T2, propTableSet)
+        # T2: array (all nodes)
+        if np.ndim(T2) > np.ndim(T1):
+            CpT1 = np.reshape(CpT1, np.shape(CpT1) + (1,)*(np.ndim(T2) - np.ndim(T1)))
         # cp average
         CpAvg = (CpT1 + CpT2)*0.50
         # print("CpAvg: ", CpAvg)
@@ -101,6 +178,37 @@ def calMixtureHeatCapacityAtConstantPressure(MoFri, HeCaCoPri):
         print(e)
 
 
+def calMixtureHeatCapacityAtConstantPressureMat(MoFri, HeCaCoPri):
+    """
+    cal: heat capacity at constant pressure of mixture for all nodes
+    unit: [kJ/kmol.K] 
+
+    args:
+        MoFri: mole fraction of components, shape: (compNo, nodes)
+        HeCaCoPri: heat capacity at constant pressure of components [kJ/kmol.K]
+            shape: (compNo,) | (compNo, nodes)
+    output:
+        CpMix: shape: (nodes)
+    """
+    # try/except
+    try:
+        _MoFri = np.asarray(MoFri, dtype=float)
+        _HeCaCoPri = np.asarray(HeCaCoPri, dtype=float)
+        # check
+        if _MoFri.shape[0] != _HeCaCoPri.shape[0]:
+            raise Exception("elements are not equal")
+
+        # component heat capacity at all nodes
+        _HeCaCoPri = np.reshape(
+            _HeCaCoPri, _HeCaCoPri.shape + (1,)*(_MoFri.ndim - _HeCaCoPri.ndim))
+        CpMix = np.sum(_MoFri*_HeCaCoPri, axis=0)
+        # res
+        return CpMix
+    except Exception as e:
+        print(e)
+        raise
+
+
 def calEnthalpyChange(comList, T2, T1=Tref):
     """
         cal: enthalpy change
@@ -255,55 +363,128 @@ def calGasHourlySpaceVelocity(VoFlRa, ReVo):
 # NOTE
 
 
-def calEnthalpyChangeOfReaction(reactionListSorted, T):
+# reaction heat capacity coefficients (key: reactions as (symbol, coeff) pairs)
+REACTION_HEAT_CAPACITY_SET = {}
+# max number of cached reaction sets
+REACTION_HEAT_CAPACITY_SIZE = 64
+
+
+def setReactionHeatCapacityCoeff(reactionListSorted):
     """
-    cal: standard enthalpy of reaction at 25C [kJ/kmol]
+        stoichiometry-weighted heat capacity coefficients of reactions (cached)
+            dCp = sum(v_i*Cp_i) = a + b*T + c*T^2 + ...
+        reactant coefficients are negative (buildReactionCoefficient)
+
+        args:
+            reactionListSorted: reaction expression dict
+        output:
+            coeff: coefficient matrix [order, reactionNo]
+            funList: non-polynomial terms [(reaction index, coeff, expression), ...]
+    """
+    _key = tuple(tuple((i['symbol'], i['coeff']) for i in item['reactants'] + item['products'])
+                 for item in reactionListSorted)
+    _res = REACTION_HEAT_CAPACITY_SET.get(_key)
+    # check
+    if _res is None:
+        _order = HEAT_CAPACITY_COEFF.shape[1]
+        coeff = np.zeros((_order, len(reactionListSorted)))
+        funList = []
+        for k, item in enumerate(reactionListSorted):
+            for i in item['reactants'] + item['products']:
+                _index = HEAT_CAPACITY_INDEX[i['symbol']]
+                # check
+                if HEAT_CAPACITY_FUN[_index] is None:
+                    coeff[:, k] += i['coeff']*HEAT_CAPACITY_COEFF[_index]
+                else:
+                    funList.append((k, i['coeff'], HEAT_CAPACITY_FUN[_index]))
+        _res = (coeff, funList)
+        # cache size limit
+        if len(REACTION_HEAT_CAPACITY_SET) >= REACTION_HEAT_CAPACITY_SIZE:
+            REACTION_HEAT_CAPACITY_SET.clear()
+        REACTION_HEAT_CAPACITY_SET[_key] = _res
+    return _res
+
+
+def calReactionHeatCapacity(reactionListSorted, T):
+    """
+        cal: heat capacity change of reactions dCp = sum(v_i*Cp_i)
+        unit: [kJ/kmol.K]
+
+        args:
+            reactionListSorted: reaction expression dict
+            T: temperature [K], scalar or array
+        output:
+            dCp: shape: (reactionNo,) | (reactionNo, T shape)
+    """
+    # coefficients
+    coeff, funList = setReactionHeatCapacityCoeff(reactionListSorted)
+
+    # dCp (horner scheme)
+    _T = T if np.ndim(T) == 0 else np.asarray(T, dtype=float)
+    _coeff = coeff if np.ndim(T) == 0 else np.reshape(
+        coeff, coeff.shape + (1,)*np.ndim(T))
+    dCp = _coeff[-1]
+    for j in range(coeff.shape[0] - 2, -1, -1):
+        dCp = dCp*_T + _coeff[j]
+
+    # non-polynomial expressions
+    if len(funList) > 0:
+        dCp = np.array(dCp, dtype=float)
+        for k, _vi, cpFun in funList:
+            dCp[k] = dCp[k] + _vi*cpFun({"T": _T})
+
+    return dCp
+
+
+def calEnthalpyChangeOfReaction(reactionListSorted, T, method="MEAN"):
+    """
+    cal: enthalpy change of reactions between Tref and T [kJ/kmol]
     args:
         reactionListSorted: reaction expression dict
-        T: temperature [K]
+        T: temperature [K], scalar or array (all nodes)
+        method: (solver-config: reaction-enthalpy)
+            MEAN: mean heat capacity, 0.5*(dCp(Tref) + dCp(T))*(T - Tref)
+            INTEGRAL: closed-form integral of dCp from Tref to T
+    output:
+        EnChList: shape: (reactionNo,) | (reactionNo, T shape)
     """
     # try/except
     try:
-        # reaction list
-        # print(f"reactionListSorted {reactionListSorted}")
-
-        # enthalpy change list
-        EnChList = []
-
-        # reactant coefficient
-        for item in reactionListSorted:
-            # reactants
-            _reactants = [i['symbol'] for i in item['reactants']]
-            _reactantCpMeanList = calMeanHeatCapacityAtConstantPressure(
-                _reactants, T)
-            # reactant coeff
-            _reactantCoeff = [i['coeff'] for i in item['reactants']]
-            # convertion
-            _loop1 = np.array(_reactantCpMeanList)
-            _loop2 = np.array(_reactantCoeff)
-            _loop3 = np.dot(_loop1, _loop2)
-
-            # products
-            _products = [i['symbol'] for i in item['products']]
-            _productCpMeanList = calMeanHeatCapacityAtConstantPressure(
-                _products, T)
-            # product coeff
-            _productCoeff = [i['coeff'] for i in item['products']]
-            # convertion
-            _loop5 = np.array(_productCpMeanList)
-            _loop6 = np.array(_productCoeff)
-            _loop7 = np.dot(_loop5, _loop6)
-
-            # Cp mean of reaction
-            CpMean = _loop7 + _loop3
-            # print(f"CpMean: {CpMean}")
-
+        if method == "INTEGRAL":
+            # coefficients
+            coeff, funList = setReactionHeatCapacityCoeff(reactionListSorted)
+            # integral coefficients: sum(c_j/(j+1)*T^(j+1))
+            _order = coeff.shape[0]
+            _coeff = coeff/np.arange(1, _order + 1).reshape((_order, 1))
+            _T = T if np.ndim(T) == 0 else np.asarray(T, dtype=float)
+            _shape = _coeff.shape + (1,)*np.ndim(T)
+
+            def _intFun(Tx):
+                _res = np.reshape(_coeff[-1], _shape[1:])
+                for j in range(_order - 2, -1, -1):
+                    _res = _res*Tx + np.reshape(_coeff[j], _shape[1:])
+                return _res*Tx
+
+            EnChList = _intFun(_T) - _intFun(Tref)
+
+            # non-polynomial expressions (mean heat capacity)
+            if len(funList) > 0:
+                EnChList = np.array(EnChList, dtype=float)
+                for k, _vi, cpFun in funList:
+                    EnChList[k] = EnChList[k] + _vi*0.5*(
+                        cpFun({"T": Tref}) + cpFun({"T": _T}))*(_T - Tref)
+        elif method == "MEAN":
+            # dCp at Tref and T [kJ/kmol.K]
+            dCpRef = calReactionHeatCapacity(reactionListSorted, Tref)
+            dCpT = calReactionHeatCapacity(reactionListSorted, T)
+            if np.ndim(T) > 0:
+                dCpRef = np.reshape(dCpRef, dCpRef.shape + (1,)*np.ndim(T))
+            # Cp mean of reactions
+            CpMean = 0.5*(dCpRef + dCpT)
             # enthalpy change between Tref and T [kJ/kmol]
-            EnChT = CpMean*(T - Tref)
-            # print(f"EnChT: {EnChT}")
-
-            # store
-            EnChList.append(EnChT)
+            EnChList = CpMean*(np.asarray(T, dtype=float) - Tref)
+        else:
+            raise Exception(f"unknown reaction enthalpy method: {method}")
 
         # res
         return EnChList
@@ -324,6 +505,18 @@ def calVolumetricFlowrateIG(P, T, MoFlRai):
     return VoFlRa
 
 
+def calVolumetricFlowrateIGMat(P, T, MoFlRai):
+    """
+    calculate: volumetric flowrate of ideal gas (IG) for all nodes [m^3/s]
+    args:
+        P: pressure [Pa], shape: (nodes)
+        T: temperature [K], shape: (nodes)
+        MoFlRai: component molar flowrate [mol/s], shape: (compNo, nodes)
+    """
+    VoFlRa = (R_CONST*np.asarray(T)/np.asarray(P))*np.sum(MoFlRai, axis=0)
+    return VoFlRa
+
+
 def calConcentrationIG(MoFlRai, VoFlRa):
     """
     calculate: concentration species species of ideal gas (IG) [mol/m^3]
@@ -339,8 +532,8 @@ def calDensityIG(MW, CoSp):
     """ 
     calculate: density of ideal gas (IG) [kg/m^3]
     args:
-        MW: molecular weight [kg/mol]
-        CoSp: concentration species [mol/m^3]
+        MW: molecular weight [kg/mol], scalar or array (nodes)
+        CoSp: concentration species [mol/m^3], scalar or array (nodes)
     """
     try:
         # density
@@ -373,8 +566,8 @@ def calMolarFlowRate(SpCo, SuGaVe, CrSeAr):
     """
     calculate molar flowrate
     args:
-        SpCo: species concentration [kmol/m^3] | [mol/m^3]
-        SuGaVe: superficial gas velocity [m/s]
+        SpCo: species concentration [kmol/m^3] | [mol/m^3], scalar or array (nodes)
+        SuGaVe: superficial gas velocity [m/s], scalar or array (nodes)
         CrSeAr: cross sectional area [m^2]
     output: 
         MoFlRa: molar flowrate [kmol/s] | [mol/s]
@@ -6,8 +6,10 @@
 import numpy as np
 import re
 from typing import List
+from scipy import sparse
 # internals
 from PyREMOT.core import constants as CONST
+from PyREMOT.docs.modelSetting import REACTION_NETWORK_SETTING
 
 
 class rmtUtilityClass:
@@ -94,6 +96,36 @@ class rmtUtilityClass:
         except Exception as e:
             print(e)
 
+    @staticmethod
+    def mixtureMolecularWeightMat(MoFri, MWi, unit="g/mol"):
+        """
+        calculate mixture molecular weight for all nodes [g/mol]
+        args:
+            MoFri: component mole fraction, shape: (compNo, nodes)
+            MWi: molecular weight [g/mol], shape: (compNo,)
+        output:
+            MixMoWe: shape: (nodes)
+        """
+        # try/exception
+        try:
+            MoFri0 = np.asarray(MoFri, dtype=float)
+            MWi0 = np.asarray(MWi, dtype=float)
+
+            # check
+            if MoFri0.shape[0] != MWi0.size:
+                raise Exception("elements are not equal")
+            #
+            MixMoWe = np.tensordot(MWi0, MoFri0, axes=(0, 0))
+
+            # check unit
+            if unit == 'kg/mol':
+                MixMoWe = MixMoWe*1e-3
+
+            return MixMoWe
+        except Exception as e:
+            print(e)
+            raise
+
     @staticmethod
     def volumetricFlowrateSTP(VoFlRa, P, T):
         """
@@ -248,6 +280,157 @@ class rmtUtilityClass:
         except Exception as e:
             raise
 
+    @staticmethod
+    def buildReactionCoeffMatrix(compList, reactionStochCoeff):
+        """
+            build stoichiometric coefficient matrix (dense)
+            args:
+                compList: list of component symbols
+                reactionStochCoeff: reaction coeff vector (buildReactionCoeffVector)
+            output:
+                reactionCoeffMat: matrix [compNo, reactionNo]
+                    positive value for products
+                    negative value for reactants
+        """
+        # try/except
+        try:
+            # component index
+            compIndex = {item: i for i, item in enumerate(compList)}
+            # matrix
+            reactionCoeffMat = np.zeros((len(compList), len(reactionStochCoeff)))
+            #
+            for m, element in enumerate(reactionStochCoeff):
+                for item in element:
+                    # components not in the list are skipped
+                    k = compIndex.get(item[0])
+                    if k is not None:
+                        reactionCoeffMat[k, m] += item[1]
+
+            # res
+            return reactionCoeffMat
+        except Exception as e:
+            raise
+
+    @staticmethod
+    def buildReactionCoeffSparseMatrix(compList, reactionStochCoeff):
+        """
+            build stoichiometric coefficient matrix (sparse csr)
+            args:
+                compList: list of component symbols
+                reactionStochCoeff: reaction coeff vector (buildReactionCoeffVector)
+            output:
+                reactionCoeffMat: sparse matrix [compNo, reactionNo]
+        """
+        # try/except
+        try:
+            # component index
+            compIndex = {item: i for i, item in enumerate(compList)}
+            # triplets
+            _rows = []
+            _cols = []
+            _vals = []
+            for m, element in enumerate(reactionStochCoeff):
+                for item in element:
+                    # components not in the list are skipped
+                    k = compIndex.get(item[0])
+                    if k is not None:
+                        _rows.append(k)
+                        _cols.append(m)
+                        _vals.append(item[1])
+
+            # duplicates are summed
+            reactionCoeffMat = sparse.csr_matrix((_vals, (_rows, _cols)), shape=(
+                len(compList), len(reactionStochCoeff)))
+
+            # res
+            return reactionCoeffMat
+        except Exception as e:
+            raise
+
+    @staticmethod
+    def setReactionCoeffMatrix(compList, reactionStochCoeff):
+        """
+            build stoichiometric coefficient matrix
+                dense for small mechanisms, sparse (csr) for large and
+                sparse ones (REACTION_NETWORK_SETTING)
+            args:
+                compList: list of component symbols
+                reactionStochCoeff: reaction coeff vector (buildReactionCoeffVector)
+            output:
+                reactionCoeffMat: matrix [compNo, reactionNo]
+        """
+        # try/except
+        try:
+            # sparse
+            reactionCoeffMat = rmtUtilityClass.buildReactionCoeffSparseMatrix(
+                compList, reactionStochCoeff)
+            # setting
+            sparseSet = REACTION_NETWORK_SETTING['sparse']
+            # size
+            _size = reactionCoeffMat.shape[0]*reactionCoeffMat.shape[1]
+            # check
+            if sparseSet == "AUTO":
+                _density = reactionCoeffMat.nnz/_size if _size > 0 else 1
+                sparseSet = "TRUE" if _size >= REACTION_NETWORK_SETTING['sparseMinSize'] and \
+                    _density <= REACTION_NETWORK_SETTING['sparseMaxDensity'] else "FALSE"
+
+            # res
+            return reactionCoeffMat if sparseSet == "TRUE" else reactionCoeffMat.toarray()
+        except Exception as e:
+            raise
+
+    @staticmethod
+    def buildReactionJacobianPattern(reactionCoeffMat, reactionDepPattern):
+        """
+            build sparsity pattern of component formation rate jacobian (dri/dCj)
+            args:
+                reactionCoeffMat: stoichiometric coefficient matrix [compNo, reactionNo]
+                reactionDepPattern: reaction rate dependency on components [reactionNo, compNo]
+            output:
+                jacPattern: sparse boolean matrix [compNo, compNo]
+        """
+        # try/except
+        try:
+            _coeff = sparse.csr_matrix(reactionCoeffMat) != 0
+            _dep = sparse.csr_matrix(reactionDepPattern) != 0
+            # i depends on j if a reaction of i depends on j
+            jacPattern = (_coeff.astype(int) @ _dep.astype(int)) != 0
+
+            # res
+            return jacPattern.tocsr()
+        except Exception as e:
+            raise
+
+    @staticmethod
+    def buildJacobianSeedColor(reactionDepPattern):
+        """
+            group the components into jacobian seeds (greedy coloring)
+                components in a group do not share a reaction rate, so
+                the rate derivatives of a group are the derivatives of its components
+            args:
+                reactionDepPattern: reaction rate dependency on components [reactionNo, compNo]
+            output:
+                seedColor: seed index of each component [compNo]
+        """
+        # try/except
+        try:
+            _dep = np.asarray(reactionDepPattern) != 0
+            compNo = _dep.shape[1]
+            # components sharing a reaction rate
+            _conflict = (_dep.T.astype(int) @ _dep.astype(int)) != 0
+            seedColor = np.zeros(compNo, dtype=int)
+            for j in range(1, compNo):
+                _used = set(seedColor[0:j][_conflict[j, 0:j]])
+                _color = 0
+                while _color in _used:
+                    _color += 1
+                seedColor[j] = _color
+
+            # res
+            return seedColor
+        except Exception as e:
+            raise
+
     @ staticmethod
     def buildreactionRateExpr(reactionRateExprDict):
         """
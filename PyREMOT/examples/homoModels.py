@@ -22,7 +22,7 @@ from PyREMOT.docs.rmtUtility import rmtUtilityClass as rmtUtil
 from PyREMOT.docs.rmtThermo import *
 from PyREMOT.docs.gasTransPor import calTest
 from PyREMOT.docs.fluidFilm import *
-from PyREMOT.docs.rmtReaction import reactionRateExe, componentFormationRate
+from PyREMOT.docs.rmtReaction import componentFormationRateMat, ReactionRateClass
 # data
 from PyREMOT.data.inputDataReactor import *
 # solvers
@@ -38,11 +38,23 @@ class HomoModelClass:
     catalyst diffusion-reaction dynamic/steady-state models
     '''
 
-    def __init__(self, modelInput, internalData, reactionListSorted, reactionStochCoeffList):
+    def __init__(self, modelInput, internalData, reactionListSorted, reactionStochCoeffList, reactionRateSet=None, propTableSet=None):
         self.modelInput = modelInput
         self.internalData = internalData
         self.reactionListSorted = reactionListSorted
         self.reactionStochCoeffList = reactionStochCoeffList
+        # reaction rate set (compiled kinetics)
+        self.reactionRateSet = reactionRateSet if reactionRateSet is not None else ReactionRateClass(
+            modelInput['reaction-rates'])
+        # property tables (opt-in, None: exact correlations)
+        self.propTableSet = propTableSet
+        # reaction enthalpy (solver-config: reaction-enthalpy)
+        # MEAN: mean heat capacity (default), INTEGRAL: closed-form integral of dCp
+        self.reactionEnthalpyMethod = modelInput.get(
+            'solver-config', {}).get('reaction-enthalpy', "MEAN")
+        # stoichiometric coefficient matrix [compNo, reactionNo]
+        self.reactionStochCoeffMat = rmtUtil.setReactionCoeffMatrix(
+            modelInput['feed']['components']['shell'], reactionStochCoeffList)
 
 # NOTE
 
@@ -184,7 +196,7 @@ class HomoModelClass:
 
         # heat capacity at constant pressure of mixture Cp [kJ/kmol.K] | [J/mol.K]
         # Cp mean list
-        GaCpMeanList0 = calMeanHeatCapacityAtConstantPressure(compList, T)
+        GaCpMeanList0 = calMeanHeatCapacityAtConstantPressure(compList, T, propTableSet=self.propTableSet)
         # Cp mixture
         GaCpMeanMix0 = calMixtureHeatCapacityAtConstantPressure(
             MoFri0, GaCpMeanList0)
@@ -340,6 +352,8 @@ class HomoModelClass:
         FunParam = {
             "compList": compList,
             "const": {
+                "propTableSet": self.propTableSet,
+                "reactionEnthalpyMethod": self.reactionEnthalpyMethod,
                 "CrSeAr": CrSeAr,
                 "MoWei": MoWei,
                 "StHeRe25": StHeRe25,
@@ -388,6 +402,8 @@ class HomoModelClass:
                 "d2Tdz2": solverSetting['T1']['d2Tdz2'],
             },
             "reactionRateExpr": reactionRateExpr,
+            "reactionRateSet": self.reactionRateSet,
+            "reactionStochCoeffMat": self.reactionStochCoeffMat,
         }
 
         # dimensionless analysis parameters
@@ -617,6 +633,10 @@ class HomoModelClass:
         comList = FunParam['compList']
         # const ->
         const = FunParam['const']
+        # property tables
+        propTableSet = const['propTableSet']
+        # reaction enthalpy method
+        reactionEnthalpyMethod = const['reactionEnthalpyMethod']
         # cross-sectional area [m^2]
         CrSeAr = const['CrSeAr']
         # component molecular weight [g/mol]
@@ -734,9 +754,10 @@ class HomoModelClass:
 
         # reaction rate expressions
         reactionRateExpr = FunParam['reactionRateExpr']
-        # using equation
-        varisSet = reactionRateExpr['VARS']
-        ratesSet = reactionRateExpr['RATES']
+        # compiled reaction rate set
+        reactionRateSet = FunParam['reactionRateSet']
+        # stoichiometric coefficient matrix
+        reactionStochCoeffMat = FunParam['reactionStochCoeffMat']
 
         # dimensionless analysis params
 
@@ -1023,14 +1044,14 @@ class HomoModelClass:
 
             # component formation rate [mol/m^3.s]
             # check unit
-            RiLoop = np.array(reactionRateExe(
-                loopVars0, varisSet, ratesSet))
+            RiLoop = np.array(reactionRateSet.reactionRateExe(
+                loopVars0))
             Ri = np.copy(RiLoop)
 
             # REVIEW
             # component formation rate [kmol/m^3.s]
-            riRes = componentFormationRate(
-                compNo, comList, reactionStochCoeff, Ri)
+            riRes = componentFormationRateMat(
+                reactionStochCoeffMat, Ri)
 
             ri = riRes  # (1-BeVoFr)*riRes
 
@@ -1043,7 +1064,7 @@ class HomoModelClass:
             # heat capacity at constant pressure of mixture Cp [kJ/kmol.K] | [J/mol.K]
             # Cp mean list
             GaCpMeanList = calMeanHeatCapacityAtConstantPressure(
-                comList, T_ReVa)
+                comList, T_ReVa, propTableSet=propTableSet)
             # Cp mixture
             GaCpMeanMix = calMixtureHeatCapacityAtConstantPressure(
                 MoFri, GaCpMeanList)
@@ -1058,7 +1079,7 @@ class HomoModelClass:
             # enthalpy change from Tref to T [kJ/kmol] | [J/mol]
             # enthalpy change
             EnChList = np.array(
-                calEnthalpyChangeOfReaction(reactionListSorted, T_ReVa))
+                calEnthalpyChangeOfReaction(reactionListSorted, T_ReVa, method=reactionEnthalpyMethod))
             # heat of reaction at T [kJ/kmol] | [J/mol]
             HeReT = np.array(EnChList + StHeRe25)
             # overall heat of reaction [kJ/m^3.s]
@@ -28,7 +28,7 @@ from PyREMOT.solvers.solOrCo import OrCoClass
 from PyREMOT.solvers.solFiEl import FiElClass
 from PyREMOT.solvers.solFiDi import FiDiBuildCMatrix, FiDiBuildTMatrix, FiDiBuildCMatrix_DiLe, FiDiBuildTMatrix_DiLe
 # docs
-from PyREMOT.docs.rmtReaction import reactionRateExe, componentFormationRate
+from PyREMOT.docs.rmtReaction import componentFormationRateMat, ReactionRateClass
 from PyREMOT.docs.rmtUtility import rmtUtilityClass as rmtUtil
 from PyREMOT.docs.rmtThermo import *
 from PyREMOT.docs.fluidFilm import *
@@ -47,11 +47,23 @@ class ParticleModelClass:
         T2: steady-state
     '''
 
-    def __init__(self, modelInput, internalData, reactionListSorted, reactionStochCoeffList):
+    def __init__(self, modelInput, internalData, reactionListSorted, reactionStochCoeffList, reactionRateSet=None, propTableSet=None):
         self.modelInput = modelInput
         self.internalData = internalData
         self.reactionListSorted = reactionListSorted
         self.reactionStochCoeffList = reactionStochCoeffList
+        # reaction rate set (compiled kinetics)
+        self.reactionRateSet = reactionRateSet if reactionRateSet is not None else ReactionRateClass(
+            modelInput['reaction-rates'])
+        # property tables (opt-in, None: exact correlations)
+        self.propTableSet = propTableSet
+        # reaction enthalpy (solver-config: reaction-enthalpy)
+        # MEAN: mean heat capacity (default), INTEGRAL: closed-form integral of dCp
+        self.reactionEnthalpyMethod = modelInput.get(
+            'solver-config', {}).get('reaction-enthalpy', "MEAN")
+        # stoichiometric coefficient matrix [compNo, reactionNo]
+        self.reactionStochCoeffMat = rmtUtil.setReactionCoeffMatrix(
+            modelInput['feed']['components']['shell'], reactionStochCoeffList)
 
 # NOTE
 # dynamic model
@@ -156,7 +168,7 @@ class ParticleModelClass:
 
         # heat capacity at constant pressure of mixture Cp [kJ/kmol.K] | [J/mol.K]
         # Cp mean list
-        GaCpMeanList0 = calMeanHeatCapacityAtConstantPressure(compList, T)
+        GaCpMeanList0 = calMeanHeatCapacityAtConstantPressure(compList, T, propTableSet=self.propTableSet)
         # Cp mixture
         GaCpMeanMix0 = calMixtureHeatCapacityAtConstantPressure(
             MoFri0, GaCpMeanList0)
@@ -270,6 +282,8 @@ class ParticleModelClass:
         FunParam = {
             "compList": compList,
             "const": {
+                "propTableSet": self.propTableSet,
+                "reactionEnthalpyMethod": self.reactionEnthalpyMethod,
                 "CrSeAr": CrSeAr,
                 "MoWei": MoWei,
                 "StHeRe25": StHeRe25,
@@ -311,7 +325,9 @@ class ParticleModelClass:
             "solverSetting": {
                 "OrCoClassSetRes": OrCoClassSetRes
             },
-            "reactionRateExpr": reactionRateExpr
+            "reactionRateExpr": reactionRateExpr,
+            "reactionRateSet": self.reactionRateSet,
+            "reactionStochCoeffMat": self.reactionStochCoeffMat
         }
 
         # NOTE
@@ -678,6 +694,10 @@ class ParticleModelClass:
         comList = FunParam['compList']
         # const ->
         const = FunParam['const']
+        # property tables
+        propTableSet = const['propTableSet']
+        # reaction enthalpy method
+        reactionEnthalpyMethod = const['reactionEnthalpyMethod']
         # cross-sectional area [m^2]
         CrSeAr = const['CrSeAr']
         # component molecular weight [g/mol]
@@ -786,9 +806,10 @@ class ParticleModelClass:
         # NOTE
         # reaction rate expressions
         reactionRateExpr = FunParam['reactionRateExpr']
-        # using equation
-        varisSet = reactionRateExpr['VARS']
-        ratesSet = reactionRateExpr['RATES']
+        # compiled reaction rate set
+        reactionRateSet = FunParam['reactionRateSet']
+        # stoichiometric coefficient matrix
+        reactionStochCoeffMat = FunParam['reactionStochCoeffMat']
 
         # NOTE
         # particle parameters
@@ -954,8 +975,8 @@ class ParticleModelClass:
 
             # component formation rate [mol/m^3.s]
             # check unit
-            r0 = np.array(reactionRateExe(
-                loopVars0, varisSet, ratesSet))
+            r0 = np.array(reactionRateSet.reactionRateExe(
+                loopVars0))
 
             Ri_r[r, :] = r0
 
@@ -963,13 +984,13 @@ class ParticleModelClass:
             # loop
             _Ri_r = Ri_r[r, :]
             # component formation rate [kmol/m^3.s]
-            ri_r[r] = componentFormationRate(
-                compNo, comList, reactionStochCoeff, _Ri_r)
+            ri_r[r] = componentFormationRateMat(
+                reactionStochCoeffMat, _Ri_r)
 
             # heat capacity at constant pressure of mixture Cp [kJ/kmol.K] | [J/mol.K]
             # Cp mean list
             SoCpMeanList = calMeanHeatCapacityAtConstantPressure(
-                comList, Ts_r_ReVa[r])
+                comList, Ts_r_ReVa[r], propTableSet=propTableSet)
             # Cp mixture
             SoCpMeanMix[r] = calMixtureHeatCapacityAtConstantPressure(
                 MoFrsi_r[r], SoCpMeanList)
@@ -981,7 +1002,7 @@ class ParticleModelClass:
             # enthalpy change from Tref to T [kJ/kmol] | [J/mol]
             # enthalpy change
             EnChList = np.array(
-                calEnthalpyChangeOfReaction(reactionListSorted, Ts_r_ReVa[r]))
+                calEnthalpyChangeOfReaction(reactionListSorted, Ts_r_ReVa[r], method=reactionEnthalpyMethod))
             # heat of reaction at T [kJ/kmol] | [J/mol]
             HeReT = np.array(EnChList + StHeRe25)
             # overall heat of reaction [kJ/m^3.s]
@@ -1214,12 +1235,12 @@ class ParticleModelClass:
             CONST_EQ_GAS_DIFFUSIVITY['Chapman-Enskog'], compList, GaDii0_paramsData)
 
         # gas viscosity [Pa.s]
-        GaVii0 = calGasViscosity(compList, T)
+        GaVii0 = calGasViscosity(compList, T, propTableSet=self.propTableSet)
         # gas mixture viscosity [Pa.s]
         GaMiVi = calMixturePropertyM1(compNo, GaVii0, MoFri0, MoWei)
 
         # thermal conductivity - gas phase [J/s.m.K]
-        GaThCoi0 = calGasThermalConductivity(compList, T)
+        GaThCoi0 = calGasThermalConductivity(compList, T, propTableSet=self.propTableSet)
         # mixture thermal conductivity - gas phase [J/s.m.K]
         GaThCoMix0 = calMixturePropertyM1(compNo, GaThCoi0, MoFri0, MoWei)
 
@@ -1233,7 +1254,7 @@ class ParticleModelClass:
 
         # heat capacity at constant pressure of mixture Cp [kJ/kmol.K] | [J/mol.K]
         # Cp mean list
-        GaCpMeanList0 = calMeanHeatCapacityAtConstantPressure(compList, T)
+        GaCpMeanList0 = calMeanHeatCapacityAtConstantPressure(compList, T, propTableSet=self.propTableSet)
         # Cp mixture
         GaCpMeanMix0 = calMixtureHeatCapacityAtConstantPressure(
             MoFri0, GaCpMeanList0)
@@ -1375,6 +1396,8 @@ class ParticleModelClass:
         FunParam = {
             "compList": compList,
             "const": {
+                "propTableSet": self.propTableSet,
+                "reactionEnthalpyMethod": self.reactionEnthalpyMethod,
                 "CrSeAr": CrSeAr,
                 "MoWei": MoWei,
                 "StHeRe25": StHeRe25,
@@ -1422,7 +1445,9 @@ class ParticleModelClass:
                 "FiElClassInitRes": FiElClassInitRes,
                 "numericalMethod": numericalMethod,
             },
-            "reactionRateExpr": reactionRateExpr
+            "reactionRateExpr": reactionRateExpr,
+            "reactionRateSet": self.reactionRateSet,
+            "reactionStochCoeffMat": self.reactionStochCoeffMat
         }
 
         # NOTE
@@ -1743,6 +1768,10 @@ class ParticleModelClass:
         comList = FunParam['compList']
         # const ->
         const = FunParam['const']
+        # property tables
+        propTableSet = const['propTableSet']
+        # reaction enthalpy method
+        reactionEnthalpyMethod = const['reactionEnthalpyMethod']
         # cross-sectional area [m^2]
         CrSeAr = const['CrSeAr']
         # component molecular weight [g/mol]
@@ -1876,9 +1905,10 @@ class ParticleModelClass:
         # NOTE
         # reaction rate expressions
         reactionRateExpr = FunParam['reactionRateExpr']
-        # using equation
-        varisSet = reactionRateExpr['VARS']
-        ratesSet = reactionRateExpr['RATES']
+        # compiled reaction rate set
+        reactionRateSet = FunParam['reactionRateSet']
+        # stoichiometric coefficient matrix
+        reactionStochCoeffMat = FunParam['reactionStochCoeffMat']
 
         # NOTE
         # dimensionless analysis params
@@ -2036,8 +2066,8 @@ class ParticleModelClass:
 
             # component formation rate [mol/m^3.s]
             # check unit
-            r0 = np.array(reactionRateExe(
-                loopVars0, varisSet, ratesSet))
+            r0 = np.array(reactionRateSet.reactionRateExe(
+                loopVars0))
 
             Ri_r[r, :] = r0
 
@@ -2045,13 +2075,13 @@ class ParticleModelClass:
             # loop
             _Ri_r = Ri_r[r, :]
             # component formation rate [mol/m^3.s]
-            ri_r[r] = componentFormationRate(
-                compNo, comList, reactionStochCoeff, _Ri_r)
+            ri_r[r] = componentFormationRateMat(
+                reactionStochCoeffMat, _Ri_r)
 
             # heat capacity at constant pressure of mixture Cp [kJ/kmol.K] | [J/mol.K]
             # Cp mean list
             SoCpMeanList = calMeanHeatCapacityAtConstantPressure(
-                comList, Ts_r_ReVa[r])
+                comList, Ts_r_ReVa[r], propTableSet=propTableSet)
             # Cp mixture
             SoCpMeanMix[r] = calMixtureHeatCapacityAtConstantPressure(
                 MoFrsi_r[r], SoCpMeanList)
@@ -2063,7 +2093,7 @@ class ParticleModelClass:
             # enthalpy change from Tref to T [kJ/kmol] | [J/mol]
             # enthalpy change
             EnChList = np.array(
-                calEnthalpyChangeOfReaction(reactionListSorted, Ts_r_ReVa[r]))
+                calEnthalpyChangeOfReaction(reactionListSorted, Ts_r_ReVa[r], method=reactionEnthalpyMethod))
             # heat of reaction at T [kJ/kmol] | [J/mol]
             HeReT = np.array(EnChList + StHeRe25)
             # overall heat of reaction [J/m^3.s]
@@ -1,4 +1,4 @@
 from PyREMOT.solvers.solSetting import solverSetting
-from PyREMOT.solvers.odeSolver import AdBash3, PreCorr3
+from PyREMOT.solvers.odeSolver import AdBash3, PreCorr3, DoPri54, BDF, BDFSolverClass
 from PyREMOT.solvers.solResultAnalysis import sortResult4, sortResult5, plotResultsSteadyState, plotResultsDynamic
 from PyREMOT.solvers.solProgress import printProgressBar
@@ -4,6 +4,9 @@
 # import package/module
 import numpy as np
 import matplotlib.pyplot as plt
+from scipy import sparse
+from scipy.linalg import lu_solve, lapack
+from scipy.sparse.linalg import splu
 
 # f in the IVP y’ = f(t,y), y(t0)=y0
 
@@ -102,6 +105,582 @@ def PreCorr3(t0, tn, n, y0, f, params):
     return y
 
 
+def odeInitialStep(t0, y0, f0, f, params, hDir, order, rtol, atol):
+    """
+    initial step size estimate (Hairer, Norsett and Wanner)
+    args:
+        t0, y0: initial point
+        f0: f(t0, y0, params)
+        f: function f(t, y, params)
+        params: function parameters
+        hDir: integration direction
+        order: order of the method
+        rtol, atol: relative/absolute tolerance
+    output:
+        h: step size (abs)
+    """
+    _scale = atol + np.abs(y0)*rtol
+    d0 = np.sqrt(np.mean((y0/_scale)**2))
+    d1 = np.sqrt(np.mean((f0/_scale)**2))
+    h0 = 1e-6 if d0 < 1e-5 or d1 < 1e-5 else 0.01*d0/d1
+    _f1 = np.asarray(f(t0 + hDir*h0, y0 + hDir*h0*f0, params))
+    d2 = np.sqrt(np.mean(((_f1 - f0)/_scale)**2))/h0
+    h1 = max(1e-6, h0*1e-3) if max(d1, d2) <= 1e-15 else (0.01 /
+                                                           max(d1, d2))**(1/(order + 1))
+    return min(100*h0, h1)
+
+
+# Dormand-Prince 5(4) tableau
+DOPRI54_C = np.array([0, 1/5, 3/10, 4/5, 8/9, 1, 1])
+DOPRI54_A = [
+    np.array([]),
+    np.array([1/5]),
+    np.array([3/40, 9/40]),
+    np.array([44/45, -56/15, 32/9]),
+    np.array([19372/6561, -25360/2187, 64448/6561, -212/729]),
+    np.array([9017/3168, -355/33, 46732/5247, 49/176, -5103/18656]),
+    np.array([35/384, 0, 500/1113, 125/192, -2187/6784, 11/84])
+]
+# 5th order weights (last stage row, FSAL)
+DOPRI54_B = np.array([35/384, 0, 500/1113, 125/192, -2187/6784, 11/84, 0])
+# error weights (5th - 4th order)
+DOPRI54_E = DOPRI54_B - \
+    np.array([5179/57600, 0, 7571/16695, 393/640, -92097/339200, 187/2100, 1/40])
+
+
+def DoPri54(t0, tn, y0, f, params, rtol=1e-3, atol=1e-6, tEval=None, hMax=np.inf, maxSteps=100000):
+    """
+    Dormand-Prince 5(4) embedded Runge-Kutta method (adaptive step)
+        the step size is set by the local error estimate, the last stage
+        is reused as the first stage of the next step (FSAL)
+    args:
+        t0, tn: time span
+        y0: initial values
+        f: function f(t, y, params)
+        params: function parameters
+        rtol, atol: relative/absolute tolerance
+        tEval: output times within (t0, tn], default: [tn]
+        hMax: max step size
+        maxSteps: max number of steps
+    output:
+        y: shape (varNo, len(tEval) + 1), y[:, 0] = y0
+    """
+    # order of the error estimate
+    errExp = -1/5
+    # step size factor limits
+    safety, minFactor, maxFactor = 0.9, 0.2, 10
+
+    # output times
+    tEval = np.array([tn], dtype=float) if tEval is None else np.asarray(
+        tEval, dtype=float)
+    # direction
+    hDir = np.sign(tn - t0) if tn != t0 else 1
+    # y matrix
+    yCur = np.array(y0, dtype=float)
+    y = np.zeros((yCur.size, tEval.size + 1))
+    y[:, 0] = yCur
+    # check
+    if tn == t0:
+        y[:, 1:] = yCur[:, np.newaxis]
+        return y
+
+    # stage workspace
+    K = np.zeros((7, yCur.size))
+    K[0] = f(t0, yCur, params)
+
+    # initial step size
+    h = min(odeInitialStep(t0, yCur, K[0], f, params, hDir, 4, rtol, atol),
+            hMax, abs(tn - t0))
+
+    # loop
+    t = t0
+    tIndex = 0
+    stepNo = 0
+    while tIndex < tEval.size:
+        # check
+        stepNo += 1
+        if stepNo > maxSteps:
+            raise Exception("DoPri54: max number of steps is reached!")
+        if h < 10*np.abs(np.nextafter(t, hDir*np.inf) - t):
+            raise Exception("DoPri54: step size is too small!")
+
+        # step size (output times are hit exactly)
+        _tNext = tEval[tIndex]
+        hStep = min(h, abs(_tNext - t))
+        tNew = _tNext if hStep == abs(_tNext - t) else t + hDir*hStep
+        hSigned = tNew - t
+
+        # stages
+        for j in range(1, 7):
+            K[j] = f(t + DOPRI54_C[j]*hSigned,
+                     yCur + hSigned*(DOPRI54_A[j] @ K[0:j]), params)
+        # 5th order solution (same as the last stage)
+        yNew = yCur + hSigned*(DOPRI54_A[6] @ K[0:6])
+        K[6] = f(tNew, yNew, params)
+
+        # error norm
+        _scale = atol + np.maximum(np.abs(yCur), np.abs(yNew))*rtol
+        errNorm = np.sqrt(
+            np.mean((hSigned*(DOPRI54_E @ K)/_scale)**2))
+
+        # check
+        if errNorm <= 1:
+            # accepted
+            t = tNew
+            yCur = yNew
+            # FSAL
+            K[0] = K[6]
+            # output
+            if t == _tNext:
+                tIndex += 1
+                y[:, tIndex] = yCur
+            _factor = maxFactor if errNorm == 0 else min(
+                maxFactor, safety*errNorm**errExp)
+            # the clipped step is not used for the next step size
+            h = min(max(h, hStep*_factor), hMax) if hStep < h else min(
+                hStep*_factor, hMax)
+        else:
+            # rejected
+            h = hStep*max(minFactor, safety*errNorm**errExp)
+
+    return y
+
+
+# BDF method (BDFSolverClass) is adapted from scipy.integrate.BDF
+# (scipy/integrate/_ivp/bdf.py), distributed under the following license:
+#
+# Copyright (c) 2001-2002 Enthought, Inc. 2003-2024, SciPy Developers.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above
+#    copyright notice, this list of conditions and the following
+#    disclaimer in the documentation and/or other materials provided
+#    with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+# BDF constants (variable order 1-5, quasi-constant step size)
+BDF_MAX_ORDER = 5
+BDF_NEWTON_MAXITER = 4
+BDF_KAPPA = np.array([0, -0.1850, -1/9, -0.0823, -0.0415, 0])
+BDF_GAMMA = np.hstack((0, np.cumsum(1/np.arange(1, BDF_MAX_ORDER + 1))))
+BDF_ALPHA = (1 - BDF_KAPPA)*BDF_GAMMA
+BDF_ERROR_CONST = BDF_KAPPA*BDF_GAMMA + 1/np.arange(1, BDF_MAX_ORDER + 2)
+
+
+class BDFSolverClass:
+    """
+    variable-order (1-5) BDF method for stiff systems
+        adapted from scipy.integrate.BDF (BSD-3-Clause, see the notice above),
+        the step size/order control and newton iteration follow scipy,
+        the jacobian and the LU factorization of the iteration matrix are kept
+        and reused over the steps, they are only updated when the newton
+        iteration fails or the step size/order changes (LU), a singular
+        iteration matrix is treated as a failed newton iteration,
+        the solver object keeps its state over successive calls of solve,
+        so a chunked time loop continues with the same history and factorization
+    args:
+        f: function f(t, y, params)
+        params: function parameters
+        jac: jacobian function jac(t, y, params), default: finite difference
+            dense: ndarray [varNo, varNo] (a sparse matrix is converted)
+            banded: ndarray [ml+mu+1, varNo], ab[mu + i - j, j] = J[i, j]
+            sparse: scipy sparse matrix [varNo, varNo]
+        jacType: dense, banded, sparse
+        jacBand: (ml, mu) lower/upper bandwidth (banded)
+        jacSparsity: jacobian sparsity pattern (sparse), e.g. FiDiJacobianPattern
+        rtol, atol: relative/absolute tolerance
+        maxOrder: max order of the method
+    """
+    # max/min step size factor
+    maxFactor = 10
+    minFactor = 0.2
+
+    def __init__(self, f, params, jac=None, jacType="dense", jacBand=None, jacSparsity=None, rtol=1e-3, atol=1e-6, maxOrder=5):
+        self.f = f
+        self.params = params
+        self.jac = jac
+        self.jacType = jacType
+        self.rtol = rtol
+        self.atol = atol
+        self.maxOrder = min(maxOrder, BDF_MAX_ORDER)
+        self.newtonTol = max(10*np.finfo(float).eps/rtol, min(0.03, rtol**0.5))
+        # check
+        if jacType not in ("dense", "banded", "sparse"):
+            raise Exception(f"BDFSolverClass: unknown jacType {jacType}!")
+        if jacType == "banded" and jacBand is None:
+            raise Exception("BDFSolverClass: jacBand (ml, mu) is required!")
+        if jacType == "sparse" and jac is None and jacSparsity is None:
+            raise Exception("BDFSolverClass: jacSparsity is required!")
+        self.jacBand = jacBand
+        self.jacSparsity = None if jacSparsity is None else sparse.coo_matrix(
+            jacSparsity)
+        # solver state
+        self.t = None
+        self.y = None
+        self.J = None
+        self.LU = None
+        # statistics
+        self.stats = {"nfev": 0, "njev": 0, "nlu": 0, "nstep": 0}
+
+    def fun(self, t, y):
+        """
+        rhs evaluation
+        """
+        self.stats['nfev'] += 1
+        return np.asarray(self.f(t, y, self.params), dtype=float)
+
+    def jacFiDiGroups(self, varNo):
+        """
+        finite difference jacobian structure
+            columns of the same group do not share a row and are perturbed in
+            one rhs evaluation
+        output:
+            groups: group number of each column
+            rows, cols: jacobian nonzero entries
+        """
+        if self.jacType == "dense":
+            rows, cols = np.indices((varNo, varNo))
+            return np.arange(varNo), rows.ravel(), cols.ravel()
+        if self.jacType == "banded":
+            ml, mu = self.jacBand
+            _pattern = sparse.diags([np.ones(varNo - abs(k)) for k in range(-ml, mu + 1)],
+                                    list(range(-ml, mu + 1)), shape=(varNo, varNo)).tocoo()
+            return np.arange(varNo) % (ml + mu + 1), _pattern.row, _pattern.col
+        # sparse (greedy column grouping)
+        _pattern = self.jacSparsity.tocsc()
+        _pattern.eliminate_zeros()
+        groups = np.zeros(varNo, dtype=int)
+        _groupRows = []
+        for j in range(varNo):
+            _rows = _pattern.indices[_pattern.indptr[j]:_pattern.indptr[j+1]]
+            for g, _used in enumerate(_groupRows):
+                if not np.any(_used[_rows]):
+                    break
+            else:
+                g = len(_groupRows)
+                _groupRows.append(np.zeros(varNo, dtype=bool))
+            _groupRows[g][_rows] = True
+            groups[j] = g
+        _pattern = _pattern.tocoo()
+        return groups, _pattern.row, _pattern.col
+
+    def jacEval(self, t, y, f0):
+        """
+        jacobian evaluation (user function or finite difference)
+        """
+        self.stats['njev'] += 1
+        varNo = y.size
+        # user jacobian
+        if self.jac is not None:
+            J = self.jac(t, y, self.params)
+            # check
+            if self.jacType == "sparse":
+                return sparse.csc_matrix(J)
+            return J.toarray() if sparse.issparse(J) else np.asarray(J, dtype=float)
+
+        # finite difference
+        if not hasattr(self, "_jacFiDi"):
+            self._jacFiDi = self.jacFiDiGroups(varNo)
+        groups, rows, cols = self._jacFiDi
+        _dy = np.sqrt(np.finfo(float).eps)*np.maximum(1, np.abs(y))
+        vals = np.zeros(rows.size)
+        for g in range(groups.max() + 1):
+            _cols = groups == g
+            _yp = y.copy()
+            _yp[_cols] += _dy[_cols]
+            _df = self.fun(t, _yp) - f0
+            _mask = _cols[cols]
+            vals[_mask] = _df[rows[_mask]]/_dy[cols[_mask]]
+        # jacobian format
+        if self.jacType == "dense":
+            return vals.reshape((varNo, varNo))
+        if self.jacType == "banded":
+            ml, mu = self.jacBand
+            J = np.zeros((ml + mu + 1, varNo))
+            J[mu + rows - cols, cols] = vals
+            return J
+        return sparse.csc_matrix((vals, (rows, cols)), shape=(varNo, varNo))
+
+    def luFactor(self, c):
+        """
+        LU factorization of the iteration matrix I - c*J
+        output:
+            LU: factorization, None if the matrix is singular
+        """
+        self.stats['nlu'] += 1
+        if self.jacType == "dense":
+            lu, piv, info = lapack.dgetrf(
+                np.identity(self.J.shape[0]) - c*self.J)
+            return None if info != 0 else (lu, piv)
+        if self.jacType == "banded":
+            ml, mu = self.jacBand
+            _ab = np.zeros((2*ml + mu + 1, self.J.shape[1]))
+            _ab[ml:] = -c*self.J
+            _ab[ml + mu] += 1
+            lu, piv, info = lapack.dgbtrf(_ab, ml, mu)
+            return None if info != 0 else (lu, piv)
+        try:
+            return splu(sparse.identity(self.J.shape[0], format="csc") - c*self.J)
+        except RuntimeError:
+            # singular matrix
+            return None
+
+    def luSolve(self, LU, b):
+        """
+        solve the linear system with the LU factorization
+        output:
+            x: solution, None if the solve fails
+        """
+        if self.jacType == "dense":
+            return lu_solve(LU, b, check_finite=False)
+        if self.jacType == "banded":
+            ml, mu = self.jacBand
+            x, info = lapack.dgbtrs(LU[0], ml, mu, b, LU[1])
+            return None if info != 0 else x
+        return LU.solve(b)
+
+    @staticmethod
+    def changeD(D, order, factor):
+        """
+        rescale the backward differences for a new step size h*factor
+        """
+        def _R(factor):
+            _i = np.arange(1, order + 1)[:, np.newaxis]
+            _j = np.arange(1, order + 1)
+            M = np.zeros((order + 1, order + 1))
+            M[1:, 1:] = (_i - 1 - factor*_j)/_i
+            M[0] = 1
+            return np.cumprod(M, axis=0)
+        RU = _R(factor).dot(_R(1))
+        D[:order + 1] = RU.T.dot(D[:order + 1])
+
+    def reset(self, t0, y0, tn):
+        """
+        restart the history (first order step) at (t0, y0)
+        """
+        self.t = t0
+        self.y = np.array(y0, dtype=float)
+        self.hDir = np.sign(tn - t0)
+        f0 = self.fun(t0, self.y)
+        self.h = odeInitialStep(t0, self.y, f0, self.f, self.params,
+                                self.hDir, 1, self.rtol, self.atol)
+        self.order = 1
+        self.nEqualSteps = 0
+        self.D = np.zeros((BDF_MAX_ORDER + 3, self.y.size))
+        self.D[0] = self.y
+        self.D[1] = f0*self.h*self.hDir
+        # jacobian (kept if available)
+        if self.J is None:
+            self.J = self.jacEval(t0, self.y, f0)
+        self.jacCurrent = False
+        self.LU = None
+
+    def newton(self, tNew, yPredict, c, psi, scale):
+        """
+        simplified newton iteration with the current LU factorization
+        """
+        d = np.zeros_like(yPredict)
+        y = yPredict.copy()
+        dyNormOld = None
+        converged = False
+        for k in range(BDF_NEWTON_MAXITER):
+            _f = self.fun(tNew, y)
+            if not np.all(np.isfinite(_f)):
+                break
+            dy = self.luSolve(self.LU, c*_f - psi - d)
+            if dy is None or not np.all(np.isfinite(dy)):
+                break
+            dyNorm = np.sqrt(np.mean((dy/scale)**2))
+            rate = None if dyNormOld is None else dyNorm/dyNormOld
+            if rate is not None and (rate >= 1 or rate**(BDF_NEWTON_MAXITER - k)/(1 - rate)*dyNorm > self.newtonTol):
+                break
+            y += dy
+            d += dy
+            if dyNorm == 0 or (rate is not None and rate/(1 - rate)*dyNorm < self.newtonTol):
+                converged = True
+                break
+            dyNormOld = dyNorm
+        return converged, k + 1, y, d
+
+    def step(self, tBound):
+        """
+        one accepted step (not beyond tBound)
+        """
+        D = self.D
+        order = self.order
+        hAbs = self.h
+        # check
+        if hAbs > abs(tBound - self.t):
+            hAbs = abs(tBound - self.t)
+            self.changeD(D, order, hAbs/self.h)
+            self.nEqualSteps = 0
+            self.LU = None
+
+        accepted = False
+        while not accepted:
+            # check
+            if hAbs < 10*np.abs(np.nextafter(self.t, self.hDir*np.inf) - self.t):
+                raise Exception("BDFSolverClass: step size is too small!")
+            h = hAbs*self.hDir
+            tNew = tBound if hAbs == abs(tBound - self.t) else self.t + h
+            yPredict = np.sum(D[:order + 1], axis=0)
+            scale = self.atol + self.rtol*np.abs(yPredict)
+            psi = np.dot(D[1:order + 1].T,
+                         BDF_GAMMA[1:order + 1])/BDF_ALPHA[order]
+            c = h/BDF_ALPHA[order]
+
+            # newton iteration (jacobian is updated only if it fails)
+            # a singular iteration matrix fails as the newton iteration does
+            converged = False
+            while not converged:
+                if self.LU is None:
+                    self.LU = self.luFactor(c)
+                if self.LU is not None:
+                    converged, nIter, yNew, d = self.newton(
+                        tNew, yPredict, c, psi, scale)
+                if not converged:
+                    if self.jacCurrent:
+                        break
+                    self.J = self.jacEval(
+                        tNew, yPredict, self.fun(tNew, yPredict))
+                    self.jacCurrent = True
+                    self.LU = None
+
+            if not converged:
+                factor = 0.5
+                hAbs *= factor
+                self.changeD(D, order, factor)
+                self.nEqualSteps = 0
+                self.LU = None
+                continue
+
+            # error estimate
+            safety = 0.9*(2*BDF_NEWTON_MAXITER + 1) / \
+                (2*BDF_NEWTON_MAXITER + nIter)
+            scale = self.atol + self.rtol*np.abs(yNew)
+            errorNorm = np.sqrt(
+                np.mean((BDF_ERROR_CONST[order]*d/scale)**2))
+            if errorNorm > 1:
+                factor = max(self.minFactor, safety *
+                             errorNorm**(-1/(order + 1)))
+                hAbs *= factor
+                self.changeD(D, order, factor)
+                self.nEqualSteps = 0
+                self.LU = None
+            else:
+                accepted = True
+
+        # accepted
+        self.stats['nstep'] += 1
+        self.nEqualSteps += 1
+        self.t = tNew
+        self.y = yNew
+        self.h = hAbs
+        self.jacCurrent = False
+        D[order + 2] = d - D[order + 1]
+        D[order + 1] = d
+        for i in reversed(range(order + 1)):
+            D[i] += D[i + 1]
+
+        # order/step size selection
+        if self.nEqualSteps < order + 1:
+            return
+        errorM = np.sqrt(np.mean((BDF_ERROR_CONST[order - 1]*D[order]/scale)**2)
+                         ) if order > 1 else np.inf
+        errorP = np.sqrt(np.mean((BDF_ERROR_CONST[order + 1]*D[order + 2]/scale)**2)
+                         ) if order < self.maxOrder else np.inf
+        errorNorms = np.array([errorM, errorNorm, errorP])
+        with np.errstate(divide='ignore'):
+            factors = errorNorms**(-1/np.arange(order, order + 3))
+        deltaOrder = np.argmax(factors) - 1
+        self.order = order + deltaOrder
+        factor = min(self.maxFactor, safety*np.max(factors))
+        self.h *= factor
+        self.changeD(D, self.order, factor)
+        self.nEqualSteps = 0
+        self.LU = None
+
+    def interpolate(self, tOut):
+        """
+        solution at tOut within the last step (backward difference polynomial)
+        """
+        h = self.h*self.hDir
+        order = self.order
+        _p = (tOut - (self.t - h*np.arange(order))) / \
+            (h*(1 + np.arange(order)))
+        return self.D[0] + np.dot(np.cumprod(_p), self.D[1:order + 1])
+
+    def solve(self, t0, tn, y0, tEval=None):
+        """
+        integrate from t0 to tn, the history is kept if (t0, y0) is the end of
+        the previous call
+        args:
+            t0, tn: time span
+            y0: initial values
+            tEval: output times within (t0, tn], default: [tn]
+        output:
+            y: shape (varNo, len(tEval) + 1), y[:, 0] = y0
+        """
+        # output times
+        tEval = np.array([tn], dtype=float) if tEval is None else np.asarray(
+            tEval, dtype=float)
+        # y matrix
+        y0 = np.array(y0, dtype=float)
+        y = np.zeros((y0.size, tEval.size + 1))
+        y[:, 0] = y0
+        # check
+        if tn == t0:
+            y[:, 1:] = y0[:, np.newaxis]
+            return y
+        # continue or restart
+        if self.t != t0 or self.hDir != np.sign(tn - t0) or not np.array_equal(self.y, y0):
+            self.reset(t0, y0, tn)
+
+        tIndex = 0
+        while tIndex < tEval.size:
+            self.step(tn)
+            # output
+            while tIndex < tEval.size and (tEval[tIndex] - self.t)*self.hDir <= 0:
+                y[:, tIndex + 1] = self.y if tEval[tIndex] == self.t else self.interpolate(
+                    tEval[tIndex])
+                tIndex += 1
+        return y
+
+
+def BDF(t0, tn, y0, f, params, tEval=None, **options):
+    """
+    variable-order BDF method (stiff systems), see BDFSolverClass
+        a BDFSolverClass object should be kept over a chunked time loop
+        to reuse the jacobian/LU factorization
+    output:
+        y: shape (varNo, len(tEval) + 1), y[:, 0] = y0
+    """
+    return BDFSolverClass(f, params, **options).solve(t0, tn, y0, tEval)
+
+
+
 # run
 # n = 300
 # t0 = 0
@@ -114,6 +693,7 @@ def PreCorr3(t0, tn, n, y0, f, params):
 # sol = RK4(t0, tn, n, y0, paramsSet)
 # sol = AdBash3(t0, tn, n, y0, funSet, paramsSet)
 # sol = PreCorr3(t0, tn, n, y0, funSet, paramsSet)
+# sol = DoPri54(t0, tn, y0, funSet, paramsSet, tEval=t[1:])
 
 # z = sol
 # plt.plot(t, z[0, :], t, z[1, :])
@@ -24,6 +24,34 @@ class OrCoCatParticleClass:
         self.A = A
         self.B = B
         self.odeNo = odeNo
+        # collocation operators (constant during a run)
+        self.LInt, self.LBC2 = self.buildOrCoOperator()
+
+    def buildOrCoOperator(self):
+        '''
+        build the constant parts of the Lhs (R) matrix
+            interior points: B + (2/Xc)*A (scaled by the effective diffusivity/conductivity)
+            BC2 point: A (the Biot number is added to the last point)
+        output:
+            LInt: interior points operator, shape: (N, N)
+            LBC2: BC2 point operator, shape: (N, N)
+        '''
+        # try/except
+        try:
+            _A = np.array(self.A, dtype=float)
+            _B = np.array(self.B, dtype=float)
+            _Xc = np.array(self.Xc, dtype=float)
+            # interior points
+            LInt = np.zeros((self.N, self.N))
+            LInt[:-1] = _B[:self.N-1] + \
+                (2/_Xc[:self.N-1]).reshape((-1, 1))*_A[:self.N-1]
+            # BC2 point
+            LBC2 = np.zeros((self.N, self.N))
+            LBC2[-1] = _A[self.N-1]
+            # res
+            return LInt, LBC2
+        except Exception as e:
+            raise
 
     def CalUpdateYnSolidGasInterface(self, yj, CTb, beta, fluxDir="lr"):
         '''
@@ -220,20 +248,55 @@ class OrCoCatParticleClass:
         try:
             # # yj
             # y[0], y[1], ..., y[n]
-            # R matrix
-            RMatrix = self.buildLhsMatrix(const1, const3)
-            # f matrix
-            fMatrix = self.buildRhsMatrix(const2, const3)
+            # res
+            return self.buildOrCoMatrixBatch(np.ravel(yj), const1, const2, const3, mode)
 
-            # [R][Y]=[RY]
-            RYMatrix = np.matmul(RMatrix, yj)
+        except Exception as e:
+            raise
+
+    def buildOrCoMatrixBatch(self, yj, const1, const2, const3=(), mode="default"):
+        '''
+        build df/dt of all variables (components, z nodes) in one call
+            [R][Y] + [F] with the precomputed collocation operators
+        args:
+            yj: var values at OC points, shape: (..., N)
+            const1:
+                concentration: effective diffusivity coefficient, shape: (...)
+                temperature: effective thermal conductivity, shape: (...)
+            const2:
+                concentration: reaction term, shape: (..., N)
+                temperature: overall enthalpy of reaction, shape: (..., N)
+            const3:
+                concentration: bulk concentration & dimensionless number, shape: (...) each
+                temperature: bulk temperature & dimensionless number, shape: (...) each
+        output:
+            RYF: shape (..., N)
+        '''
+        try:
+            # var
+            _yj = np.asarray(yj, dtype=float)
+            _const1 = np.asarray(const1, dtype=float)[..., np.newaxis]
+            # bulk value, dimensionless number
+            _yb = np.asarray(const3[0], dtype=float)
+            _beta = np.asarray(const3[1], dtype=float)
+
+            # [R][Y]
+            RYMatrix = _const1*np.einsum('ij,...j->...i', self.LInt, _yj) + \
+                np.einsum('ij,...j->...i', self.LBC2, _yj)
+            RYMatrix[..., -1] += _beta*_yj[..., -1]
+
+            # f matrix
+            # interior points: reaction term, BC2 point: bulk value
+            fMatrix = np.array(np.broadcast_to(
+                const2, RYMatrix.shape), dtype=float)
+            fMatrix[..., -1] = -1*_yb*_beta
 
             # sum of R and F
             RYFMatrix = RYMatrix + fMatrix
 
             # should be flip C[n], C[n-1], ..., C[0]
-            RYFMatrix_flip = np.flipud(
-                RYFMatrix) if mode == "default" else RYFMatrix
+            RYFMatrix_flip = np.flip(
+                RYFMatrix, axis=-1) if mode == "default" else RYFMatrix
 
             # res
             return RYFMatrix_flip
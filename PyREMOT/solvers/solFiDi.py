@@ -4,6 +4,7 @@
 # import module/packages
 import numpy as np
 import matplotlib.pyplot as plt
+from scipy import sparse
 # internals
 from PyREMOT.solvers.solSetting import DIFF_SETTING
 
@@ -832,3 +833,203 @@ def FiDiMeshGenerator(NoNo, DoLe, DoLeSe, MeReDe, display=False):
         return res
     except Exception as e:
         raise
+
+
+def FiDiDerivativeOperator(zNo, dz, dzs, zNoNoDense, solverMeshSet, diff1Set, diff2Set):
+    """
+    build the first/second derivative operators of the axial mesh
+        the node stencils and boundary conditions (BC1, BC2) are the same as
+        the node loop of the model equations, the inlet value of node 0
+        (BC1) is a ghost node and its coefficients are kept separately,
+        the i-2 value of node 1 is the ghost node too (the node loop takes
+        the last node) and the ghost node spacing is dzs[0] (non-uniform mesh)
+    args:
+        zNo: number of finite difference points
+        dz: step size (uniform mesh | normal section)
+        dzs: step sizes (non-uniform mesh, FiDiMeshGenerator)
+        zNoNoDense: number of nodes in the dense section
+        solverMeshSet: uniform mesh (True), non-uniform mesh (False)
+        diff1Set: first derivative setting (dFdz | dTdz)
+        diff2Set: second derivative setting (d2Fdz2 | d2Tdz2): BC1, BC2, G
+    output:
+        res:
+            D1: first derivative, sparse matrix [zNo, zNo]
+            D2: second derivative, sparse matrix [zNo, zNo]
+            g1: first derivative ghost node coefficient [zNo]
+            g2: second derivative ghost node coefficient [zNo]
+    """
+    # try/except
+    try:
+        # stencil unit values: i-2, i-1, i, i+1, i+2
+        _unit = np.identity(5)
+        D1 = sparse.lil_matrix((zNo, zNo))
+        D2 = sparse.lil_matrix((zNo, zNo))
+        g1 = np.zeros(zNo)
+        g2 = np.zeros(zNo)
+
+        for z in range(zNo):
+            # stencil nodes (ghost: inlet ghost node, None: zero value)
+            if z == 0:
+                # BC1
+                _nodes = [None, "ghost", z, z+1, z+2]
+                _dz = dz if solverMeshSet is True else dzs[z]
+                def _d1(F): return FiDiDerivative1(F[1:4], _dz, diff1Set)
+                if solverMeshSet is True:
+                    def _d2(F): return FiDiDerivative2(F, _dz, diff2Set['BC1'])
+                else:
+                    # ghost node spacing: dzs[0]
+                    def _d2(F): return FiDiNonUniformDerivative2(
+                        F, _dz, diff2Set['BC1'], 1)
+            elif z < zNoNoDense and solverMeshSet is False:
+                # dense section
+                _nodes = [z-2 if z > 1 else "ghost", z-1, z, z+1, z+2]
+                def _d1(F): return FiDiNonUniformDerivative1(
+                    F, dzs[z], diff1Set, dzs[max(z-2, 0)]/dzs[z-1])
+                def _d2(F): return FiDiNonUniformDerivative2(
+                    F, dzs[z], diff2Set['G'], dzs[z]/dzs[z-1])
+            elif z == zNo - 1:
+                # BC2
+                _nodes = [z-2, z-1, z, z-1, None]
+                def _d1(F): return FiDiDerivative1(F[1:4], dz, diff1Set)
+                def _d2(F): return FiDiDerivative2(F, dz, diff2Set['BC2'])
+            else:
+                # interior nodes
+                _nodes = [z-2 if z > 1 else "ghost", z-1, z, z+1,
+                          z+2 if z < zNo-2 else None]
+                def _d1(F): return FiDiDerivative1(F[1:4], dz, diff1Set)
+                def _d2(F): return FiDiDerivative2(F, dz, diff2Set['G'])
+
+            # coefficients
+            for k, _node in enumerate(_nodes):
+                # check
+                if _node is None:
+                    continue
+                _c1 = _d1(_unit[k])
+                _c2 = _d2(_unit[k])
+                if _node == "ghost":
+                    g1[z] += _c1
+                    g2[z] += _c2
+                else:
+                    D1[z, _node] += _c1
+                    D2[z, _node] += _c2
+
+        # res
+        res = {
+            "D1": D1.tocsr(),
+            "D2": D2.tocsr(),
+            "g1": g1,
+            "g2": g2
+        }
+        return res
+    except Exception as e:
+        raise
+
+
+def FiDiDerivativeApply(zOperator, F, Fb):
+    """
+    apply the derivative operators to all variables
+    args:
+        zOperator: FiDiDerivativeOperator result
+        F: variable values [n, zNo]
+        Fb: inlet ghost node values [n]
+    output:
+        dFdz: first derivative [n, zNo]
+        d2Fdz2: second derivative [n, zNo]
+    """
+    # try/except
+    try:
+        _F = np.atleast_2d(F)
+        _Fb = np.atleast_1d(Fb)
+        dFdz = (zOperator['D1'] @ _F.T).T + np.outer(_Fb, zOperator['g1'])
+        d2Fdz2 = (zOperator['D2'] @ _F.T).T + \
+            np.outer(_Fb, zOperator['g2'])
+        return dFdz, d2Fdz2
+    except Exception as e:
+        raise
+
+
+def FiDiStencilHalfWidth(solverSetting, solverMeshSet=True):
+    """
+    half width of the axial finite difference stencil
+    args:
+        solverSetting: T1 solver setting (dFdz, d2Fdz2, dTdz, d2Tdz2)
+        solverMeshSet: uniform mesh (True), non-uniform mesh (False)
+    output:
+        halfWidth: node i depends on nodes i-halfWidth, ..., i+halfWidth
+    """
+    # try/except
+    try:
+        # NOTE
+        # non-uniform nodes use the 5-point formulas
+        if solverMeshSet is False:
+            return 2
+        # first derivative: i-1, i, i+1
+        # second derivative: i-2 (BD) | i+2 (FD)
+        _modes = list(solverSetting['d2Fdz2'].values()) + \
+            list(solverSetting['d2Tdz2'].values())
+        # check
+        if all(item == DIFF_SETTING['CD'] for item in _modes):
+            return 1
+        return 2
+    except Exception as e:
+        raise
+
+
+def FiDiJacobianPattern(noLayer, varNoRows, varNoColumns, halfWidth=1, stencilRows=None, upstreamRows=None, upstreamLayers=None, rowPattern=None):
+    """
+    build jacobian sparsity pattern of a finite difference model
+        y is reshaped as (noLayer, varNoRows, varNoColumns), the variables
+        of a node (layers, rows) are coupled, the axial coupling (columns)
+        is set by the stencil
+    args:
+        noLayer: number of layers (components, temperature)
+        varNoRows: number of rows (gas phase, particle nodes)
+        varNoColumns: number of finite difference points (zNo)
+        halfWidth: stencil half width (FiDiStencilHalfWidth)
+        stencilRows: rows discretized along the reactor length,
+            other rows are coupled at the same node only (default: all rows)
+        upstreamRows: rows coupled to all downstream nodes, e.g. the pressure
+            profile (ergun equation) is integrated from the inlet (default: none)
+        upstreamLayers: layers of upstreamRows coupled to all downstream
+            nodes, e.g. the gas density of the ergun equation depends on the
+            concentrations only (default: all layers)
+        rowPattern: coupling of the rows of a node [varNoRows, varNoRows],
+            e.g. the reaction network of a homogeneous model (default: all rows)
+    output:
+        jacPattern: sparse boolean matrix [varNoT, varNoT]
+    """
+    # try/except
+    try:
+        # axial coupling
+        _band = sparse.diags([np.ones(varNoColumns - abs(k)) for k in range(-halfWidth, halfWidth + 1)],
+                             list(range(-halfWidth, halfWidth + 1)), shape=(varNoColumns, varNoColumns))
+        _node = sparse.identity(varNoColumns)
+        # rows
+        _rowSet = np.zeros(varNoRows)
+        _rowSet[list(range(varNoRows)) if stencilRows is None else stencilRows] = 1
+        _rowPair = np.outer(_rowSet, _rowSet)
+        _rowNode = np.ones((varNoRows, varNoRows)) if rowPattern is None else \
+            (sparse.csr_matrix(rowPattern).toarray() != 0)
+        _rowMat = sparse.kron(_rowPair, _band - _node) + \
+            sparse.kron(_rowNode, _node)
+        # layers
+        jacPattern = sparse.kron(np.ones((noLayer, noLayer)), _rowMat)
+        # NOTE
+        # upstream nodes (lower triangle): all variables of a node depend on
+        # the upstream layers/rows of the previous nodes
+        if upstreamRows is not None:
+            _upSet = np.zeros(varNoRows)
+            _upSet[upstreamRows] = 1
+            _layerSet = np.zeros(noLayer)
+            _layerSet[list(range(noLayer))
+                      if upstreamLayers is None else upstreamLayers] = 1
+            _upMat = sparse.kron(np.outer(np.ones(varNoRows), _upSet),
+                                 sparse.tril(np.ones((varNoColumns, varNoColumns)), -1))
+            jacPattern = jacPattern + \
+                sparse.kron(np.outer(np.ones(noLayer), _layerSet), _upMat)
+        jacPattern = jacPattern != 0
+
+        # res
+        return jacPattern.tocsr()
+    except Exception as e:
+        raise
@@ -58,7 +58,12 @@ solverSetting = {
             "DoLeSe": 30,
             "MeReDe": 1.001
         },
-        "rampList": [1]
+        "rampList": [1],
+        # node results cache (solver-config: cache)
+        "cache": {
+            "size": 4096,
+            "bits": 52
+        }
     },
     "T1": {
         "zMesh": {
@@ -73,7 +78,18 @@ solverSetting = {
             "fdm": 7,
             "oc": 7
         },
+        # ivp: "AM" (in-house solvers), method: PreCorr3 (fixed-step, default), DoPri54 (adaptive), BDF (stiff)
         "ode-solver": {
+            "method": "PreCorr3",
+            "DoPri54": {
+                "rtol": 1e-6,
+                "atol": 1e-8
+            },
+            "BDF": {
+                "rtol": 1e-6,
+                "atol": 1e-8,
+                "maxOrder": 5
+            },
             "PreCorr3": {
                 "n": 100
             }
@@ -90,6 +106,11 @@ solverSetting = {
             "BC2": DIFF_SETTING['CD'],
             "G": DIFF_SETTING['CD']
         },
+        # change-driven property update (solver-config: property-update)
+        "propertyUpdate": {
+            "tolerance": 1e-3,
+            "refMin": 1e-6
+        }
     },
     "ParticleModel": {
         "tNo": 10,
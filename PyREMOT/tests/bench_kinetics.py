@@ -0,0 +1,293 @@
+# KINETICS BENCHMARK
+# ------------------
+
+# REVIEW
+# throughput of the chemistry hot path (reaction rates, formation rates,
+# enthalpy of reaction) for the shipped mechanisms (DME, CH4, C6)
+# and scaling over species count and grid size
+# usage: python -m PyREMOT.tests.bench_kinetics [-o result.json]
+
+# import packages/modules
+import argparse
+import json
+import os
+import sys
+import numpy as np
+from timeit import default_timer as timer
+# internals
+from PyREMOT.data import calConcentration
+from PyREMOT.docs.rmtUtility import rmtUtilityClass as rmtUtil
+from PyREMOT.docs.rmtReaction import reactionRateExe, componentFormationRate, componentFormationRateMat, ReactionRateClass
+from PyREMOT.docs.rmtThermo import calEnthalpyChangeOfReaction
+# examples import the data module from the package folder
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from PyREMOT.examples.reactionList import reactionRateSet as reactionRateSetDME
+
+# NOTE
+### mechanisms ###
+# methane coupling (tests/test_rmt_CH4_6.py, tests/test_rmt_C6.py)
+reactionRateSetCH4 = {
+    "VARS": {
+        "k0": 0.0072*1e3,
+        "y_CH4": lambda x: x['MoFri'][0],
+        "C_CH4": lambda x: x['SpCoi'][0]
+    },
+    "RATES": {
+        "r1": lambda x: x['k0']*(x['C_CH4']**2)
+    }
+}
+
+reactionRateSetC6 = {
+    "VARS": {
+        "k0": 0.0072,
+        "y_CH4": lambda x: x['MoFri'][0],
+        "C_CH4": lambda x: x['SpCoi'][0]
+    },
+    "RATES": {
+        "r1": lambda x: x['k0']*(x['C_CH4']**2)
+    }
+}
+
+MECHANISMS = {
+    "DME": {
+        "compList": ["H2", "CO2", "H2O", "CO", "CH3OH", "DME"],
+        "reactions": {
+            "R1": "CO2+3H2<=>CH3OH+H2O",
+            "R2": "CO+H2O<=>H2+CO2",
+            "R3": "2CH3OH<=>DME+H2O"
+        },
+        "reaction-rates": reactionRateSetDME,
+        "MoFri": [0.499985, 0.2499925, 1e-05, 0.2499925, 1e-05, 1e-05],
+        "P": 5e6,
+        "T": 523
+    },
+    "CH4": {
+        "compList": ["CH4", "C2H4", "H2"],
+        "reactions": {
+            "R1": "2CH4 <=> C2H4 + 2H2",
+        },
+        "reaction-rates": reactionRateSetCH4,
+        "MoFri": [0.9, 0.05, 0.05],
+        "P": 3*1e5,
+        "T": 973
+    },
+    "C6": {
+        "compList": ["CH4", "C2H4", "H2"],
+        "reactions": {
+            "R1": "2CH4 <=> C2H4 + 2H2",
+        },
+        "reaction-rates": reactionRateSetC6,
+        "MoFri": [0.9, 0.05, 0.05],
+        "P": 3*1e5,
+        "T": 973
+    }
+}
+
+# grid sizes (number of nodes)
+GRID_SIZE_LIST = [10, 100, 1000]
+# species count (synthetic mechanisms)
+SPECIES_NO_LIST = [5, 20, 80, 320]
+
+
+def timeFun(fun, number, repeat=3):
+    """
+    best time of a function [s/call]
+    args:
+        fun: function without args
+        number: calls in each repeat
+        repeat: number of repeats
+    """
+    _res = []
+    for _ in range(repeat):
+        start = timer()
+        for _ in range(number):
+            fun()
+        _res.append((timer() - start)/number)
+    return min(_res)
+
+
+def setRecord(mechanism, funName, mode, nodeNo, compNo, reactionNo, timeCall):
+    """
+    benchmark record
+    """
+    return {
+        "mechanism": mechanism,
+        "function": funName,
+        "mode": mode,
+        "nodeNo": nodeNo,
+        "compNo": compNo,
+        "reactionNo": reactionNo,
+        "timePerCall": timeCall,
+        "nodesPerSecond": nodeNo/timeCall if timeCall > 0 else None
+    }
+
+
+def buildMechanism(name):
+    """
+    build kinetics data of a mechanism
+    """
+    mechanism = MECHANISMS[name]
+    compList = mechanism['compList']
+    # reaction list sorted
+    reactionListSorted = rmtUtil.buildReactionCoefficient(
+        mechanism['reactions'])
+    # stoichiometric coefficients
+    reactionStochCoeff = rmtUtil.buildReactionCoeffVector(reactionListSorted)
+    # node state
+    MoFri = np.array(mechanism['MoFri'])
+    SpCoi = np.array(calConcentration(
+        MoFri, mechanism['P'], mechanism['T'], "mol/m^3"))
+
+    return {
+        "compList": compList,
+        "reactionListSorted": reactionListSorted,
+        "reactionStochCoeff": reactionStochCoeff,
+        "reactionStochCoeffMat": rmtUtil.setReactionCoeffMatrix(compList, reactionStochCoeff),
+        "reactionRateExpr": mechanism['reaction-rates'],
+        "reactionRateSet": ReactionRateClass(mechanism['reaction-rates']),
+        "loopVars": (mechanism['T'], mechanism['P'], MoFri, SpCoi)
+    }
+
+
+def benchMechanism(name, number=200):
+    """
+    node and grid throughput of a mechanism
+    """
+    res = []
+    mec = buildMechanism(name)
+    compList = mec['compList']
+    compNo = len(compList)
+    reactionNo = len(mec['reactionStochCoeff'])
+    reactionRateSet = mec['reactionRateSet']
+    reactionRateExpr = mec['reactionRateExpr']
+    T, P, MoFri, SpCoi = mec['loopVars']
+    Ri = np.array(reactionRateSet.reactionRateExe(mec['loopVars']))
+
+    # NOTE
+    # node
+    _funList = [
+        ("reactionRateExe", lambda: reactionRateExe(
+            mec['loopVars'], reactionRateExpr['VARS'], reactionRateExpr['RATES'])),
+        ("ReactionRateClass.reactionRateExe",
+         lambda: reactionRateSet.reactionRateExe(mec['loopVars'])),
+        ("componentFormationRate", lambda: componentFormationRate(
+            compNo, compList, mec['reactionStochCoeff'], Ri)),
+        ("componentFormationRateMat", lambda: componentFormationRateMat(
+            mec['reactionStochCoeffMat'], Ri)),
+        ("calEnthalpyChangeOfReaction", lambda: calEnthalpyChangeOfReaction(
+            mec['reactionListSorted'], T))
+    ]
+    for funName, fun in _funList:
+        res.append(setRecord(name, funName, "node", 1, compNo,
+                   reactionNo, timeFun(fun, number)))
+
+    # NOTE
+    # grid
+    for nodeNo in GRID_SIZE_LIST:
+        _number = max(1, number*10//nodeNo)
+        # temperature profile
+        T_z = T + np.linspace(0, 10, nodeNo)
+        MoFri_z = np.tile(MoFri[:, np.newaxis], (1, nodeNo))
+        SpCoi_z = np.tile(SpCoi[:, np.newaxis], (1, nodeNo))
+        Ri_z = np.tile(Ri, (nodeNo, 1))
+        _funList = [
+            ("ReactionRateClass.reactionRateExeGrid", lambda: reactionRateSet.reactionRateExeGrid(
+                (T_z, P, MoFri_z, SpCoi_z))),
+            ("componentFormationRateMat", lambda: componentFormationRateMat(
+                mec['reactionStochCoeffMat'], Ri_z)),
+            ("calEnthalpyChangeOfReaction", lambda: [calEnthalpyChangeOfReaction(
+                mec['reactionListSorted'], item) for item in T_z])
+        ]
+        for funName, fun in _funList:
+            res.append(setRecord(name, funName, "grid", nodeNo, compNo,
+                       reactionNo, timeFun(fun, _number)))
+
+    return res
+
+
+def buildSyntheticMechanism(compNo, seed=0):
+    """
+    mass-action mechanism with compNo species and compNo reactions (A + B -> C)
+    """
+    rng = np.random.default_rng(seed)
+    compList = [f"S{i}" for i in range(compNo)]
+    _index = rng.integers(0, compNo, (compNo, 3))
+    # rate expressions (compiled strings)
+    rates = {f"r{m}": f"k{m}*exp(-E{m}/T)*SpCoi[{a}]*SpCoi[{b}]" for m,
+             (a, b, c) in enumerate(_index)}
+    varis = {}
+    for m in range(compNo):
+        varis[f"k{m}"] = float(rng.uniform(1e3, 1e5))
+        varis[f"E{m}"] = float(rng.uniform(5e3, 1e4))
+    reactionStochCoeff = [[(compList[a], -1.0), (compList[b], -1.0), (compList[c], 1.0)]
+                          for a, b, c in _index]
+    return compList, {"VARS": varis, "RATES": rates}, reactionStochCoeff
+
+
+def benchScaling(nodeNo=100, number=20):
+    """
+    scaling of rates/formation rates over species count
+    """
+    res = []
+    for compNo in SPECIES_NO_LIST:
+        compList, reactionRateExpr, reactionStochCoeff = buildSyntheticMechanism(
+            compNo)
+        reactionRateSet = ReactionRateClass(reactionRateExpr)
+        reactionStochCoeffMat = rmtUtil.setReactionCoeffMatrix(
+            compList, reactionStochCoeff)
+        SpCoi = np.full(compNo, 10.0)
+        loopVars = (600.0, 1e5, SpCoi/np.sum(SpCoi), SpCoi)
+        Ri = np.array(reactionRateSet.reactionRateExe(loopVars))
+        SpCoi_z = np.tile(SpCoi[:, np.newaxis], (1, nodeNo))
+        T_z = np.linspace(600, 650, nodeNo)
+        Ri_z = np.tile(Ri, (nodeNo, 1))
+        _funList = [
+            ("ReactionRateClass.reactionRateExe", "node", 1,
+             lambda: reactionRateSet.reactionRateExe(loopVars)),
+            ("componentFormationRate", "node", 1, lambda: componentFormationRate(
+                compNo, compList, reactionStochCoeff, Ri)),
+            ("componentFormationRateMat", "node", 1,
+             lambda: componentFormationRateMat(reactionStochCoeffMat, Ri)),
+            ("ReactionRateClass.reactionRateExeGrid", "grid", nodeNo, lambda: reactionRateSet.reactionRateExeGrid(
+                (T_z, 1e5, SpCoi_z/np.sum(SpCoi_z, axis=0), SpCoi_z))),
+            ("componentFormationRateMat", "grid", nodeNo,
+             lambda: componentFormationRateMat(reactionStochCoeffMat, Ri_z))
+        ]
+        for funName, mode, _nodeNo, fun in _funList:
+            res.append(setRecord(f"synthetic-{compNo}", funName, mode, _nodeNo, compNo,
+                       compNo, timeFun(fun, number)))
+
+    return res
+
+
+def main(output=None, number=200):
+    """
+    run all benchmarks
+    args:
+        output: json file (None: print)
+        number: calls for node benchmarks
+    """
+    res = []
+    for name in MECHANISMS:
+        res.extend(benchMechanism(name, number))
+    res.extend(benchScaling(number=max(1, number//10)))
+
+    # json
+    resJson = json.dumps({"results": res}, indent=2)
+    if output is None:
+        print(resJson)
+    else:
+        with open(output, 'w') as f:
+            f.write(resJson)
+
+    return res
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="kinetics benchmark")
+    parser.add_argument("-o", "--output", default=None,
+                        help="json result file")
+    parser.add_argument("-n", "--number", type=int, default=200,
+                        help="calls per node benchmark")
+    args = parser.parse_args()
+    main(args.output, args.number)
@@ -0,0 +1,69 @@
+# expression compiler
+# usage: python -m pytest PyREMOT/tests/test_expression.py
+import math
+import numpy as np
+import pytest
+# internals
+from PyREMOT.docs.rmtReaction import compileExpression, compileExpressionVec
+
+# variables
+varDict = {"k0": 2.0, "Ea": 1000.0, "R_CONST": 8.314,
+           "T": 500.0, "P": 5e6, "MoFri": [0.5, 0.1]}
+
+
+@pytest.mark.parametrize("exprText, value", [
+    ("T + P + 1", 500.0 + 5e6 + 1),
+    ("k0*exp(-Ea/(R_CONST*T))*MoFri[0]**2",
+     2.0*math.exp(-1000.0/(8.314*500.0))*0.25),
+    ("sqrt(P)/log(T, 10) - 7//2 + 7 % 2", math.sqrt(5e6)/math.log(500.0, 10) - 3 + 1),
+    ("-MoFri[1]*pi + e", -0.1*math.pi + math.e),
+    ("pow(T, 2) + T**2", 2*500.0**2),
+])
+def test_accept(exprText, value):
+    fun = compileExpression(exprText)
+    assert fun(varDict) == pytest.approx(value)
+    # cache by expression text
+    assert compileExpression(exprText) is fun
+
+
+def test_variables():
+    fun = compileExpression("k0*exp(-Ea/(R_CONST*T))*MoFri[0]")
+    assert fun.exprVars == {"k0", "Ea", "R_CONST", "T", "MoFri"}
+
+
+@pytest.mark.parametrize("exprText", [
+    "__import__('os')",
+    "().__class__",
+    "T.real",
+    "open('f')",
+    "exp(x=1)",
+    "[T, P]",
+    "lambda: 1",
+    "T if P else 1",
+    "T < P",
+    "'a'*10",
+    "True + 1",
+    "MoFri[T]",
+    "MoFri[0:1]",
+    "_x + 1",
+    "T; P",
+    "1" + "0"*400,
+])
+def test_reject(exprText):
+    with pytest.raises(Exception):
+        compileExpression(exprText)
+
+
+def test_power_overflow():
+    # numbers are floats: a large power fails at once instead of hanging
+    fun = compileExpression("9**9**9")
+    with pytest.raises(OverflowError):
+        fun({})
+
+
+def test_vectorized():
+    fun = compileExpressionVec("k0*exp(-Ea/(R_CONST*T))*MoFri[0]")
+    T = np.array([450.0, 500.0, 550.0])
+    _varDict = dict(varDict, T=T)
+    res = fun(_varDict)
+    assert np.allclose(res, 2.0*np.exp(-1000.0/(8.314*T))*0.5)
@@ -0,0 +1,44 @@
+# gas-solid film correlations
+# usage: python -m pytest PyREMOT/tests/test_fluidFilm.py
+import numpy as np
+import pytest
+# internals
+from PyREMOT.core import CONST_EQ_Sh
+from PyREMOT.docs.fluidFilm import calShNoEq1, calFilmCoefficientMat, calReNoEq1, calScNoEq1, \
+    calPrNoEq1, calNuNoEq1, calMassTransferCoefficientEq1, calHeatTransferCoefficientEq1
+
+
+@pytest.mark.parametrize("Sc, Re", [(0.7, 10.0), (1.2, 150.0), (2.0, 1000.0)])
+def test_sherwood_rosner(Sc, Re):
+    # Sh = Sc^0.4*(0.4*Re^(1/2) + 0.2*Re^(2/3))
+    Sh = calShNoEq1(Sc, Re, CONST_EQ_Sh['Rosner'])
+    assert Sh == pytest.approx((Sc**0.4)*(0.4*np.sqrt(Re) + 0.2*np.cbrt(Re)**2))
+
+
+def test_sherwood_unknown_method():
+    with pytest.raises(Exception):
+        calShNoEq1(0.7, 10.0, 0)
+
+
+@pytest.mark.parametrize("ShMethod", list(CONST_EQ_Sh.values()))
+def test_film_coefficient_nodes(ShMethod):
+    # all nodes at once vs node by node
+    GaDe = np.array([20.0, 25.0, 30.0])
+    GaVi = np.array([2e-5, 2.2e-5, 2.4e-5])
+    GaDiCoi = np.array([5e-6, 2e-6])
+    GaCp = np.array([30.0, 31.0, 32.0])
+    GaThCo = 0.1
+    GaMoWe = np.array([0.01, 0.012, 0.014])
+    SuVe, PaDi = 0.2, 5e-3
+    res = calFilmCoefficientMat(
+        GaDe, SuVe, PaDi, GaVi, GaDiCoi, GaCp, GaThCo, GaMoWe, ShMethod)
+    assert res['MaTrCo'].shape == (2, 3)
+    for z in range(3):
+        ReNu = calReNoEq1(GaDe[z], SuVe, PaDi, GaVi[z])
+        ScNu = calScNoEq1(GaDe[z], GaVi[z], GaDiCoi)
+        ShNu = calShNoEq1(ScNu, ReNu, ShMethod)
+        PrNu = calPrNoEq1(GaCp[z], GaVi[z], GaThCo, GaMoWe[z])
+        assert np.allclose(res['MaTrCo'][:, z],
+                           calMassTransferCoefficientEq1(ShNu, GaDiCoi, PaDi))
+        assert res['HeTrCo'][z] == pytest.approx(calHeatTransferCoefficientEq1(
+            calNuNoEq1(PrNu, ReNu), GaThCo, PaDi))
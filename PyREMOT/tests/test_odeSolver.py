@@ -0,0 +1,177 @@
+# ode solvers
+# usage: python -m pytest PyREMOT/tests/test_odeSolver.py
+import numpy as np
+import pytest
+from scipy import sparse
+from scipy.integrate import solve_ivp
+# internals
+from PyREMOT.solvers.odeSolver import DoPri54, BDF, BDFSolverClass
+from PyREMOT.solvers.solSetting import solverSetting
+
+
+def robertsonFun(t, y, params):
+    # robertson chemical kinetics (stiff)
+    k1, k2, k3 = params
+    return np.array([
+        -k1*y[0] + k3*y[1]*y[2],
+        k1*y[0] - k2*y[1]**2 - k3*y[1]*y[2],
+        k2*y[1]**2
+    ])
+
+
+def diffusionFun(t, y, params):
+    # 1d diffusion-reaction (central difference, fixed inlet)
+    D, k = params
+    _yb = np.concatenate(([1.0], y, [y[-1]]))
+    return D*(_yb[:-2] - 2*_yb[1:-1] + _yb[2:]) - k*y**2
+
+
+robertsonParams = (0.04, 3e7, 1e4)
+diffusionParams = (400.0, 5.0)
+
+
+def test_robertson():
+    # stiff regression vs scipy radau
+    y0 = [1.0, 0.0, 0.0]
+    tEval = np.array([1e-3, 1.0, 10.0, 100.0, 1e3])
+    rtol, atol = 1e-6, 1e-10
+    solver = BDFSolverClass(robertsonFun, robertsonParams, rtol=rtol, atol=atol)
+    y = solver.solve(0, tEval[-1], y0, tEval)
+    ref = solve_ivp(robertsonFun, (0, tEval[-1]), y0, method="Radau", t_eval=tEval,
+                    args=(robertsonParams,), rtol=1e-10, atol=1e-14)
+    assert y.shape == (3, tEval.size + 1)
+    assert np.allclose(y[:, 1:], ref.y, rtol=1e-3, atol=1e-8)
+    # mass balance
+    assert np.allclose(np.sum(y, axis=0), 1.0)
+    # jacobian/LU reuse
+    assert solver.stats['njev'] < solver.stats['nstep']
+
+
+def test_chunked_solve():
+    # a kept solver object continues the history over a chunked time loop
+    y0 = np.array([1.0, 0.0, 0.0])
+    tSpan = np.linspace(0, 10, 11)
+    ySingle = BDF(0, 10, y0, robertsonFun, robertsonParams,
+                  tEval=tSpan[1:], rtol=1e-6, atol=1e-10)
+    solver = BDFSolverClass(robertsonFun, robertsonParams, rtol=1e-6, atol=1e-10)
+    _y = y0
+    for i in range(tSpan.size - 1):
+        _y = solver.solve(tSpan[i], tSpan[i+1], _y)[:, -1]
+        assert np.allclose(_y, ySingle[:, i+1], rtol=1e-4, atol=1e-9)
+    # the history is kept: a single restart (first call)
+    assert solver.t == tSpan[-1]
+    assert solver.stats['njev'] <= 3
+
+
+def test_jacobian_types():
+    # banded/sparse vs dense finite difference jacobian
+    varNo = 40
+    y0 = np.zeros(varNo)
+    tEval = np.array([0.01, 0.1, 1.0])
+    options = {"rtol": 1e-6, "atol": 1e-9}
+    yDense = BDF(0, 1, y0, diffusionFun, diffusionParams,
+                 tEval=tEval, **options)
+    yBanded = BDF(0, 1, y0, diffusionFun, diffusionParams, tEval=tEval,
+                  jacType="banded", jacBand=(1, 1), **options)
+    _pattern = sparse.diags([1.0, 1.0, 1.0], [-1, 0, 1], shape=(varNo, varNo))
+    ySparse = BDF(0, 1, y0, diffusionFun, diffusionParams, tEval=tEval,
+                  jacType="sparse", jacSparsity=_pattern, **options)
+    assert np.allclose(yBanded, yDense, rtol=1e-8, atol=1e-10)
+    assert np.allclose(ySparse, yDense, rtol=1e-8, atol=1e-10)
+    ref = solve_ivp(diffusionFun, (0, 1), y0, method="Radau", t_eval=tEval,
+                    args=(diffusionParams,), rtol=1e-10, atol=1e-12)
+    assert np.allclose(yDense[:, 1:], ref.y, rtol=1e-4, atol=1e-6)
+
+
+@pytest.mark.parametrize("jacType, options", [
+    ("dense", {}),
+    ("banded", {"jacBand": (1, 1)}),
+    ("sparse", {"jacSparsity": np.ones((3, 3))}),
+])
+def test_singular_iteration_matrix(jacType, options):
+    # singular I - c*J: no factorization, the step is retried
+    solver = BDFSolverClass(robertsonFun, robertsonParams,
+                            jacType=jacType, **options)
+    c = 0.5
+    if jacType == "banded":
+        solver.J = np.zeros((3, 3))
+        solver.J[1] = 1/c
+    elif jacType == "sparse":
+        solver.J = sparse.csc_matrix(np.identity(3)/c)
+    else:
+        solver.J = np.identity(3)/c
+    assert solver.luFactor(c) is None
+    solver.J = solver.J*0
+    assert solver.luFactor(c) is not None
+
+
+def lotkaVolterraFun(t, y, params):
+    # lotka-volterra system
+    a, b, c, d = params
+    return np.array([a*y[0] - b*y[0]*y[1], c*y[0]*y[1] - d*y[1]])
+
+
+lotkaVolterraParams = (1.5, 1, 3, 1)
+
+
+def test_dopri54_accuracy():
+    # dopri54 vs scipy rk45 (tight tolerance)
+    y0 = [10.0, 5.0]
+    tEval = np.linspace(0, 15, 31)[1:]
+    y = DoPri54(0, 15, y0, lotkaVolterraFun, lotkaVolterraParams,
+                rtol=1e-8, atol=1e-10, tEval=tEval)
+    ref = solve_ivp(lotkaVolterraFun, (0, 15), y0, method="DOP853", t_eval=tEval,
+                    args=(lotkaVolterraParams,), rtol=1e-12, atol=1e-12)
+    assert y.shape == (2, tEval.size + 1)
+    assert np.allclose(y[:, 0], y0)
+    assert np.allclose(y[:, 1:], ref.y, rtol=1e-5, atol=1e-6)
+
+
+def test_dopri54_tEval():
+    # output times are step ends (no interpolation)
+    tCalls = []
+
+    def _fun(t, y, params):
+        tCalls.append(t)
+        return -params*y
+
+    tEval = np.array([0.1, 0.35, 1.0, 2.5])
+    y = DoPri54(0, 2.5, [1.0], _fun, 2.0, rtol=1e-9, atol=1e-12, tEval=tEval)
+    assert set(tEval).issubset(tCalls)
+    assert np.allclose(y[0, 1:], np.exp(-2.0*tEval), rtol=1e-7)
+
+
+def test_dopri54_backward():
+    # integration from t0 to tn < t0
+    tEval = np.array([0.8, 0.5, 0.0])
+    y = DoPri54(1.0, 0.0, [np.exp(-2.0)], lambda t, y, params: -params*y, 2.0,
+                rtol=1e-9, atol=1e-12, tEval=tEval)
+    assert np.allclose(y[0, 1:], np.exp(-2.0*tEval), rtol=1e-7)
+
+
+def test_default_method():
+    # existing "AM" settings keep the fixed-step predictor-corrector
+    odeSolverSetting = solverSetting['T1']['ode-solver']
+    assert odeSolverSetting['method'] == "PreCorr3"
+    assert odeSolverSetting['PreCorr3']['n'] == 100
+
+
+def test_sparse_user_jacobian():
+    # a sparse user jacobian is converted for the dense type
+    varNo = 20
+    y0 = np.zeros(varNo)
+    D, k = diffusionParams
+
+    def _jac(t, y, params):
+        _J = sparse.diags([D*np.ones(varNo - 1), -2*D - 2*k*y, D*np.ones(varNo - 1)],
+                          [-1, 0, 1], format="lil")
+        _J[varNo - 1, varNo - 1] += D
+        return _J.tocsr()
+
+    yRef = BDF(0, 1, y0, diffusionFun, diffusionParams, tEval=[1.0],
+               rtol=1e-6, atol=1e-9)
+    for jacType in ("dense", "sparse"):
+        solver = BDFSolverClass(diffusionFun, diffusionParams, jac=_jac, jacType=jacType,
+                                rtol=1e-6, atol=1e-9)
+        y = solver.solve(0, 1, y0, [1.0])
+        assert np.allclose(y, yRef, rtol=1e-5, atol=1e-8)
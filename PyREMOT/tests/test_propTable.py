@@ -0,0 +1,70 @@
+# property tables
+# usage: python -m pytest PyREMOT/tests/test_propTable.py
+import numpy as np
+# internals
+from PyREMOT.docs.propTable import PropertyTableClass, setPropertyTable, propertyTableExe, clearPropertyTable, PROPERTY_TABLE_CACHE
+from PyREMOT.docs.rmtThermo import calHeatCapacityAtConstantPressure, calMeanHeatCapacityAtConstantPressure
+from PyREMOT.docs.gasTransPor import calGasViscosity, calGasThermalConductivity
+
+# component list
+compList = ["H2", "CO2", "H2O", "CO", "CH3OH", "DME"]
+
+
+def test_table_error_bound():
+    # interpolated values vs exact correlations inside the range
+    for fun in (calHeatCapacityAtConstantPressure, calGasViscosity, calGasThermalConductivity):
+        _table = PropertyTableClass(fun, compList, 298.15, 800, tolerance=1e-6)
+        assert _table.maxErr <= 1e-6
+        T = np.linspace(300, 799, 37)
+        exact = np.asarray(fun(compList, T))
+        assert np.max(np.abs(_table.exe(T) - exact)/np.abs(exact)) <= 2e-6
+        # scalar
+        assert np.allclose(_table.exe(523.0), np.asarray(
+            fun(compList, 523.0)), rtol=2e-6)
+
+
+def test_table_out_of_range():
+    _table = PropertyTableClass(
+        calHeatCapacityAtConstantPressure, compList, 400, 600)
+    assert _table.exe(350.0) is None
+    assert _table.exe(np.array([450.0, 650.0])) is None
+    assert _table.stats()['misses'] == 2
+
+
+def test_table_cache():
+    # tables are reused across runs for the same key, a new range builds a new table
+    clearPropertyTable()
+    _table1 = setPropertyTable(
+        "Cp", calHeatCapacityAtConstantPressure, compList, 298.15, 800)
+    _table2 = setPropertyTable(
+        "Cp", calHeatCapacityAtConstantPressure, list(compList), 298.15, 800)
+    assert _table1 is _table2
+    _table3 = setPropertyTable(
+        "Cp", calHeatCapacityAtConstantPressure, compList, 298.15, 900)
+    assert _table3 is not _table1
+    assert len(PROPERTY_TABLE_CACHE.data) == 2
+    clearPropertyTable()
+
+
+def test_explicit_table_set():
+    # property functions use a table only when it is passed
+    _table = PropertyTableClass(
+        calHeatCapacityAtConstantPressure, compList, 298.15, 800)
+    propTableSet = {"Cp": _table}
+    T = 523.0
+    # exact
+    Cp0 = calHeatCapacityAtConstantPressure(compList, T)
+    # table
+    _hits = _table.hits
+    Cp1 = calHeatCapacityAtConstantPressure(compList, T, propTableSet)
+    assert _table.hits == _hits + 1
+    assert np.allclose(Cp0, Cp1, rtol=2e-6)
+    # mean Cp (T, Tref)
+    CpMean = calMeanHeatCapacityAtConstantPressure(
+        compList, T, propTableSet=propTableSet)
+    assert np.allclose(
+        CpMean, calMeanHeatCapacityAtConstantPressure(compList, T), rtol=2e-6)
+    # other component list: exact correlations
+    assert propertyTableExe(propTableSet, "Cp", compList[0:2], T) is None
+    # no table for the property
+    assert propertyTableExe(propTableSet, "Vi", compList, T) is None
@@ -0,0 +1,75 @@
+# enthalpy change of reactions
+# usage: python -m pytest PyREMOT/tests/test_reactionEnthalpy.py
+import numpy as np
+import pytest
+from scipy.integrate import quad
+# internals
+from PyREMOT.core import Tref
+from PyREMOT.docs.rmtUtility import rmtUtilityClass as rmtUtil
+from PyREMOT.docs import rmtThermo
+from PyREMOT.docs.rmtThermo import calEnthalpyChangeOfReaction, calReactionHeatCapacity, calMeanHeatCapacityAtConstantPressure
+
+# reactions
+reactionSet = {
+    "R1": "CO2 + 3H2 <=> CH3OH + H2O",
+    "R2": "CO + H2O <=> H2 + CO2",
+    "R3": "2CH3OH <=> DME + H2O",
+}
+
+
+def _meanReference(reactionListSorted, T):
+    # species mean heat capacity weighted by stoichiometric coefficients
+    res = []
+    for item in reactionListSorted:
+        _species = item['reactants'] + item['products']
+        _comList = [i['symbol'] for i in _species]
+        _coeff = np.array([i['coeff'] for i in _species])
+        CpMean = calMeanHeatCapacityAtConstantPressure(_comList, T)
+        res.append(np.dot(_coeff, CpMean)*(T - Tref))
+    return np.array(res)
+
+
+@pytest.mark.parametrize("T", [400.0, 523.0, 700.0])
+def test_mean(T):
+    reactionListSorted = rmtUtil.buildReactionCoefficient(reactionSet)
+    EnChList = calEnthalpyChangeOfReaction(reactionListSorted, T)
+    assert np.allclose(EnChList, _meanReference(reactionListSorted, T))
+
+
+@pytest.mark.parametrize("T", [400.0, 523.0, 700.0])
+def test_integral(T):
+    reactionListSorted = rmtUtil.buildReactionCoefficient(reactionSet)
+    EnChList = calEnthalpyChangeOfReaction(
+        reactionListSorted, T, method="INTEGRAL")
+    for k in range(len(reactionListSorted)):
+        _ref = quad(lambda x: calReactionHeatCapacity(
+            reactionListSorted, x)[k], Tref, T)[0]
+        assert EnChList[k] == pytest.approx(_ref, rel=1e-10)
+
+
+def test_grid():
+    # one call for all nodes: (reactionNo, T shape)
+    reactionListSorted = rmtUtil.buildReactionCoefficient(reactionSet)
+    T = np.array([[450.0, 500.0], [550.0, 600.0]])
+    for method in ("MEAN", "INTEGRAL"):
+        EnChList = calEnthalpyChangeOfReaction(
+            reactionListSorted, T, method=method)
+        assert EnChList.shape == (3, 2, 2)
+        for index in np.ndindex(2, 2):
+            assert np.allclose(EnChList[(slice(None),) + index], calEnthalpyChangeOfReaction(
+                reactionListSorted, T[index], method=method))
+
+
+def test_coefficient_cache():
+    # coefficients are cached by the reaction contents, not by the list object
+    rmtThermo.REACTION_HEAT_CAPACITY_SET.clear()
+    for _ in range(5):
+        calEnthalpyChangeOfReaction(
+            rmtUtil.buildReactionCoefficient(reactionSet), 500.0)
+    assert len(rmtThermo.REACTION_HEAT_CAPACITY_SET) == 1
+
+
+def test_unknown_method():
+    reactionListSorted = rmtUtil.buildReactionCoefficient(reactionSet)
+    with pytest.raises(Exception):
+        calEnthalpyChangeOfReaction(reactionListSorted, 500.0, method="EXACT")
@@ -0,0 +1,134 @@
+# sparse reaction network
+# usage: python -m pytest PyREMOT/tests/test_reactionNetwork.py
+import numpy as np
+import pytest
+from scipy import sparse
+# internals
+from PyREMOT.docs.modelSetting import REACTION_NETWORK_SETTING
+from PyREMOT.docs.rmtUtility import rmtUtilityClass as rmtUtil
+from PyREMOT.docs.rmtReaction import componentFormationRate, componentFormationRateMat, componentFormationRateJacobian, ReactionRateClass
+
+
+def _mechanism(compNo):
+    # mass action chain: S(m) + S(m+1) -> S(m+2)
+    compList = [f"S{i}" for i in range(compNo)]
+    _index = [(m, (m + 1) % compNo, (m + 2) % compNo) for m in range(compNo)]
+    reactionStochCoeff = [[(compList[a], -1.0), (compList[b], -1.0), (compList[c], 1.0)]
+                          for a, b, c in _index]
+    reactionRateExpr = {
+        "VARS": {"k": 1e-2, "E": 2e3},
+        "RATES": {f"r{m}": f"k*exp(-E/T)*SpCoi[{a}]*SpCoi[{b}]" for m, (a, b, c) in enumerate(_index)}
+    }
+    return compList, reactionStochCoeff, reactionRateExpr
+
+
+@pytest.mark.parametrize("sparseSet, compNo, sparseRes", [
+    ("AUTO", 5, False),
+    ("AUTO", 40, True),
+    ("TRUE", 5, True),
+    ("FALSE", 40, False),
+])
+def test_coeff_matrix_setting(monkeypatch, sparseSet, compNo, sparseRes):
+    # dense for small mechanisms, sparse (csr) for large and sparse ones
+    monkeypatch.setitem(REACTION_NETWORK_SETTING, "sparse", sparseSet)
+    compList, reactionStochCoeff, _ = _mechanism(compNo)
+    reactionCoeffMat = rmtUtil.setReactionCoeffMatrix(
+        compList, reactionStochCoeff)
+    assert sparse.issparse(reactionCoeffMat) is sparseRes
+    assert np.allclose(sparse.csr_matrix(reactionCoeffMat).toarray(),
+                       rmtUtil.buildReactionCoeffMatrix(compList, reactionStochCoeff))
+
+
+def test_formation_rate():
+    # csr/dense vs the list based formation rate
+    compList, reactionStochCoeff, _ = _mechanism(8)
+    coeffMat = rmtUtil.buildReactionCoeffMatrix(compList, reactionStochCoeff)
+    coeffMatSparse = rmtUtil.buildReactionCoeffSparseMatrix(
+        compList, reactionStochCoeff)
+    rng = np.random.default_rng(0)
+    Ri = rng.random(8)
+    ri = componentFormationRate(8, compList, reactionStochCoeff, Ri)
+    assert np.allclose(componentFormationRateMat(coeffMat, Ri), ri)
+    assert np.allclose(componentFormationRateMat(coeffMatSparse, Ri), ri)
+    # batch of nodes, shape: (..., reactionNo)
+    RiBatch = rng.random((3, 4, 8))
+    riBatch = componentFormationRateMat(coeffMatSparse, RiBatch)
+    assert riBatch.shape == (3, 4, 8)
+    assert np.allclose(riBatch, componentFormationRateMat(coeffMat, RiBatch))
+
+
+def test_formation_rate_jacobian():
+    # csr vs dense, shape: (reactionNo, ...) -> (compNo, ...)
+    compList, reactionStochCoeff, _ = _mechanism(8)
+    coeffMat = rmtUtil.buildReactionCoeffMatrix(compList, reactionStochCoeff)
+    coeffMatSparse = rmtUtil.buildReactionCoeffSparseMatrix(
+        compList, reactionStochCoeff)
+    rng = np.random.default_rng(1)
+    for shape in ((8,), (8, 5), (8, 8, 5)):
+        dRi = rng.random(shape)
+        dri = componentFormationRateJacobian(coeffMatSparse, dRi)
+        assert dri.shape == shape
+        assert np.allclose(dri, componentFormationRateJacobian(coeffMat, dRi))
+        assert np.allclose(dri, np.einsum('ir,r...->i...', coeffMat, dRi))
+
+
+def test_jacobian_pattern():
+    # dri/dCj: i takes part in a reaction depending on j
+    compList, reactionStochCoeff, reactionRateExpr = _mechanism(6)
+    coeffMat = rmtUtil.buildReactionCoeffSparseMatrix(
+        compList, reactionStochCoeff)
+    SpCoi = np.full(6, 10.0)
+    depPattern = ReactionRateClass(reactionRateExpr).reactionDependencyPattern(
+        (600.0, 1e5, SpCoi/np.sum(SpCoi), SpCoi))
+    # reaction m depends on m, m+1
+    assert np.array_equal(depPattern, np.identity(6, dtype=bool) | np.roll(
+        np.identity(6, dtype=bool), 1, axis=1))
+    jacPattern = rmtUtil.buildReactionJacobianPattern(
+        coeffMat, depPattern).toarray()
+    _ref = (coeffMat.toarray() != 0).astype(int) @ depPattern.astype(int) != 0
+    assert np.array_equal(jacPattern, _ref)
+    assert jacPattern.sum() < 36
+
+
+def test_dependency_probe():
+    # zero concentrations at the probe state do not hide a dependency
+    ReactionRateSet = ReactionRateClass({
+        "VARS": {},
+        "RATES": {"r1": "SpCoi[0]*SpCoi[1] - SpCoi[2]*SpCoi[3]"}
+    })
+    SpCoi = np.array([1.0, 2.0, 0.0, 0.0])
+    depPattern = ReactionRateSet.reactionDependencyPattern(
+        (600.0, 1e5, SpCoi/np.sum(SpCoi), SpCoi))
+    assert np.all(depPattern)
+
+
+def test_seed_color():
+    # components of a seed do not share a reaction rate
+    depPattern = np.identity(20, dtype=bool) | np.roll(
+        np.identity(20, dtype=bool), 1, axis=1)
+    seedColor = rmtUtil.buildJacobianSeedColor(depPattern)
+    assert seedColor.max() + 1 == 2
+    for r in range(20):
+        _colors = seedColor[depPattern[r]]
+        assert np.unique(_colors).size == _colors.size
+    # all rates depend on all components
+    assert np.array_equal(rmtUtil.buildJacobianSeedColor(
+        np.ones((3, 4))), np.arange(4))
+
+
+def test_seeded_jacobian():
+    # grouped seeds vs one seed per component (grid)
+    compList, _, reactionRateExpr = _mechanism(12)
+    ReactionRateSet = ReactionRateClass(reactionRateExpr)
+    rng = np.random.default_rng(2)
+    SpCoi = 1 + rng.random((12, 5))
+    T = 500 + 100*rng.random(5)
+    loopVars = (T, 1e5, SpCoi/np.sum(SpCoi, axis=0), SpCoi)
+    depPattern = ReactionRateSet.reactionDependencyPattern(
+        (T[0], 1e5, SpCoi[:, 0]/np.sum(SpCoi[:, 0]), SpCoi[:, 0]))
+    Ri, dRidCi, dRidT = ReactionRateSet.reactionRateJacobian(loopVars)
+    RiS, dRidCiS, dRidTS = ReactionRateSet.reactionRateJacobian(
+        loopVars, depPattern)
+    assert np.allclose(RiS, Ri)
+    assert np.allclose(dRidCiS, dRidCi)
+    assert np.allclose(dRidTS, dRidT)
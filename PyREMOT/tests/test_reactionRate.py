@@ -0,0 +1,124 @@
+# reaction rate expressions
+# usage: python -m pytest PyREMOT/tests/test_reactionRate.py
+import math
+import numpy as np
+import pytest
+# internals
+from PyREMOT.docs.rmtReaction import ReactionRateClass
+
+# rate expression (pressure dependent)
+reactionRateSet = {
+    "VARS": {
+        "k": lambda x: 2*math.sqrt(x['P'])
+    },
+    "RATES": {
+        "r1": lambda x: x['k']*x['SpCoi'][0]
+    }
+}
+
+
+def _gridVars():
+    # T, P, MoFri, SpCoi on a (3, 2) grid
+    T = np.full((3, 2), 500.0)
+    P = np.array([[1e5, 2e5], [1e5, 1e5], [3e5, 1e5]])
+    SpCoi = np.ones((2, 3, 2))
+    MoFri = SpCoi/2
+    return T, P, MoFri, SpCoi
+
+
+def test_grid_matches_node():
+    # grid mode vs node mode
+    ReactionRateSet = ReactionRateClass(reactionRateSet)
+    T, P, MoFri, SpCoi = _gridVars()
+    Ri = ReactionRateSet.reactionRateExeGrid((T, P, MoFri, SpCoi))
+    assert Ri.shape == (1, 3, 2)
+    for index in np.ndindex(3, 2):
+        _index = (slice(None),) + index
+        RiNode = ReactionRateSet.reactionRateExe(
+            (T[index], P[index], MoFri[_index], SpCoi[_index]))
+        assert np.allclose(Ri[_index], RiNode)
+
+
+def test_grid_invalid_state_raises():
+    # negative pressure: math.sqrt raises in the scalar mode, grid mode must not return nan
+    ReactionRateSet = ReactionRateClass(reactionRateSet)
+    T, P, MoFri, SpCoi = _gridVars()
+    ReactionRateSet.reactionRateExeGrid((T, P, MoFri, SpCoi))
+    P[1, 1] = -1
+    with pytest.raises(ValueError):
+        ReactionRateSet.reactionRateExeGrid((T, P, MoFri, SpCoi))
+    # grid mode is kept for valid states
+    P[1, 1] = 1e5
+    Ri = ReactionRateSet.reactionRateExeGrid((T, P, MoFri, SpCoi))
+    assert np.all(np.isfinite(Ri))
+    assert ReactionRateSet.gridSet is True
+
+
+# rate expressions (langmuir-hinshelwood type)
+reactionRateSetLH = {
+    "VARS": {
+        "RT": lambda x: 8.314*x['T'],
+        "K1": lambda x: 35.45*math.exp(-1.7069e4/x['RT']),
+        "KH2": lambda x: 0.249*math.exp(3.4394e4/x['RT']),
+        "PH2": lambda x: x['P']*x['MoFri'][0]*1e-5,
+        "PCO2": lambda x: x['P']*x['MoFri'][1]*1e-5,
+        "ra2": lambda x: 1 + math.sqrt(x['KH2']*x['PH2']),
+    },
+    "RATES": {
+        "r1": lambda x: x['K1']*x['PCO2']*x['PH2']/math.pow(x['ra2'], 3),
+        "r2": lambda x: x['SpCoi'][1]**2 - 0.5*x['SpCoi'][0]*x['SpCoi'][2]
+    }
+}
+
+
+def _rateFiDi(ReactionRateSet, T, P, SpCoi):
+    # central finite difference (MoFri = SpCoi/sum(SpCoi))
+    def _rate(_T, _SpCoi):
+        return np.array(ReactionRateSet.reactionRateExe(
+            (_T, P, _SpCoi/np.sum(_SpCoi), _SpCoi)))
+    dRidCi = np.zeros((2, SpCoi.size))
+    for i in range(SpCoi.size):
+        _dC = 1e-6*SpCoi[i]
+        _Cp = SpCoi.copy()
+        _Cm = SpCoi.copy()
+        _Cp[i] += _dC
+        _Cm[i] -= _dC
+        dRidCi[:, i] = (_rate(T, _Cp) - _rate(T, _Cm))/(2*_dC)
+    dRidT = (_rate(T + 1e-3, SpCoi) - _rate(T - 1e-3, SpCoi))/2e-3
+    return _rate(T, SpCoi), dRidCi, dRidT
+
+
+def test_jacobian_node():
+    # dual numbers vs finite difference
+    ReactionRateSet = ReactionRateClass(reactionRateSetLH)
+    T, P = 523.0, 5e6
+    SpCoi = np.array([0.6, 0.3, 0.1])
+    Ri, dRidCi, dRidT = ReactionRateSet.reactionRateJacobian(
+        (T, P, SpCoi/np.sum(SpCoi), SpCoi))
+    RiFD, dRidCiFD, dRidTFD = _rateFiDi(ReactionRateSet, T, P, SpCoi)
+    assert np.allclose(Ri, RiFD)
+    assert np.allclose(dRidCi, dRidCiFD, rtol=1e-6, atol=1e-12)
+    assert np.allclose(dRidT, dRidTFD, rtol=1e-5)
+    # dependency pattern: both rates depend on all components (mole fractions)
+    depPattern = ReactionRateSet.reactionDependencyPattern(
+        (T, P, SpCoi/np.sum(SpCoi), SpCoi))
+    assert depPattern.shape == (2, 3) and np.all(depPattern)
+
+
+def test_jacobian_grid():
+    # all nodes vs node by node
+    ReactionRateSet = ReactionRateClass(reactionRateSetLH)
+    T = np.array([[500.0, 520.0], [540.0, 560.0]])
+    P = 5e6
+    SpCoi = np.random.default_rng(2).random((3, 2, 2)) + 0.1
+    MoFri = SpCoi/np.sum(SpCoi, axis=0)
+    Ri, dRidCi, dRidT = ReactionRateSet.reactionRateJacobian(
+        (T, P, MoFri, SpCoi))
+    assert Ri.shape == (2, 2, 2) and dRidCi.shape == (2, 3, 2, 2)
+    for index in np.ndindex(2, 2):
+        _index = (slice(None),) + index
+        _Ri, _dRidCi, _dRidT = ReactionRateSet.reactionRateJacobian(
+            (T[index], P, MoFri[_index], SpCoi[_index]))
+        assert np.allclose(Ri[_index], _Ri)
+        assert np.allclose(dRidCi[(slice(None), slice(None)) + index], _dRidCi)
+        assert np.allclose(dRidT[_index], _dRidT)
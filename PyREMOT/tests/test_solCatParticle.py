@@ -0,0 +1,67 @@
+# catalyst particle (orthogonal collocation)
+# usage: python -m pytest PyREMOT/tests/test_solCatParticle.py
+import numpy as np
+import pytest
+# internals
+from PyREMOT.solvers.solOrCo import OrCoClass
+from PyREMOT.solvers.solCatParticle import OrCoCatParticleClass
+
+# collocation matrices
+OrCoClassSetRes = OrCoClass().buildMatrix()
+N = OrCoClassSetRes['N']
+
+
+def _particleClass():
+    return OrCoCatParticleClass(OrCoClassSetRes['Xc'], N, OrCoClassSetRes['Q'],
+                                OrCoClassSetRes['A'], OrCoClassSetRes['B'], 1)
+
+
+def _inputs(shape, seed=0):
+    # var, diffusivity, reaction term, bulk value, beta
+    rng = np.random.default_rng(seed)
+    return (rng.random(shape + (N,)), 1 + rng.random(shape), rng.random(shape + (N,)),
+            rng.random(shape), 1 + 5*rng.random(shape))
+
+
+def test_batch_matches_element():
+    # all (z, component) at once vs the element matrices
+    OrCoCatParticleClassSet = _particleClass()
+    yj, const1, const2, yb, beta = _inputs((3, 2))
+    RYF = OrCoCatParticleClassSet.buildOrCoMatrixBatch(
+        yj, const1, const2, (yb, beta))
+    assert RYF.shape == (3, 2, N)
+    for index in np.ndindex(3, 2):
+        _const3 = (yb[index], beta[index])
+        R = OrCoCatParticleClassSet.buildLhsMatrix(const1[index], _const3)
+        f = OrCoCatParticleClassSet.buildRhsMatrix(const2[index], _const3)
+        assert np.allclose(RYF[index], np.flipud(R @ yj[index] + f))
+        # single element
+        assert np.allclose(RYF[index], OrCoCatParticleClassSet.buildOrCoMatrix(
+            yj[index].reshape((N, 1)), const1[index], const2[index], _const3))
+
+
+@pytest.mark.parametrize("sign", [1, -1])
+def test_surface_residual(sign):
+    # the surface value is set by the gas-solid interface balance, so the BC2
+    # row (first row, flipped) vanishes when const3 is (bulk value, beta)
+    OrCoCatParticleClassSet = _particleClass()
+    yj, const1, const2, yb, beta = _inputs((4, 3), seed=1)
+    beta = sign*beta
+    yjUpdated = np.zeros_like(yj)
+    for index in np.ndindex(4, 3):
+        yjUpdated[index] = OrCoCatParticleClassSet.CalUpdateYnSolidGasInterface(
+            yj[index].copy(), yb[index], beta[index]).flatten()
+    RYF = OrCoCatParticleClassSet.buildOrCoMatrixBatch(
+        yjUpdated, const1, const2, (yb, beta))
+    assert np.allclose(RYF[..., 0], 0, atol=1e-10)
+    # interior rows are not affected by the interface term
+    assert np.allclose(RYF[..., 1:], OrCoCatParticleClassSet.buildOrCoMatrixBatch(
+        yjUpdated, const1, const2, (0*yb, 0*beta))[..., 1:])
+
+
+def test_interface_term_required():
+    # as buildLhsMatrix: the gas-solid interface term has no default
+    OrCoCatParticleClassSet = _particleClass()
+    yj, const1, const2, yb, beta = _inputs((2,))
+    with pytest.raises(IndexError):
+        OrCoCatParticleClassSet.buildOrCoMatrixBatch(yj, const1, const2)
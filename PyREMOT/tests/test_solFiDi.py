@@ -0,0 +1,119 @@
+# finite difference operators
+# usage: python -m pytest PyREMOT/tests/test_solFiDi.py
+import itertools
+import numpy as np
+import pytest
+# internals
+from PyREMOT.solvers.solSetting import DIFF_SETTING
+from PyREMOT.solvers.solFiDi import FiDiDerivative1, FiDiDerivative2, FiDiMeshGenerator, \
+    FiDiDerivativeOperator, FiDiDerivativeApply, FiDiStencilHalfWidth, FiDiJacobianPattern
+
+# uniform mesh
+zNo = 12
+dz = 1/(zNo - 1)
+# non-uniform mesh
+_mesh = FiDiMeshGenerator([15, 10], 1, 30, 1.001)
+zNoNonUniform = _mesh['data3']
+dzs = _mesh['data2']
+
+
+def _diff2Set(mode):
+    return {"BC1": DIFF_SETTING['CD'], "BC2": DIFF_SETTING['CD'], "G": mode}
+
+
+def test_operator_exact():
+    # central difference is exact for a quadratic profile (interior nodes)
+    _op = FiDiDerivativeOperator(
+        zNo, dz, None, 0, True, DIFF_SETTING['CD'], _diff2Set(DIFF_SETTING['CD']))
+    zs = np.linspace(0, 1, zNo)
+    F = 1 + 2*zs + 3*zs**2
+    dFdz, d2Fdz2 = FiDiDerivativeApply(_op, F, 1 - 2*dz + 3*dz**2)
+    assert np.allclose(dFdz[0, :-1], 2 + 6*zs[:-1])
+    assert np.allclose(d2Fdz2[0, :-1], 6)
+
+
+@pytest.mark.parametrize("mode", ["BD", "CD", "FD"])
+def test_operator_node_formula(mode):
+    # operator rows vs the node formulas, the inlet value is the ghost node
+    _op = FiDiDerivativeOperator(
+        zNo, dz, None, 0, True, DIFF_SETTING[mode], _diff2Set(DIFF_SETTING[mode]))
+    F = np.random.default_rng(1).random((2, zNo))
+    Fb = np.array([0.3, 0.7])
+    dFdz, d2Fdz2 = FiDiDerivativeApply(_op, F, Fb)
+    for i in range(2):
+        _F = np.concatenate(([Fb[i]], F[i], [0]))
+        for z in range(1, zNo - 1):
+            # node z: _F[z+1]
+            assert dFdz[i, z] == pytest.approx(FiDiDerivative1(
+                _F[z:z+3], dz, DIFF_SETTING[mode]))
+            _Fbb = _F[z-1] if z > 1 else Fb[i]
+            assert d2Fdz2[i, z] == pytest.approx(FiDiDerivative2(
+                [_Fbb, *_F[z:z+3], _F[z+3] if z < zNo - 2 else 0], dz, DIFF_SETTING[mode]))
+
+
+@pytest.mark.parametrize("solverMeshSet, mode", list(itertools.product([True, False], ["BD", "CD", "FD"])))
+def test_pattern_covers_operator(solverMeshSet, mode):
+    # no wrap-around at the inlet, the jacobian pattern holds all stencil entries
+    _zNo = zNo if solverMeshSet is True else zNoNonUniform
+    _op = FiDiDerivativeOperator(_zNo, dz if solverMeshSet is True else _mesh['data5'], dzs, 15, solverMeshSet,
+                                 DIFF_SETTING[mode], _diff2Set(DIFF_SETTING[mode]))
+    assert _op['D1'][1, _zNo - 1] == 0 and _op['D2'][1, _zNo - 1] == 0
+    _setting = {"d2Fdz2": _diff2Set(DIFF_SETTING[mode]),
+                "d2Tdz2": _diff2Set(DIFF_SETTING['CD'])}
+    _pattern = FiDiJacobianPattern(
+        1, 1, _zNo, FiDiStencilHalfWidth(_setting, solverMeshSet)).toarray()
+    _entries = (abs(_op['D1']) + abs(_op['D2'])).toarray() != 0
+    assert np.all(_pattern[_entries])
+    # ghost node: node 0, and node 1 for i-2 stencils
+    assert np.all(np.nonzero(_op['g1'])[0] <= 1)
+    assert np.all(np.nonzero(_op['g2'])[0] <= 1)
+
+
+def test_non_uniform_ratio():
+    # the non-uniform inlet stencils do not use the last element size
+    _dzs = list(dzs)
+    _dzs[-1] = 10*_dzs[-1]
+    _op0 = FiDiDerivativeOperator(zNoNonUniform, _mesh['data5'], dzs, 15, False,
+                                  DIFF_SETTING['BD'], _diff2Set(DIFF_SETTING['CD']))
+    _op1 = FiDiDerivativeOperator(zNoNonUniform, _mesh['data5'], _dzs, 15, False,
+                                  DIFF_SETTING['BD'], _diff2Set(DIFF_SETTING['CD']))
+    for _key in ("D1", "D2"):
+        assert np.allclose(_op0[_key][0:2].toarray(),
+                           _op1[_key][0:2].toarray())
+
+
+def test_pattern_upstream():
+    # pressure (ergun equation): all variables depend on the concentration
+    # layers of the gas phase row of the upstream nodes
+    noLayer, varNoRows, _zNo = 3, 2, 6
+    _pattern = FiDiJacobianPattern(
+        noLayer, varNoRows, _zNo, 1, [0], [0], [0, 1]).toarray()
+    _pattern = _pattern.reshape(
+        (noLayer, varNoRows, _zNo, noLayer, varNoRows, _zNo))
+    # node 5 <- gas phase concentrations of node 0
+    assert np.all(_pattern[:, :, 5, 0:2, 0, 0])
+    # temperature layer, particle rows and downstream nodes are not coupled
+    assert not np.any(_pattern[:, :, 5, 2, :, 0])
+    assert not np.any(_pattern[:, :, 5, :, 1, 0])
+    assert not np.any(_pattern[:, :, 0, :, :, 5])
+    # default: all layers
+    _patternAll = FiDiJacobianPattern(
+        noLayer, varNoRows, _zNo, 1, [0], [0]).toarray()
+    assert _patternAll.sum() > _pattern.sum()
+
+
+def test_pattern_row_coupling():
+    # the variables of a node are coupled by rowPattern, the axial and upstream
+    # coupling are not changed
+    varNoRows, _zNo = 3, 5
+    rowPattern = np.identity(varNoRows, dtype=bool)
+    rowPattern[0, 1] = True
+    _pattern = FiDiJacobianPattern(1, varNoRows, _zNo, 1, None, [0], rowPattern=rowPattern).toarray()
+    _patternAll = FiDiJacobianPattern(1, varNoRows, _zNo, 1, None, [0]).toarray()
+    # shape: (z, z, row, row)
+    _pattern = _pattern.reshape((varNoRows, _zNo, varNoRows, _zNo)).transpose((1, 3, 0, 2))
+    _patternAll = _patternAll.reshape((varNoRows, _zNo, varNoRows, _zNo)).transpose((1, 3, 0, 2))
+    for z in range(_zNo):
+        assert np.array_equal(_pattern[z, z], rowPattern)
+    _offNode = ~np.identity(_zNo, dtype=bool)
+    assert np.array_equal(_pattern[_offNode], _patternAll[_offNode])
@@ -0,0 +1,123 @@
+# result cache and node property update
+# usage: python -m pytest PyREMOT/tests/test_utilities.py
+import numpy as np
+# internals
+from PyREMOT.core.utilities import LruCacheClass, cacheExe, PropertyUpdateClass, propertyUpdateExe
+
+
+def test_cache_key():
+    # exact keys (52 bits) vs quantized keys
+    cache = LruCacheClass()
+    assert cache.setKey("Cp", [500.0, [0.2, 0.8]]) == cache.setKey(
+        "Cp", [500.0, np.array([0.2, 0.8])])
+    assert cache.setKey("Cp", [500.0]) != cache.setKey(
+        "Cp", [500.0*(1 + 1e-12)])
+    assert cache.setKey("Cp", [500.0]) != cache.setKey("mu", [500.0])
+    cacheQ = LruCacheClass(bits=20)
+    assert cacheQ.setKey("Cp", [500.0]) == cacheQ.setKey(
+        "Cp", [500.0*(1 + 1e-12)])
+    assert cacheQ.setKey("Cp", [500.0]) != cacheQ.setKey(
+        "Cp", [500.0*(1 + 1e-3)])
+
+
+def test_cache_lru():
+    # the least recently used result is removed
+    cache = LruCacheClass(maxSize=2)
+    keys = [cache.setKey("T", [i]) for i in range(3)]
+    cache.set(keys[0], 0)
+    cache.set(keys[1], 1)
+    # key 0 is used: key 1 is removed
+    assert cache.get(keys[0]) == 0
+    cache.set(keys[2], 2)
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) == 0 and cache.get(keys[2]) == 2
+    assert cache.stats() == {"hits": 3, "misses": 1,
+                             "size": 2, "hitRate": 0.75}
+
+
+def test_cache_exe():
+    # the function is called once per key
+    calls = []
+
+    def _fun(T):
+        calls.append(T)
+        return 2*T
+
+    cache = LruCacheClass()
+    for _ in range(3):
+        assert cacheExe(cache, "f", [300.0], _fun, 300.0) == 600.0
+    assert len(calls) == 1
+    # no cache
+    assert cacheExe(None, "f", [300.0], _fun, 300.0) == 600.0
+    assert len(calls) == 2
+
+
+def test_property_update():
+    # only the drifted nodes are recomputed
+    calls = []
+
+    def _fun(T):
+        def _nodes(index):
+            calls.append(index)
+            return 2*T[index]
+        return _nodes
+
+    propUpdate = PropertyUpdateClass(tolerance=1e-3)
+    T = np.array([400.0, 450.0, 500.0, 550.0])
+    assert np.allclose(propUpdate.exe("Cp", [T], _fun(T)), 2*T)
+    assert np.array_equal(calls[-1], np.arange(4))
+    # node 1 within the tolerance, node 2 drifted
+    T1 = T.copy()
+    T1[1] *= 1 + 1e-4
+    T1[2] *= 1 + 1e-2
+    res = propUpdate.exe("Cp", [T1], _fun(T1))
+    assert np.array_equal(calls[-1], [2])
+    assert res[1] == 2*T[1] and res[2] == 2*T1[2]
+    # no drift: no call
+    propUpdate.exe("Cp", [T1], _fun(T1))
+    assert len(calls) == 2
+    # the reference state is the last evaluation of each node: node 1 drifts
+    # less than the tolerance from T1 but more than it from T
+    T2 = T1.copy()
+    T2[1] *= 1 + 9.5e-4
+    propUpdate.exe("Cp", [T2], _fun(T2))
+    assert np.array_equal(calls[-1], [1])
+    assert propUpdate.stats() == {"calls": 4, "updates": 6,
+                                  "nodes": 16, "updateRate": 6/16}
+
+
+def test_property_update_composition():
+    # composition (component, node) and tuple values
+    propUpdate = PropertyUpdateClass(tolerance=1e-3, refMin=1e-6)
+    T = np.array([500.0, 500.0, 500.0])
+    MoFri = np.array([[0.5, 0.5, 0.5], [0.5, 0.5, 0.5], [0, 0, 0]])
+
+    def _fun(T, MoFri):
+        def _nodes(index):
+            return MoFri[:, index]*T[index], T[index]
+        return _nodes
+
+    propUpdate.exe("k", [T, MoFri], _fun(T, MoFri))
+    # node 2: a trace component (refMin)
+    MoFri1 = MoFri.copy()
+    MoFri1[2, 2] = 1e-5
+    res = propUpdate.exe("k", [T, MoFri1], _fun(T, MoFri1))
+    assert propUpdate.stats()['updates'] == 4
+    assert isinstance(res, tuple) and res[0].shape == (3, 3)
+    assert np.allclose(res[0], MoFri1*T)
+    # node number change: all nodes
+    T2 = np.full(5, 500.0)
+    MoFri2 = np.full((3, 5), 1/3)
+    res = propUpdate.exe("k", [T2, MoFri2], _fun(T2, MoFri2))
+    assert res[0].shape == (3, 5) and propUpdate.stats()['updates'] == 9
+
+
+def test_property_update_exe():
+    # no scheduler: all nodes
+    T = np.array([400.0, 500.0])
+    assert np.allclose(propertyUpdateExe(
+        None, "Cp", [T], lambda index: 2*T[index]), 2*T)
+    propUpdate = PropertyUpdateClass()
+    assert np.allclose(propertyUpdateExe(
+        propUpdate, "Cp", [T], lambda index: 2*T[index]), 2*T)
+    assert propUpdate.stats()['calls'] == 1